@@ -52,7 +52,7 @@
     is_cacheable_partition_type,
 )
 
-from dagster_graphql.implementation.loader import StaleStatusLoader
+from dagster_graphql.implementation.loader import AssetStatusCacheLoader, StaleStatusLoader
 
 if TYPE_CHECKING:
     from dagster_graphql.schema.asset_graph import (
@@ -415,9 +415,13 @@ def get_partition_subsets(
     asset_key: AssetKey,
     dynamic_partitions_loader: DynamicPartitionsStore,
     partitions_def: Optional[PartitionsDefinition] = None,
+    asset_status_cache_loader: Optional[AssetStatusCacheLoader] = None,
 ) -> Tuple[Optional[PartitionsSubset], Optional[PartitionsSubset], Optional[PartitionsSubset]]:
     """Returns a tuple of PartitionSubset objects: the first is the materialized partitions,
     the second is the failed partitions, and the third are in progress.
+
+    If an asset status cache loader covering the asset is provided, its status cache is updated
+    together with those of the other assets of the loader.
     """
     if not partitions_def:
         return None, None, None
@@ -425,25 +429,34 @@ def get_partition_subsets(
     if instance.can_read_asset_status_cache() and is_cacheable_partition_type(partitions_def):
         # When the "cached_status_data" column exists in storage, update the column to contain
         # the latest partition status values
-        updated_cache_value = get_and_update_asset_status_cache_value(
-            instance,
-            asset_key,
-            partitions_def,
-            dynamic_partitions_loader,
-            loading_context,
-        )
+        if asset_status_cache_loader and asset_status_cache_loader.has(asset_key):
+            updated_cache_value = asset_status_cache_loader.get(asset_key)
+        else:
+            updated_cache_value = get_and_update_asset_status_cache_value(
+                instance,
+                asset_key,
+                partitions_def,
+                dynamic_partitions_loader,
+                loading_context,
+            )
         materialized_subset = (
-            updated_cache_value.deserialize_materialized_partition_subsets(partitions_def)
+            updated_cache_value.deserialize_materialized_partition_subsets(
+                partitions_def, dynamic_partitions_loader
+            )
             if updated_cache_value
             else partitions_def.empty_subset()
         )
         failed_subset = (
-            updated_cache_value.deserialize_failed_partition_subsets(partitions_def)
+            updated_cache_value.deserialize_failed_partition_subsets(
+                partitions_def, dynamic_partitions_loader
+            )
             if updated_cache_value
             else partitions_def.empty_subset()
         )
         in_progress_subset = (
-            updated_cache_value.deserialize_in_progress_partition_subsets(partitions_def)
+            updated_cache_value.deserialize_in_progress_partition_subsets(
+                partitions_def, dynamic_partitions_loader
+            )
             if updated_cache_value
             else partitions_def.empty_subset()
         )
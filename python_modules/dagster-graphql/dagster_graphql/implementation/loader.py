@@ -1,14 +1,21 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
 
 from dagster import (
     DagsterInstance,
     _check as check,
 )
+from dagster._core.definitions.asset_key import AssetKey
 from dagster._core.definitions.data_version import CachingStaleStatusResolver
+from dagster._core.definitions.partition import DynamicPartitionsStore, PartitionsDefinition
+from dagster._core.loader import LoadingContext
 from dagster._core.remote_representation import RemoteRepository
 from dagster._core.scheduler.instigation import InstigatorState, InstigatorType
+from dagster._core.storage.partition_status_cache import (
+    AssetStatusCacheValue,
+    get_and_update_asset_status_cache_values,
+)
 
 
 class RepositoryDataType(Enum):
@@ -139,3 +146,49 @@ def get_schedule_ticks(self, origin_id: str, selector_id: str, limit: int) -> Se
 
 # CachingStaleStatusResolver from core can be used directly as a GQL batch loader.
 StaleStatusLoader = CachingStaleStatusResolver
+
+
+class AssetStatusCacheLoader:
+    """A batch loader for the partition status caches of a set of assets. This loader is expected
+    to be instantiated once per request with the partitions definitions of all the asset nodes being
+    resolved, and then passed to each of them.
+
+    The status caches of all the assets are brought up to date together the first time any of them
+    is requested, so that resolving the partition statuses of thousands of asset nodes issues a
+    handful of queries instead of several per asset.
+    """
+
+    def __init__(
+        self,
+        instance: DagsterInstance,
+        partitions_defs_by_key: Callable[[], Mapping[AssetKey, PartitionsDefinition]],
+        dynamic_partitions_loader: DynamicPartitionsStore,
+        loading_context: LoadingContext,
+    ):
+        self._instance = instance
+        self._load_partitions_defs_by_key = partitions_defs_by_key
+        self._partitions_defs_by_key: Optional[Mapping[AssetKey, PartitionsDefinition]] = None
+        self._dynamic_partitions_loader = dynamic_partitions_loader
+        self._loading_context = loading_context
+        self._values: Optional[Mapping[AssetKey, Optional[AssetStatusCacheValue]]] = None
+
+    def has(self, asset_key: AssetKey) -> bool:
+        return asset_key in self._get_partitions_defs_by_key()
+
+    def get(self, asset_key: AssetKey) -> Optional[AssetStatusCacheValue]:
+        return self._get_values()[asset_key]
+
+    def _get_partitions_defs_by_key(self) -> Mapping[AssetKey, PartitionsDefinition]:
+        if self._partitions_defs_by_key is None:
+            self._partitions_defs_by_key = self._load_partitions_defs_by_key()
+        return self._partitions_defs_by_key
+
+    def _get_values(self) -> Mapping[AssetKey, Optional[AssetStatusCacheValue]]:
+        if self._values is None:
+            self._values = get_and_update_asset_status_cache_values(
+                self._instance,
+                self._get_partitions_defs_by_key(),
+                self._dynamic_partitions_loader,
+                self._loading_context,
+            )
+        return self._values
@@ -1,11 +1,15 @@
 import enum
 import itertools
-from typing import Optional, Sequence, Union
+from typing import Optional, Sequence, Tuple, Union
 
 import graphene
 from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
+from dagster._core.definitions.asset_key import AssetCheckKey, EntityKey
 from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionEntityProfile,
     AutomationConditionEvaluation,
+    AutomationConditionEvaluationProfile,
+    AutomationConditionNodeProfile,
     AutomationConditionSnapshot,
 )
 from dagster._core.scheduler.instigation import AutoMaterializeAssetEvaluationRecord
@@ -301,6 +305,96 @@ def __init__(
         )
 
 
+def _get_asset_key_and_check_name(
+    key: Optional[EntityKey],
+) -> Tuple[Optional[GrapheneAssetKey], Optional[str]]:
+    if key is None:
+        return None, None
+    elif isinstance(key, AssetCheckKey):
+        return GrapheneAssetKey(path=key.asset_key.path), key.name
+    return GrapheneAssetKey(path=key.path), None
+
+
+class GrapheneAutomationConditionNodeProfile(graphene.ObjectType):
+    uniqueId = graphene.NonNull(graphene.String)
+    parentUniqueId = graphene.Field(graphene.String)
+    description = graphene.NonNull(graphene.String)
+    userLabel = graphene.Field(graphene.String)
+
+    numEvaluations = graphene.NonNull(graphene.Int)
+    numCacheHits = graphene.NonNull(graphene.Int)
+    totalDuration = graphene.NonNull(graphene.Float)
+    selfDuration = graphene.NonNull(graphene.Float)
+    maxDuration = graphene.NonNull(graphene.Float)
+
+    slowestAssetKey = graphene.Field(GrapheneAssetKey)
+    slowestCheckName = graphene.Field(graphene.String)
+
+    class Meta:
+        name = "AutomationConditionNodeProfile"
+
+    def __init__(self, node_profile: AutomationConditionNodeProfile):
+        slowest_asset_key, slowest_check_name = _get_asset_key_and_check_name(
+            node_profile.slowest_entity_key
+        )
+        super().__init__(
+            uniqueId=node_profile.node_snapshot.unique_id,
+            parentUniqueId=node_profile.parent_unique_id,
+            description=node_profile.node_snapshot.description,
+            userLabel=node_profile.node_snapshot.label,
+            numEvaluations=node_profile.num_evaluations,
+            numCacheHits=node_profile.num_cache_hits,
+            totalDuration=node_profile.total_duration,
+            selfDuration=node_profile.self_duration,
+            maxDuration=node_profile.max_duration,
+            slowestAssetKey=slowest_asset_key,
+            slowestCheckName=slowest_check_name,
+        )
+
+
+class GrapheneAutomationConditionEntityProfile(graphene.ObjectType):
+    assetKey = graphene.NonNull(GrapheneAssetKey)
+    checkName = graphene.Field(graphene.String)
+    duration = graphene.NonNull(graphene.Float)
+
+    class Meta:
+        name = "AutomationConditionEntityProfile"
+
+    def __init__(self, entity_profile: AutomationConditionEntityProfile):
+        asset_key, check_name = _get_asset_key_and_check_name(entity_profile.key)
+        super().__init__(assetKey=asset_key, checkName=check_name, duration=entity_profile.duration)
+
+
+class GrapheneAutomationConditionEvaluationProfile(graphene.ObjectType):
+    duration = graphene.NonNull(graphene.Float)
+    numEvaluated = graphene.NonNull(graphene.Int)
+    numSkipped = graphene.NonNull(graphene.Int)
+    nodeProfiles = non_null_list(GrapheneAutomationConditionNodeProfile)
+    slowestEntityProfiles = non_null_list(GrapheneAutomationConditionEntityProfile)
+    numMemoHits = graphene.NonNull(graphene.Int)
+    numMemoMisses = graphene.NonNull(graphene.Int)
+
+    class Meta:
+        name = "AutomationConditionEvaluationProfile"
+
+    def __init__(self, profile: AutomationConditionEvaluationProfile):
+        super().__init__(
+            duration=profile.duration,
+            numEvaluated=profile.num_evaluated,
+            numSkipped=profile.num_skipped,
+            nodeProfiles=[
+                GrapheneAutomationConditionNodeProfile(node_profile)
+                for node_profile in profile.node_profiles
+            ],
+            slowestEntityProfiles=[
+                GrapheneAutomationConditionEntityProfile(entity_profile)
+                for entity_profile in profile.slowest_entity_profiles
+            ],
+            numMemoHits=profile.num_memo_hits,
+            numMemoMisses=profile.num_memo_misses,
+        )
+
+
 class GrapheneAssetConditionEvaluationRecords(graphene.ObjectType):
     records = non_null_list(GrapheneAssetConditionEvaluationRecord)
 
@@ -50,7 +50,7 @@
     get_freshness_info,
     get_partition_subsets,
 )
-from dagster_graphql.implementation.loader import StaleStatusLoader
+from dagster_graphql.implementation.loader import AssetStatusCacheLoader, StaleStatusLoader
 from dagster_graphql.schema import external
 from dagster_graphql.schema.asset_checks import (
     AssetChecksOrErrorUnion,
@@ -324,6 +324,7 @@ def __init__(
         remote_node: RemoteAssetNode,
         stale_status_loader: Optional[StaleStatusLoader] = None,
         dynamic_partitions_loader: Optional[CachingDynamicPartitionsLoader] = None,
+        asset_status_cache_loader: Optional[AssetStatusCacheLoader] = None,
         asset_graph_differ: Optional[AssetGraphDiffer] = None,
     ):
         from dagster_graphql.implementation.fetch_assets import get_unique_asset_id
@@ -343,6 +344,9 @@ def __init__(
         self._dynamic_partitions_loader = check.opt_inst_param(
             dynamic_partitions_loader, "dynamic_partitions_loader", CachingDynamicPartitionsLoader
         )
+        self._asset_status_cache_loader = check.opt_inst_param(
+            asset_status_cache_loader, "asset_status_cache_loader", AssetStatusCacheLoader
+        )
         self._asset_graph_differ = check.opt_inst_param(
             asset_graph_differ, "asset_graph_differ", AssetGraphDiffer
         )
@@ -456,9 +460,15 @@ def get_partition_keys(
                     MultiPartitionsSnap,
                 ),
             ):
-                if start_idx and end_idx and isinstance(partitions_snap, TimeWindowPartitionsSnap):
-                    return partitions_snap.get_partitions_definition().get_partition_keys_between_indexes(
-                        start_idx, end_idx
+                if (
+                    start_idx is not None
+                    and end_idx is not None
+                    and isinstance(partitions_snap, TimeWindowPartitionsSnap)
+                ):
+                    return list(
+                        partitions_snap.get_partitions_definition().iter_partition_keys(
+                            max(start_idx, 0), max(end_idx, 0)
+                        )
                     )
                 else:
                     return partitions_snap.get_partitions_definition().get_partition_keys(
@@ -1046,6 +1056,7 @@ def resolve_assetPartitionStatuses(
             asset_key,
             self._dynamic_partitions_loader,
             partitions_def,
+            self._asset_status_cache_loader,
         )
 
         return build_partition_statuses(
@@ -1080,6 +1091,7 @@ def resolve_partitionStats(
                     if self._asset_node_snap.partitions
                     else None
                 ),
+                self._asset_status_cache_loader,
             )
 
             if (
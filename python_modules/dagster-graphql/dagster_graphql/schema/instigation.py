@@ -33,6 +33,9 @@
 from dagster_graphql.implementation.fetch_ticks import get_instigation_ticks
 from dagster_graphql.implementation.loader import RepositoryScopedBatchLoader
 from dagster_graphql.implementation.utils import UserFacingGraphQLError
+from dagster_graphql.schema.asset_condition_evaluations import (
+    GrapheneAutomationConditionEvaluationProfile,
+)
 from dagster_graphql.schema.asset_key import GrapheneAssetKey
 from dagster_graphql.schema.errors import (
     GrapheneError,
@@ -251,6 +254,7 @@ class GrapheneInstigationTick(graphene.ObjectType):
     requestedAssetMaterializationCount = graphene.NonNull(graphene.Int)
     requestedMaterializationsForAssets = non_null_list(GrapheneRequestedMaterializationsForAsset)
     autoMaterializeAssetEvaluationId = graphene.Field(graphene.ID)
+    automationConditionProfile = graphene.Field(GrapheneAutomationConditionEvaluationProfile)
     instigationType = graphene.NonNull(GrapheneInstigationType)
 
     class Meta:
@@ -272,6 +276,11 @@ def __init__(self, tick: InstigatorTick):
             logKey=tick.log_key,
             endTimestamp=tick.end_timestamp,
             autoMaterializeAssetEvaluationId=tick.automation_condition_evaluation_id,
+            automationConditionProfile=GrapheneAutomationConditionEvaluationProfile(
+                tick.automation_condition_profile
+            )
+            if tick.automation_condition_profile
+            else None,
         )
 
     def resolve_id(self, _):
@@ -368,20 +368,27 @@ def __init__(
             mode=remote_partition_set.mode,
         )
 
-    def _get_partition_names(self, graphene_info: ResolveInfo) -> Sequence[str]:
-        if self._partition_names is None:
-            result = graphene_info.context.get_partition_names(
-                repository_handle=self._repository_handle,
-                job_name=self._remote_partition_set.job_name,
-                instance=graphene_info.context.instance,
-                selected_asset_keys=None,
-            )
-            if isinstance(result, PartitionExecutionErrorSnap):
-                raise DagsterUserCodeProcessError.from_error_info(result.error)
+    def _get_partition_names(
+        self, graphene_info: ResolveInfo, start_index: int = 0, end_index: Optional[int] = None
+    ) -> Sequence[str]:
+        if self._partition_names is not None:
+            return self._partition_names[start_index:end_index]
+
+        result = graphene_info.context.get_partition_names(
+            repository_handle=self._repository_handle,
+            job_name=self._remote_partition_set.job_name,
+            instance=graphene_info.context.instance,
+            selected_asset_keys=None,
+            start_index=start_index,
+            end_index=end_index,
+        )
+        if isinstance(result, PartitionExecutionErrorSnap):
+            raise DagsterUserCodeProcessError.from_error_info(result.error)
 
+        if start_index == 0 and end_index is None:
             self._partition_names = result.partition_names
 
-        return self._partition_names
+        return result.partition_names
 
     def resolve_id(self, _graphene_info: ResolveInfo):
         return self._remote_partition_set.get_remote_origin_id()
@@ -394,10 +401,16 @@ def resolve_partitionsOrError(
         limit: Optional[int] = None,
         reverse: Optional[bool] = None,
     ):
+        if not cursor and not reverse and limit:
+            # the first page of partitions only needs the names of the partitions in it
+            partition_names = self._get_partition_names(graphene_info, end_index=limit)
+        else:
+            partition_names = self._get_partition_names(graphene_info)
+
         return get_partitions(
             self._repository_handle,
             self._remote_partition_set,
-            self._get_partition_names(graphene_info),
+            partition_names,
             cursor=cursor,
             limit=limit,
             reverse=reverse or False,
@@ -5,7 +5,7 @@
 from dagster import AssetCheckKey
 from dagster._core.definitions.asset_graph_differ import AssetGraphDiffer
 from dagster._core.definitions.events import AssetKey
-from dagster._core.definitions.partition import CachingDynamicPartitionsLoader
+from dagster._core.definitions.partition import CachingDynamicPartitionsLoader, PartitionsDefinition
 from dagster._core.definitions.remote_asset_graph import RemoteAssetGraph
 from dagster._core.definitions.selector import (
     InstigatorSelector,
@@ -20,6 +20,7 @@
 from dagster._core.remote_representation.external import CompoundID
 from dagster._core.scheduler.instigation import InstigatorStatus, InstigatorType
 from dagster._core.storage.event_log.base import AssetRecord
+from dagster._core.storage.partition_status_cache import is_cacheable_partition_type
 from dagster._core.workspace.permissions import Permissions
 
 from dagster_graphql.implementation.execution.backfill import get_asset_backfill_preview
@@ -89,7 +90,7 @@
 from dagster_graphql.implementation.fetch_sensors import get_sensor_or_error, get_sensors_or_error
 from dagster_graphql.implementation.fetch_solids import get_graph_or_error
 from dagster_graphql.implementation.fetch_ticks import get_instigation_ticks
-from dagster_graphql.implementation.loader import StaleStatusLoader
+from dagster_graphql.implementation.loader import AssetStatusCacheLoader, StaleStatusLoader
 from dagster_graphql.implementation.run_config_schema import resolve_run_config_schema_or_error
 from dagster_graphql.implementation.utils import (
     UserFacingGraphQLError,
@@ -1091,6 +1092,22 @@ def load_asset_graph() -> RemoteAssetGraph:
             loading_context=graphene_info.context,
         )
 
+        def load_partitions_defs_by_key() -> Mapping[AssetKey, PartitionsDefinition]:
+            if not graphene_info.context.instance.can_read_asset_status_cache():
+                return {}
+            return {
+                node.key: node.partitions_def
+                for node in results
+                if node.partitions_def and is_cacheable_partition_type(node.partitions_def)
+            }
+
+        asset_status_cache_loader = AssetStatusCacheLoader(
+            instance=graphene_info.context.instance,
+            partitions_defs_by_key=load_partitions_defs_by_key,
+            dynamic_partitions_loader=dynamic_partitions_loader,
+            loading_context=graphene_info.context,
+        )
+
         base_deployment_context = graphene_info.context.get_base_deployment_context()
 
         nodes = [
@@ -1098,6 +1115,7 @@ def load_asset_graph() -> RemoteAssetGraph:
                 remote_node=remote_node,
                 stale_status_loader=stale_status_loader,
                 dynamic_partitions_loader=dynamic_partitions_loader,
+                asset_status_cache_loader=asset_status_cache_loader,
                 # base_deployment_context will be None if we are not in a branch deployment
                 asset_graph_differ=AssetGraphDiffer.from_remote_repositories(
                     code_location_name=remote_node.resolve_to_singular_repo_scoped_node().repository_handle.location_name,
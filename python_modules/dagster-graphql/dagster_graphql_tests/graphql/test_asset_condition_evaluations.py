@@ -62,7 +62,48 @@
 """
 
 
-def _create_tick(instance, status, timestamp, evaluation_id, run_requests=None, end_timestamp=None):
+TICK_PROFILE_QUERY = """
+query AssetDaemonTickProfileQuery {
+    autoMaterializeTicks {
+        id
+        automationConditionProfile {
+            numEvaluated
+            numSkipped
+            numMemoHits
+            numMemoMisses
+            nodeProfiles {
+                uniqueId
+                parentUniqueId
+                numEvaluations
+                numCacheHits
+                totalDuration
+                selfDuration
+                slowestAssetKey {
+                    path
+                }
+            }
+            slowestEntityProfiles {
+                assetKey {
+                    path
+                }
+                checkName
+                duration
+            }
+        }
+    }
+}
+"""
+
+
+def _create_tick(
+    instance,
+    status,
+    timestamp,
+    evaluation_id,
+    run_requests=None,
+    end_timestamp=None,
+    automation_condition_profile=None,
+):
     return instance.create_tick(
         TickData(
             instigator_origin_id=_PRE_SENSOR_AUTO_MATERIALIZE_ORIGIN_ID,
@@ -75,6 +116,7 @@ def _create_tick(instance, status, timestamp, evaluation_id, run_requests=None,
             run_ids=[],
             auto_materialize_evaluation_id=evaluation_id,
             run_requests=run_requests,
+            automation_condition_profile=automation_condition_profile,
         )
     )
 
@@ -204,6 +246,43 @@ def test_get_tick_range(self, graphql_context):
         assert len(ticks) == 1
         assert ticks[0]["timestamp"] == success_2.timestamp
 
+    def test_get_tick_automation_condition_profile(self, graphql_context):
+        @asset(automation_condition=AutomationCondition.eager())
+        def A() -> None: ...
+
+        profile = evaluate_automation_conditions(
+            defs=[A], instance=DagsterInstance.ephemeral()
+        ).profile
+        _create_tick(
+            graphql_context.instance,
+            TickStatus.SUCCESS,
+            get_current_datetime().timestamp(),
+            evaluation_id=1,
+            automation_condition_profile=profile,
+        )
+
+        result = execute_dagster_graphql(graphql_context, TICK_PROFILE_QUERY)
+        ticks = result.data["autoMaterializeTicks"]
+        assert len(ticks) == 1
+        graphql_profile = ticks[0]["automationConditionProfile"]
+        assert graphql_profile["numEvaluated"] == 1
+        assert graphql_profile["numSkipped"] == 0
+        assert graphql_profile["numMemoHits"] == profile.num_memo_hits
+        assert graphql_profile["numMemoMisses"] == profile.num_memo_misses
+        assert graphql_profile["slowestEntityProfiles"] == [
+            {"assetKey": {"path": ["A"]}, "checkName": None, "duration": entity_profile.duration}
+            for entity_profile in profile.slowest_entity_profiles
+        ]
+        assert len(graphql_profile["nodeProfiles"]) == len(profile.node_profiles)
+        root_node_profiles = [
+            node_profile
+            for node_profile in graphql_profile["nodeProfiles"]
+            if node_profile["parentUniqueId"] is None
+        ]
+        assert len(root_node_profiles) == 1
+        assert root_node_profiles[0]["numEvaluations"] == 1
+        assert root_node_profiles[0]["slowestAssetKey"] == {"path": ["A"]}
+
 
 FRAGMENTS = """
 fragment evaluationFields on AssetConditionEvaluation {
@@ -0,0 +1,366 @@
+# ruff: noqa: T201
+import argparse
+import sys
+from typing import Any, List, Mapping, Optional, Sequence
+
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    AssetOut,
+    Definitions,
+    DynamicOut,
+    DynamicOutput,
+    JobDefinition,
+    Output,
+    define_asset_job,
+    job,
+    multi_asset,
+    op,
+)
+from dagster._core.definitions.assets import AssetsDefinition
+from dagster._core.definitions.reconstruct import build_reconstructable_job
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.execution.api import create_execution_plan, execute_job
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.instance import DagsterInstance
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.system_config.objects import ResolvedRunConfig
+from dagster._core.utils import make_new_run_id
+from dagster._time import get_current_timestamp
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+SHAPES = ["wide", "deep", "dynamic", "multi_asset"]
+
+DESC = f"""
+Analyze execution time when building execution plans for and executing synthetic jobs, and the rate
+at which events are written to a SQLite event log. Jobs are generated in one of these shapes, with
+`--num-ops` ops (or steps, for `dynamic`):
+
+    - wide: a root op fanning out to N ops, which fan back in to a single op
+    - deep: a chain of N ops
+    - dynamic: an op yielding N dynamic outputs, mapped over an op and collected
+    - multi_asset: N assets produced by multi-assets of 10 assets each, each depending on the last
+
+For each shape, the benchmark times `ExecutionPlan.build`, `create_execution_plan`,
+`execute_in_process` and execution with the multiprocess executor. Execution time is logged for each
+step, along with the number of steps or events processed per second.
+
+Pass `--json-output` to write the results as JSON (to a file, or to stdout with `-`) so that they
+can be compared across versions.
+
+Shapes: {", ".join(SHAPES)}
+"""
+
+parser = argparse.ArgumentParser(
+    prog="execution",
+    description=DESC,
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+)
+
+parser.add_argument(
+    "--shape",
+    choices=SHAPES,
+    action="append",
+    help="Set the shape of the benchmark job. Can be repeated. Defaults to all shapes.",
+)
+
+parser.add_argument(
+    "--num-ops",
+    type=int,
+    default=500,
+    help="Set the number of ops in each benchmark job.",
+)
+
+parser.add_argument(
+    "--multiprocess",
+    action=argparse.BooleanOptionalAction,
+    default=True,
+    help="Execute each benchmark job with the multiprocess executor.",
+)
+
+parser.add_argument(
+    "--max-concurrent",
+    type=int,
+    default=4,
+    help="Set `max_concurrent` for the multiprocess executor.",
+)
+
+parser.add_argument(
+    "--reuse-processes",
+    action=argparse.BooleanOptionalAction,
+    default=False,
+    help="Set `reuse_processes` for the multiprocess executor.",
+)
+
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=5000,
+    help="Set the number of events written to the event log.",
+)
+
+parser.add_argument(
+    "--event-batch-size",
+    type=int,
+    default=100,
+    help="Set the number of events per batch when writing event batches to the event log.",
+)
+
+parser.add_argument(
+    "--json-output",
+    type=str,
+    default=None,
+    help="Write the results as JSON to this path, or to stdout if `-`.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+@op
+def emit() -> int:
+    return 1
+
+
+@op
+def add_one(num: int) -> int:
+    return num + 1
+
+
+@op
+def total(nums: List[int]) -> int:
+    return sum(nums)
+
+
+def build_wide_job(num_ops: int) -> JobDefinition:
+    @job(name="wide")
+    def _job():
+        root = emit()
+        total([add_one.alias(f"add_one_{i}")(root) for i in range(num_ops)])
+
+    return _job
+
+
+def build_deep_job(num_ops: int) -> JobDefinition:
+    @job(name="deep")
+    def _job():
+        num = emit()
+        for i in range(num_ops):
+            num = add_one.alias(f"add_one_{i}")(num)
+
+    return _job
+
+
+def build_dynamic_job(num_ops: int) -> JobDefinition:
+    @op(out=DynamicOut(int))
+    def fan_out():
+        for i in range(num_ops):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @job(name="dynamic")
+    def _job():
+        total(fan_out().map(add_one).collect())
+
+    return _job
+
+
+def build_multi_asset(index: int, names: Sequence[str]) -> AssetsDefinition:
+    @multi_asset(
+        name=f"multi_asset_{index}",
+        outs={name: AssetOut() for name in names},
+        deps=[AssetKey(f"asset_{index - 1}")] if index > 0 else [],
+    )
+    def _multi_asset():
+        for name in names:
+            yield Output(None, output_name=name)
+
+    return _multi_asset
+
+
+def build_multi_assets(
+    num_assets: int, assets_per_multi_asset: int = 10
+) -> Sequence[AssetsDefinition]:
+    return [
+        build_multi_asset(
+            i, [f"asset_{j}" for j in range(i, min(i + assets_per_multi_asset, num_assets))]
+        )
+        for i in range(0, num_assets, assets_per_multi_asset)
+    ]
+
+
+def build_multi_asset_job(num_ops: int) -> JobDefinition:
+    defs = Definitions(
+        assets=build_multi_assets(num_ops),
+        jobs=[define_asset_job("multi_asset")],
+    )
+    return defs.get_job_def("multi_asset")
+
+
+def build_job(shape: str, num_ops: int) -> JobDefinition:
+    builders = {
+        "wide": build_wide_job,
+        "deep": build_deep_job,
+        "dynamic": build_dynamic_job,
+        "multi_asset": build_multi_asset_job,
+    }
+    return builders[shape](num_ops)
+
+
+def get_multiprocess_run_config(max_concurrent: int, reuse_processes: bool) -> Mapping[str, Any]:
+    config: dict = {"max_concurrent": max_concurrent}
+    if reuse_processes:
+        config["reuse_processes"] = {}
+    return {"execution": {"config": {"multiprocess": config}}}
+
+
+def get_event_log_entries(run_id: str, num_events: int) -> Sequence[EventLogEntry]:
+    return [
+        EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id=run_id,
+            timestamp=get_current_timestamp(),
+            step_key="my_step",
+            job_name="my_job",
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION.value,
+                "my_job",
+                event_specific_data=StepMaterializationData(
+                    AssetMaterialization(
+                        asset_key=AssetKey(["my_prefix", f"asset_{i % 100}"]),
+                        metadata={"row_count": i},
+                    )
+                ),
+            ),
+        )
+        for i in range(num_events)
+    ]
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def benchmark_job(
+    session: ProfilingSession,
+    instance: DagsterInstance,
+    shape: str,
+    num_ops: int,
+    multiprocess: bool,
+    max_concurrent: int,
+    reuse_processes: bool,
+) -> None:
+    with session.logged_execution_time(f"{shape}: Build job"):
+        job_def = build_job(shape, num_ops)
+
+    with session.logged_execution_time(f"{shape}: ExecutionPlan.build"):
+        plan = ExecutionPlan.build(job_def, ResolvedRunConfig.build(job_def, {}))
+
+    num_steps = len(plan.step_keys_to_execute)
+    with session.logged_execution_time(f"{shape}: create_execution_plan", num_items=num_steps):
+        create_execution_plan(job_def)
+
+    # the mapped step of the dynamic job is only resolved into `num_ops` steps during execution
+    if shape == "dynamic":
+        num_steps += num_ops - 1
+
+    with session.logged_execution_time(f"{shape}: execute_in_process", num_items=num_steps):
+        result = job_def.execute_in_process(instance=instance)
+    assert result.success
+
+    if multiprocess:
+        recon_job = build_reconstructable_job(
+            "dagster_test.benchmarks.execution", "build_job", (shape, num_ops)
+        )
+        with session.logged_execution_time(f"{shape}: Multiprocess executor", num_items=num_steps):
+            with execute_job(
+                recon_job,
+                instance=instance,
+                run_config=get_multiprocess_run_config(max_concurrent, reuse_processes),
+            ) as result:
+                assert result.success
+
+
+def benchmark_event_log(
+    session: ProfilingSession, instance: DagsterInstance, num_events: int, batch_size: int
+) -> None:
+    events = get_event_log_entries(make_new_run_id(), num_events)
+    with session.logged_execution_time("Store events", num_items=num_events):
+        for event in events:
+            instance.event_log_storage.store_event(event)
+
+    events = get_event_log_entries(make_new_run_id(), num_events)
+    with session.logged_execution_time(
+        f"Store events in batches of {batch_size}", num_items=num_events
+    ):
+        for i in range(0, num_events, batch_size):
+            instance.event_log_storage.store_event_batch(events[i : i + batch_size])
+
+    with session.logged_execution_time("Read events", num_items=num_events):
+        records = instance.event_log_storage.get_records_for_run(
+            events[0].run_id, limit=num_events
+        ).records
+    assert len(records) == num_events
+
+
+def main(
+    shapes: Sequence[str],
+    num_ops: int,
+    multiprocess: bool,
+    max_concurrent: int,
+    reuse_processes: bool,
+    num_events: int,
+    event_batch_size: int,
+    json_output: Optional[str],
+) -> None:
+    session = ProfilingSession(
+        # keep stdout clean for the results if they are written there
+        output=sys.stderr if json_output == "-" else sys.stdout,
+        name="Execution",
+        experiment_settings={
+            "shapes": ",".join(shapes),
+            "num_ops": num_ops,
+            "multiprocess": multiprocess,
+            "max_concurrent": max_concurrent,
+            "reuse_processes": reuse_processes,
+            "num_events": num_events,
+            "event_batch_size": event_batch_size,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    with instance_for_test() as instance:
+        for shape in shapes:
+            benchmark_job(
+                session, instance, shape, num_ops, multiprocess, max_concurrent, reuse_processes
+            )
+
+        benchmark_event_log(session, instance, num_events, event_batch_size)
+
+    session.log_result_summary()
+
+    if json_output == "-":
+        session.write_json(sys.stdout)
+    elif json_output:
+        with open(json_output, "w") as f:
+            session.write_json(f)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(
+        args.shape or SHAPES,
+        args.num_ops,
+        args.multiprocess,
+        args.max_concurrent,
+        args.reuse_processes,
+        args.num_events,
+        args.event_batch_size,
+        args.json_output,
+    )
@@ -0,0 +1,159 @@
+# ruff: noqa: T201
+import argparse
+from datetime import datetime, timedelta
+from typing import Sequence, Tuple
+
+from dagster import (
+    DailyPartitionsDefinition,
+    HourlyPartitionsDefinition,
+    TimeWindowPartitionMapping,
+    TimeWindowPartitionsDefinition,
+    WeeklyPartitionsDefinition,
+)
+from dagster._core.definitions.partition import PartitionsSubset
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+PAIRS = ["daily_to_daily", "daily_to_hourly", "hourly_to_daily", "weekly_to_daily"]
+
+DESC = f"""
+Analyze execution time when mapping time window partitions subsets between assets with
+TimeWindowPartitionMapping, as automation ticks do for every edge of the asset graph. Each pair of
+partitions definitions is built with a start date `--num-days` days before the current time, and
+the downstream subset consists of `--num-windows` disjoint ranges of partitions, so that the cost
+of the mapping can be compared across partition counts.
+
+For each pair, the benchmark times mapping the subset upstream and the upstream subset back
+downstream, with `start_offset=-1` and with no offsets, `--iterations` times each.
+
+Pairs (downstream_to_upstream): {", ".join(PAIRS)}
+"""
+
+parser = argparse.ArgumentParser(
+    prog="partition_mapping",
+    description=DESC,
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+)
+
+parser.add_argument(
+    "--pair",
+    choices=PAIRS,
+    action="append",
+    help="Set the pair of partitions definitions to map between. Can be repeated. Defaults to all.",
+)
+
+parser.add_argument(
+    "--num-days",
+    type=int,
+    action="append",
+    help=(
+        "Set the number of days covered by the partitions definitions. Can be repeated. Defaults"
+        " to 365 and 3650."
+    ),
+)
+
+parser.add_argument(
+    "--num-windows",
+    type=int,
+    default=20,
+    help="Set the number of disjoint ranges of partitions in the mapped subset.",
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=10,
+    help="Set the number of times each subset is mapped.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def build_partitions_defs(
+    pair: str, start: datetime
+) -> Tuple[TimeWindowPartitionsDefinition, TimeWindowPartitionsDefinition]:
+    daily = DailyPartitionsDefinition(start_date=start)
+    hourly = HourlyPartitionsDefinition(start_date=start)
+    weekly = WeeklyPartitionsDefinition(start_date=start)
+    return {
+        "daily_to_daily": (daily, daily),
+        "daily_to_hourly": (daily, hourly),
+        "hourly_to_daily": (hourly, daily),
+        "weekly_to_daily": (weekly, daily),
+    }[pair]
+
+
+def build_subset(
+    partitions_def: TimeWindowPartitionsDefinition, current_time: datetime, num_windows: int
+) -> PartitionsSubset:
+    # num_windows evenly spaced ranges of partitions, each a tenth of the space between them
+    partition_keys = partitions_def.get_partition_keys(current_time=current_time)
+    step = max(len(partition_keys) // num_windows, 1)
+    width = max(step // 10, 1)
+    return partitions_def.empty_subset().with_partition_keys(
+        partition_key
+        for range_start in range(0, step * num_windows, step)
+        for partition_key in partition_keys[range_start : range_start + width]
+    )
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(
+    pairs: Sequence[str], num_days_list: Sequence[int], num_windows: int, iterations: int
+) -> None:
+    session = ProfilingSession(
+        name="Partition mapping",
+        experiment_settings={
+            "pairs": ", ".join(pairs),
+            "num_days": ", ".join(str(num_days) for num_days in num_days_list),
+            "num_windows": num_windows,
+            "iterations": iterations,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    current_time = datetime(2024, 1, 1)
+    for pair in pairs:
+        for num_days in num_days_list:
+            downstream_def, upstream_def = build_partitions_defs(
+                pair, current_time - timedelta(days=num_days)
+            )
+            subset = build_subset(downstream_def, current_time, num_windows)
+            num_partitions = downstream_def.get_num_partitions(current_time=current_time)
+
+            for mapping in [
+                TimeWindowPartitionMapping(start_offset=-1),
+                TimeWindowPartitionMapping(),
+            ]:
+                label = f"{pair}, {num_partitions} partitions, start_offset={mapping.start_offset}"
+                with session.logged_execution_time(
+                    f"Map upstream ({label}) x{iterations}", num_items=iterations
+                ):
+                    for _ in range(iterations):
+                        upstream_subset = (
+                            mapping.get_upstream_mapped_partitions_result_for_partitions(
+                                subset, downstream_def, upstream_def, current_time=current_time
+                            ).partitions_subset
+                        )
+
+                with session.logged_execution_time(
+                    f"Map downstream ({label}) x{iterations}", num_items=iterations
+                ):
+                    for _ in range(iterations):
+                        mapping.get_downstream_partitions_for_partitions(
+                            upstream_subset, upstream_def, downstream_def, current_time=current_time
+                        )
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.pair or PAIRS, args.num_days or [365, 3650], args.num_windows, args.iterations)
@@ -0,0 +1,166 @@
+# ruff: noqa: T201
+import argparse
+from typing import Sequence
+
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    AutomationCondition,
+    DagsterInstance,
+    DailyPartitionsDefinition,
+    Definitions,
+    asset,
+    define_asset_job,
+    evaluate_automation_conditions,
+)
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.assets import AssetsDefinition
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.remote_representation.external_data import RepositorySnap
+from dagster._serdes import deserialize_value, serialize_value
+from dagster._time import get_current_timestamp
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze execution time when serializing and deserializing the serdes objects that dominate storage
+reads, gRPC responses and cursor loads:
+
+    - `EventLogEntry` objects wrapping asset materializations, as read from the event log
+    - `ExternalRepositoryData` (`RepositorySnap`) for a repository with a chain of partitioned assets
+    - `AssetDaemonCursor` produced by evaluating the automation conditions of those assets
+
+Each object is serialized and then deserialized `--iterations` times. Execution time is logged for
+each step.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=200,
+    help="Set the number of assets in the benchmark repository and automation cursor.",
+)
+
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=5000,
+    help="Set the number of event log entries to serialize and deserialize.",
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=10,
+    help="Set the number of times each object is serialized and deserialized.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_assets(num_assets: int) -> Sequence[AssetsDefinition]:
+    partitions_def = DailyPartitionsDefinition(start_date="2023-01-01")
+    assets = []
+    for i in range(num_assets):
+
+        @asset(
+            name=f"asset_{i}",
+            deps=[f"asset_{i - 1}"] if i > 0 else [],
+            partitions_def=partitions_def,
+            automation_condition=AutomationCondition.eager(),
+            metadata={"index": i, "owner": "benchmarks"},
+        )
+        def _asset() -> None: ...
+
+        assets.append(_asset)
+    return assets
+
+
+def get_event_log_entries(num_events: int) -> Sequence[EventLogEntry]:
+    return [
+        EventLogEntry(
+            error_info=None,
+            level="debug",
+            user_message="",
+            run_id="a0b1c2d3-e4f5-a6b7-c8d9-e0f1a2b3c4d5",
+            timestamp=get_current_timestamp(),
+            step_key="my_step",
+            job_name="my_job",
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION.value,
+                "my_job",
+                event_specific_data=StepMaterializationData(
+                    AssetMaterialization(
+                        asset_key=AssetKey(["my_prefix", f"asset_{i % 100}"]),
+                        partition=str(i),
+                        metadata={"row_count": i, "path": f"/tmp/asset_{i}"},
+                    )
+                ),
+            ),
+        )
+        for i in range(num_events)
+    ]
+
+
+def get_repository_snap(assets: Sequence[AssetsDefinition]) -> RepositorySnap:
+    defs = Definitions(assets=assets, jobs=[define_asset_job("all_assets")])
+    return RepositorySnap.from_def(defs.get_repository_def())
+
+
+def get_asset_daemon_cursor(assets: Sequence[AssetsDefinition]) -> AssetDaemonCursor:
+    with DagsterInstance.ephemeral() as instance:
+        return evaluate_automation_conditions(defs=assets, instance=instance).cursor
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, num_events: int, iterations: int) -> None:
+    session = ProfilingSession(
+        name="Serdes",
+        experiment_settings={
+            "num_assets": num_assets,
+            "num_events": num_events,
+            "iterations": iterations,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Build benchmark objects"):
+        assets = get_assets(num_assets)
+        objects = {
+            "EventLogEntry": get_event_log_entries(num_events),
+            "ExternalRepositoryData": get_repository_snap(assets),
+            "AssetDaemonCursor": get_asset_daemon_cursor(assets),
+        }
+
+    deserialized_objects = {}
+    for name, obj in objects.items():
+        with session.logged_execution_time(f"Serialize {name} x{iterations}"):
+            for _ in range(iterations):
+                serialized = serialize_value(obj)
+
+        with session.logged_execution_time(f"Deserialize {name} x{iterations}"):
+            for _ in range(iterations):
+                deserialized_objects[name] = deserialize_value(serialized)
+
+    session.log_result_summary()
+
+    for name, obj in objects.items():
+        assert serialize_value(deserialized_objects[name]) == serialize_value(obj)
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.num_events, args.iterations)
@@ -1,3 +1,5 @@
+import json
+import platform
 import sys
 import time
 from contextlib import contextmanager
@@ -13,6 +15,14 @@
 class ProfilingEntry:
     name: str
     time: float
+    duration: float = 0.0
+    num_items: Optional[int] = None
+
+    @property
+    def items_per_second(self) -> Optional[float]:
+        if self.num_items is None or self.duration <= 0:
+            return None
+        return self.num_items / self.duration
 
 
 class ProfilingSession:
@@ -24,7 +34,7 @@ def __init__(
         experiment_settings: Optional[Mapping[str, Any]] = None,
     ):
         self.entries: List[ProfilingEntry] = []
-        self.output = Console()
+        self.output = Console(file=output)
         self.name = name or "anonymous"
         self.experiment_settings = experiment_settings
 
@@ -40,9 +50,14 @@ def log_start_message(self) -> None:
         self._log_blank_line()
 
     @contextmanager
-    def logged_execution_time(self, name: str) -> Iterator[None]:
+    def logged_execution_time(self, name: str, num_items: Optional[int] = None) -> Iterator[None]:
+        """Time the wrapped block. If `num_items` is set, the throughput of the step in items per
+        second is reported as well.
+        """
+        start = time.time()
         yield
-        self.entries.append(ProfilingEntry(name, time.time()))
+        end = time.time()
+        self.entries.append(ProfilingEntry(name, end, end - start, num_items))
         self._log_step(-1)
 
     def log_result_summary(self):
@@ -52,6 +67,35 @@ def log_result_summary(self):
             self._log_blank_line()
         self._log_result_table()
 
+    def get_results(self) -> Mapping[str, Any]:
+        """Machine-readable results of the session, for comparing runs across versions."""
+        from dagster.version import __version__ as dagster_version
+
+        return {
+            "name": self.name,
+            "experiment_settings": dict(self.experiment_settings or {}),
+            "environment": {
+                "dagster_version": dagster_version,
+                "python_version": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "start_time": self.entries[0].time if self.entries else None,
+            "steps": [
+                {
+                    "index": i,
+                    "name": entry.name,
+                    "duration": entry.duration,
+                    "num_items": entry.num_items,
+                    "items_per_second": entry.items_per_second,
+                }
+                for i, entry in enumerate(self.entries[1:])
+            ],
+        }
+
+    def write_json(self, output: TextIO) -> None:
+        json.dump(self.get_results(), output, indent=2)
+        output.write("\n")
+
     # ########################
     # ##### PRIVATE
     # ########################
@@ -60,8 +104,9 @@ def _log_step(self, index: int) -> None:
         index = index if index >= 0 else len(self.entries) + index
         entry = self.entries[index]
         label = f"Execution time for step {index} ({entry.name}):"
-        time_elapsed = entry.time - self.entries[index - 1].time
-        message = f"{label} {time_elapsed:.4f} seconds"
+        message = f"{label} {entry.duration:.4f} seconds"
+        if entry.items_per_second is not None:
+            message += f" ({entry.items_per_second:.1f} items/second)"
         self.output.print(message)
 
     def _log_header(self, header: str) -> None:
@@ -96,6 +141,13 @@ def _get_result_table(self) -> Table:
         table.add_column("Index", justify="right")
         table.add_column("Step", justify="right")
         table.add_column("Time", justify="right")
+        table.add_column("Items/second", justify="right")
         for i, entry in enumerate(self.entries[1:]):
-            table.add_row(str(i), entry.name, f"{entry.time - self.entries[i].time:.4f}")
+            rate = entry.items_per_second
+            table.add_row(
+                str(i),
+                entry.name,
+                f"{entry.duration:.4f}",
+                f"{rate:.1f}" if rate is not None else "",
+            )
         return table
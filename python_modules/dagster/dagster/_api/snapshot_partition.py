@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Optional, Sequence
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
@@ -23,6 +23,8 @@ def sync_get_external_partition_names_grpc(
     api_client: "DagsterGrpcClient",
     repository_handle: RepositoryHandle,
     job_name: str,
+    start_index: int = 0,
+    end_index: Optional[int] = None,
 ) -> PartitionNamesSnap:
     from dagster._grpc.client import DagsterGrpcClient
 
@@ -36,6 +38,8 @@ def sync_get_external_partition_names_grpc(
                 repository_origin=repository_origin,
                 job_name=job_name,
                 partition_set_name=partition_set_snap_name_for_job_name(job_name),
+                start_index=start_index,
+                end_index=end_index,
             ),
         ),
         (PartitionNamesSnap, PartitionExecutionErrorSnap),
@@ -43,6 +47,13 @@ def sync_get_external_partition_names_grpc(
     if isinstance(result, PartitionExecutionErrorSnap):
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
+    if result.start_index is None:
+        # servers from before partition name ranges were supported return all the names
+        return PartitionNamesSnap(
+            partition_names=result.partition_names[start_index:end_index],
+            start_index=start_index,
+        )
+
     return result
 
 
@@ -19,11 +19,11 @@
 from dagster._core.definitions.asset_key import AssetCheckKey, AssetKey, EntityKey, T_EntityKey
 from dagster._core.definitions.events import AssetKeyPartitionKey
 from dagster._core.definitions.multi_dimensional_partitions import (
-    MultiPartitionKey,
     MultiPartitionsDefinition,
+    MultiPartitionsSubset,
     PartitionDimensionDefinition,
 )
-from dagster._core.definitions.partition import AllPartitionsSubset
+from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
 from dagster._core.definitions.time_window_partitions import (
     TimeWindow,
     TimeWindowPartitionsDefinition,
@@ -195,14 +195,21 @@ def get_subset_from_serializable_subset(
         self, serializable_subset: SerializableEntitySubset[T_EntityKey]
     ) -> Optional[EntitySubset[T_EntityKey]]:
         key = serializable_subset.key
-        if self.asset_graph.has(key) and serializable_subset.is_compatible_with_partitions_def(
-            self._get_partitions_def(key)
+        if not self.asset_graph.has(key):
+            return None
+        partitions_def = self._get_partitions_def(key)
+        if not serializable_subset.is_compatible_with_partitions_def(partitions_def):
+            return None
+
+        value = serializable_subset.value
+        if isinstance(partitions_def, MultiPartitionsDefinition) and isinstance(
+            value, DefaultPartitionsSubset
         ):
-            return EntitySubset(
-                self, key=key, value=_ValidatedEntitySubsetValue(serializable_subset.value)
+            # multi-partitioned subsets are serialized as the set of multi-partition keys
+            value = MultiPartitionsSubset.empty_subset(partitions_def).with_partition_keys(
+                value.get_partition_keys()
             )
-        else:
-            return None
+        return EntitySubset(self, key=key, value=_ValidatedEntitySubsetValue(value))
 
     def legacy_get_asset_subset_from_valid_subset(
         self, subset: "ValidAssetSubset"
@@ -685,31 +692,20 @@ def _build_time_partition_subset(
     def _build_multi_partition_subset(
         self, asset_key: AssetKey, multi_dim_info: MultiDimInfo, time_window: TimeWindow
     ) -> EntitySubset[AssetKey]:
-        # Note: Potential perf improvement here. There is no way to encode a cartesian product
-        # in the underlying PartitionsSet. We could add a specialized PartitionsSubset
-        # subclass that itself composed two PartitionsSubset to avoid materializing the entire
-        # partitions range.
-        return self.get_asset_subset_from_asset_partitions(
-            asset_key,
-            {
-                AssetKeyPartitionKey(
-                    asset_key,
-                    MultiPartitionKey(
-                        {
-                            multi_dim_info.tw_dim.name: tw_pk,
-                            multi_dim_info.secondary_dim.name: secondary_pk,
-                        }
-                    ),
-                )
-                for tw_pk in multi_dim_info.tw_partition_def.get_partition_keys_in_time_window(
-                    time_window
-                )
-                for secondary_pk in multi_dim_info.secondary_partition_def.get_partition_keys(
-                    current_time=self.effective_dt,
-                    dynamic_partitions_store=self._queryer,
-                )
-            },
+        # the subset is stored as the cross product of the time window with all keys of the
+        # secondary dimension, rather than as the full set of multi-partition keys
+        partitions_def = check.inst(self._get_partitions_def(asset_key), MultiPartitionsDefinition)
+        tw_partitions_def = multi_dim_info.tw_partition_def
+        value = MultiPartitionsSubset.empty_subset(partitions_def).with_cross_product(
+            tw_partitions_def.empty_subset().with_partition_keys(
+                tw_partitions_def.get_partition_keys_in_time_window(time_window)
+            ),
+            multi_dim_info.secondary_partition_def.get_partition_keys(
+                current_time=self.effective_dt,
+                dynamic_partitions_store=self._queryer,
+            ),
         )
+        return EntitySubset(self, key=asset_key, value=_ValidatedEntitySubsetValue(value))
 
 
 I_Dispatch = TypeVar("I_Dispatch")
@@ -4,6 +4,7 @@
 import dagster._check as check
 from dagster._core.definitions.asset_key import T_EntityKey
 from dagster._core.definitions.events import AssetKeyPartitionKey
+from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
 from dagster._core.definitions.partition import (
     AllPartitionsSubset,
     PartitionsDefinition,
@@ -72,7 +73,10 @@ def is_compatible_with_partitions_def(
         if self.is_partitioned:
             # for some PartitionSubset types, we have access to the underlying partitions
             # definitions, so we can ensure those are identical
-            if isinstance(self.value, (TimeWindowPartitionsSubset, AllPartitionsSubset)):
+            if isinstance(
+                self.value,
+                (TimeWindowPartitionsSubset, AllPartitionsSubset, MultiPartitionsSubset),
+            ):
                 return self.value.partitions_def == partitions_def
             else:
                 return partitions_def is not None
@@ -35,6 +35,7 @@
 )
 from dagster._core.definitions.declarative_automation.serialized_objects import (
     AutomationConditionEvaluation,
+    AutomationConditionEvaluationProfile,
 )
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.definitions.partition import PartitionsDefinition
@@ -100,6 +101,10 @@ def asset_graph(self) -> BaseAssetGraph:
     def total_keys(self) -> int:
         return self._total_keys
 
+    @property
+    def profile(self) -> AutomationConditionEvaluationProfile:
+        return self._evaluator.profile
+
     def _legacy_build_auto_observe_run_requests(self) -> Sequence[RunRequest]:
         current_timestamp = self._evaluator.evaluation_time.timestamp()
         assets_to_auto_observe: Set[AssetKey] = set()
@@ -344,19 +344,18 @@ def _calculate_data_time_by_key(
 
     @cached_method
     def _get_in_progress_run_ids(self, current_time: datetime.datetime) -> Sequence[str]:
-        return [
-            record.dagster_run.run_id
-            for record in self.instance_queryer.instance.get_run_records(
-                filters=RunsFilter(
-                    statuses=[
-                        status for status in DagsterRunStatus if status not in FINISHED_STATUSES
-                    ],
-                    # ignore old runs that may be stuck in an unfinished state
-                    created_after=current_time - datetime.timedelta(days=1),
-                ),
-                limit=25,
-            )
-        ]
+        run_records = self.instance_queryer.instance.get_run_records(
+            filters=RunsFilter(
+                statuses=[status for status in DagsterRunStatus if status not in FINISHED_STATUSES],
+                # ignore old runs that may be stuck in an unfinished state
+                created_after=current_time - datetime.timedelta(days=1),
+            ),
+            limit=25,
+        )
+        self.instance_queryer.prime_run_records(run_records)
+        run_ids = [record.dagster_run.run_id for record in run_records]
+        self.instance_queryer.prefetch_planned_materializations_for_runs(run_ids)
+        return run_ids
 
     @cached_method
     def _get_in_progress_data_time_in_run(
@@ -668,7 +668,14 @@ def __init__(
         # hidden_param which should only be set by builtin conditions which require high performance
         # in their serdes layer
         structured_cursor = kwargs.get("structured_cursor")
-        invalid_hidden_params = set(kwargs.keys()) - {"subsets_with_metadata", "structured_cursor"}
+        # hidden_param which should only be set by builtin conditions whose subset was reused from
+        # an identical evaluation on the same tick
+        self._memoized = check.opt_bool_param(kwargs.get("memoized"), "memoized", default=False)
+        invalid_hidden_params = set(kwargs.keys()) - {
+            "subsets_with_metadata",
+            "structured_cursor",
+            "memoized",
+        }
         check.param_invariant(
             not invalid_hidden_params, "kwargs", f"Invalid hidden params: {invalid_hidden_params}"
         )
@@ -681,6 +688,8 @@ def __init__(
 
         # used to enable the evaluator class to modify the evaluation in some edge cases
         self._serializable_subset_override: Optional[SerializableEntitySubset] = None
+        # used to enable the evaluator class to skip the next evaluation if its inputs are unchanged
+        self._input_hash: Optional[str] = None
 
     @property
     def key(self) -> T_EntityKey:
@@ -702,6 +711,13 @@ def end_timestamp(self) -> float:
     def child_results(self) -> Sequence["AutomationResult"]:
         return self._child_results
 
+    @property
+    def is_memoized(self) -> bool:
+        """Whether the true subset of this result was reused from an identical evaluation on the
+        same tick rather than being computed.
+        """
+        return self._memoized
+
     @property
     def condition(self) -> AutomationCondition:
         return self._context.condition
@@ -763,6 +779,12 @@ def set_internal_serializable_subset_override(self, override: SerializableEntity
         """
         self._serializable_subset_override = override
 
+    def set_internal_input_hash(self, input_hash: Optional[str]) -> None:
+        """Internal method for recording the hash of the inputs to this evaluation on its cursor,
+        which allows the next evaluation to be skipped if these inputs do not change.
+        """
+        self._input_hash = input_hash
+
     def get_child_node_cursors(self) -> Mapping[str, AutomationConditionNodeCursor]:
         node_cursors = {self.condition_unique_id: self.node_cursor} if self.node_cursor else {}
         for child_result in self._child_results:
@@ -776,6 +798,7 @@ def get_new_cursor(self) -> AutomationConditionCursor:
             last_event_id=self._context.max_storage_id,
             node_cursors_by_unique_id=self.get_child_node_cursors(),
             result_value_hash=self.value_hash,
+            input_hash=self._input_hash,
         )
 
     def get_serializable_subset(self) -> SerializableEntitySubset:
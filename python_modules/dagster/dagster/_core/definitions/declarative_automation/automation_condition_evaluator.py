@@ -1,11 +1,27 @@
 import asyncio
+import dataclasses
 import datetime
 import logging
+import multiprocessing
 from collections import defaultdict
-from typing import TYPE_CHECKING, AbstractSet, Dict, Mapping, Optional, Sequence, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
+import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
 from dagster._core.asset_graph_view.entity_subset import EntitySubset
+from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
 from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
 from dagster._core.definitions.asset_key import EntityKey
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph, BaseAssetNode
@@ -14,12 +30,29 @@
     AutomationCondition,
     AutomationResult,
 )
+from dagster._core.definitions.declarative_automation.automation_condition_input_hasher import (
+    AutomationConditionInputHasher,
+)
+from dagster._core.definitions.declarative_automation.automation_condition_memo import (
+    AutomationConditionMemo,
+)
+from dagster._core.definitions.declarative_automation.automation_condition_profiler import (
+    AutomationConditionProfiler,
+)
 from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
+    AutomationConditionEvaluation,
+    AutomationConditionEvaluationProfile,
+)
 from dagster._core.definitions.events import AssetKey
-from dagster._core.instance import DagsterInstance
-from dagster._time import get_current_datetime
+from dagster._core.instance import DagsterInstance, InstanceRef
+from dagster._serdes import deserialize_value, serialize_value
+from dagster._time import datetime_from_timestamp, get_current_datetime, get_current_timestamp
 
 if TYPE_CHECKING:
+    from dagster._core.definitions.remote_asset_graph import RemoteAssetGraph
+    from dagster._core.storage.event_log.base import AssetRecord
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 
@@ -35,10 +68,12 @@ def __init__(
         default_condition: Optional[AutomationCondition] = None,
         evaluation_time: Optional[datetime.datetime] = None,
         logger: logging.Logger = logging.getLogger("dagster.automation"),
+        temporal_context: Optional[TemporalContext] = None,
     ):
         self.entity_keys = entity_keys
         self.asset_graph_view = AssetGraphView(
-            temporal_context=TemporalContext(
+            temporal_context=temporal_context
+            or TemporalContext(
                 effective_dt=evaluation_time or get_current_datetime(),
                 last_event_id=instance.event_log_storage.get_maximum_record_id(),
             ),
@@ -67,6 +102,15 @@ def __init__(
 
         self.request_subsets_by_key: Dict[EntityKey, EntitySubset] = {}
 
+        self.input_hasher = (
+            AutomationConditionInputHasher(self)
+            if _instance.auto_materialize_skip_unchanged_entities
+            else None
+        )
+        self.memo = AutomationConditionMemo()
+        self.profiler = AutomationConditionProfiler()
+        self._evaluation_duration = 0.0
+
     @property
     def instance_queryer(self) -> "CachingInstanceQueryer":
         return self.asset_graph_view.get_inner_queryer_for_back_compat()
@@ -101,6 +145,8 @@ def prefetch(self) -> None:
         )
         self.instance_queryer.prefetch_asset_records(self.asset_records_to_prefetch)
         self.logger.info("Done prefetching asset records.")
+        self.instance_queryer.prefetch_asset_status_cache_values(self.asset_records_to_prefetch)
+        self.logger.info("Done prefetching asset status cache values.")
 
     def evaluate(self) -> Tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
         return asyncio.run(self.async_evaluate())
@@ -108,9 +154,33 @@ def evaluate(self) -> Tuple[Sequence[AutomationResult], Sequence[EntitySubset[En
     async def async_evaluate(
         self,
     ) -> Tuple[Sequence[AutomationResult], Sequence[EntitySubset[EntityKey]]]:
+        start_timestamp = get_current_timestamp()
         self.prefetch()
+        num_processes = self._get_num_evaluation_processes()
+        if num_processes > 1:
+            self.logger.info(f"Evaluating conditions in {num_processes} processes.")
+            with ProcessPoolExecutor(
+                max_workers=num_processes,
+                # threads are in use in the daemon, so avoid forking
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker_evaluator,
+                initargs=(self._get_worker_snapshot(),),
+            ) as executor:
+                await self._async_evaluate_levels(executor, num_processes)
+        else:
+            await self._async_evaluate_levels(None, 1)
+        self._evaluation_duration = get_current_timestamp() - start_timestamp
+
+        return list(self.current_results_by_key.values()), [
+            v for v in self.request_subsets_by_key.values() if not v.is_empty
+        ]
+
+    async def _async_evaluate_levels(
+        self, executor: Optional[Executor], num_processes: int
+    ) -> None:
         num_conditions = len(self.entity_keys)
         num_evaluated = 0
+        num_skipped = 0
 
         async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
             self.logger.debug(
@@ -124,45 +194,257 @@ async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
                     f"Error while evaluating conditions for {entity_key.to_user_string()}"
                 ) from e
 
-            result = self.current_results_by_key[entity_key]
-            num_requested = result.true_subset.size
-            if result.true_subset.is_partitioned:
-                requested_str = ",".join(result.true_subset.expensively_compute_partition_keys())
+            self._log_result(self.current_results_by_key[entity_key])
+
+        for topo_level in self.asset_graph.toposorted_entity_keys_by_level:
+            level_entity_keys = [
+                entity_key for entity_key in topo_level if entity_key in self.entity_keys
+            ]
+            input_hashes_by_key = self._get_input_hashes(level_entity_keys)
+            entity_keys = [
+                entity_key
+                for entity_key in level_entity_keys
+                if not self._skip_if_unchanged(entity_key, input_hashes_by_key.get(entity_key))
+            ]
+            if executor:
+                await self._async_evaluate_level_in_executor(executor, num_processes, entity_keys)
             else:
-                requested_str = "(no partition)"
-            log_fn = self.logger.info if num_requested > 0 else self.logger.debug
-            log_fn(
-                f"{entity_key.to_user_string()} evaluation result: {num_requested} "
-                f"requested ({requested_str}) "
-                f"({format(result.end_timestamp - result.start_timestamp, '.3f')} seconds)"
+                await asyncio.gather(
+                    *[
+                        _evaluate_entity_async(entity_key, offset)
+                        for offset, entity_key in enumerate(entity_keys)
+                    ]
+                )
+            for entity_key in entity_keys:
+                self._set_input_hash(entity_key, input_hashes_by_key.get(entity_key))
+            num_evaluated += len(level_entity_keys)
+            num_skipped += len(level_entity_keys) - len(entity_keys)
+
+        if self.input_hasher:
+            self.logger.info(
+                f"Skipped the evaluation of {num_skipped} entities whose inputs have not changed "
+                "since the previous tick."
             )
+        self.logger.info(
+            f"Reused {self.memo.num_hits} subsets computed for other entities "
+            f"(hit ratio: {self.memo.hit_ratio:.2f}, {self.memo.num_entries}/"
+            f"{self.memo.max_entries} entries, {self.memo.num_evictions} evicted)."
+        )
 
-        for topo_level in self.asset_graph.toposorted_entity_keys_by_level:
-            coroutines = [
-                _evaluate_entity_async(entity_key, offset)
-                for offset, entity_key in enumerate(topo_level)
-                if entity_key in self.entity_keys
+    @property
+    def profile(self) -> AutomationConditionEvaluationProfile:
+        """Timing information for each node of the conditions evaluated by this evaluator."""
+        return self.profiler.get_profile(self._evaluation_duration, self.memo)
+
+    def _get_input_hashes(
+        self, entity_keys: Sequence[EntityKey]
+    ) -> Mapping[EntityKey, Optional[str]]:
+        if self.input_hasher is None:
+            return {}
+        return {
+            entity_key: self.input_hasher.get_input_hash(entity_key) for entity_key in entity_keys
+        }
+
+    def _skip_if_unchanged(self, entity_key: EntityKey, input_hash: Optional[str]) -> bool:
+        """Reuses the previous result for the given entity if the inputs to its evaluation have not
+        changed since the previous tick, returning True if it did so.
+        """
+        previous_cursor = self.cursor.get_previous_condition_cursor(entity_key)
+        if (
+            input_hash is None
+            or previous_cursor is None
+            or previous_cursor.input_hash != input_hash
+        ):
+            return False
+        self.profiler.add_skipped(
+            check.not_none(
+                self.asset_graph.get(entity_key).automation_condition or self.default_condition
+            )
+        )
+        self._add_result(
+            _SkippedAutomationResult(
+                true_subset=self.asset_graph_view.get_empty_subset(key=entity_key),
+                cursor=dataclasses.replace(
+                    previous_cursor,
+                    effective_timestamp=self.evaluation_time.timestamp(),
+                    last_event_id=self.asset_graph_view.last_event_id,
+                ),
+            )
+        )
+        return True
+
+    def _set_input_hash(self, entity_key: EntityKey, input_hash: Optional[str]) -> None:
+        """Records the hash of the inputs to the evaluation of the given entity on its cursor if
+        evaluating it again with the same inputs would not change its cursor, i.e. if this
+        evaluation did not change it either.
+        """
+        previous_cursor = self.cursor.get_previous_condition_cursor(entity_key)
+        if input_hash is None or previous_cursor is None:
+            return
+        result = self.current_results_by_key[entity_key]
+        new_cursor = result.get_new_cursor()
+        if (
+            new_cursor.previous_requested_subset.is_empty
+            and new_cursor.result_value_hash == previous_cursor.result_value_hash
+            and new_cursor.node_cursors_by_unique_id == previous_cursor.node_cursors_by_unique_id
+        ):
+            result.set_internal_input_hash(input_hash)
+
+    async def _async_evaluate_level_in_executor(
+        self, executor: Executor, num_processes: int, entity_keys: Sequence[EntityKey]
+    ) -> None:
+        """Evaluates the given entities, which do not depend on each other, in worker processes.
+        Workers are sent the state of this evaluation so far, and the results they send back are
+        recorded in topological order, exactly as if they had been evaluated in this process.
+        """
+        if not entity_keys:
+            return
+
+        # entities which must be executed together can influence each other's requested subsets,
+        # so they are evaluated in order by a single worker
+        groups: Dict[AbstractSet[EntityKey], List[EntityKey]] = defaultdict(list)
+        for entity_key in entity_keys:
+            groups[self._get_execution_set_keys(entity_key)].append(entity_key)
+        # split the work into more chunks than there are workers to even out their load
+        num_chunks = min(len(groups), num_processes * 4)
+        chunks: List[List[EntityKey]] = [[] for _ in range(num_chunks)]
+        for i, group in enumerate(groups.values()):
+            chunks[i % num_chunks].extend(group)
+
+        serialized_state = serialize_value(
+            [
+                subset.convert_to_serializable_subset()
+                for subset in self.request_subsets_by_key.values()
             ]
-            await asyncio.gather(*coroutines)
-            num_evaluated += len(coroutines)
+        )
+        legacy_expected_data_time_by_key = {
+            key: value.timestamp() if value else None
+            for key, value in self.legacy_expected_data_time_by_key.items()
+        }
+        loop = asyncio.get_running_loop()
+        chunk_results = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    executor,
+                    _evaluate_entities_in_worker,
+                    chunk,
+                    serialized_state,
+                    legacy_expected_data_time_by_key,
+                )
+                for chunk in chunks
+            ]
+        )
 
-        return list(self.current_results_by_key.values()), [
-            v for v in self.request_subsets_by_key.values() if not v.is_empty
-        ]
+        results_by_key = {
+            result.key: result
+            for serialized_results in chunk_results
+            for result in (
+                _DeserializedAutomationResult.from_worker_result(self.asset_graph_view, r)
+                for r in serialized_results
+            )
+        }
+        for entity_key in entity_keys:
+            result = results_by_key[entity_key]
+            self.profiler.add_evaluation(result.serializable_evaluation)
+            self._add_result(result)
+            self._log_result(result)
+
+    def _get_execution_set_keys(self, entity_key: EntityKey) -> AbstractSet[EntityKey]:
+        if isinstance(entity_key, AssetKey):
+            execution_set_keys = self.asset_graph.get(entity_key).execution_set_entity_keys
+            if len(execution_set_keys) > 1:
+                return frozenset(execution_set_keys)
+        return frozenset({entity_key})
+
+    def _get_num_evaluation_processes(self) -> int:
+        from dagster._core.definitions.remote_asset_graph import RemoteAssetGraph
+
+        num_processes = self.asset_graph_view.instance.auto_materialize_num_evaluation_processes
+        if not num_processes or num_processes <= 1:
+            return 1
+        if not isinstance(self.asset_graph, RemoteAssetGraph):
+            self.logger.warning(
+                "Conditions can only be evaluated in separate processes for asset graphs loaded "
+                "from code locations. Evaluating them in the current process instead."
+            )
+            return 1
+        if self.asset_graph_view.instance.is_ephemeral:
+            self.logger.warning(
+                "Conditions cannot be evaluated in separate processes with an ephemeral instance. "
+                "Evaluating them in the current process instead."
+            )
+            return 1
+        return num_processes
+
+    def _get_worker_snapshot(self) -> "_WorkerSnapshot":
+        """Captures the read-only state shared by all evaluations in this tick, so that workers can
+        evaluate conditions without refetching the records already fetched by this process.
+        """
+        from dagster._core.definitions.remote_asset_graph import RemoteAssetGraph
+        from dagster._core.storage.event_log.base import AssetRecord
+
+        asset_graph = check.inst(self.asset_graph, RemoteAssetGraph)
+        asset_keys = self.asset_records_to_prefetch
+        asset_records = AssetRecord.blocking_get_many(self.asset_graph_view, asset_keys)
+        asset_records_by_key = {
+            asset_record.asset_entry.asset_key: asset_record for asset_record in asset_records
+        }
+        return _WorkerSnapshot(
+            instance_ref=self.asset_graph_view.instance.get_ref(),
+            asset_graph_type=type(asset_graph),
+            serialized_asset_graph=serialize_value(
+                [
+                    list(asset_graph.remote_asset_nodes_by_key.values()),
+                    list(asset_graph.remote_asset_check_nodes_by_key.values()),
+                ]
+            ),
+            serialized_cursor=serialize_value(self.cursor),
+            serialized_default_condition=serialize_value(self.default_condition)
+            if self.default_condition
+            else None,
+            evaluation_time=self.evaluation_time,
+            last_event_id=self.asset_graph_view.last_event_id,
+            emit_backfills=self.emit_backfills,
+            asset_records_by_key={key: asset_records_by_key.get(key) for key in asset_keys},
+            serialized_asset_status_cache_values=serialize_value(
+                [
+                    [asset_key, cache_value]
+                    for asset_key, cache_value in self.instance_queryer.get_prefetched_asset_status_cache_values().items()
+                ]
+            ),
+        )
 
     async def evaluate_entity(self, key: EntityKey) -> None:
         # evaluate the condition of this asset
         result = await AutomationContext.create(key=key, evaluator=self).evaluate_async()
+        self.profiler.add_result(result)
+        self._add_result(result)
 
+    def _add_result(self, result: AutomationResult) -> None:
         # update dictionaries to keep track of this result
-        self.current_results_by_key[key] = result
+        self.current_results_by_key[result.key] = result
         self._add_request_subset(result.true_subset)
 
-        if isinstance(key, AssetKey):
-            self.legacy_expected_data_time_by_key[key] = result.compute_legacy_expected_data_time()
+        if isinstance(result.key, AssetKey):
+            self.legacy_expected_data_time_by_key[result.key] = (
+                result.compute_legacy_expected_data_time()
+            )
             # handle cases where an entity must be materialized with others
             self._handle_execution_set(result)
 
+    def _log_result(self, result: AutomationResult) -> None:
+        num_requested = result.true_subset.size
+        if result.true_subset.is_partitioned:
+            requested_str = ",".join(result.true_subset.expensively_compute_partition_keys())
+        else:
+            requested_str = "(no partition)"
+        log_fn = self.logger.info if num_requested > 0 else self.logger.debug
+        log_fn(
+            f"{result.key.to_user_string()} evaluation result: {num_requested} "
+            f"requested ({requested_str}) "
+            f"({format(result.end_timestamp - result.start_timestamp, '.3f')} seconds)"
+        )
+
     def _add_request_subset(self, subset: EntitySubset) -> None:
         """Adds the provided subset to the dictionary tracking what we will request on this tick."""
         if subset.key not in self.request_subsets_by_key:
@@ -200,3 +482,224 @@ def _handle_execution_set(self, result: AutomationResult[AssetKey]) -> None:
                     )
 
                 self._add_request_subset(neighbor_true_subset)
+
+
+class _WorkerSnapshot(NamedTuple):
+    """The read-only state of a tick shared with the processes that evaluate its conditions."""
+
+    instance_ref: InstanceRef
+    asset_graph_type: Type["RemoteAssetGraph"]
+    serialized_asset_graph: str
+    serialized_cursor: str
+    serialized_default_condition: Optional[str]
+    evaluation_time: datetime.datetime
+    last_event_id: Optional[int]
+    emit_backfills: bool
+    asset_records_by_key: Mapping[AssetKey, Optional["AssetRecord"]]
+    serialized_asset_status_cache_values: str
+
+
+class _WorkerResult(NamedTuple):
+    """The result of evaluating the condition of a single entity in a worker process."""
+
+    serialized_evaluation: str
+    serialized_cursor: str
+    value_hash: str
+    legacy_expected_data_timestamp: Optional[float]
+
+
+class _DeserializedAutomationResult(AutomationResult):
+    """An AutomationResult computed in a worker process. The context of the evaluation only exists
+    in that process, so the evaluation and cursor are sent back already computed.
+    """
+
+    def __init__(
+        self,
+        true_subset: EntitySubset,
+        evaluation: AutomationConditionEvaluation,
+        cursor: AutomationConditionCursor,
+        value_hash: str,
+        legacy_expected_data_time: Optional[datetime.datetime],
+    ):
+        self._true_subset = true_subset
+        self._child_results = []
+        self._evaluation = evaluation
+        self._cursor = cursor
+        self._value_hash = value_hash
+        self._legacy_expected_data_time = legacy_expected_data_time
+        self._serializable_subset_override = None
+        self._input_hash = None
+
+    @staticmethod
+    def from_worker_result(
+        asset_graph_view: AssetGraphView, worker_result: _WorkerResult
+    ) -> "_DeserializedAutomationResult":
+        evaluation = deserialize_value(
+            worker_result.serialized_evaluation, AutomationConditionEvaluation
+        )
+        return _DeserializedAutomationResult(
+            true_subset=check.not_none(
+                asset_graph_view.get_subset_from_serializable_subset(evaluation.true_subset)
+            ),
+            evaluation=evaluation,
+            cursor=deserialize_value(worker_result.serialized_cursor, AutomationConditionCursor),
+            value_hash=worker_result.value_hash,
+            legacy_expected_data_time=datetime_from_timestamp(
+                worker_result.legacy_expected_data_timestamp
+            )
+            if worker_result.legacy_expected_data_timestamp is not None
+            else None,
+        )
+
+    @property
+    def start_timestamp(self) -> float:
+        return self._evaluation.start_timestamp or 0.0
+
+    @property
+    def end_timestamp(self) -> float:
+        return self._evaluation.end_timestamp or 0.0
+
+    @property
+    def condition_unique_id(self) -> str:
+        return self._evaluation.condition_snapshot.unique_id
+
+    @property
+    def value_hash(self) -> str:
+        return self._value_hash
+
+    @property
+    def serializable_evaluation(self) -> AutomationConditionEvaluation:
+        return self._evaluation
+
+    def get_new_cursor(self) -> AutomationConditionCursor:
+        return dataclasses.replace(self._cursor, input_hash=self._input_hash)
+
+    def get_serializable_subset(self) -> SerializableEntitySubset:
+        return self._evaluation.true_subset
+
+    def compute_legacy_expected_data_time(self) -> Optional[datetime.datetime]:
+        return self._legacy_expected_data_time
+
+
+class _SkippedAutomationResult(AutomationResult):
+    """The result for an entity whose evaluation was skipped because its inputs have not changed
+    since the previous tick. Nothing is requested, and its cursor is carried over to the next tick.
+    """
+
+    def __init__(self, true_subset: EntitySubset, cursor: AutomationConditionCursor):
+        self._true_subset = true_subset
+        self._child_results = []
+        self._cursor = cursor
+        self._serializable_subset_override = None
+        self._input_hash = cursor.input_hash
+        self._start_timestamp = self._end_timestamp = get_current_timestamp()
+
+    @property
+    def value_hash(self) -> str:
+        return self._cursor.result_value_hash
+
+    @property
+    def serializable_evaluation(self) -> AutomationConditionEvaluation:
+        # the evaluation is identical to the previous one, so it is never stored again
+        check.failed("No evaluation exists for a skipped AutomationCondition evaluation.")
+
+    def get_new_cursor(self) -> AutomationConditionCursor:
+        return dataclasses.replace(self._cursor, input_hash=self._input_hash)
+
+    def get_serializable_subset(self) -> SerializableEntitySubset:
+        return self._true_subset.convert_to_serializable_subset()
+
+    def compute_legacy_expected_data_time(self) -> Optional[datetime.datetime]:
+        return None
+
+
+# the evaluator of the tick a worker process was started for
+_worker_evaluator: Optional[AutomationConditionEvaluator] = None
+
+
+def _initialize_worker_evaluator(snapshot: _WorkerSnapshot) -> None:
+    from dagster._core.storage.event_log.base import AssetRecord
+
+    global _worker_evaluator  # noqa: PLW0603
+
+    asset_nodes, asset_check_nodes = deserialize_value(snapshot.serialized_asset_graph, list)
+    asset_graph = snapshot.asset_graph_type(
+        remote_asset_nodes_by_key={node.key: node for node in asset_nodes},
+        remote_asset_check_nodes_by_key={node.asset_check.key: node for node in asset_check_nodes},
+    )
+    evaluator = AutomationConditionEvaluator(
+        entity_keys=set(),
+        instance=DagsterInstance.from_ref(snapshot.instance_ref),
+        asset_graph=asset_graph,
+        cursor=deserialize_value(snapshot.serialized_cursor, AssetDaemonCursor),
+        emit_backfills=snapshot.emit_backfills,
+        default_condition=deserialize_value(
+            snapshot.serialized_default_condition, AutomationCondition
+        )
+        if snapshot.serialized_default_condition
+        else None,
+        temporal_context=TemporalContext(
+            effective_dt=snapshot.evaluation_time, last_event_id=snapshot.last_event_id
+        ),
+    )
+    for asset_key, asset_record in snapshot.asset_records_by_key.items():
+        AssetRecord.prime(evaluator.asset_graph_view, asset_key, asset_record)
+    evaluator.instance_queryer.prime_asset_status_cache_values(
+        {
+            asset_key: cache_value
+            for asset_key, cache_value in deserialize_value(
+                snapshot.serialized_asset_status_cache_values, list
+            )
+        }
+    )
+    _worker_evaluator = evaluator
+
+
+def _evaluate_entities_in_worker(
+    entity_keys: Sequence[EntityKey],
+    serialized_request_subsets: str,
+    legacy_expected_data_time_by_key: Mapping[AssetKey, Optional[float]],
+) -> Sequence[_WorkerResult]:
+    evaluator = check.not_none(_worker_evaluator)
+
+    # bring the worker up to date with the entities evaluated so far in this tick
+    evaluator.current_results_by_key.clear()
+    evaluator.request_subsets_by_key.clear()
+    for serializable_subset in deserialize_value(serialized_request_subsets, list):
+        subset = evaluator.asset_graph_view.get_subset_from_serializable_subset(serializable_subset)
+        if subset is not None:
+            evaluator.request_subsets_by_key[subset.key] = subset
+    evaluator.legacy_expected_data_time_by_key.clear()
+    evaluator.legacy_expected_data_time_by_key.update(
+        {
+            key: datetime_from_timestamp(timestamp) if timestamp is not None else None
+            for key, timestamp in legacy_expected_data_time_by_key.items()
+        }
+    )
+
+    async def _evaluate() -> None:
+        for entity_key in entity_keys:
+            try:
+                await evaluator.evaluate_entity(entity_key)
+            except Exception as e:
+                raise Exception(
+                    f"Error while evaluating conditions for {entity_key.to_user_string()}"
+                ) from e
+
+    asyncio.run(_evaluate())
+
+    worker_results = []
+    for entity_key in entity_keys:
+        result = evaluator.current_results_by_key[entity_key]
+        legacy_expected_data_time = evaluator.legacy_expected_data_time_by_key.get(entity_key)  # type: ignore
+        worker_results.append(
+            _WorkerResult(
+                serialized_evaluation=serialize_value(result.serializable_evaluation),
+                serialized_cursor=serialize_value(result.get_new_cursor()),
+                value_hash=result.value_hash,
+                legacy_expected_data_timestamp=legacy_expected_data_time.timestamp()
+                if legacy_expected_data_time
+                else None,
+            )
+        )
+    return worker_results
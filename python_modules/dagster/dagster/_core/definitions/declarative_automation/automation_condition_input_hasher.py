@@ -0,0 +1,257 @@
+from typing import TYPE_CHECKING, AbstractSet, Dict, List, Optional, Sequence, Tuple
+
+from dagster._core.definitions.asset_key import AssetCheckKey, AssetKey, EntityKey
+from dagster._core.definitions.declarative_automation.automation_condition import (
+    AutomationCondition,
+)
+from dagster._core.definitions.declarative_automation.operands import (
+    BackfillInProgressAutomationCondition,
+    CheckResultCondition,
+    CodeVersionChangedCondition,
+    CronTickPassedCondition,
+    ExecutionFailedAutomationCondition,
+    InitialEvaluationCondition,
+    InLatestTimeWindowCondition,
+    LatestRunExecutedWithRootTargetCondition,
+    MissingAutomationCondition,
+    NewlyRequestedCondition,
+    NewlyUpdatedCondition,
+    RunInProgressAutomationCondition,
+    WillBeRequestedCondition,
+)
+from dagster._core.definitions.declarative_automation.operators import (
+    AllChecksCondition,
+    AllDepsCondition,
+    AndAutomationCondition,
+    AnyChecksCondition,
+    AnyDepsCondition,
+    NewlyTrueCondition,
+    NotAutomationCondition,
+    OrAutomationCondition,
+    SinceCondition,
+)
+from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
+from dagster._core.definitions.partition import DynamicPartitionsDefinition, PartitionsDefinition
+from dagster._core.definitions.time_window_partitions import get_time_partitions_def
+from dagster._utils.cached_method import cached_method
+from dagster._utils.security import non_secure_md5_hash_str
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.base_asset_graph import BaseAssetGraph, BaseAssetNode
+    from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+        AutomationConditionEvaluator,
+    )
+
+# conditions whose results only depend on the state of the entities they are evaluated on, their
+# own cursors, and the inputs tracked by AutomationConditionInputHasher
+_SUPPORTED_CONDITION_TYPES = {
+    AndAutomationCondition,
+    OrAutomationCondition,
+    NotAutomationCondition,
+    NewlyTrueCondition,
+    SinceCondition,
+    BackfillInProgressAutomationCondition,
+    CheckResultCondition,
+    CodeVersionChangedCondition,
+    CronTickPassedCondition,
+    ExecutionFailedAutomationCondition,
+    InitialEvaluationCondition,
+    InLatestTimeWindowCondition,
+    LatestRunExecutedWithRootTargetCondition,
+    MissingAutomationCondition,
+    NewlyRequestedCondition,
+    NewlyUpdatedCondition,
+    RunInProgressAutomationCondition,
+    WillBeRequestedCondition,
+}
+
+# conditions which evaluate their operand on the parents or checks of an entity
+_RELATED_ENTITY_CONDITION_TYPES = {
+    AnyDepsCondition,
+    AllDepsCondition,
+    AnyChecksCondition,
+    AllChecksCondition,
+}
+
+
+def _get_cron_conditions(
+    condition: AutomationCondition, within_related_entity_condition: bool = False
+) -> Optional[Sequence[CronTickPassedCondition]]:
+    """Returns all CronTickPassedConditions within the given condition, or None if its result may
+    depend on anything other than the entity it is evaluated on and its parents and checks.
+    """
+    if type(condition) in _RELATED_ENTITY_CONDITION_TYPES:
+        if within_related_entity_condition:
+            # the operand would be evaluated on the parents or checks of related entities
+            return None
+        within_related_entity_condition = True
+    elif type(condition) not in _SUPPORTED_CONDITION_TYPES:
+        return None
+
+    cron_conditions: List[CronTickPassedCondition] = []
+    if isinstance(condition, CronTickPassedCondition):
+        cron_conditions.append(condition)
+    for child in condition.children:
+        child_cron_conditions = _get_cron_conditions(child, within_related_entity_condition)
+        if child_cron_conditions is None:
+            return None
+        cron_conditions.extend(child_cron_conditions)
+    return cron_conditions
+
+
+def _has_dynamic_dimension(partitions_def: Optional[PartitionsDefinition]) -> bool:
+    if isinstance(partitions_def, MultiPartitionsDefinition):
+        return any(
+            isinstance(dimension.partitions_def, DynamicPartitionsDefinition)
+            for dimension in partitions_def.partitions_defs
+        )
+    return isinstance(partitions_def, DynamicPartitionsDefinition)
+
+
+class AutomationConditionInputHasher:
+    """Computes hashes of the inputs to the evaluation of each entity's AutomationCondition on the
+    current tick, other than its previous cursor.
+
+    If the previous evaluation of a condition had the same inputs and left its cursor unchanged,
+    evaluating it again would produce an identical result. A hash is therefore only returned if
+    nothing that could affect the evaluation has happened since the previous tick: no new events
+    for the entity, its parents or its checks, no requests of any of these on the previous or
+    current tick, and no newly passed cron ticks. Entities whose conditions depend on state which
+    is not tracked here never get a hash, and so are always evaluated.
+    """
+
+    def __init__(self, evaluator: "AutomationConditionEvaluator"):
+        self._evaluator = evaluator
+        self._condition_info_by_id: Dict[
+            int, Tuple[str, Optional[Sequence[CronTickPassedCondition]]]
+        ] = {}
+
+    @property
+    def _asset_graph(self) -> "BaseAssetGraph[BaseAssetNode]":
+        return self._evaluator.asset_graph
+
+    @cached_method
+    def _get_updated_entity_keys(self) -> Optional[AbstractSet[EntityKey]]:
+        """Returns the entities with new events since the earliest previous evaluation, or None if
+        these cannot be determined.
+        """
+        previous_cursors = [
+            self._evaluator.cursor.get_previous_condition_cursor(key)
+            for key in self._evaluator.entity_keys
+        ]
+        storage_id = min(
+            (cursor.last_event_id or 0 for cursor in previous_cursors if cursor is not None),
+            default=None,
+        )
+        if storage_id is None or storage_id == self._evaluator.asset_graph_view.last_event_id:
+            return set()
+        return self._evaluator.instance_queryer.get_entity_keys_updated_after_storage_id(storage_id)
+
+    @cached_method
+    def _get_backfill_asset_keys(self) -> AbstractSet[AssetKey]:
+        return self._evaluator.instance_queryer.get_active_backfill_target_asset_graph_subset().asset_keys
+
+    def _get_condition_info(
+        self, condition: AutomationCondition
+    ) -> Tuple[str, Optional[Sequence[CronTickPassedCondition]]]:
+        # conditions are shared between many entities, so only traverse each of them once
+        if id(condition) not in self._condition_info_by_id:
+            self._condition_info_by_id[id(condition)] = (
+                condition.get_unique_id(),
+                _get_cron_conditions(condition),
+            )
+        return self._condition_info_by_id[id(condition)]
+
+    def _get_related_keys(self, key: EntityKey) -> AbstractSet[EntityKey]:
+        if isinstance(key, AssetKey):
+            asset_node = self._asset_graph.get(key)
+            return {*asset_node.parent_entity_keys, *asset_node.check_keys}
+        return self._asset_graph.get(key).parent_entity_keys
+
+    @cached_method
+    def _get_entity_state_str(self, key: EntityKey) -> Optional[str]:
+        node = self._asset_graph.get(key)
+        partitions_def = node.partitions_def
+        if _has_dynamic_dimension(partitions_def):
+            # new partitions are added without any events
+            return None
+
+        parts = [key.to_user_string()]
+        if isinstance(key, AssetKey):
+            parts.append(str(self._asset_graph.get(key).code_version))
+        if partitions_def is not None:
+            parts.append(partitions_def.get_serializable_unique_identifier())
+            time_partitions_def = get_time_partitions_def(partitions_def)
+            if time_partitions_def is not None:
+                # new time partitions are added as time passes
+                parts.append(
+                    str(
+                        time_partitions_def.get_last_partition_key(
+                            current_time=self._evaluator.evaluation_time
+                        )
+                    )
+                )
+        parts.extend(
+            f"{parent_key.to_user_string()}:{mapping!r}"
+            for parent_key, mapping in sorted(
+                node.partition_mappings.items(), key=lambda item: item[0].to_user_string()
+            )
+        )
+        return ":".join(parts)
+
+    def get_input_hash(self, key: EntityKey) -> Optional[str]:
+        """Returns a hash of the inputs to the evaluation of the given entity's condition, or None
+        if these inputs may have changed since the previous tick.
+        """
+        previous_cursor = self._evaluator.cursor.get_previous_condition_cursor(key)
+        if previous_cursor is None or not previous_cursor.previous_requested_subset.is_empty:
+            return None
+
+        condition = (
+            self._asset_graph.get(key).automation_condition or self._evaluator.default_condition
+        )
+        if condition is None:
+            return None
+        condition_id, cron_conditions = self._get_condition_info(condition)
+        if cron_conditions is None:
+            return None
+        if any(
+            cron_condition._get_previous_cron_tick(self._evaluator.evaluation_time).timestamp()  # noqa
+            >= previous_cursor.effective_timestamp
+            for cron_condition in cron_conditions
+        ):
+            return None
+
+        if (
+            isinstance(key, AssetKey)
+            and len(self._asset_graph.get(key).execution_set_entity_keys) > 1
+        ):
+            # the requests of the other entities in the execution set are made on the same level
+            return None
+
+        related_keys = self._get_related_keys(key)
+        updated_entity_keys = self._get_updated_entity_keys()
+        if updated_entity_keys is None:
+            return None
+        for related_key in [key, *related_keys]:
+            asset_key = (
+                related_key.asset_key if isinstance(related_key, AssetCheckKey) else related_key
+            )
+            if related_key in updated_entity_keys or asset_key in self._get_backfill_asset_keys():
+                return None
+            if related_key == key:
+                continue
+            related_cursor = self._evaluator.cursor.get_previous_condition_cursor(related_key)
+            if related_cursor is not None and not related_cursor.previous_requested_subset.is_empty:
+                return None
+            request_subset = self._evaluator.request_subsets_by_key.get(related_key)
+            if request_subset is not None and not request_subset.is_empty:
+                return None
+
+        parts = [condition_id]
+        for entity_key in sorted([key, *related_keys], key=lambda k: k.to_user_string()):
+            entity_state_str = self._get_entity_state_str(entity_key)
+            if entity_state_str is None:
+                return None
+            parts.append(entity_state_str)
+        return non_secure_md5_hash_str("\n".join(parts).encode("utf-8"))
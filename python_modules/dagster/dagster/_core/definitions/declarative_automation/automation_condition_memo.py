@@ -0,0 +1,87 @@
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Hashable, Optional, Tuple
+
+from dagster._core.asset_graph_view.entity_subset import EntitySubset
+from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsSubset
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.declarative_automation.automation_condition import (
+        AutomationCondition,
+    )
+
+# bounds the memory used by the memo on large asset graphs, as each entry holds a single subset
+DEFAULT_MAX_MEMO_ENTRIES = 100_000
+
+
+def get_subset_value_key(subset: EntitySubset) -> Optional[Hashable]:
+    """Returns a hashable representation of the value of the given subset, or None if one cannot
+    be cheaply computed. Subsets with equal values may have different representations, but subsets
+    with different values never share one.
+    """
+    value = subset.get_internal_value()
+    if isinstance(value, bool):
+        return value
+    elif isinstance(value, AllPartitionsSubset):
+        return AllPartitionsSubset.__name__
+    elif isinstance(value, TimeWindowPartitionsSubset):
+        return (TimeWindowPartitionsSubset.__name__, tuple(value.included_time_windows))
+    elif isinstance(value, DefaultPartitionsSubset):
+        return (DefaultPartitionsSubset.__name__, frozenset(value.get_partition_keys()))
+    return None
+
+
+class AutomationConditionMemo:
+    """Memo of the subsets computed while evaluating the AutomationConditions of all entities on a
+    tick. Identical conditions are often evaluated on the same entity and candidate subset by the
+    conditions of many different entities, e.g. each child of an asset evaluating whether that
+    asset is missing, and this allows them to share a single computation.
+
+    At most `max_entries` subsets are kept, evicting the least recently used ones first.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_MEMO_ENTRIES):
+        self._max_entries = max_entries
+        self._subsets_by_key: "OrderedDict[Hashable, EntitySubset]" = OrderedDict()
+        self._structural_ids: Dict[int, Tuple["AutomationCondition", str]] = {}
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_evictions = 0
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @property
+    def num_entries(self) -> int:
+        return len(self._subsets_by_key)
+
+    @property
+    def hit_ratio(self) -> float:
+        num_lookups = self.num_hits + self.num_misses
+        return self.num_hits / num_lookups if num_lookups else 0.0
+
+    def get_structural_id(self, condition: "AutomationCondition") -> str:
+        """Returns an identifier for the structure of the given condition, which is shared by all
+        identical conditions regardless of their position within a condition tree.
+        """
+        # conditions are shared between many entities, so only hash each of them once. the
+        # condition is kept alongside its id to ensure that its id() is not reused
+        if id(condition) not in self._structural_ids:
+            self._structural_ids[id(condition)] = (condition, condition.get_unique_id())
+        return self._structural_ids[id(condition)][1]
+
+    def get(self, key: Hashable) -> Optional[EntitySubset]:
+        subset = self._subsets_by_key.get(key)
+        if subset is None:
+            self.num_misses += 1
+            return None
+        self._subsets_by_key.move_to_end(key)
+        self.num_hits += 1
+        return subset
+
+    def set(self, key: Hashable, subset: EntitySubset) -> None:
+        self._subsets_by_key[key] = subset
+        if len(self._subsets_by_key) > self._max_entries:
+            self._subsets_by_key.popitem(last=False)
+            self.num_evictions += 1
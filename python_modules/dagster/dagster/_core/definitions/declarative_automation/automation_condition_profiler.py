@@ -0,0 +1,158 @@
+from typing import Callable, Dict, List, Optional
+
+from dagster._core.definitions.asset_key import EntityKey
+from dagster._core.definitions.declarative_automation.automation_condition import (
+    AutomationCondition,
+    AutomationResult,
+)
+from dagster._core.definitions.declarative_automation.automation_condition_memo import (
+    AutomationConditionMemo,
+)
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionEntityProfile,
+    AutomationConditionEvaluation,
+    AutomationConditionEvaluationProfile,
+    AutomationConditionNodeProfile,
+    AutomationConditionNodeSnapshot,
+)
+
+# the number of entities stored on each profile, to bound its size on large asset graphs
+DEFAULT_NUM_SLOWEST_ENTITIES = 25
+
+
+class _NodeStats:
+    """Mutable accumulator for the timing information of a single node across all entities."""
+
+    def __init__(
+        self, node_snapshot: AutomationConditionNodeSnapshot, parent_unique_id: Optional[str]
+    ):
+        self.node_snapshot = node_snapshot
+        self.parent_unique_id = parent_unique_id
+        self.num_evaluations = 0
+        self.num_cache_hits = 0
+        self.total_duration = 0.0
+        self.self_duration = 0.0
+        self.max_duration = 0.0
+        self.slowest_entity_key: Optional[EntityKey] = None
+
+    def add_evaluation(self, key: EntityKey, duration: float, self_duration: float) -> None:
+        self.num_evaluations += 1
+        self.total_duration += duration
+        self.self_duration += self_duration
+        if self.slowest_entity_key is None or duration > self.max_duration:
+            self.max_duration = duration
+            self.slowest_entity_key = key
+
+    def to_profile(self) -> AutomationConditionNodeProfile:
+        return AutomationConditionNodeProfile(
+            node_snapshot=self.node_snapshot,
+            parent_unique_id=self.parent_unique_id,
+            num_evaluations=self.num_evaluations,
+            num_cache_hits=self.num_cache_hits,
+            total_duration=self.total_duration,
+            self_duration=self.self_duration,
+            max_duration=self.max_duration,
+            slowest_entity_key=self.slowest_entity_key,
+        )
+
+
+class AutomationConditionProfiler:
+    """Aggregates the time spent evaluating each node of the AutomationCondition trees evaluated on
+    a tick. Nodes are identified by their unique ids, so identical conditions shared between many
+    entities are aggregated into a single node profile.
+    """
+
+    def __init__(self, num_slowest_entities: int = DEFAULT_NUM_SLOWEST_ENTITIES):
+        self._num_slowest_entities = num_slowest_entities
+        self._node_stats_by_unique_id: Dict[str, _NodeStats] = {}
+        self._entity_profiles: List[AutomationConditionEntityProfile] = []
+        self._num_skipped = 0
+
+    def _get_node_stats(
+        self,
+        unique_id: str,
+        parent_unique_id: Optional[str],
+        get_node_snapshot: Callable[[], AutomationConditionNodeSnapshot],
+    ) -> _NodeStats:
+        # snapshots are only created the first time a node is seen
+        if unique_id not in self._node_stats_by_unique_id:
+            self._node_stats_by_unique_id[unique_id] = _NodeStats(
+                get_node_snapshot(), parent_unique_id
+            )
+        return self._node_stats_by_unique_id[unique_id]
+
+    def _add_result_node(
+        self, key: EntityKey, result: AutomationResult, parent_unique_id: Optional[str]
+    ) -> float:
+        duration = result.end_timestamp - result.start_timestamp
+        child_duration = sum(
+            self._add_result_node(key, child_result, result.condition_unique_id)
+            for child_result in result.child_results
+        )
+        node_stats = self._get_node_stats(
+            result.condition_unique_id,
+            parent_unique_id,
+            lambda: result.condition.get_node_snapshot(result.condition_unique_id),
+        )
+        if result.is_memoized:
+            node_stats.num_cache_hits += 1
+        else:
+            node_stats.add_evaluation(key, duration, max(duration - child_duration, 0.0))
+        return duration
+
+    def _add_evaluation_node(
+        self,
+        key: EntityKey,
+        evaluation: AutomationConditionEvaluation,
+        parent_unique_id: Optional[str],
+    ) -> float:
+        duration = (evaluation.end_timestamp or 0.0) - (evaluation.start_timestamp or 0.0)
+        child_duration = sum(
+            self._add_evaluation_node(
+                key, child_evaluation, evaluation.condition_snapshot.unique_id
+            )
+            for child_evaluation in evaluation.child_evaluations
+        )
+        self._get_node_stats(
+            evaluation.condition_snapshot.unique_id,
+            parent_unique_id,
+            lambda: evaluation.condition_snapshot,
+        ).add_evaluation(key, duration, max(duration - child_duration, 0.0))
+        return duration
+
+    def add_result(self, result: AutomationResult) -> None:
+        """Records the timing of each node of a result computed in this process."""
+        duration = self._add_result_node(result.key, result, None)
+        self._entity_profiles.append(AutomationConditionEntityProfile(result.key, duration))
+
+    def add_evaluation(self, evaluation: AutomationConditionEvaluation) -> None:
+        """Records the timing of each node of an evaluation computed in another process."""
+        duration = self._add_evaluation_node(evaluation.key, evaluation, None)
+        self._entity_profiles.append(AutomationConditionEntityProfile(evaluation.key, duration))
+
+    def add_skipped(self, condition: AutomationCondition) -> None:
+        """Records that the previous result of the given root condition was reused instead of
+        evaluating it.
+        """
+        unique_id = condition.get_node_unique_id(parent_unique_id=None, index=None)
+        self._get_node_stats(
+            unique_id, None, lambda: condition.get_node_snapshot(unique_id)
+        ).num_cache_hits += 1
+        self._num_skipped += 1
+
+    def get_profile(
+        self, duration: float, memo: AutomationConditionMemo
+    ) -> AutomationConditionEvaluationProfile:
+        return AutomationConditionEvaluationProfile(
+            duration=duration,
+            num_evaluated=len(self._entity_profiles),
+            num_skipped=self._num_skipped,
+            node_profiles=[
+                node_stats.to_profile() for node_stats in self._node_stats_by_unique_id.values()
+            ],
+            slowest_entity_profiles=sorted(
+                self._entity_profiles, key=lambda profile: profile.duration, reverse=True
+            )[: self._num_slowest_entities],
+            num_memo_hits=memo.num_hits,
+            num_memo_misses=memo.num_misses,
+        )
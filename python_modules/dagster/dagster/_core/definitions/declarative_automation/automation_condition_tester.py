@@ -13,6 +13,9 @@
 from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
     AutomationConditionEvaluator,
 )
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionEvaluationProfile,
+)
 from dagster._core.definitions.definitions_class import Definitions
 from dagster._core.instance import DagsterInstance
 from dagster._serdes.serdes import deserialize_value, serialize_value
@@ -24,6 +27,7 @@ def __init__(
         cursor: AssetDaemonCursor,
         results: Iterable[AutomationResult],
         requested_subsets: Iterable[EntitySubset],
+        profile: AutomationConditionEvaluationProfile,
     ):
         self._requested_subsets = requested_subsets
         self._requested_asset_partitions = set().union(
@@ -35,6 +39,7 @@ def __init__(
         )
         self.cursor = cursor
         self.results = list(results)
+        self.profile = profile
 
     @cached_property
     def _requested_partitions_by_asset_key(self) -> Mapping[AssetKey, AbstractSet[Optional[str]]]:
@@ -144,5 +149,8 @@ def my_dbt_assets(context: AssetExecutionContext, dbt: DbtCliResource):
     )
 
     return EvaluateAutomationConditionsResult(
-        cursor=cursor, requested_subsets=requested_subsets, results=results
+        cursor=cursor,
+        requested_subsets=requested_subsets,
+        results=results,
+        profile=evaluator.profile,
     )
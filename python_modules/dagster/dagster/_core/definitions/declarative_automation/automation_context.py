@@ -2,7 +2,7 @@
 import inspect
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Generic, Mapping, Optional, Type, TypeVar
+from typing import TYPE_CHECKING, Generic, Hashable, Literal, Mapping, Optional, Type, TypeVar
 
 import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
@@ -12,6 +12,10 @@
     AutomationCondition,
     AutomationResult,
 )
+from dagster._core.definitions.declarative_automation.automation_condition_memo import (
+    AutomationConditionMemo,
+    get_subset_value_key,
+)
 from dagster._core.definitions.declarative_automation.legacy.legacy_context import (
     LegacyRuleEvaluationContext,
 )
@@ -59,6 +63,7 @@ class AutomationContext(Generic[T_EntityKey]):
 
     _cursor: Optional[AutomationConditionCursor]
     _legacy_context: Optional[LegacyRuleEvaluationContext]
+    _memo: AutomationConditionMemo
 
     _root_log: logging.Logger
 
@@ -82,6 +87,7 @@ def create(key: EntityKey, evaluator: "AutomationConditionEvaluator") -> "Automa
             _legacy_context=LegacyRuleEvaluationContext.create(key, evaluator)
             if condition.has_rule_condition and isinstance(key, AssetKey)
             else None,
+            _memo=evaluator.memo,
             _root_log=evaluator.logger,
         )
 
@@ -108,6 +114,7 @@ def for_child_condition(
             )
             if self._legacy_context
             else None,
+            _memo=self._memo,
             _root_log=self._root_log,
         )
 
@@ -245,6 +252,44 @@ def get_empty_subset(self) -> EntitySubset[T_EntityKey]:
         """Returns an empty EntitySubset of the currently-evaluated key."""
         return self.asset_graph_view.get_empty_subset(key=self.key)
 
+    def get_memo_key(self) -> Optional[Hashable]:
+        """Returns a key which identifies the result of evaluating the current condition on the
+        current candidate subset, or None if that result cannot be shared with other evaluations.
+        """
+        value_key = get_subset_value_key(self.candidate_subset)
+        if value_key is None:
+            return None
+        return (
+            self._memo.get_structural_id(self.condition),
+            self.key,
+            value_key,
+            self.previous_temporal_context,
+        )
+
+    def get_memoized_subset(self, memo_key: Hashable) -> Optional[EntitySubset[T_EntityKey]]:
+        """Returns a subset previously computed for the given key on this tick, if any."""
+        return self._memo.get(memo_key)
+
+    def set_memoized_subset(self, memo_key: Hashable, subset: EntitySubset[T_EntityKey]) -> None:
+        self._memo.set(memo_key, subset)
+
+    def compute_mapped_subset(
+        self, subset: EntitySubset, to_key: U_EntityKey, direction: Literal["up", "down"]
+    ) -> EntitySubset[U_EntityKey]:
+        """Maps the given subset to the given key, reusing the result of any identical mapping
+        computed on this tick.
+        """
+        value_key = get_subset_value_key(subset)
+        if value_key is None:
+            return subset.compute_mapped_subset(to_key, direction=direction)
+
+        memo_key = ("mapped_subset", subset.key, value_key, to_key, direction)
+        mapped_subset = self._memo.get(memo_key)
+        if mapped_subset is None:
+            mapped_subset = subset.compute_mapped_subset(to_key, direction=direction)
+            self._memo.set(memo_key, mapped_subset)
+        return mapped_subset
+
     def get_structured_cursor(
         self, as_type: Type[T_StructuredCursor]
     ) -> Optional[T_StructuredCursor]:
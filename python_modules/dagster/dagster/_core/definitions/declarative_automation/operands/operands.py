@@ -56,6 +56,10 @@ def evaluate(self, context: AutomationContext) -> AutomationResult:
 @whitelist_for_serdes
 @record
 class MissingAutomationCondition(SubsetAutomationCondition):
+    @property
+    def memoizable(self) -> bool:
+        return True
+
     @property
     def name(self) -> str:
         return "missing"
@@ -69,6 +73,10 @@ async def compute_subset(self, context: AutomationContext) -> EntitySubset:
 @whitelist_for_serdes(storage_name="InProgressAutomationCondition")
 @record
 class RunInProgressAutomationCondition(SubsetAutomationCondition):
+    @property
+    def memoizable(self) -> bool:
+        return True
+
     @property
     def name(self) -> str:
         return "run_in_progress"
@@ -80,6 +88,10 @@ async def compute_subset(self, context: AutomationContext) -> EntitySubset:
 @whitelist_for_serdes
 @record
 class BackfillInProgressAutomationCondition(SubsetAutomationCondition):
+    @property
+    def memoizable(self) -> bool:
+        return True
+
     @property
     def name(self) -> str:
         return "backfill_in_progress"
@@ -91,6 +103,10 @@ async def compute_subset(self, context: AutomationContext) -> EntitySubset:
 @whitelist_for_serdes(storage_name="FailedAutomationCondition")
 @record
 class ExecutionFailedAutomationCondition(SubsetAutomationCondition):
+    @property
+    def memoizable(self) -> bool:
+        return True
+
     @property
     def name(self) -> str:
         return "execution_failed"
@@ -156,6 +172,10 @@ async def compute_subset(self, context: AutomationContext) -> EntitySubset:
 @whitelist_for_serdes
 @record
 class NewlyUpdatedCondition(SubsetAutomationCondition):
+    @property
+    def memoizable(self) -> bool:
+        return True
+
     @property
     def name(self) -> str:
         return "newly_updated"
@@ -179,6 +199,10 @@ class CronTickPassedCondition(SubsetAutomationCondition):
     def name(self) -> str:
         return f"cron_tick_passed(cron_schedule={self.cron_schedule}, cron_timezone={self.cron_timezone})"
 
+    @property
+    def memoizable(self) -> bool:
+        return True
+
     def _get_previous_cron_tick(self, effective_dt: datetime.datetime) -> datetime.datetime:
         previous_ticks = reverse_cron_string_iterator(
             end_timestamp=effective_dt.timestamp(),
@@ -205,6 +229,10 @@ def compute_subset(self, context: AutomationContext) -> EntitySubset:
 class InLatestTimeWindowCondition(SubsetAutomationCondition):
     serializable_lookback_timedelta: Optional[SerializableTimeDelta] = None
 
+    @property
+    def memoizable(self) -> bool:
+        return True
+
     @staticmethod
     def from_lookback_delta(
         lookback_delta: Optional[datetime.timedelta],
@@ -249,6 +277,10 @@ def compute_subset(self, context: AutomationContext) -> EntitySubset:
 class CheckResultCondition(SubsetAutomationCondition[AssetCheckKey]):
     passed: bool
 
+    @property
+    def memoizable(self) -> bool:
+        return True
+
     @property
     def name(self) -> str:
         return "check_passed" if self.passed else "check_failed"
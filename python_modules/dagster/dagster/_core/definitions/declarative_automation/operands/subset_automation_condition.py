@@ -19,6 +19,14 @@ class SubsetAutomationCondition(BuiltinAutomationCondition[T_EntityKey]):
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def memoizable(self) -> bool:
+        """Whether the computed subset depends only on the evaluated entity, the candidate subset,
+        and the temporal context of the previous evaluation, and so may be shared between every
+        condition tree that evaluates this condition on the same inputs within a tick.
+        """
+        return False
+
     @abstractmethod
     def compute_subset(
         self, context: AutomationContext[T_EntityKey]
@@ -29,10 +37,19 @@ async def evaluate(
     ) -> AutomationResult[T_EntityKey]:
         # don't compute anything if there are no candidates
         if context.candidate_subset.is_empty:
-            true_subset = context.get_empty_subset()
-        elif inspect.iscoroutinefunction(self.compute_subset):
+            return AutomationResult(context, context.get_empty_subset())
+
+        memo_key = context.get_memo_key() if self.memoizable else None
+        if memo_key is not None:
+            memoized_subset = context.get_memoized_subset(memo_key)
+            if memoized_subset is not None:
+                return AutomationResult(context, memoized_subset, memoized=True)
+
+        if inspect.iscoroutinefunction(self.compute_subset):
             true_subset = await self.compute_subset(context)
         else:
             true_subset = self.compute_subset(context)
 
+        if memo_key is not None:
+            context.set_memoized_subset(memo_key, true_subset)
         return AutomationResult(context, true_subset)
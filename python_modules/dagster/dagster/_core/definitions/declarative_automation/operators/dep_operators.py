@@ -43,8 +43,8 @@ async def evaluate(
         else:
             directions = ("up", "down")
 
-        to_candidate_subset = context.candidate_subset.compute_mapped_subset(
-            self.key, direction=directions[0]
+        to_candidate_subset = context.compute_mapped_subset(
+            context.candidate_subset, self.key, direction=directions[0]
         )
         to_context = context.for_child_condition(
             child_condition=self.operand, child_index=0, candidate_subset=to_candidate_subset
@@ -52,8 +52,8 @@ async def evaluate(
 
         to_result = await to_context.evaluate_async()
 
-        true_subset = to_result.true_subset.compute_mapped_subset(
-            context.key, direction=directions[1]
+        true_subset = context.compute_mapped_subset(
+            to_result.true_subset, context.key, direction=directions[1]
         )
         return AutomationResult(context=context, true_subset=true_subset, child_results=[to_result])
 
@@ -17,7 +17,7 @@
 
 from dagster._core.asset_graph_view.asset_graph_view import TemporalContext
 from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
-from dagster._core.definitions.asset_key import T_EntityKey
+from dagster._core.definitions.asset_key import EntityKey, T_EntityKey
 from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.metadata import MetadataMapping, MetadataValue
 from dagster._core.definitions.partition import AllPartitionsSubset
@@ -147,6 +147,74 @@ def num_requested(self) -> int:
         return self.evaluation.true_subset.size
 
 
+@whitelist_for_serdes
+class AutomationConditionNodeProfile(NamedTuple):
+    """Timing information for a node in the AutomationCondition tree, aggregated over every entity
+    that it was evaluated for on a tick.
+
+    Attributes:
+        node_snapshot: A snapshot of the node.
+        parent_unique_id: The unique ID of the parent of this node, if any.
+        num_evaluations: The number of times this node was evaluated.
+        num_cache_hits: The number of times a previously computed result for this node was reused
+            instead of evaluating it.
+        total_duration: The total time spent evaluating this node, including its children.
+        self_duration: The total time spent evaluating this node, excluding its children.
+        max_duration: The longest time spent evaluating this node for a single entity.
+        slowest_entity_key: The entity for which this node took the longest to evaluate.
+    """
+
+    node_snapshot: AutomationConditionNodeSnapshot
+    parent_unique_id: Optional[str]
+    num_evaluations: int
+    num_cache_hits: int
+    total_duration: float
+    self_duration: float
+    max_duration: float
+    slowest_entity_key: Optional[EntityKey]
+
+
+@whitelist_for_serdes
+class AutomationConditionEntityProfile(NamedTuple):
+    """Timing information for the evaluation of the AutomationCondition of a single entity."""
+
+    key: EntityKey
+    duration: float
+
+
+@whitelist_for_serdes
+class AutomationConditionEvaluationProfile(NamedTuple):
+    """Timing information for the evaluation of all AutomationConditions on a tick.
+
+    Attributes:
+        duration: The total time spent evaluating conditions.
+        num_evaluated: The number of entities whose conditions were evaluated.
+        num_skipped: The number of entities whose previous results were reused because the inputs
+            to their conditions did not change.
+        node_profiles: Timing information for each distinct node in the evaluated condition trees.
+        slowest_entity_profiles: Timing information for the entities whose conditions took the
+            longest to evaluate, slowest first.
+        num_memo_hits: The number of subsets that were reused from an identical computation for
+            another entity instead of being computed.
+        num_memo_misses: The number of subsets that could be reused by other entities, but had not
+            been computed yet.
+    """
+
+    duration: float
+    num_evaluated: int
+    num_skipped: int
+    node_profiles: Sequence[AutomationConditionNodeProfile]
+    slowest_entity_profiles: Sequence[AutomationConditionEntityProfile]
+    num_memo_hits: int = 0
+    num_memo_misses: int = 0
+
+    def get_node_profile(self, unique_id: str) -> Optional[AutomationConditionNodeProfile]:
+        for node_profile in self.node_profiles:
+            if node_profile.node_snapshot.unique_id == unique_id:
+                return node_profile
+        return None
+
+
 @whitelist_for_serdes
 @dataclass
 class AutomationConditionNodeCursor(Generic[T_EntityKey]):
@@ -180,6 +248,9 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
             tree to any incremental state calculated for it.
         result_hash: A unique hash of the result for this tick. Used to determine if anything
             has changed since the last time this was evaluated.
+        input_hash: A unique hash of the inputs to this evaluation, set only if evaluating again
+            with identical inputs would produce an identical cursor. Used to skip the evaluation
+            on the next tick if the inputs have not changed.
     """
 
     previous_requested_subset: SerializableEntitySubset
@@ -188,6 +259,7 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
 
     node_cursors_by_unique_id: Mapping[str, AutomationConditionNodeCursor]
     result_value_hash: str
+    input_hash: Optional[str] = None
 
     @staticmethod
     def backcompat_from_evaluation_state(
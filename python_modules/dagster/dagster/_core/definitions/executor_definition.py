@@ -331,12 +331,21 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
 
+    reuse_cfg = check.opt_nullable_dict_elem(config, "reuse_processes")
+
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        reuse_processes=reuse_cfg is not None,
+        max_steps_per_process=(
+            check.opt_int_elem(reuse_cfg, "max_steps_per_process") if reuse_cfg else None
+        ),
+        max_process_memory_mb=(
+            check.opt_int_elem(reuse_cfg, "max_process_memory_mb") if reuse_cfg else None
+        ),
     )
 
 
@@ -389,6 +398,33 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "reuse_processes": Field(
+            {
+                "max_steps_per_process": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "The number of steps a worker process executes before it is replaced by a"
+                        " new one. By default, worker processes are not replaced."
+                    ),
+                ),
+                "max_process_memory_mb": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "Replace a worker process after the step it executed, once its peak memory"
+                        " usage reaches this many megabytes. Not supported on Windows."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes, instead of launching a"
+                " new subprocess for each step. Workers keep user code imported and the job loaded"
+                " between steps, which reduces the overhead of executing many small steps. Each"
+                " step still initializes its own resources."
+            ),
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -418,6 +454,17 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    For jobs with many small ops, set ``reuse_processes`` to execute steps in a pool of long-lived
+    worker processes instead of launching a new process for each step:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              reuse_processes:
+                max_steps_per_process: 100
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
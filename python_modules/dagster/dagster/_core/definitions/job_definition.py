@@ -9,6 +9,7 @@
     Any,
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -801,6 +802,15 @@ def get_partition_keys(
         partitions_def = self._get_partitions_def(selected_asset_keys)
         return partitions_def.get_partition_keys()
 
+    def iter_partition_keys(
+        self,
+        selected_asset_keys: Optional[Iterable[AssetKey]],
+        start_index: int = 0,
+        end_index: Optional[int] = None,
+    ) -> Iterator[str]:
+        partitions_def = self._get_partitions_def(selected_asset_keys)
+        return partitions_def.iter_partition_keys(start_index, end_index)
+
     def validate_partition_key(
         self,
         partition_key: str,
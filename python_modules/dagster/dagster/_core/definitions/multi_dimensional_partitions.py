@@ -1,9 +1,16 @@
 import hashlib
 import itertools
+import json
+from collections import defaultdict
 from datetime import datetime
 from functools import lru_cache, reduce
 from typing import (
+    AbstractSet,
+    Any,
     Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -19,19 +26,24 @@
 import dagster._check as check
 from dagster._annotations import public
 from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
     DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
+    PartitionKeyBitmap,
     PartitionsDefinition,
     PartitionsSubset,
     StaticPartitionsDefinition,
+    check_partition_key_indexes,
 )
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     TimeWindow,
     TimeWindowPartitionsDefinition,
+    TimeWindowPartitionsSubset,
 )
 from dagster._core.errors import (
     DagsterInvalidDefinitionError,
+    DagsterInvalidDeserializationVersionError,
     DagsterInvalidInvocationError,
     DagsterUnknownPartitionError,
 )
@@ -219,7 +231,7 @@ def __init__(self, partitions_defs: Mapping[str, PartitionsDefinition]):
 
     @property
     def partitions_subset_class(self) -> Type["PartitionsSubset"]:
-        return DefaultPartitionsSubset
+        return MultiPartitionsSubset
 
     def get_partition_keys_in_range(
         self,
@@ -345,6 +357,61 @@ def get_partition_keys(
             current_time or get_current_datetime(), dynamic_partitions_store
         )
 
+    def iter_partition_keys(
+        self,
+        start_index: int = 0,
+        end_index: Optional[int] = None,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterator[MultiPartitionKey]:
+        check_partition_key_indexes(start_index, end_index)
+        current_time = current_time or get_current_datetime()
+        outer_dimension, *inner_dimensions = self._partitions_defs
+
+        # keys are ordered by the first dimension, then the other ones, so only the keys of the
+        # first dimension that the range overlaps are iterated over
+        inner_key_tuples = list(
+            itertools.product(
+                *(
+                    dimension.partitions_def.get_partition_keys(
+                        current_time=current_time,
+                        dynamic_partitions_store=dynamic_partitions_store,
+                    )
+                    for dimension in inner_dimensions
+                )
+            )
+        )
+        if not inner_key_tuples:
+            return
+
+        num_inner_keys = len(inner_key_tuples)
+        outer_start_index = start_index // num_inner_keys
+        outer_end_index = None if end_index is None else -(-end_index // num_inner_keys)
+        partition_keys = (
+            MultiPartitionKey(
+                {
+                    outer_dimension.name: outer_key,
+                    **{
+                        dimension.name: key
+                        for dimension, key in zip(inner_dimensions, inner_key_tuple)
+                    },
+                }
+            )
+            for outer_key in outer_dimension.partitions_def.iter_partition_keys(
+                outer_start_index,
+                outer_end_index,
+                current_time=current_time,
+                dynamic_partitions_store=dynamic_partitions_store,
+            )
+            for inner_key_tuple in inner_key_tuples
+        )
+        offset = outer_start_index * num_inner_keys
+        yield from itertools.islice(
+            partition_keys,
+            start_index - offset,
+            None if end_index is None else max(end_index - offset, 0),
+        )
+
     def filter_valid_partition_keys(
         self, partition_keys: Set[str], dynamic_partitions_store: DynamicPartitionsStore
     ) -> Set[MultiPartitionKey]:
@@ -549,6 +616,526 @@ def get_num_partitions(
         return reduce(lambda x, y: x * y, dimension_counts, 1)
 
 
+def _get_subset_grouping_key(subset: PartitionsSubset) -> Any:
+    # a hashable value that is equal for subsets containing the same partitions, used to group
+    # the secondary keys of a MultiPartitionsSubset without comparing every pair of subsets
+    if isinstance(subset, TimeWindowPartitionsSubset):
+        return tuple(
+            sorted(
+                (time_window.start.timestamp(), time_window.end.timestamp())
+                for time_window in subset.included_time_windows
+            )
+        )
+    if isinstance(subset, DefaultPartitionsSubset) and isinstance(
+        subset.subset, PartitionKeyBitmap
+    ):
+        return subset.subset.bitmap
+    return frozenset(subset.get_partition_keys())
+
+
+class MultiPartitionsSubset(
+    PartitionsSubset,
+    NamedTuple(
+        "_MultiPartitionsSubset",
+        [
+            ("partitions_def", MultiPartitionsDefinition),
+            ("subsets_by_secondary_key", Mapping[str, PartitionsSubset]),
+        ],
+    ),
+):
+    """A PartitionsSubset for a MultiPartitionsDefinition, which internally stores a subset of the
+    primary dimension for each partition key of the secondary dimension, rather than the full set
+    of MultiPartitionKeys. Set operations and partition mappings are evaluated per dimension.
+
+    This is an in-memory class. When serialized with serdes, it is converted to an equivalent
+    DefaultPartitionsSubset.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data.
+    SERIALIZATION_VERSION = 1
+
+    def __new__(
+        cls,
+        partitions_def: MultiPartitionsDefinition,
+        subsets_by_secondary_key: Optional[Mapping[str, PartitionsSubset]] = None,
+    ):
+        check.opt_mapping_param(
+            subsets_by_secondary_key,
+            "subsets_by_secondary_key",
+            key_type=str,
+            value_type=PartitionsSubset,
+        )
+        return super(MultiPartitionsSubset, cls).__new__(
+            cls,
+            partitions_def=check.inst_param(
+                partitions_def, "partitions_def", MultiPartitionsDefinition
+            ),
+            # empty subsets are dropped so that equal subsets have the same secondary keys
+            subsets_by_secondary_key={
+                secondary_key: subset.to_serializable_subset()
+                if isinstance(subset, AllPartitionsSubset)
+                else subset
+                for secondary_key, subset in (subsets_by_secondary_key or {}).items()
+                if not subset.is_empty
+            },
+        )
+
+    @property
+    def primary_partitions_def(self) -> PartitionsDefinition:
+        return self.partitions_def.primary_dimension.partitions_def
+
+    @property
+    def secondary_partitions_def(self) -> PartitionsDefinition:
+        return self.partitions_def.secondary_dimension.partitions_def
+
+    def _get_dimension_names(self) -> Tuple[str, str]:
+        return (
+            self.partitions_def.primary_dimension.name,
+            self.partitions_def.secondary_dimension.name,
+        )
+
+    def _split_partition_key(self, partition_key: str) -> Optional[Tuple[str, str]]:
+        """Returns the primary and secondary keys of a partition key of the partitions_def, or None
+        if the partition key does not have a key for each dimension.
+        """
+        keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        if len(keys) != 2:
+            return None
+        # keys are ordered by dimension name
+        if (
+            self.partitions_def.partitions_defs[0].name
+            == self.partitions_def.primary_dimension.name
+        ):
+            return keys[0], keys[1]
+        return keys[1], keys[0]
+
+    def _group_by_secondary_key(self, partition_keys: Iterable[str]) -> Mapping[str, List[str]]:
+        primary_index = (
+            0
+            if self.partitions_def.partitions_defs[0].name
+            == self.partitions_def.primary_dimension.name
+            else 1
+        )
+        primary_keys_by_secondary_key: Dict[str, List[str]] = defaultdict(list)
+        for partition_key in partition_keys:
+            keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+            if len(keys) != 2:
+                check.failed(
+                    f"Invalid partition key {partition_key} for {self.partitions_def}. Expected a"
+                    " key for each dimension."
+                )
+            primary_keys_by_secondary_key[keys[1 - primary_index]].append(keys[primary_index])
+        return primary_keys_by_secondary_key
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.subsets_by_secondary_key) == 0
+
+    def get_partition_keys(self) -> AbstractSet[MultiPartitionKey]:
+        primary_name, secondary_name = self._get_dimension_names()
+        return {
+            MultiPartitionKey({primary_name: primary_key, secondary_name: secondary_key})
+            for secondary_key, subset in self.subsets_by_secondary_key.items()
+            for primary_key in subset.get_partition_keys()
+        }
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[MultiPartitionKey]:
+        if partitions_def != self.partitions_def:
+            return set(
+                partitions_def.get_partition_keys(
+                    current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+                )
+            ) - set(self.get_partition_keys())
+
+        primary_name, secondary_name = self._get_dimension_names()
+        primary_partitions_def = self.primary_partitions_def
+        all_primary_keys = list(
+            primary_partitions_def.get_partition_keys(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+        )
+        result = set()
+        for secondary_key in self.secondary_partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        ):
+            subset = self.subsets_by_secondary_key.get(secondary_key)
+            if subset is None:
+                primary_keys = all_primary_keys
+            elif (
+                isinstance(subset, TimeWindowPartitionsSubset)
+                and subset._ordinal_intervals is not None  # noqa: SLF001
+            ):
+                # ordinals are positions in the list of all primary keys, so the missing keys
+                # are the slices between the included intervals
+                primary_keys = []
+                prev_end = 0
+                for start, end in subset._ordinal_intervals:  # noqa: SLF001
+                    primary_keys.extend(all_primary_keys[prev_end:start])
+                    prev_end = end
+                primary_keys.extend(all_primary_keys[prev_end:])
+            else:
+                primary_keys = subset.get_partition_keys_not_in_subset(
+                    primary_partitions_def,
+                    current_time=current_time,
+                    dynamic_partitions_store=dynamic_partitions_store,
+                )
+            result.update(
+                MultiPartitionKey({primary_name: primary_key, secondary_name: secondary_key})
+                for primary_key in primary_keys
+            )
+        return result
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        partition_keys = partitions_def.get_partition_keys(
+            current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        cur_range_start = None
+        cur_range_end = None
+        result = []
+        for partition_key in partition_keys:
+            if partition_key in self:
+                if cur_range_start is None:
+                    cur_range_start = partition_key
+                cur_range_end = partition_key
+            else:
+                if cur_range_start is not None and cur_range_end is not None:
+                    result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+                cur_range_start = cur_range_end = None
+
+        if cur_range_start is not None and cur_range_end is not None:
+            result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+
+        return result
+
+    def _build_time_window_subsets(
+        self,
+        partitions_def: TimeWindowPartitionsDefinition,
+        primary_key_sets: Iterable[FrozenSet[str]],
+    ) -> Mapping[FrozenSet[str], PartitionsSubset]:
+        # most primary keys are shared by many secondary keys, so the time window of each primary
+        # key is computed once rather than once per secondary key
+        first_window = partitions_def.get_first_partition_window()
+        last_window = partitions_def.get_last_partition_window()
+        if first_window is None or last_window is None:
+            check.failed("No partitions in the PartitionsDefinition")
+        start_timestamp = first_window.start.timestamp()
+        end_timestamp = last_window.end.timestamp()
+
+        # (start timestamp, end timestamp, start, end) of the time window of each primary key
+        bounds_by_primary_key: Dict[str, Optional[Tuple[float, float, datetime, datetime]]] = {}
+        subsets_by_primary_keys: Dict[FrozenSet[str], PartitionsSubset] = {}
+        for primary_keys in primary_key_sets:
+            bounds = []
+            for primary_key in primary_keys:
+                if primary_key not in bounds_by_primary_key:
+                    time_window = partitions_def.time_window_for_partition_key(primary_key)
+                    window_start, window_end = (
+                        time_window.start.timestamp(),
+                        time_window.end.timestamp(),
+                    )
+                    # keys outside of the partitions definition are dropped, like in
+                    # TimeWindowPartitionsSubset.with_partition_keys
+                    bounds_by_primary_key[primary_key] = (
+                        (window_start, window_end, time_window.start, time_window.end)
+                        if window_start >= start_timestamp and window_end <= end_timestamp
+                        else None
+                    )
+                primary_key_bounds = bounds_by_primary_key[primary_key]
+                if primary_key_bounds is not None:
+                    bounds.append(primary_key_bounds)
+
+            bounds.sort()
+            merged_bounds: List[Tuple[float, float, datetime, datetime]] = []
+            for window_bounds in bounds:
+                if merged_bounds and merged_bounds[-1][1] == window_bounds[0]:
+                    merged_start, _, merged_start_dt, _ = merged_bounds[-1]
+                    merged_bounds[-1] = (
+                        merged_start,
+                        window_bounds[1],
+                        merged_start_dt,
+                        window_bounds[3],
+                    )
+                else:
+                    merged_bounds.append(window_bounds)
+            subsets_by_primary_keys[primary_keys] = TimeWindowPartitionsSubset(
+                partitions_def,
+                num_partitions=len(bounds),
+                included_time_windows=[
+                    TimeWindow(start_dt, end_dt) for _, _, start_dt, end_dt in merged_bounds
+                ],
+            )
+        return subsets_by_primary_keys
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "MultiPartitionsSubset":
+        primary_partitions_def = self.primary_partitions_def
+        primary_key_sets_by_secondary_key = {
+            secondary_key: frozenset(primary_keys)
+            for secondary_key, primary_keys in self._group_by_secondary_key(partition_keys).items()
+        }
+        # secondary keys that are added with the same primary keys share a primary subset
+        unique_primary_key_sets = set(primary_key_sets_by_secondary_key.values())
+        if isinstance(primary_partitions_def, TimeWindowPartitionsDefinition):
+            new_subsets_by_primary_keys = self._build_time_window_subsets(
+                primary_partitions_def, unique_primary_key_sets
+            )
+        else:
+            new_subsets_by_primary_keys = {
+                primary_keys: primary_partitions_def.empty_subset().with_partition_keys(
+                    primary_keys
+                )
+                for primary_keys in unique_primary_key_sets
+            }
+
+        subsets_by_secondary_key = dict(self.subsets_by_secondary_key)
+        for secondary_key, primary_keys in primary_key_sets_by_secondary_key.items():
+            new_subset = new_subsets_by_primary_keys[primary_keys]
+            subset = subsets_by_secondary_key.get(secondary_key)
+            subsets_by_secondary_key[secondary_key] = (
+                new_subset if subset is None else subset | new_subset
+            )
+        return MultiPartitionsSubset(self.partitions_def, subsets_by_secondary_key)
+
+    def with_cross_product(
+        self, primary_subset: PartitionsSubset, secondary_partition_keys: Iterable[str]
+    ) -> "MultiPartitionsSubset":
+        """Returns a subset that additionally contains every combination of a partition in the given
+        subset of the primary dimension with one of the given keys of the secondary dimension.
+        """
+        if primary_subset.is_empty:
+            return self
+        subsets_by_secondary_key = dict(self.subsets_by_secondary_key)
+        for secondary_key in secondary_partition_keys:
+            subset = subsets_by_secondary_key.get(secondary_key)
+            subsets_by_secondary_key[secondary_key] = (
+                primary_subset if subset is None else subset | primary_subset
+            )
+        return MultiPartitionsSubset(self.partitions_def, subsets_by_secondary_key)
+
+    def get_secondary_keys_by_primary_subset(
+        self,
+    ) -> Sequence[Tuple[PartitionsSubset, Sequence[str]]]:
+        """Groups the secondary keys of this subset by their subset of the primary dimension, so
+        that the subset can be processed as a small number of cross products.
+        """
+        groups: Dict[Any, Tuple[PartitionsSubset, List[str]]] = {}
+        for secondary_key, subset in self.subsets_by_secondary_key.items():
+            grouping_key = _get_subset_grouping_key(subset)
+            if grouping_key not in groups:
+                groups[grouping_key] = (subset, [])
+            groups[grouping_key][1].append(secondary_key)
+        return list(groups.values())
+
+    def _coerce(self, other: PartitionsSubset) -> Optional["MultiPartitionsSubset"]:
+        if isinstance(other, MultiPartitionsSubset):
+            if other.partitions_def is self.partitions_def or (
+                other.partitions_def == self.partitions_def
+            ):
+                return other
+            return None
+        if isinstance(other, AllPartitionsSubset):
+            return None
+        return self.empty_subset(self.partitions_def).with_partition_keys(
+            other.get_partition_keys()
+        )
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or other.is_empty:
+            return self
+        other_subset = self._coerce(other)
+        if other_subset is None:
+            return super().__or__(other)
+        subsets_by_secondary_key = dict(self.subsets_by_secondary_key)
+        for secondary_key, other_primary_subset in other_subset.subsets_by_secondary_key.items():
+            subset = subsets_by_secondary_key.get(secondary_key)
+            subsets_by_secondary_key[secondary_key] = (
+                other_primary_subset if subset is None else subset | other_primary_subset
+            )
+        return MultiPartitionsSubset(self.partitions_def, subsets_by_secondary_key)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self.empty_subset(self.partitions_def)
+        if other.is_empty:
+            return self
+        if isinstance(other, AllPartitionsSubset):
+            return self.empty_subset(self.partitions_def)
+        other_subset = self._coerce(other)
+        if other_subset is None:
+            return self.empty_subset(self.partitions_def).with_partition_keys(
+                set(self.get_partition_keys()) - set(other.get_partition_keys())
+            )
+        return MultiPartitionsSubset(
+            self.partitions_def,
+            {
+                secondary_key: subset - other_subset.subsets_by_secondary_key[secondary_key]
+                if secondary_key in other_subset.subsets_by_secondary_key
+                else subset
+                for secondary_key, subset in self.subsets_by_secondary_key.items()
+            },
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        if other.is_empty:
+            return self.empty_subset(self.partitions_def)
+        if isinstance(other, AllPartitionsSubset):
+            return self
+        other_subset = self._coerce(other)
+        if other_subset is None:
+            return self.empty_subset(self.partitions_def).with_partition_keys(
+                set(self.get_partition_keys()) & set(other.get_partition_keys())
+            )
+        return MultiPartitionsSubset(
+            self.partitions_def,
+            {
+                secondary_key: subset & other_subset.subsets_by_secondary_key[secondary_key]
+                for secondary_key, subset in self.subsets_by_secondary_key.items()
+                if secondary_key in other_subset.subsets_by_secondary_key
+            },
+        )
+
+    def serialize(self) -> str:
+        # Serialize version number, so attempting to deserialize old versions can be handled gracefully.
+        # Any time the serialization format changes, we should increment the version number.
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "primary_dimension": self.partitions_def.primary_dimension.name,
+                # sort to ensure that equivalent partition subsets have identical serialized forms
+                "subsets_by_secondary_key": {
+                    secondary_key: json.loads(
+                        self.subsets_by_secondary_key[secondary_key].serialize()
+                    )
+                    for secondary_key in sorted(self.subsets_by_secondary_key.keys())
+                },
+            }
+        )
+
+    @classmethod
+    def _is_serialized_multi_subset(cls, data: Any) -> bool:
+        return isinstance(data, dict) and "subsets_by_secondary_key" in data
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "MultiPartitionsSubset":
+        partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        data = json.loads(serialized)
+        if not cls._is_serialized_multi_subset(data):
+            # subsets serialized as a list of MultiPartitionKeys
+            return cls.empty_subset(partitions_def).with_partition_keys(
+                DefaultPartitionsSubset.from_serialized(
+                    partitions_def, serialized
+                ).get_partition_keys()
+            )
+
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {cls.SERIALIZATION_VERSION} is supported."
+            )
+        if data.get("primary_dimension") != partitions_def.primary_dimension.name:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with primary dimension"
+                f" {data.get('primary_dimension')}, but the primary dimension of"
+                f" {partitions_def} is {partitions_def.primary_dimension.name}."
+            )
+
+        primary_partitions_def = partitions_def.primary_dimension.partitions_def
+        return cls(
+            partitions_def,
+            {
+                secondary_key: primary_partitions_def.deserialize_subset(json.dumps(subset_data))
+                for secondary_key, subset_data in data["subsets_by_secondary_key"].items()
+            },
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        data = json.loads(serialized)
+        if not cls._is_serialized_multi_subset(data):
+            return DefaultPartitionsSubset.can_deserialize(
+                partitions_def,
+                serialized,
+                serialized_partitions_def_unique_id,
+                serialized_partitions_def_class_name,
+            )
+
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ) or not isinstance(partitions_def, MultiPartitionsDefinition):
+            return False
+
+        primary_partitions_def = partitions_def.primary_dimension.partitions_def
+        return (
+            data.get("version") == cls.SERIALIZATION_VERSION
+            and data.get("primary_dimension") == partitions_def.primary_dimension.name
+            and all(
+                primary_partitions_def.can_deserialize_subset(
+                    json.dumps(subset_data),
+                    serialized_partitions_def_unique_id=None,
+                    serialized_partitions_def_class_name=None,
+                )
+                for subset_data in data["subsets_by_secondary_key"].values()
+            )
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MultiPartitionsSubset) and other.partitions_def == self.partitions_def:
+            return self.subsets_by_secondary_key == other.subsets_by_secondary_key
+        if isinstance(other, (MultiPartitionsSubset, DefaultPartitionsSubset)):
+            return set(self.get_partition_keys()) == set(other.get_partition_keys())
+        return False
+
+    def __len__(self) -> int:
+        return sum(len(subset) for subset in self.subsets_by_secondary_key.values())
+
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, str):
+            return False
+        keys = self._split_partition_key(value)
+        if keys is None:
+            return False
+        primary_key, secondary_key = keys
+        subset = self.subsets_by_secondary_key.get(secondary_key)
+        return subset is not None and primary_key in subset
+
+    def __repr__(self) -> str:
+        return f"MultiPartitionsSubset(subsets_by_secondary_key={self.subsets_by_secondary_key})"
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "MultiPartitionsSubset":
+        if not isinstance(partitions_def, MultiPartitionsDefinition):
+            check.failed("Partitions definition must be a MultiPartitionsDefinition")
+        return cls(partitions_def)
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+
 def get_tags_from_multi_partition_key(multi_partition_key: MultiPartitionKey) -> Mapping[str, str]:
     check.inst_param(multi_partition_key, "multi_partition_key", MultiPartitionKey)
 
@@ -1,8 +1,13 @@
+import base64
 import copy
 import hashlib
+import itertools
 import json
+import re
+import threading
+import zlib
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from enum import Enum
 from typing import (
@@ -12,10 +17,12 @@
     Dict,
     Generic,
     Iterable,
+    Iterator,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -41,6 +48,7 @@
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster._serdes import whitelist_for_serdes
+from dagster._serdes.serdes import NamedTupleSerializer
 from dagster._utils import xor
 from dagster._utils.cached_method import cached_method
 from dagster._utils.tags import normalize_tags
@@ -151,6 +159,25 @@ def get_partition_keys(
         """
         ...
 
+    def iter_partition_keys(
+        self,
+        start_index: int = 0,
+        end_index: Optional[int] = None,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterator[T_str]:
+        """Iterates over the partition keys of the PartitionsDefinition between the given indexes,
+        in the same order as `get_partition_keys`. The start index is inclusive and the end index
+        is exclusive, or the iteration continues to the last partition if it is None.
+
+        Partitions definitions that can compute their keys from their position implement this
+        without building the full list of keys, so that huge partition sets can be paged through.
+        """
+        check_partition_key_indexes(start_index, end_index)
+        yield from itertools.islice(
+            self.get_partition_keys(current_time, dynamic_partitions_store), start_index, end_index
+        )
+
     def __str__(self) -> str:
         joined_keys = ", ".join([f"'{key}'" for key in self.get_partition_keys()])
         return joined_keys
@@ -280,6 +307,13 @@ def validate_partition_key(
             )
 
 
+def check_partition_key_indexes(start_index: int, end_index: Optional[int]) -> None:
+    check.int_param(start_index, "start_index")
+    check.opt_int_param(end_index, "end_index")
+    check.param_invariant(start_index >= 0, "start_index", "Must be non-negative")
+    check.param_invariant(end_index is None or end_index >= 0, "end_index", "Must be non-negative")
+
+
 def raise_error_on_invalid_partition_key_substring(partition_keys: Sequence[str]) -> None:
     for partition_key in partition_keys:
         found_invalid_substrs = [
@@ -337,6 +371,7 @@ def __init__(self, partition_keys: Sequence[str]):
         raise_error_on_duplicate_partition_keys(partition_keys)
 
         self._partition_keys = partition_keys
+        self._partition_key_index: Optional[PartitionKeyIndex] = None
 
     @public
     def get_partition_keys(
@@ -359,6 +394,17 @@ def get_partition_keys(
         """
         return self._partition_keys
 
+    def get_partition_key_index(
+        self, dynamic_partitions_store: Optional[DynamicPartitionsStore] = None
+    ) -> "PartitionKeyIndex":
+        # the partition keys of a static partitions definition never change, so subsets of it can
+        # be stored as bitmaps over the key order without any additional context
+        if self._partition_key_index is None:
+            self._partition_key_index = PartitionKeyIndex(
+                self._partition_keys, requires_dynamic_partitions_store=False
+            )
+        return self._partition_key_index
+
     def __hash__(self):
         return hash(self.__repr__())
 
@@ -398,6 +444,12 @@ def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) ->
         return self._instance.has_dynamic_partition(partitions_def_name, partition_key)
 
 
+_dynamic_partition_key_indexes: Dict[str, "PartitionKeyIndex"] = {}
+
+# number of dynamic partition keys read from storage at once when iterating over them
+DYNAMIC_PARTITION_KEYS_PAGE_SIZE = 10000
+
+
 @deprecated_param(
     param="partition_fn",
     breaking_version="2.0",
@@ -542,6 +594,35 @@ def get_partition_keys(
                 partitions_def_name=self._validated_name()
             )
 
+    def iter_partition_keys(
+        self,
+        start_index: int = 0,
+        end_index: Optional[int] = None,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterator[str]:
+        if self.partition_fn or not isinstance(dynamic_partitions_store, DagsterInstance):
+            yield from super().iter_partition_keys(
+                start_index, end_index, current_time, dynamic_partitions_store
+            )
+            return
+
+        check_partition_key_indexes(start_index, end_index)
+        # page through the keys in storage rather than loading all of them at once
+        index = 0
+        cursor = None
+        while end_index is None or index < end_index:
+            result = dynamic_partitions_store.get_paginated_dynamic_partitions(
+                self._validated_name(), limit=DYNAMIC_PARTITION_KEYS_PAGE_SIZE, cursor=cursor
+            )
+            for partition_key in result.partition_keys:
+                if start_index <= index and (end_index is None or index < end_index):
+                    yield partition_key
+                index += 1
+            if not result.has_more:
+                return
+            cursor = result.cursor
+
     def has_partition_key(
         self,
         partition_key: str,
@@ -564,6 +645,19 @@ def has_partition_key(
                 partitions_def_name=self._validated_name(), partition_key=partition_key
             )
 
+    def get_partition_key_index(
+        self, dynamic_partitions_store: Optional[DynamicPartitionsStore] = None
+    ) -> "PartitionKeyIndex":
+        partition_keys = self.get_partition_keys(dynamic_partitions_store=dynamic_partitions_store)
+        # caching dynamic partitions stores return the same sequence of keys on each call, so the
+        # index over them can be reused until the keys are refetched
+        key_index = _dynamic_partition_key_indexes.get(self.name) if self.name else None
+        if key_index is None or key_index.partition_keys is not partition_keys:
+            key_index = PartitionKeyIndex(partition_keys, requires_dynamic_partitions_store=True)
+            if self.name:
+                _dynamic_partition_key_indexes[self.name] = key_index
+        return key_index
+
     def build_add_request(self, partition_keys: Sequence[str]) -> AddDynamicPartitionsRequest:
         check.sequence_param(partition_keys, "partition_keys", of_type=str)
         validated_name = self._validated_name()
@@ -1091,7 +1185,258 @@ def deserialize(self, partitions_def: PartitionsDefinition) -> PartitionsSubset:
         return partitions_def.deserialize_subset(self.serialized_subset)
 
 
-@whitelist_for_serdes
+class PartitionKeyIndex:
+    """The position of each partition key in the key order of a partitions definition.
+
+    Subsets of partitions definitions with an index are stored as bitmaps over these positions. The
+    fingerprint of a prefix of the key order is stored alongside serialized bitmaps, so that they
+    can be decoded as long as keys have only been appended to the partitions definition since.
+    """
+
+    def __init__(self, partition_keys: Sequence[str], requires_dynamic_partitions_store: bool):
+        self._partition_keys = partition_keys
+        self._positions: Optional[Mapping[str, int]] = None
+        # bitmaps over the keys of dynamic partitions definitions can only be decoded when a
+        # dynamic partitions store is available, so they are only stored when one is
+        self.requires_dynamic_partitions_store = requires_dynamic_partitions_store
+        self._fingerprints: Dict[int, str] = {}
+
+    @property
+    def partition_keys(self) -> Sequence[str]:
+        return self._partition_keys
+
+    def __len__(self) -> int:
+        return len(self._partition_keys)
+
+    def is_equivalent(self, other: "PartitionKeyIndex") -> bool:
+        return self is other or self._partition_keys == other.partition_keys
+
+    def _get_positions(self) -> Mapping[str, int]:
+        if self._positions is None:
+            self._positions = dict(zip(self._partition_keys, range(len(self._partition_keys))))
+        return self._positions
+
+    def get_fingerprint(self, num_partition_keys: int) -> str:
+        if num_partition_keys not in self._fingerprints:
+            self._fingerprints[num_partition_keys] = hashlib.sha1(
+                json.dumps(list(self._partition_keys[:num_partition_keys])).encode("utf-8")
+            ).hexdigest()
+        return self._fingerprints[num_partition_keys]
+
+    def get_bitmap(self, partition_keys: Iterable[str]) -> Optional[int]:
+        """Returns the bitmap of the given partition keys, or None if any of them are not in the
+        index.
+        """
+        positions = self._get_positions()
+        bitmap = bytearray((len(self._partition_keys) + 7) // 8)
+        for partition_key in partition_keys:
+            position = positions.get(partition_key)
+            if position is None:
+                return None
+            bitmap[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(bitmap, "little")
+
+    def get_position(self, partition_key: str) -> Optional[int]:
+        return self._get_positions().get(partition_key)
+
+
+class PartitionKeyCacheStats(NamedTuple):
+    """Counters of lookups in a PartitionKeyCache, and the current size of the cache."""
+
+    hits: int
+    misses: int
+    num_entries: int
+    num_partition_keys: int
+
+    @property
+    def hit_rate(self) -> float:
+        num_lookups = self.hits + self.misses
+        return self.hits / num_lookups if num_lookups else 0.0
+
+
+class PartitionKeyCache:
+    """A process-wide LRU cache of PartitionKeyIndexes, so that partitions definitions shared by
+    many assets, or equal but distinct, enumerate and index their partition keys once rather than
+    on every call.
+
+    Entries are keyed by the serializable unique identifier of the partitions definition along with
+    a bucket of the current time in which its partition keys do not change. Least recently used
+    entries are evicted once the cached indexes hold more than max_num_partition_keys keys in total.
+    """
+
+    def __init__(self, max_num_partition_keys: int):
+        self._max_num_partition_keys = max_num_partition_keys
+        self._key_indexes: "OrderedDict[Tuple[str, int], PartitionKeyIndex]" = OrderedDict()
+        self._num_partition_keys = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def peek(self, cache_key: Tuple[str, int]) -> Optional[PartitionKeyIndex]:
+        """Returns the cached index for the given key if there is one, without counting a lookup.
+        Used where computing the index would cost more than the lookup it speeds up.
+        """
+        with self._lock:
+            key_index = self._key_indexes.get(cache_key)
+            if key_index is not None:
+                self._key_indexes.move_to_end(cache_key)
+            return key_index
+
+    def get(
+        self, cache_key: Tuple[str, int], get_partition_keys: Callable[[], Sequence[str]]
+    ) -> PartitionKeyIndex:
+        with self._lock:
+            key_index = self._key_indexes.get(cache_key)
+            if key_index is not None:
+                self._hits += 1
+                self._key_indexes.move_to_end(cache_key)
+                return key_index
+            self._misses += 1
+
+        # computed outside of the lock, so a concurrent miss for the same key computes it twice
+        key_index = PartitionKeyIndex(get_partition_keys(), requires_dynamic_partitions_store=False)
+        with self._lock:
+            if cache_key not in self._key_indexes:
+                self._key_indexes[cache_key] = key_index
+                self._num_partition_keys += len(key_index)
+            while self._num_partition_keys > self._max_num_partition_keys and self._key_indexes:
+                _, evicted = self._key_indexes.popitem(last=False)
+                self._num_partition_keys -= len(evicted)
+        return key_index
+
+    @property
+    def stats(self) -> PartitionKeyCacheStats:
+        with self._lock:
+            return PartitionKeyCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                num_entries=len(self._key_indexes),
+                num_partition_keys=self._num_partition_keys,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._key_indexes.clear()
+            self._num_partition_keys = 0
+            self._hits = 0
+            self._misses = 0
+
+
+# a million keys, e.g. a century of hourly partitions, take on the order of 100MB with their positions
+PARTITION_KEY_CACHE_MAX_NUM_PARTITION_KEYS = 1_000_000
+
+_partition_key_cache = PartitionKeyCache(PARTITION_KEY_CACHE_MAX_NUM_PARTITION_KEYS)
+
+
+def get_partition_key_cache() -> PartitionKeyCache:
+    """Returns the PartitionKeyCache shared by all partitions definitions in the process."""
+    return _partition_key_cache
+
+
+def _iter_bitmap_runs(bitmap: int) -> Iterator[Tuple[int, int]]:
+    """Yields the half-open ranges of positions of consecutive set bits in the bitmap."""
+    for match in re.finditer("1+", format(bitmap, "b")[::-1]):
+        yield match.start(), match.end()
+
+
+class PartitionKeyBitmap(AbstractSet[str]):
+    """A set of partition keys stored as a bitmap over the positions of a PartitionKeyIndex.
+
+    Set operations between bitmaps over the same key order are bitwise operations on the bitmaps.
+    Set operations with any other set fall back to building a python set.
+    """
+
+    def __init__(self, key_index: PartitionKeyIndex, bitmap: int):
+        self._key_index = key_index
+        self._bitmap = bitmap
+        self._len: Optional[int] = None
+
+    @property
+    def key_index(self) -> PartitionKeyIndex:
+        return self._key_index
+
+    @property
+    def bitmap(self) -> int:
+        return self._bitmap
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[str]) -> AbstractSet[str]:
+        return set(it)
+
+    def _get_shared_bitmap(self, other: object) -> Optional[int]:
+        if isinstance(other, PartitionKeyBitmap) and self._key_index.is_equivalent(other.key_index):
+            return other.bitmap
+        return None
+
+    def __contains__(self, value: object) -> bool:
+        position = self._key_index.get_position(value) if isinstance(value, str) else None
+        return position is not None and bool(self._bitmap >> position & 1)
+
+    def __iter__(self) -> Iterator[str]:
+        partition_keys = self._key_index.partition_keys
+        for start, end in _iter_bitmap_runs(self._bitmap):
+            yield from partition_keys[start:end]
+
+    def __len__(self) -> int:
+        if self._len is None:
+            self._len = bin(self._bitmap).count("1")
+        return self._len
+
+    def __eq__(self, other: object) -> bool:
+        other_bitmap = self._get_shared_bitmap(other)
+        if other_bitmap is not None:
+            return self._bitmap == other_bitmap
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore  # mutable-set semantics, like set
+
+    def __and__(self, other: Iterable[Any]) -> AbstractSet[str]:
+        other_bitmap = self._get_shared_bitmap(other)
+        if other_bitmap is not None:
+            return PartitionKeyBitmap(self._key_index, self._bitmap & other_bitmap)
+        return super().__and__(other)
+
+    def __or__(self, other: Iterable[Any]) -> AbstractSet[str]:
+        other_bitmap = self._get_shared_bitmap(other)
+        if other_bitmap is not None:
+            return PartitionKeyBitmap(self._key_index, self._bitmap | other_bitmap)
+        return super().__or__(other)
+
+    def __sub__(self, other: Iterable[Any]) -> AbstractSet[str]:
+        other_bitmap = self._get_shared_bitmap(other)
+        if other_bitmap is not None:
+            return PartitionKeyBitmap(self._key_index, self._bitmap & ~other_bitmap)
+        return super().__sub__(other)
+
+    def complement(self) -> "PartitionKeyBitmap":
+        return PartitionKeyBitmap(
+            self._key_index, ((1 << len(self._key_index)) - 1) & ~self._bitmap
+        )
+
+    def iter_ranges(self) -> Iterator[Tuple[str, str]]:
+        """Yields the first and last partition key of each run of consecutive keys in the set."""
+        partition_keys = self._key_index.partition_keys
+        for start, end in _iter_bitmap_runs(self._bitmap):
+            yield partition_keys[start], partition_keys[end - 1]
+
+    def __repr__(self) -> str:
+        return (
+            "{" + ", ".join(repr(partition_key) for partition_key in self) + "}"
+            if self
+            else "set()"
+        )
+
+
+class DefaultPartitionsSubsetSerializer(NamedTupleSerializer):
+    # Bitmap-backed subsets are only meaningful alongside their partitions definition, so they are
+    # stored as plain sets when serialized as part of another object.
+    def before_pack(self, value: "DefaultPartitionsSubset") -> "DefaultPartitionsSubset":
+        if isinstance(value.subset, PartitionKeyBitmap):
+            return DefaultPartitionsSubset(set(value.subset))
+        return value
+
+
+@whitelist_for_serdes(serializer=DefaultPartitionsSubsetSerializer)
 class DefaultPartitionsSubset(
     PartitionsSubset,
     NamedTuple("_DefaultPartitionsSubset", [("subset", AbstractSet[str])]),
@@ -1099,13 +1444,39 @@ class DefaultPartitionsSubset(
     # Every time we change the serialization format, we should increment the version number.
     # This will ensure that we can gracefully degrade when deserializing old data.
     SERIALIZATION_VERSION = 1
+    # Subsets that are stored as bitmaps over the key order of their partitions definition are
+    # serialized as compressed bitmaps instead of as a list of keys.
+    BITMAP_SERIALIZATION_VERSION = 2
 
     def __new__(
         cls,
         subset: Optional[AbstractSet[str]] = None,
     ):
-        check.opt_set_param(subset, "subset")
-        return super(DefaultPartitionsSubset, cls).__new__(cls, subset or set())
+        if not isinstance(subset, PartitionKeyBitmap):
+            check.opt_set_param(subset, "subset")
+        return super(DefaultPartitionsSubset, cls).__new__(
+            cls, subset if subset is not None else set()
+        )
+
+    @staticmethod
+    def _get_key_index(partitions_def: PartitionsDefinition) -> Optional[PartitionKeyIndex]:
+        if isinstance(partitions_def, StaticPartitionsDefinition):
+            return partitions_def.get_partition_key_index()
+        return None
+
+    def _get_bitmap_for_partitions_def(
+        self, partitions_def: PartitionsDefinition
+    ) -> Optional[PartitionKeyBitmap]:
+        if not isinstance(self.subset, PartitionKeyBitmap):
+            return None
+        key_index = self._get_key_index(partitions_def)
+        if key_index is None or not key_index.is_equivalent(self.subset.key_index):
+            return None
+        return self.subset
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self.subset) == 0
 
     def get_partition_keys_not_in_subset(
         self,
@@ -1113,6 +1484,10 @@ def get_partition_keys_not_in_subset(
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Iterable[str]:
+        bitmap = self._get_bitmap_for_partitions_def(partitions_def)
+        if bitmap is not None:
+            return bitmap.complement()
+
         return set(
             partitions_def.get_partition_keys(
                 current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
@@ -1128,6 +1503,10 @@ def get_partition_key_ranges(
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Sequence[PartitionKeyRange]:
+        bitmap = self._get_bitmap_for_partitions_def(partitions_def)
+        if bitmap is not None:
+            return [PartitionKeyRange(start, end) for start, end in bitmap.iter_ranges()]
+
         partition_keys = partitions_def.get_partition_keys(
             current_time, dynamic_partitions_store=dynamic_partitions_store
         )
@@ -1150,11 +1529,53 @@ def get_partition_key_ranges(
         return result
 
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "DefaultPartitionsSubset":
+        if isinstance(self.subset, PartitionKeyBitmap):
+            partition_keys = list(partition_keys)
+            bitmap = self.subset.key_index.get_bitmap(partition_keys)
+            if bitmap is not None:
+                return DefaultPartitionsSubset(
+                    PartitionKeyBitmap(self.subset.key_index, self.subset.bitmap | bitmap)
+                )
+
         return DefaultPartitionsSubset(
-            self.subset | set(partition_keys),
+            set(self.subset) | set(partition_keys),
         )
 
+    def with_key_index(self, key_index: PartitionKeyIndex) -> "DefaultPartitionsSubset":
+        """Returns an equivalent subset stored as a bitmap over the given key order, or this subset
+        if it contains keys that are not in the key order.
+        """
+        if isinstance(self.subset, PartitionKeyBitmap) and self.subset.key_index.is_equivalent(
+            key_index
+        ):
+            return self
+        bitmap = key_index.get_bitmap(self.subset)
+        if bitmap is None:
+            return self
+        return DefaultPartitionsSubset(PartitionKeyBitmap(key_index, bitmap))
+
+    def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if isinstance(other, DefaultPartitionsSubset):
+            return DefaultPartitionsSubset(self.subset | other.subset)
+        return super().__or__(other)
+
+    def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if isinstance(other, DefaultPartitionsSubset):
+            return DefaultPartitionsSubset(self.subset - other.subset)
+        return super().__sub__(other)
+
+    def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
+        if isinstance(other, DefaultPartitionsSubset):
+            return DefaultPartitionsSubset(self.subset & other.subset)
+        return super().__and__(other)
+
     def serialize(self) -> str:
+        if (
+            isinstance(self.subset, PartitionKeyBitmap)
+            and not self.subset.key_index.requires_dynamic_partitions_store
+        ):
+            return self.serialize_bitmap(self.subset.key_index)
+
         # Serialize version number, so attempting to deserialize old versions can be handled gracefully.
         # Any time the serialization format changes, we should increment the version number.
         return json.dumps(
@@ -1165,13 +1586,82 @@ def serialize(self) -> str:
             }
         )
 
+    def serialize_bitmap(self, key_index: PartitionKeyIndex) -> str:
+        """Serializes the subset as a compressed bitmap over the given key order. Falls back to
+        serializing the list of keys if the subset contains keys that are not in the key order.
+        """
+        subset = self.with_key_index(key_index)
+        if not isinstance(subset.subset, PartitionKeyBitmap):
+            return DefaultPartitionsSubset(set(subset.subset)).serialize()
+
+        num_partition_keys = len(key_index)
+        return json.dumps(
+            {
+                "version": self.BITMAP_SERIALIZATION_VERSION,
+                "num_partition_keys": num_partition_keys,
+                "partition_keys_fingerprint": key_index.get_fingerprint(num_partition_keys),
+                "bitmap": base64.b64encode(
+                    zlib.compress(
+                        subset.subset.bitmap.to_bytes((num_partition_keys + 7) // 8, "little")
+                    )
+                ).decode("ascii"),
+            }
+        )
+
     @classmethod
-    def from_serialized(
-        cls, partitions_def: PartitionsDefinition, serialized: str
-    ) -> "PartitionsSubset":
-        # Check the version number, so only valid versions can be deserialized.
+    def _can_decode_bitmap(cls, key_index: PartitionKeyIndex, data: Mapping[str, Any]) -> bool:
+        num_partition_keys = data.get("num_partition_keys")
+        return (
+            isinstance(num_partition_keys, int)
+            and num_partition_keys <= len(key_index)
+            and key_index.get_fingerprint(num_partition_keys)
+            == data.get("partition_keys_fingerprint")
+        )
+
+    @classmethod
+    def _decode_bitmap(
+        cls, key_index: PartitionKeyIndex, data: Mapping[str, Any]
+    ) -> "DefaultPartitionsSubset":
+        if not cls._can_decode_bitmap(key_index, data):
+            raise DagsterInvalidDeserializationVersionError(
+                "Attempted to deserialize a partition subset bitmap over a different partition key"
+                " order than the current one. This likely indicates that partition keys have been"
+                " removed or reordered since it was stored."
+            )
+        bitmap = int.from_bytes(zlib.decompress(base64.b64decode(data["bitmap"])), "little")
+        return cls(subset=PartitionKeyBitmap(key_index, bitmap))
+
+    @classmethod
+    def can_deserialize_bitmap(cls, key_index: PartitionKeyIndex, serialized: str) -> bool:
+        """Returns whether the given string was serialized with `serialize_bitmap` over a prefix of
+        the given key order, i.e. whether it decodes to exactly the keys it was serialized from.
+        """
+        data = json.loads(serialized)
+        return (
+            isinstance(data, dict)
+            and data.get("version") == cls.BITMAP_SERIALIZATION_VERSION
+            and cls._can_decode_bitmap(key_index, data)
+        )
+
+    @classmethod
+    def is_serialized_bitmap(cls, serialized: str) -> bool:
+        data = json.loads(serialized)
+        return isinstance(data, dict) and data.get("version") == cls.BITMAP_SERIALIZATION_VERSION
+
+    @classmethod
+    def from_serialized_bitmap(
+        cls, key_index: PartitionKeyIndex, serialized: str
+    ) -> "DefaultPartitionsSubset":
+        """Deserializes a subset serialized with `serialize_bitmap` over the given key order. Also
+        accepts subsets serialized as a list of keys.
+        """
         data = json.loads(serialized)
+        if isinstance(data, dict) and data.get("version") == cls.BITMAP_SERIALIZATION_VERSION:
+            return cls._decode_bitmap(key_index, data)
+        return cls._from_data(data).with_key_index(key_index)
 
+    @classmethod
+    def _from_data(cls, data: Any) -> "DefaultPartitionsSubset":
         if isinstance(data, list):
             # backwards compatibility
             return cls(subset=set(data))
@@ -1183,6 +1673,25 @@ def from_serialized(
                 )
             return cls(subset=set(data.get("subset")))
 
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset":
+        # Check the version number, so only valid versions can be deserialized.
+        data = json.loads(serialized)
+
+        key_index = cls._get_key_index(partitions_def)
+        if isinstance(data, dict) and data.get("version") == cls.BITMAP_SERIALIZATION_VERSION:
+            if key_index is None:
+                raise DagsterInvalidDeserializationVersionError(
+                    "Attempted to deserialize a partition subset bitmap without the partition keys"
+                    f" of {partitions_def}."
+                )
+            return cls._decode_bitmap(key_index, data)
+
+        subset = cls._from_data(data)
+        return subset.with_key_index(key_index) if key_index is not None else subset
+
     @classmethod
     def can_deserialize(
         cls,
@@ -1191,16 +1700,29 @@ def can_deserialize(
         serialized_partitions_def_unique_id: Optional[str],
         serialized_partitions_def_class_name: Optional[str],
     ) -> bool:
-        if serialized_partitions_def_class_name is not None:
-            return serialized_partitions_def_class_name == partitions_def.__class__.__name__
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
 
         data = json.loads(serialized)
-        return isinstance(data, list) or (
-            data.get("subset") is not None and data.get("version") == cls.SERIALIZATION_VERSION
+        if isinstance(data, dict) and data.get("version") == cls.BITMAP_SERIALIZATION_VERSION:
+            key_index = cls._get_key_index(partitions_def)
+            return key_index is not None and cls._can_decode_bitmap(key_index, data)
+
+        return serialized_partitions_def_class_name is not None or (
+            isinstance(data, list)
+            or (data.get("subset") is not None and data.get("version") == cls.SERIALIZATION_VERSION)
         )
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
+        if isinstance(other, DefaultPartitionsSubset):
+            return self.subset == other.subset
+        if isinstance(other, PartitionsSubset) and not isinstance(other, AllPartitionsSubset):
+            # defer to other subset types that store partitions of the same keys differently
+            return NotImplemented
+        return False
 
     def __len__(self) -> int:
         return len(self.subset)
@@ -1215,6 +1737,9 @@ def __repr__(self) -> str:
     def empty_subset(
         cls, partitions_def: Optional[PartitionsDefinition] = None
     ) -> "DefaultPartitionsSubset":
+        key_index = cls._get_key_index(partitions_def) if partitions_def else None
+        if key_index is not None:
+            return cls(subset=PartitionKeyBitmap(key_index, 0))
         return cls()
 
 
@@ -1,5 +1,4 @@
 import collections.abc
-import itertools
 import warnings
 from abc import ABC, abstractmethod, abstractproperty
 from collections import defaultdict
@@ -22,8 +21,8 @@
 import dagster._check as check
 from dagster._annotations import PublicAttr, experimental, public
 from dagster._core.definitions.multi_dimensional_partitions import (
-    MultiPartitionKey,
     MultiPartitionsDefinition,
+    MultiPartitionsSubset,
 )
 from dagster._core.definitions.partition import (
     AllPartitionsSubset,
@@ -375,23 +374,6 @@ def _get_dependency_partitions_subset(
         partition keys in the partitions definition b_partitions_def that are
         dependencies of the partition keys in a_partition_keys.
         """
-        a_partition_keys_by_dimension = defaultdict(set)
-        if isinstance(a_partitions_def, MultiPartitionsDefinition):
-            for partition_key in a_partitions_subset.get_partition_keys():
-                key = a_partitions_def.get_partition_key_from_str(partition_key)
-                for dimension_name, key in key.keys_by_dimension.items():
-                    a_partition_keys_by_dimension[dimension_name].add(key)
-        else:
-            for partition_key in a_partitions_subset.get_partition_keys():
-                a_partition_keys_by_dimension[None].add(partition_key)
-
-        # Maps the dimension name and key of a partition in a_partitions_def to the list of
-        # partition keys in b_partitions_def that are dependencies of that partition
-        dep_b_keys_by_a_dim_and_key: Dict[Optional[str], Dict[Optional[str], List[str]]] = (
-            defaultdict(lambda: defaultdict(list))
-        )
-        required_but_nonexistent_upstream_partitions = set()
-
         b_dimension_partitions_def_by_name: Dict[Optional[str], PartitionsDefinition] = (
             {
                 dimension.name: dimension.partitions_def
@@ -401,10 +383,9 @@ def _get_dependency_partitions_subset(
             else {None: b_partitions_def}
         )
 
+        # Maps the dimension names of a_partitions_def to the corresponding dependent or
+        # dependency dimensions of b_partitions_def
         if a_upstream_of_b:
-            # a_partitions_def is upstream of b_partitions_def, so we need to map the
-            # dimension names of a_partitions_def to the corresponding dependent dimensions of
-            # b_partitions_def
             a_dim_to_dependency_b_dim = {
                 dimension_mapping.upstream_dimension_name: (
                     dimension_mapping.downstream_dimension_name,
@@ -414,38 +395,7 @@ def _get_dependency_partitions_subset(
                     a_partitions_def, b_partitions_def
                 )
             }
-
-            for a_dim_name, keys in a_partition_keys_by_dimension.items():
-                if a_dim_name in a_dim_to_dependency_b_dim:
-                    (
-                        b_dim_name,
-                        dimension_mapping,
-                    ) = a_dim_to_dependency_b_dim[a_dim_name]
-                    a_dimension_partitions_def = self.get_partitions_def(
-                        a_partitions_def, a_dim_name
-                    )
-                    b_dimension_partitions_def = self.get_partitions_def(
-                        b_partitions_def, b_dim_name
-                    )
-                    for key in keys:
-                        # if downstream dimension mapping exists, for a given key, get the list of
-                        # downstream partition keys that are dependencies of that key
-                        dep_b_keys_by_a_dim_and_key[a_dim_name][key] = list(
-                            dimension_mapping.get_downstream_partitions_for_partitions(
-                                a_dimension_partitions_def.empty_subset().with_partition_keys(
-                                    [key]
-                                ),
-                                a_dimension_partitions_def,
-                                b_dimension_partitions_def,
-                                current_time=current_time,
-                                dynamic_partitions_store=dynamic_partitions_store,
-                            ).get_partition_keys()
-                        )
-
         else:
-            # a_partitions_def is downstream of b_partitions_def, so we need to map the
-            # dimension names of a_partitions_def to the corresponding dependency dimensions of
-            # b_partitions_def
             a_dim_to_dependency_b_dim = {
                 dimension_mapping.downstream_dimension_name: (
                     dimension_mapping.upstream_dimension_name,
@@ -456,80 +406,85 @@ def _get_dependency_partitions_subset(
                 )
             }
 
-            for a_dim_name, keys in a_partition_keys_by_dimension.items():
-                if a_dim_name in a_dim_to_dependency_b_dim:
-                    (
-                        b_dim_name,
-                        partition_mapping,
-                    ) = a_dim_to_dependency_b_dim[a_dim_name]
-                    a_dimension_partitions_def = self.get_partitions_def(
-                        a_partitions_def, a_dim_name
-                    )
-                    b_dimension_partitions_def = self.get_partitions_def(
-                        b_partitions_def, b_dim_name
-                    )
-                    for key in keys:
-                        mapped_partitions_result = (
-                            partition_mapping.get_upstream_mapped_partitions_result_for_partitions(
-                                a_dimension_partitions_def.empty_subset().with_partition_keys(
-                                    [key]
-                                ),
-                                a_dimension_partitions_def,
-                                b_dimension_partitions_def,
-                                current_time=current_time,
-                                dynamic_partitions_store=dynamic_partitions_store,
-                            )
-                        )
-                        dep_b_keys_by_a_dim_and_key[a_dim_name][key] = list(
-                            mapped_partitions_result.partitions_subset.get_partition_keys()
-                        )
-                        required_but_nonexistent_upstream_partitions.update(
-                            set(mapped_partitions_result.required_but_nonexistent_partition_keys)
-                        )
-
-        b_partition_keys = set()
-
-        mapped_a_dim_names = a_dim_to_dependency_b_dim.keys()
         mapped_b_dim_names = [mapping[0] for mapping in a_dim_to_dependency_b_dim.values()]
-        unmapped_b_dim_names = list(
-            set(b_dimension_partitions_def_by_name.keys()) - set(mapped_b_dim_names)
-        )
+        unmapped_b_subsets_by_dim_name = {
+            dim_name: b_dimension_partitions_def_by_name[dim_name].subset_with_all_partitions(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+            for dim_name in set(b_dimension_partitions_def_by_name.keys()) - set(mapped_b_dim_names)
+        }
 
-        for key in a_partitions_subset.get_partition_keys():
-            for b_key_values in itertools.product(
-                *(
-                    [
-                        dep_b_keys_by_a_dim_and_key[dim_name][
-                            (
-                                cast(MultiPartitionsDefinition, a_partitions_def)
-                                .get_partition_key_from_str(key)
-                                .keys_by_dimension[dim_name]
-                                if dim_name
-                                else key
-                            )
-                        ]
-                        for dim_name in mapped_a_dim_names
-                    ]
-                ),
-                *[
-                    b_dimension_partitions_def_by_name[dim_name].get_partition_keys(
-                        dynamic_partitions_store=dynamic_partitions_store, current_time=current_time
-                    )
-                    for dim_name in unmapped_b_dim_names
-                ],
+        # Rather than mapping each partition key, a_partitions_subset is split into cross
+        # products of a subset of each dimension, and each dimension of each cross product is
+        # mapped in a single call
+        a_subsets_by_dim_name: List[Mapping[Optional[str], PartitionsSubset]] = []
+        if isinstance(a_partitions_def, MultiPartitionsDefinition):
+            if not (
+                isinstance(a_partitions_subset, MultiPartitionsSubset)
+                and a_partitions_subset.partitions_def == a_partitions_def
             ):
-                b_partition_keys.add(
-                    MultiPartitionKey(
-                        {
-                            cast(str, (mapped_b_dim_names + unmapped_b_dim_names)[i]): key
-                            for i, key in enumerate(b_key_values)
-                        }
+                a_partitions_subset = MultiPartitionsSubset.empty_subset(
+                    a_partitions_def
+                ).with_partition_keys(a_partitions_subset.get_partition_keys())
+            primary_dimension = a_partitions_def.primary_dimension
+            secondary_dimension = a_partitions_def.secondary_dimension
+            for (
+                primary_subset,
+                secondary_keys,
+            ) in a_partitions_subset.get_secondary_keys_by_primary_subset():
+                a_subsets_by_dim_name.append(
+                    {
+                        primary_dimension.name: primary_subset,
+                        secondary_dimension.name: secondary_dimension.partitions_def.empty_subset().with_partition_keys(
+                            secondary_keys
+                        ),
+                    }
+                )
+        elif not a_partitions_subset.is_empty:
+            a_subsets_by_dim_name.append({None: a_partitions_subset})
+
+        mapped_subset = b_partitions_def.empty_subset()
+        required_but_nonexistent_upstream_partitions = set()
+        for a_subset_by_dim_name in a_subsets_by_dim_name:
+            b_subset_by_dim_name = dict(unmapped_b_subsets_by_dim_name)
+            for a_dim_name, (b_dim_name, partition_mapping) in a_dim_to_dependency_b_dim.items():
+                a_dimension_partitions_def = self.get_partitions_def(a_partitions_def, a_dim_name)
+                b_dimension_partitions_def = self.get_partitions_def(b_partitions_def, b_dim_name)
+                if a_upstream_of_b:
+                    b_subset_by_dim_name[b_dim_name] = (
+                        partition_mapping.get_downstream_partitions_for_partitions(
+                            a_subset_by_dim_name[a_dim_name],
+                            a_dimension_partitions_def,
+                            b_dimension_partitions_def,
+                            current_time=current_time,
+                            dynamic_partitions_store=dynamic_partitions_store,
+                        )
                     )
-                    if len(b_key_values) > 1
-                    else b_key_values[0]  # type: ignore
+                else:
+                    mapped_partitions_result = (
+                        partition_mapping.get_upstream_mapped_partitions_result_for_partitions(
+                            a_subset_by_dim_name[a_dim_name],
+                            a_dimension_partitions_def,
+                            b_dimension_partitions_def,
+                            current_time=current_time,
+                            dynamic_partitions_store=dynamic_partitions_store,
+                        )
+                    )
+                    b_subset_by_dim_name[b_dim_name] = mapped_partitions_result.partitions_subset
+                    required_but_nonexistent_upstream_partitions.update(
+                        set(mapped_partitions_result.required_but_nonexistent_partition_keys)
+                    )
+
+            if isinstance(b_partitions_def, MultiPartitionsDefinition):
+                mapped_subset = cast(MultiPartitionsSubset, mapped_subset).with_cross_product(
+                    b_subset_by_dim_name[b_partitions_def.primary_dimension.name],
+                    b_subset_by_dim_name[
+                        b_partitions_def.secondary_dimension.name
+                    ].get_partition_keys(),
                 )
+            else:
+                mapped_subset = mapped_subset | b_subset_by_dim_name[None]
 
-        mapped_subset = b_partitions_def.empty_subset().with_partition_keys(b_partition_keys)
         if a_upstream_of_b:
             return mapped_subset
         else:
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import List, NamedTuple, Optional, Sequence, cast
+from typing import List, NamedTuple, Optional, Sequence, Tuple, cast
 
 import dagster._check as check
 from dagster._annotations import PublicAttr, experimental_param
@@ -266,6 +266,18 @@ def _map_partitions(
         if result is not None:
             return result
 
+        result = self._map_partitions_by_ordinals(
+            from_partitions_def=from_partitions_def,
+            to_partitions_def=to_partitions_def,
+            from_partitions_subset=from_partitions_subset,
+            start_offset=start_offset,
+            end_offset=end_offset,
+            current_time=current_time,
+            mapping_downstream_to_upstream=mapping_downstream_to_upstream,
+        )
+        if result is not None:
+            return result
+
         first_window = to_partitions_def.get_first_partition_window(current_time=current_time)
         last_window = to_partitions_def.get_last_partition_window(current_time=current_time)
         full_window = (
@@ -274,115 +286,298 @@ def _map_partitions(
             else None
         )
 
-        time_windows = []
+        filtered_time_windows = []
+        required_but_nonexistent_partition_keys = set()
         for from_partition_time_window in from_partitions_subset.included_time_windows:
-            from_start_dt, from_end_dt = (
-                from_partition_time_window.start,
-                from_partition_time_window.end,
+            time_window = self._map_time_window(
+                from_partitions_def=from_partitions_def,
+                to_partitions_def=to_partitions_def,
+                from_time_window=from_partition_time_window,
+                start_offset=start_offset,
+                end_offset=end_offset,
+                full_window=full_window,
+                mapping_downstream_to_upstream=mapping_downstream_to_upstream,
             )
+            if time_window is None:
+                continue
 
-            if mapping_downstream_to_upstream:
-                offsetted_from_start_dt = _offsetted_datetime_with_bounds(
-                    from_partitions_def, from_start_dt, start_offset, full_window
-                )
-                offsetted_from_end_dt = _offsetted_datetime_with_bounds(
-                    from_partitions_def, from_end_dt, end_offset, full_window
-                )
-            else:
-                # we'll apply the offsets later, after we've found the corresponding windows
-                offsetted_from_start_dt = from_start_dt
-                offsetted_from_end_dt = from_end_dt
+            filtered_time_window, nonexistent_partition_keys = self._filter_time_window(
+                to_partitions_def, time_window, first_window, last_window
+            )
+            if filtered_time_window is not None:
+                filtered_time_windows.append(filtered_time_window)
+            required_but_nonexistent_partition_keys.update(nonexistent_partition_keys)
 
-            # Align the windows to partition boundaries in the target PartitionsDefinition
-            if (from_partitions_def.cron_schedule == to_partitions_def.cron_schedule) or (
-                from_partitions_def.is_basic_daily and to_partitions_def.is_basic_hourly
-            ):
-                # If the above conditions hold true, then we're confident that the partition
-                # boundaries in the PartitionsDefinition that we're mapping from match up with
-                # boundaries in the PartitionsDefinition that we're mapping to. That means
-                # we can just use these boundaries directly instead of finding nearby boundaries.
-                to_start_dt = offsetted_from_start_dt
-                to_end_dt = offsetted_from_end_dt
-            else:
-                # The partition boundaries that we're mapping from might land in the middle of
-                # partitions that we're mapping to, so find those partitions.
-                to_start_partition_key = to_partitions_def.get_partition_key_for_timestamp(
-                    offsetted_from_start_dt.timestamp(), end_closed=False
-                )
-                to_end_partition_key = to_partitions_def.get_partition_key_for_timestamp(
-                    offsetted_from_end_dt.timestamp(), end_closed=True
-                )
+        return UpstreamPartitionsResult(
+            TimeWindowPartitionsSubset(
+                to_partitions_def,
+                num_partitions=None,
+                included_time_windows=self._merge_time_windows(filtered_time_windows),
+            ),
+            sorted(list(required_but_nonexistent_partition_keys)),
+        )
 
-                to_start_dt = to_partitions_def.start_time_for_partition_key(to_start_partition_key)
-                to_end_dt = to_partitions_def.end_time_for_partition_key(to_end_partition_key)
+    def _map_time_window(
+        self,
+        from_partitions_def: TimeWindowPartitionsDefinition,
+        to_partitions_def: TimeWindowPartitionsDefinition,
+        from_time_window: TimeWindow,
+        start_offset: int,
+        end_offset: int,
+        full_window: Optional[TimeWindow],
+        mapping_downstream_to_upstream: bool,
+    ) -> Optional[TimeWindow]:
+        """Maps a time window of from_partitions_def to the time window of to_partitions_def that
+        it depends on or is depended on by, or returns None if it maps to an empty time window.
+        The result may extend beyond the partitions of to_partitions_def.
+        """
+        from_start_dt, from_end_dt = from_time_window.start, from_time_window.end
 
-            if mapping_downstream_to_upstream:
-                offsetted_to_start_dt = to_start_dt
-                offsetted_to_end_dt = to_end_dt
-            else:
-                offsetted_to_start_dt = _offsetted_datetime_with_bounds(
-                    to_partitions_def, to_start_dt, start_offset, full_window
-                )
-                offsetted_to_end_dt = _offsetted_datetime_with_bounds(
-                    to_partitions_def, to_end_dt, end_offset, full_window
-                )
+        if mapping_downstream_to_upstream:
+            offsetted_from_start_dt = _offsetted_datetime_with_bounds(
+                from_partitions_def, from_start_dt, start_offset, full_window
+            )
+            offsetted_from_end_dt = _offsetted_datetime_with_bounds(
+                from_partitions_def, from_end_dt, end_offset, full_window
+            )
+        else:
+            # we'll apply the offsets later, after we've found the corresponding windows
+            offsetted_from_start_dt = from_start_dt
+            offsetted_from_end_dt = from_end_dt
+
+        # Align the windows to partition boundaries in the target PartitionsDefinition
+        if (from_partitions_def.cron_schedule == to_partitions_def.cron_schedule) or (
+            from_partitions_def.is_basic_daily and to_partitions_def.is_basic_hourly
+        ):
+            # If the above conditions hold true, then we're confident that the partition
+            # boundaries in the PartitionsDefinition that we're mapping from match up with
+            # boundaries in the PartitionsDefinition that we're mapping to. That means
+            # we can just use these boundaries directly instead of finding nearby boundaries.
+            to_start_dt = offsetted_from_start_dt
+            to_end_dt = offsetted_from_end_dt
+        else:
+            # The partition boundaries that we're mapping from might land in the middle of
+            # partitions that we're mapping to, so find those partitions.
+            to_start_partition_key = to_partitions_def.get_partition_key_for_timestamp(
+                offsetted_from_start_dt.timestamp(), end_closed=False
+            )
+            to_end_partition_key = to_partitions_def.get_partition_key_for_timestamp(
+                offsetted_from_end_dt.timestamp(), end_closed=True
+            )
 
-            if offsetted_to_start_dt.timestamp() < offsetted_to_end_dt.timestamp():
-                time_windows.append(TimeWindow(offsetted_to_start_dt, offsetted_to_end_dt))
+            to_start_dt = to_partitions_def.start_time_for_partition_key(to_start_partition_key)
+            to_end_dt = to_partitions_def.end_time_for_partition_key(to_end_partition_key)
 
-        filtered_time_windows = []
+        if mapping_downstream_to_upstream:
+            offsetted_to_start_dt = to_start_dt
+            offsetted_to_end_dt = to_end_dt
+        else:
+            offsetted_to_start_dt = _offsetted_datetime_with_bounds(
+                to_partitions_def, to_start_dt, start_offset, full_window
+            )
+            offsetted_to_end_dt = _offsetted_datetime_with_bounds(
+                to_partitions_def, to_end_dt, end_offset, full_window
+            )
+
+        if offsetted_to_start_dt.timestamp() < offsetted_to_end_dt.timestamp():
+            return TimeWindow(offsetted_to_start_dt, offsetted_to_end_dt)
+        return None
+
+    def _filter_time_window(
+        self,
+        to_partitions_def: TimeWindowPartitionsDefinition,
+        time_window: TimeWindow,
+        first_window: Optional[TimeWindow],
+        last_window: Optional[TimeWindow],
+    ) -> Tuple[Optional[TimeWindow], Sequence[str]]:
+        """Returns the part of a mapped time window that lies within the partitions of
+        to_partitions_def, if any, along with the keys of the partitions in the time window that do
+        not exist, unless nonexistent upstream partitions are allowed.
+        """
+        filtered_time_window = None
+        if (
+            first_window
+            and last_window
+            and time_window.start.timestamp() <= last_window.start.timestamp()
+            and time_window.end.timestamp() >= first_window.end.timestamp()
+        ):
+            window_start = max(time_window.start, first_window.start, key=lambda d: d.timestamp())
+            window_end = min(time_window.end, last_window.end, key=lambda d: d.timestamp())
+            filtered_time_window = TimeWindow(window_start, window_end)
+
+        if self.allow_nonexistent_upstream_partitions:
+            # If allowed to have nonexistent upstream partitions, do not consider
+            # out of range partitions to be invalid
+            return filtered_time_window, []
+
+        invalid_time_window = None
+        if not (first_window and last_window) or (
+            time_window.start.timestamp() < first_window.start.timestamp()
+            and time_window.end.timestamp() > last_window.end.timestamp()
+        ):
+            invalid_time_window = time_window
+        elif time_window.start.timestamp() < first_window.start.timestamp():
+            invalid_time_window = TimeWindow(
+                time_window.start,
+                min(time_window.end, first_window.start, key=lambda d: d.timestamp()),
+            )
+        elif time_window.end.timestamp() > last_window.end.timestamp():
+            invalid_time_window = TimeWindow(
+                max(time_window.start, last_window.end, key=lambda d: d.timestamp()),
+                time_window.end,
+            )
+
+        if invalid_time_window:
+            return filtered_time_window, to_partitions_def.get_partition_keys_in_time_window(
+                time_window=invalid_time_window
+            )
+        return filtered_time_window, []
+
+    def _map_partitions_by_ordinals(
+        self,
+        from_partitions_def: TimeWindowPartitionsDefinition,
+        to_partitions_def: TimeWindowPartitionsDefinition,
+        from_partitions_subset: TimeWindowPartitionsSubset,
+        start_offset: int,
+        end_offset: int,
+        current_time: Optional[datetime],
+        mapping_downstream_to_upstream: bool,
+    ) -> Optional[UpstreamPartitionsResult]:
+        """Maps the partitions in from_partitions_subset by shifting and rescaling the intervals of
+        partition ordinals that it includes, so that the cost depends on the number of included
+        time windows rather than the number of partitions. Follows the same rules as
+        _map_time_window and _filter_time_window, which are used directly for the few windows
+        with bounds outside of the partitions of to_partitions_def.
+
+        Returns None if the subset or the mapped windows are not covered by the ordinal indexes of
+        the partitions definitions.
+        """
+        if from_partitions_subset.partitions_def != from_partitions_def:
+            return None
+        from_intervals = from_partitions_subset._ordinal_intervals  # noqa: SLF001
+        if from_intervals is None:
+            return None
+
+        # the partitions of to_partitions_def are the ordinals from 0 up to num_to_partitions
+        num_to_partitions = to_partitions_def._get_num_partitions_from_ordinal_index(  # noqa: SLF001
+            to_partitions_def._get_current_timestamp(current_time=current_time)  # noqa: SLF001
+        )
+        if not num_to_partitions:
+            return None
+
+        from_index = from_partitions_def.get_partition_ordinal_index()
+        to_index = to_partitions_def.get_partition_ordinal_index()
+        first_window = TimeWindow(
+            to_index.datetime_for_ordinal(0), to_index.datetime_for_ordinal(1)
+        )
+        last_window = TimeWindow(
+            to_index.datetime_for_ordinal(num_to_partitions - 1),
+            to_index.datetime_for_ordinal(num_to_partitions),
+        )
+        first_boundary = first_window.start.timestamp()
+        last_boundary = last_window.end.timestamp()
+
+        def _offsetted_from_boundary(ordinal: int, offset: int) -> Optional[float]:
+            if ordinal + offset < 0:
+                return None
+            boundary = from_index.boundary_for_ordinal(ordinal + offset)
+            if offset < 0:
+                return max(boundary, first_boundary)
+            if offset > 0:
+                return min(boundary, last_boundary)
+            return boundary
+
+        def _offsetted_to_ordinal(ordinal: int, offset: int) -> int:
+            if offset < 0:
+                return max(ordinal + offset, 0)
+            if offset > 0:
+                return min(ordinal + offset, num_to_partitions)
+            return ordinal
+
+        to_intervals: List[Tuple[int, int]] = []
         required_but_nonexistent_partition_keys = set()
+        for from_start, from_end in from_intervals:
+            if mapping_downstream_to_upstream:
+                start_boundary = _offsetted_from_boundary(from_start, start_offset)
+                end_boundary = _offsetted_from_boundary(from_end, end_offset)
+            else:
+                start_boundary = from_index.boundary_for_ordinal(from_start)
+                end_boundary = from_index.boundary_for_ordinal(from_end)
 
-        for time_window in time_windows:
             if (
-                first_window
-                and last_window
-                and time_window.start.timestamp() <= last_window.start.timestamp()
-                and time_window.end.timestamp() >= first_window.end.timestamp()
+                start_boundary is not None
+                and end_boundary is not None
+                and start_boundary >= first_boundary
+                and end_boundary >= first_boundary
             ):
-                window_start = max(
-                    time_window.start, first_window.start, key=lambda d: d.timestamp()
-                )
-                window_end = min(time_window.end, last_window.end, key=lambda d: d.timestamp())
-                filtered_time_windows.append(TimeWindow(window_start, window_end))
+                # the partitions of to_partitions_def that contain the bounds, which are exact
+                # boundaries when the cron schedules line up
+                num_boundaries = to_index.num_boundaries_at_or_before(start_boundary)
+                end = to_index.ordinal_at_or_after(end_boundary)
+                if num_boundaries is None or end is None:
+                    return None
+                start = num_boundaries - 1
+
+                if not mapping_downstream_to_upstream:
+                    start = _offsetted_to_ordinal(start, start_offset)
+                    end = _offsetted_to_ordinal(end, end_offset)
+
+                if start < end:
+                    to_intervals.append((start, end))
+                continue
 
-            if self.allow_nonexistent_upstream_partitions:
-                # If allowed to have nonexistent upstream partitions, do not consider
-                # out of range partitions to be invalid
+            # a bound falls before the first partition of either partitions definition, so map
+            # the time window without the ordinal indexes
+            time_window = self._map_time_window(
+                from_partitions_def=from_partitions_def,
+                to_partitions_def=to_partitions_def,
+                from_time_window=TimeWindow(
+                    from_index.datetime_for_ordinal(from_start),
+                    from_index.datetime_for_ordinal(from_end),
+                ),
+                start_offset=start_offset,
+                end_offset=end_offset,
+                full_window=TimeWindow(first_window.start, last_window.end),
+                mapping_downstream_to_upstream=mapping_downstream_to_upstream,
+            )
+            if time_window is None:
                 continue
-            else:
-                invalid_time_window = None
-                if not (first_window and last_window) or (
-                    time_window.start.timestamp() < first_window.start.timestamp()
-                    and time_window.end.timestamp() > last_window.end.timestamp()
-                ):
-                    invalid_time_window = time_window
-                elif time_window.start.timestamp() < first_window.start.timestamp():
-                    invalid_time_window = TimeWindow(
-                        time_window.start,
-                        min(time_window.end, first_window.start, key=lambda d: d.timestamp()),
-                    )
-                elif time_window.end.timestamp() > last_window.end.timestamp():
-                    invalid_time_window = TimeWindow(
-                        max(time_window.start, last_window.end, key=lambda d: d.timestamp()),
-                        time_window.end,
+            filtered_time_window, nonexistent_partition_keys = self._filter_time_window(
+                to_partitions_def, time_window, first_window, last_window
+            )
+            required_but_nonexistent_partition_keys.update(nonexistent_partition_keys)
+            if filtered_time_window is not None:
+                start = to_index.ordinal_for_boundary(filtered_time_window.start.timestamp())
+                end = to_index.ordinal_for_boundary(filtered_time_window.end.timestamp())
+                if start is None or end is None:
+                    return None
+                to_intervals.append((start, end))
+
+        filtered_intervals: List[Tuple[int, int]] = []
+        for start, end in sorted(to_intervals):
+            if start < num_to_partitions:
+                end_in_range = min(end, num_to_partitions)
+                if filtered_intervals and start <= filtered_intervals[-1][1]:
+                    filtered_intervals[-1] = (
+                        filtered_intervals[-1][0],
+                        max(filtered_intervals[-1][1], end_in_range),
                     )
-
-                if invalid_time_window:
-                    required_but_nonexistent_partition_keys.update(
-                        set(
-                            to_partitions_def.get_partition_keys_in_time_window(
-                                time_window=invalid_time_window
-                            )
+                else:
+                    filtered_intervals.append((start, end_in_range))
+
+            if end > num_to_partitions and not self.allow_nonexistent_upstream_partitions:
+                required_but_nonexistent_partition_keys.update(
+                    to_partitions_def.get_partition_keys_in_time_window(
+                        time_window=TimeWindow(
+                            to_index.datetime_for_ordinal(max(start, num_to_partitions)),
+                            to_index.datetime_for_ordinal(end),
                         )
                     )
+                )
 
+        empty_subset = cast(TimeWindowPartitionsSubset, to_partitions_def.empty_subset())
         return UpstreamPartitionsResult(
-            TimeWindowPartitionsSubset(
-                to_partitions_def,
-                num_partitions=None,
-                included_time_windows=self._merge_time_windows(filtered_time_windows),
-            ),
+            empty_subset._with_ordinal_intervals(filtered_intervals),  # noqa: SLF001
             sorted(list(required_but_nonexistent_partition_keys)),
         )
 
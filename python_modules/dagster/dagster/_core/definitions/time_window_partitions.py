@@ -1,15 +1,22 @@
+import bisect
 import functools
 import hashlib
+import heapq
+import itertools
 import json
+import math
 import re
+from abc import ABC, abstractmethod
 from datetime import date, datetime, timedelta
 from enum import Enum
 from functools import cached_property
 from typing import (
     Any,
     Callable,
+    Dict,
     FrozenSet,
     Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
@@ -27,10 +34,13 @@
     DEFAULT_DATE_FORMAT,
     AllPartitionsSubset,
     PartitionedConfig,
+    PartitionKeyIndex,
     PartitionsDefinition,
     PartitionsSubset,
     ScheduleType,
+    check_partition_key_indexes,
     cron_schedule_from_schedule_type_and_offsets,
+    get_partition_key_cache,
 )
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.timestamp import TimestampWithTimezone
@@ -229,6 +239,241 @@ def to_public_time_window(self) -> TimeWindow:
         return TimeWindow(start=self.start, end=self.end)
 
 
+class TimeWindowPartitionOrdinalIndex(ABC):
+    """Maps between the boundaries of the partitions of a TimeWindowPartitionsDefinition and the
+    ordinals of those partitions, i.e. their positions counting from the first partition at or
+    after the start of the definition. The start of partition i is boundary i, and its end is
+    boundary i + 1.
+
+    Use `for_partitions_def` to construct the cheapest index for a given definition.
+    """
+
+    def __init__(self, first_boundary: float, timezone: str):
+        self._first_boundary = first_boundary
+        self._tzinfo = get_timezone(timezone)
+
+    @staticmethod
+    def for_partitions_def(
+        partitions_def: "TimeWindowPartitionsDefinition",
+    ) -> "TimeWindowPartitionOrdinalIndex":
+        time_windows = partitions_def._iterate_time_windows(partitions_def.start.timestamp())  # noqa: SLF001
+        first_boundary = next(iter(time_windows)).start.timestamp()
+        schedule_type = partitions_def.schedule_type
+
+        fixed_minute_interval = get_fixed_minute_interval(partitions_def.cron_schedule)
+        if fixed_minute_interval is None and schedule_type == ScheduleType.HOURLY:
+            # hourly schedules with a minute offset tick every 60 minutes as well
+            fixed_minute_interval = 60
+        if fixed_minute_interval:
+            return FixedIntervalPartitionOrdinalIndex(
+                first_boundary, partitions_def.timezone, fixed_minute_interval * 60
+            )
+
+        if schedule_type in (ScheduleType.DAILY, ScheduleType.WEEKLY) or (
+            # months without the given day would be skipped by the cron schedule
+            schedule_type == ScheduleType.MONTHLY
+            and int(partitions_def.cron_schedule.split()[2]) <= 28
+        ):
+            return CalendarPartitionOrdinalIndex(first_boundary, partitions_def)
+
+        return CronIteratorPartitionOrdinalIndex(first_boundary, partitions_def)
+
+    @abstractmethod
+    def _ordinal_at_or_after(self, timestamp: float) -> Optional[int]:
+        """Returns the ordinal of the first partition that starts at or after the given timestamp,
+        which is at or after the first boundary, or None if it is not covered by the index.
+        """
+
+    @abstractmethod
+    def boundary_for_ordinal(self, ordinal: int) -> float:
+        """Returns the start timestamp of the partition with the given ordinal."""
+
+    def datetime_for_ordinal(self, ordinal: int) -> datetime:
+        """Returns the start of the partition with the given ordinal, as the cron schedule would."""
+        return datetime.fromtimestamp(self.boundary_for_ordinal(ordinal), tz=self._tzinfo)
+
+    def ordinal_at_or_after(self, timestamp: float) -> Optional[int]:
+        """Returns the ordinal of the first partition that starts at or after the given timestamp,
+        or None if it is not covered by the index.
+        """
+        if timestamp < self._first_boundary:
+            return None
+        return self._ordinal_at_or_after(timestamp)
+
+    def ordinal_for_boundary(self, timestamp: float) -> Optional[int]:
+        """Returns the ordinal of the partition that starts at the given timestamp, or None if the
+        timestamp is not a partition boundary covered by the index.
+        """
+        ordinal = self.ordinal_at_or_after(timestamp)
+        if ordinal is None or self.boundary_for_ordinal(ordinal) != timestamp:
+            return None
+        return ordinal
+
+    def num_boundaries_at_or_before(self, timestamp: float) -> Optional[int]:
+        """Returns the number of partition boundaries at or before the given timestamp, or None if
+        it is not covered by the index.
+        """
+        if timestamp < self._first_boundary:
+            return 0
+        ordinal = self._ordinal_at_or_after(timestamp)
+        if ordinal is None:
+            return None
+        return ordinal + 1 if self.boundary_for_ordinal(ordinal) == timestamp else ordinal
+
+
+class FixedIntervalPartitionOrdinalIndex(TimeWindowPartitionOrdinalIndex):
+    """An index for cron schedules with a fixed number of seconds between ticks, such as hourly
+    or every 15 minutes, where boundaries are computed arithmetically.
+    """
+
+    def __init__(self, first_boundary: float, timezone: str, interval_seconds: int):
+        super().__init__(first_boundary, timezone)
+        self._interval_seconds = interval_seconds
+
+    def _ordinal_at_or_after(self, timestamp: float) -> Optional[int]:
+        return -int((self._first_boundary - timestamp) // self._interval_seconds)
+
+    def boundary_for_ordinal(self, ordinal: int) -> float:
+        return self._first_boundary + ordinal * self._interval_seconds
+
+
+class CalendarPartitionOrdinalIndex(TimeWindowPartitionOrdinalIndex):
+    """An index for daily, weekly and monthly cron schedules, where the local date of each
+    boundary is computed by calendar arithmetic and converted to a timestamp in the timezone of
+    the partitions definition. Boundaries whose local time is skipped or repeated by a DST
+    transition are taken from the cron schedule instead.
+    """
+
+    def __init__(self, first_boundary: float, partitions_def: "TimeWindowPartitionsDefinition"):
+        super().__init__(first_boundary, partitions_def.timezone)
+        self._partitions_def = partitions_def
+        self._schedule_type = partitions_def.schedule_type
+        self._hour_offset = partitions_def.hour_offset
+        self._minute_offset = partitions_def.minute_offset
+        self._first_date = datetime.fromtimestamp(first_boundary, tz=self._tzinfo).date()
+        # boundaries are memoized, since converting between local dates and timestamps dominates the
+        # cost of set operations on fragmented subsets
+        self._datetimes_by_ordinal: Dict[int, datetime] = {}
+        self._boundaries_by_ordinal: Dict[int, float] = {}
+
+    def _months_since_first_date(self, local_date: date) -> int:
+        return (local_date.year - self._first_date.year) * 12 + (
+            local_date.month - self._first_date.month
+        )
+
+    def _date_for_ordinal(self, ordinal: int) -> date:
+        if self._schedule_type == ScheduleType.DAILY:
+            return self._first_date + timedelta(days=ordinal)
+        elif self._schedule_type == ScheduleType.WEEKLY:
+            return self._first_date + timedelta(days=7 * ordinal)
+        else:
+            year, month = divmod(self._first_date.month - 1 + ordinal, 12)
+            return self._first_date.replace(year=self._first_date.year + year, month=month + 1)
+
+    def _ordinal_at_or_after(self, timestamp: float) -> Optional[int]:
+        local_date = datetime.fromtimestamp(timestamp, tz=self._tzinfo).date()
+        if self._schedule_type == ScheduleType.DAILY:
+            ordinal = (local_date - self._first_date).days
+        elif self._schedule_type == ScheduleType.WEEKLY:
+            ordinal = (local_date - self._first_date).days // 7
+        else:
+            ordinal = self._months_since_first_date(local_date)
+
+        # the boundary on the same local date may be before or after the timestamp
+        ordinal = max(ordinal, 0)
+        while ordinal > 0 and self.boundary_for_ordinal(ordinal - 1) >= timestamp:
+            ordinal -= 1
+        while self.boundary_for_ordinal(ordinal) < timestamp:
+            ordinal += 1
+        return ordinal
+
+    def boundary_for_ordinal(self, ordinal: int) -> float:
+        boundary = self._boundaries_by_ordinal.get(ordinal)
+        if boundary is None:
+            boundary = self.datetime_for_ordinal(ordinal).timestamp()
+            self._boundaries_by_ordinal[ordinal] = boundary
+        return boundary
+
+    def datetime_for_ordinal(self, ordinal: int) -> datetime:
+        dt = self._datetimes_by_ordinal.get(ordinal)
+        if dt is None:
+            dt = self._compute_datetime_for_ordinal(ordinal)
+            self._datetimes_by_ordinal[ordinal] = dt
+        return dt
+
+    def _compute_datetime_for_ordinal(self, ordinal: int) -> datetime:
+        local_date = self._date_for_ordinal(ordinal)
+        local_dt = datetime(
+            local_date.year,
+            local_date.month,
+            local_date.day,
+            self._hour_offset,
+            self._minute_offset,
+            tzinfo=self._tzinfo,
+        )
+        if local_dt.utcoffset() == local_dt.replace(fold=1).utcoffset():
+            return local_dt
+
+        # the local time is skipped or repeated, so defer to the cron schedule. noon of the previous
+        # day is a safe distance from any DST transition on this date
+        previous_noon = datetime(
+            local_date.year, local_date.month, local_date.day, 12, tzinfo=self._tzinfo
+        ) - timedelta(days=1)
+        for time_window in self._partitions_def._iterate_time_windows(  # noqa: SLF001
+            previous_noon.timestamp()
+        ):
+            if time_window.start.date() >= local_date:
+                return time_window.start
+        check.failed("unreachable")
+
+
+class CronIteratorPartitionOrdinalIndex(TimeWindowPartitionOrdinalIndex):
+    """An index for irregular cron schedules, which bisects an array of boundaries generated
+    lazily from the cron schedule as later timestamps are requested, so that each boundary is only
+    computed once per definition.
+    """
+
+    # beyond this many partitions, callers fall back to datetime arithmetic rather than holding the
+    # whole partition range in memory
+    MAX_NUM_PARTITIONS = 100_000
+
+    def __init__(self, first_boundary: float, partitions_def: "TimeWindowPartitionsDefinition"):
+        super().__init__(first_boundary, partitions_def.timezone)
+        self._time_windows_iter = iter(
+            partitions_def._iterate_time_windows(first_boundary)  # noqa: SLF001
+        )
+        first_window = next(self._time_windows_iter)
+        self._datetimes: List[datetime] = [first_window.start, first_window.end]
+        self._boundaries: List[float] = [first_boundary, first_window.end.timestamp()]
+
+    def _extend(self) -> None:
+        end = next(self._time_windows_iter).end
+        self._datetimes.append(end)
+        self._boundaries.append(end.timestamp())
+
+    def _extend_to_timestamp(self, timestamp: float) -> bool:
+        while self._boundaries[-1] < timestamp:
+            if len(self._boundaries) > self.MAX_NUM_PARTITIONS:
+                return False
+            self._extend()
+        return True
+
+    def _ordinal_at_or_after(self, timestamp: float) -> Optional[int]:
+        if not self._extend_to_timestamp(timestamp):
+            return None
+        return bisect.bisect_left(self._boundaries, timestamp)
+
+    def boundary_for_ordinal(self, ordinal: int) -> float:
+        while len(self._boundaries) <= ordinal:
+            self._extend()
+        return self._boundaries[ordinal]
+
+    def datetime_for_ordinal(self, ordinal: int) -> datetime:
+        while len(self._datetimes) <= ordinal:
+            self._extend()
+        return self._datetimes[ordinal]
+
+
 @whitelist_for_serdes
 @record_custom(
     field_to_new_mapping={
@@ -377,6 +622,12 @@ def _get_current_timestamp(self, current_time: Optional[datetime]) -> float:
         return current_time.timestamp()
 
     def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
+        index = self.get_partition_ordinal_index()
+        start_ordinal = index.ordinal_for_boundary(time_window.start.timestamp())
+        end_ordinal = index.ordinal_for_boundary(time_window.end.timestamp())
+        if start_ordinal is not None and end_ordinal is not None:
+            return end_ordinal - start_ordinal
+
         if self.is_basic_daily:
             return (
                 date(
@@ -398,11 +649,67 @@ def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
 
         return len(self.get_partition_keys_in_time_window(time_window))
 
+    def _get_num_partitions_from_ordinal_index(self, current_timestamp: float) -> Optional[int]:
+        """Counts the partitions that exist at the given time using the ordinal index, or returns
+        None if the index does not cover them. The partitions are the ordinals from 0 up to the
+        returned count.
+        """
+        index = self.get_partition_ordinal_index()
+        # partitions that end at or before the current time
+        num_boundaries = index.num_boundaries_at_or_before(current_timestamp)
+        if num_boundaries is None:
+            return None
+        num_partitions = max(num_boundaries - 1, 0)
+        if self.end_offset > 0:
+            num_partitions += self.end_offset
+
+        if self.end:
+            num_boundaries_before_end = index.num_boundaries_at_or_before(self.end.timestamp())
+            if num_boundaries_before_end is None:
+                return None
+            num_partitions = min(num_partitions, max(num_boundaries_before_end - 1, 0))
+
+        if self.end_offset < 0:
+            num_partitions = max(num_partitions + self.end_offset, 0)
+        return num_partitions
+
+    def _get_partition_keys_for_ordinals(self, ordinals: Iterable[int]) -> List[str]:
+        index = self.get_partition_ordinal_index()
+        return [
+            dst_safe_strftime(
+                index.datetime_for_ordinal(ordinal), self.timezone, self.fmt, self.cron_schedule
+            )
+            for ordinal in ordinals
+        ]
+
+    def _get_partition_key_cache_key(self, num_partitions: int) -> Tuple[str, int]:
+        # the keys of the partitions that exist only change when a partition is added, so the
+        # number of partitions buckets the current time
+        return (self._serializable_unique_identifier, num_partitions)
+
+    def _get_cached_partition_key_index(self, num_partitions: int) -> PartitionKeyIndex:
+        """Returns the keys of the first num_partitions partitions and their positions, from the
+        cache shared across equal partitions definitions.
+        """
+        return get_partition_key_cache().get(
+            self._get_partition_key_cache_key(num_partitions),
+            lambda: self._get_partition_keys_for_ordinals(range(num_partitions)),
+        )
+
+    def _peek_cached_partition_key_index(self, num_partitions: int) -> Optional[PartitionKeyIndex]:
+        return get_partition_key_cache().peek(self._get_partition_key_cache_key(num_partitions))
+
     def get_num_partitions(
         self,
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> int:
+        num_partitions = self._get_num_partitions_from_ordinal_index(
+            self._get_current_timestamp(current_time=current_time)
+        )
+        if num_partitions is not None:
+            return num_partitions
+
         last_partition_window = self.get_last_partition_window(current_time)
         first_partition_window = self.get_first_partition_window(current_time)
 
@@ -420,38 +727,39 @@ def get_partition_keys_between_indexes(
         # Start index is inclusive, end index is exclusive.
         # Method added for performance reasons, to only string format
         # partition keys included within the indices.
-        current_timestamp = self._get_current_timestamp(current_time=current_time)
-
-        partitions_past_current_time = 0
-        partition_keys = []
-        reached_end = False
-
-        for idx, time_window in enumerate(self._iterate_time_windows(self.start.timestamp())):
-            if time_window.end.timestamp() >= current_timestamp:
-                reached_end = True
-            if self.end and time_window.end.timestamp() > self.end.timestamp():
-                reached_end = True
-            if (
-                time_window.end.timestamp() <= current_timestamp
-                or partitions_past_current_time < self.end_offset
-            ):
-                if idx >= start_idx and idx < end_idx:
-                    partition_keys.append(
-                        dst_safe_strftime(
-                            time_window.start, self.timezone, self.fmt, self.cron_schedule
-                        )
-                    )
-                if time_window.end.timestamp() > current_timestamp:
-                    partitions_past_current_time += 1
-            else:
-                break
-            if len(partition_keys) >= end_idx - start_idx:
-                break
-
-        if reached_end and self.end_offset < 0:
-            partition_keys = partition_keys[: self.end_offset]
+        return list(
+            self.iter_partition_keys(max(start_idx, 0), max(end_idx, 0), current_time=current_time)
+        )
 
-        return partition_keys
+    def iter_partition_keys(
+        self,
+        start_index: int = 0,
+        end_index: Optional[int] = None,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterator[str]:
+        check_partition_key_indexes(start_index, end_index)
+        num_partitions = self._get_num_partitions_from_ordinal_index(
+            self._get_current_timestamp(current_time=current_time)
+        )
+        if num_partitions is None:
+            yield from super().iter_partition_keys(
+                start_index, end_index, current_time, dynamic_partitions_store
+            )
+            return
+
+        end_index = num_partitions if end_index is None else min(end_index, num_partitions)
+        key_index = self._peek_cached_partition_key_index(num_partitions)
+        if key_index is not None:
+            yield from itertools.islice(key_index.partition_keys, start_index, end_index)
+            return
+
+        # format only the keys in the range, from their ordinals
+        index = self.get_partition_ordinal_index()
+        for ordinal in range(start_index, end_index):
+            yield dst_safe_strftime(
+                index.datetime_for_ordinal(ordinal), self.timezone, self.fmt, self.cron_schedule
+            )
 
     def get_partition_keys(
         self,
@@ -460,6 +768,11 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
+        num_partitions = self._get_num_partitions_from_ordinal_index(current_timestamp)
+        if num_partitions is not None:
+            # copied, since the cached keys are shared with every equal partitions definition
+            return list(self._get_cached_partition_key_index(num_partitions).partition_keys)
+
         partitions_past_current_time = 0
         partition_keys: List[str] = []
         for time_window in self._iterate_time_windows(self.start.timestamp()):
@@ -511,11 +824,51 @@ def __repr__(self):
     def __hash__(self):
         return hash(tuple(self.__repr__()))
 
+    @cached_property
+    def _partition_ordinal_index(self) -> TimeWindowPartitionOrdinalIndex:
+        return TimeWindowPartitionOrdinalIndex.for_partitions_def(self)
+
+    def get_partition_ordinal_index(self) -> TimeWindowPartitionOrdinalIndex:
+        # cached on the instance rather than with lru_cache, since hashing the partitions
+        # definition is expensive relative to set operations on small subsets
+        return self._partition_ordinal_index
+
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
         return next(iter(self._iterate_time_windows(partition_key_dt.timestamp())))
 
+    def _get_time_windows_for_partition_keys_from_cache(
+        self, partition_keys: FrozenSet[str]
+    ) -> Optional[Sequence[TimeWindow]]:
+        """Returns the time windows of the given partition keys, sorted, by looking up their
+        positions in the cached keys of the partitions that currently exist. Returns None if any of
+        the keys is not one of those partitions.
+        """
+        num_partitions = self._get_num_partitions_from_ordinal_index(get_current_timestamp())
+        if num_partitions is None:
+            return None
+        # enumerating every partition key only pays off when many of them are looked up, unless
+        # they are already cached
+        key_index = self._peek_cached_partition_key_index(num_partitions)
+        if key_index is None:
+            if len(partition_keys) * 10 < num_partitions:
+                return None
+            key_index = self._get_cached_partition_key_index(num_partitions)
+
+        ordinals = []
+        for partition_key in partition_keys:
+            ordinal = key_index.get_position(partition_key)
+            if ordinal is None:
+                return None
+            ordinals.append(ordinal)
+
+        index = self.get_partition_ordinal_index()
+        return [
+            TimeWindow(index.datetime_for_ordinal(ordinal), index.datetime_for_ordinal(ordinal + 1))
+            for ordinal in sorted(ordinals)
+        ]
+
     @functools.lru_cache(maxsize=5)
     def time_windows_for_partition_keys(
         self,
@@ -525,6 +878,10 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
+        time_windows = self._get_time_windows_for_partition_keys_from_cache(partition_keys)
+        if time_windows is not None:
+            return time_windows
+
         sorted_pks = sorted(
             partition_keys,
             key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
@@ -574,6 +931,10 @@ def start_time_for_partition_key(self, partition_key: str) -> datetime:
         # the datetime format might not include granular components, so we need to recover them,
         # e.g. if cron_schedule="0 7 * * *" and fmt="%Y-%m-%d".
         # we make the assumption that the parsed partition key is <= the start datetime.
+        index = self.get_partition_ordinal_index()
+        ordinal = index.ordinal_at_or_after(partition_key_dt.timestamp())
+        if ordinal is not None:
+            return index.datetime_for_ordinal(ordinal)
         return next(iter(self._iterate_time_windows(partition_key_dt.timestamp()))).start
 
     def get_next_partition_key(
@@ -670,8 +1031,17 @@ def _get_last_partition_window(self, *, current_timestamp: float) -> Optional[Ti
 
         if self.end_offset == 0:
             return next(iter(self._reverse_iterate_time_windows(current_timestamp)))
+
+        num_partitions = self._get_num_partitions_from_ordinal_index(current_timestamp)
+        if num_partitions is not None:
+            if num_partitions == 0:
+                return None
+            index = self.get_partition_ordinal_index()
+            return TimeWindow(
+                index.datetime_for_ordinal(num_partitions - 1),
+                index.datetime_for_ordinal(num_partitions),
+            )
         else:
-            # TODO: make this efficient
             last_partition_key = super().get_last_partition_key(
                 datetime.fromtimestamp(current_timestamp, tz=get_timezone(self.timezone))
             )
@@ -935,6 +1305,26 @@ def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = F
         timestamp (float): Timestamp from the unix epoch, UTC.
         end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
+        index = self.get_partition_ordinal_index()
+        if end_closed:
+            # the partition that ends at or after the timestamp
+            end_ordinal = index.ordinal_at_or_after(timestamp)
+            ordinal = end_ordinal - 1 if end_ordinal is not None else None
+        else:
+            # the partition that starts at or before the timestamp
+            num_boundaries = index.num_boundaries_at_or_before(timestamp)
+            ordinal = num_boundaries - 1 if num_boundaries is not None else None
+        if ordinal is not None and ordinal >= 0:
+            num_partitions = self._get_num_partitions_from_ordinal_index(get_current_timestamp())
+            key_index = (
+                self._peek_cached_partition_key_index(num_partitions)
+                if num_partitions is not None
+                else None
+            )
+            if key_index is not None and ordinal < len(key_index):
+                return key_index.partition_keys[ordinal]
+            return self._get_partition_keys_for_ordinals([ordinal])[0]
+
         iterator = cron_string_iterator(
             timestamp, self.cron_schedule, self.timezone, start_offset=-1
         )
@@ -978,10 +1368,14 @@ def subset_with_all_partitions(
             partitions_def=self, num_partitions=None, included_time_windows=windows
         )
 
+    @cached_property
+    def _serializable_unique_identifier(self) -> str:
+        return hashlib.sha1(self.__repr__().encode("utf-8")).hexdigest()
+
     def get_serializable_unique_identifier(
         self, dynamic_partitions_store: Optional[DynamicPartitionsStore] = None
     ) -> str:
-        return hashlib.sha1(self.__repr__().encode("utf-8")).hexdigest()
+        return self._serializable_unique_identifier
 
     def has_partition_key(
         self,
@@ -997,6 +1391,23 @@ def has_partition_key(
             # unparseable partition key
             return False
 
+        num_partitions = self._get_num_partitions_from_ordinal_index(
+            self._get_current_timestamp(current_time=current_time)
+        )
+        if num_partitions is not None:
+            index = self.get_partition_ordinal_index()
+            if num_partitions == 0 or partition_start_timestamp >= index.boundary_for_ordinal(
+                num_partitions
+            ):
+                return False
+            return (
+                index.ordinal_for_boundary(partition_start_timestamp) is not None
+                and dst_safe_strftime(
+                    partition_start_time, self.timezone, self.fmt, self.cron_schedule
+                )
+                == partition_key
+            )
+
         first_partition_window = self.get_first_partition_window(current_time=current_time)
         last_partition_window = self.get_last_partition_window(current_time=current_time)
         return not (
@@ -1809,6 +2220,59 @@ def num_partitions(self) -> int:
             )
         return num_partitions_
 
+    @cached_property
+    def _ordinal_intervals(self) -> Optional[Sequence[Tuple[int, int]]]:
+        """The included partitions as sorted, disjoint, non-adjacent half-open intervals of
+        partition ordinals, or None if any included time window does not line up with partition
+        boundaries covered by the ordinal index of the partitions_def.
+        """
+        index = self.partitions_def.get_partition_ordinal_index()
+        intervals: List[Tuple[int, int]] = []
+        for window in sorted(self.included_time_windows, key=lambda tw: tw.start.timestamp()):
+            start = index.ordinal_for_boundary(window.start.timestamp())
+            end = index.ordinal_for_boundary(window.end.timestamp())
+            if start is None or end is None:
+                return None
+            if start >= end:
+                continue
+            if intervals and start <= intervals[-1][1]:
+                intervals[-1] = (intervals[-1][0], max(intervals[-1][1], end))
+            else:
+                intervals.append((start, end))
+        return intervals
+
+    def _get_ordinal_intervals_shared_with(
+        self, other: "TimeWindowPartitionsSubset"
+    ) -> Optional[Tuple[Sequence[Tuple[int, int]], Sequence[Tuple[int, int]]]]:
+        """Returns the ordinal intervals of both subsets if they can be combined as integers."""
+        if self.partitions_def != other.partitions_def:
+            return None
+        self_intervals = self._ordinal_intervals
+        other_intervals = other._ordinal_intervals  # noqa: SLF001
+        if self_intervals is None or other_intervals is None:
+            return None
+        return self_intervals, other_intervals
+
+    def _with_ordinal_intervals(
+        self, intervals: Sequence[Tuple[int, int]]
+    ) -> "TimeWindowPartitionsSubset":
+        index = self.partitions_def.get_partition_ordinal_index()
+        timezone = self.partitions_def.timezone
+        subset = TimeWindowPartitionsSubset(
+            partitions_def=self.partitions_def,
+            num_partitions=sum(end - start for start, end in intervals),
+            included_time_windows=[
+                PersistedTimeWindow(
+                    TimestampWithTimezone(index.boundary_for_ordinal(start), timezone),
+                    TimestampWithTimezone(index.boundary_for_ordinal(end), timezone),
+                )
+                for start, end in intervals
+            ],
+        )
+        # the intervals are already known, so avoid recomputing them from the time windows
+        subset.__dict__["_ordinal_intervals"] = intervals
+        return subset
+
     @classmethod
     def _num_partitions_from_time_windows(
         cls,
@@ -2012,8 +2476,25 @@ def get_partition_keys(self) -> Iterable[str]:
         ]
 
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "TimeWindowPartitionsSubset":
+        partition_keys = list(partition_keys)
+        intervals = self._ordinal_intervals
+        if intervals is not None:
+            index = self.partitions_def.get_partition_ordinal_index()
+            ordinals = [
+                index.ordinal_for_boundary(time_window.start.timestamp())
+                for time_window in self.partitions_def.time_windows_for_partition_keys(
+                    frozenset(partition_keys)
+                )
+            ]
+            if None not in ordinals:
+                return self._with_ordinal_intervals(
+                    _union_ordinal_intervals(
+                        intervals, _ordinals_to_intervals(cast(List[int], ordinals))
+                    )
+                )
+
         result_windows, added_partitions = self._add_partitions_to_time_windows(
-            self.included_time_windows, list(partition_keys)
+            self.included_time_windows, partition_keys
         )
 
         return TimeWindowPartitionsSubset(
@@ -2053,6 +2534,10 @@ def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__and__(other)
 
+        shared_intervals = self._get_ordinal_intervals_shared_with(other)
+        if shared_intervals is not None:
+            return self._with_ordinal_intervals(_intersect_ordinal_intervals(*shared_intervals))
+
         self_time_windows_iter = iter(
             sorted(self.included_time_windows, key=lambda tw: tw.start.timestamp())
         )
@@ -2093,6 +2578,10 @@ def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__or__(other)
 
+        shared_intervals = self._get_ordinal_intervals_shared_with(other)
+        if shared_intervals is not None:
+            return self._with_ordinal_intervals(_union_ordinal_intervals(*shared_intervals))
+
         input_time_windows = sorted(
             [*self.included_time_windows, *other.included_time_windows],
             key=lambda tw: tw.start.timestamp(),
@@ -2120,6 +2609,10 @@ def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if not isinstance(other, TimeWindowPartitionsSubset):
             return super().__sub__(other)
 
+        shared_intervals = self._get_ordinal_intervals_shared_with(other)
+        if shared_intervals is not None:
+            return self._with_ordinal_intervals(_subtract_ordinal_intervals(*shared_intervals))
+
         time_windows = sorted(self.included_time_windows, key=lambda tw: tw.start.timestamp())
         other_time_windows = sorted(
             other.included_time_windows, key=lambda tw: tw.start.timestamp()
@@ -2172,6 +2665,28 @@ def __contains__(self, partition_key: Optional[str]) -> bool:
         if partition_key is None:
             return False
 
+        intervals = self._ordinal_intervals
+        if intervals is not None:
+            if not intervals:
+                return False
+            try:
+                partition_key_timestamp = dst_safe_strptime(
+                    partition_key, self.partitions_def.timezone, self.partitions_def.fmt
+                ).timestamp()
+            except ValueError:
+                # invalid partition key
+                return False
+
+            index = self.partitions_def.get_partition_ordinal_index()
+            # the partition starts at or after the parsed key, so there is no need to look past
+            # the end of the subset
+            if partition_key_timestamp >= index.boundary_for_ordinal(intervals[-1][1]):
+                return False
+            ordinal = index.ordinal_at_or_after(partition_key_timestamp)
+            if ordinal is not None:
+                i = bisect.bisect_right(intervals, (ordinal, math.inf)) - 1
+                return i >= 0 and ordinal < intervals[i][1]
+
         try:
             time_window = cast(
                 TimeWindowPartitionsDefinition, self.partitions_def
@@ -2494,6 +3009,69 @@ def get_time_partition_key(
         check.failed(f"Cannot get time partition from non-time partitions def {partitions_def}")
 
 
+def _ordinals_to_intervals(ordinals: Iterable[int]) -> Sequence[Tuple[int, int]]:
+    """Collapses partition ordinals into sorted, disjoint, non-adjacent half-open intervals."""
+    intervals: List[Tuple[int, int]] = []
+    for ordinal in sorted(set(ordinals)):
+        if intervals and intervals[-1][1] == ordinal:
+            intervals[-1] = (intervals[-1][0], ordinal + 1)
+        else:
+            intervals.append((ordinal, ordinal + 1))
+    return intervals
+
+
+def _union_ordinal_intervals(
+    intervals: Sequence[Tuple[int, int]], other_intervals: Sequence[Tuple[int, int]]
+) -> Sequence[Tuple[int, int]]:
+    result: List[Tuple[int, int]] = []
+    for start, end in heapq.merge(intervals, other_intervals):
+        if result and start <= result[-1][1]:
+            if end > result[-1][1]:
+                result[-1] = (result[-1][0], end)
+        else:
+            result.append((start, end))
+    return result
+
+
+def _intersect_ordinal_intervals(
+    intervals: Sequence[Tuple[int, int]], other_intervals: Sequence[Tuple[int, int]]
+) -> Sequence[Tuple[int, int]]:
+    result: List[Tuple[int, int]] = []
+    i = j = 0
+    while i < len(intervals) and j < len(other_intervals):
+        start = max(intervals[i][0], other_intervals[j][0])
+        end = min(intervals[i][1], other_intervals[j][1])
+        if start < end:
+            result.append((start, end))
+        # advance past the interval that ends first to find the next potential intersection
+        if intervals[i][1] < other_intervals[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _subtract_ordinal_intervals(
+    intervals: Sequence[Tuple[int, int]], other_intervals: Sequence[Tuple[int, int]]
+) -> Sequence[Tuple[int, int]]:
+    result: List[Tuple[int, int]] = []
+    j = 0
+    for interval_start, end in intervals:
+        start = interval_start
+        # skip the subtracted intervals that end before this interval starts
+        while j < len(other_intervals) and other_intervals[j][1] <= start:
+            j += 1
+        k = j
+        while k < len(other_intervals) and other_intervals[k][0] < end:
+            if other_intervals[k][0] > start:
+                result.append((start, other_intervals[k][0]))
+            start = max(start, other_intervals[k][1])
+            k += 1
+        if start < end:
+            result.append((start, end))
+    return result
+
+
 def _attempt_coerce_to_time_window_subset(subset: "PartitionsSubset") -> "PartitionsSubset":
     """Attempts to convert the input subset into a TimeWindowPartitionsSubset."""
     if isinstance(subset, TimeWindowPartitionsSubset):
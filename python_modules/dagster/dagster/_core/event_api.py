@@ -10,7 +10,8 @@
 from dagster._core.definitions.events import AssetKey, AssetMaterialization, AssetObservation
 from dagster._core.events import EVENT_TYPE_TO_PIPELINE_RUN_STATUS, DagsterEventType
 from dagster._core.events.log import EventLogEntry
-from dagster._serdes import whitelist_for_serdes
+from dagster._serdes import deserialize_value, whitelist_for_serdes
+from dagster._serdes.codecs import decode_serialized_value
 from dagster._seven import json
 
 EventHandlerFn: TypeAlias = Callable[[EventLogEntry, str], None]
@@ -145,6 +146,74 @@ def event_type(self) -> DagsterEventType:
         ).event_type
 
 
+class LazyEventLogRecord:
+    """An event log record read from storage, holding the serialized event payload alongside the
+    columns that are indexed with it. The payload is only deserialized when `event_log_entry` is
+    accessed, so callers that only need the indexed columns or the timestamp avoid the cost of
+    unpacking the full event.
+    """
+
+    __slots__ = [
+        "storage_id",
+        "step_key",
+        "_serialized_event",
+        "_dagster_event_type_value",
+        "_asset_key_str",
+        "_event_log_entry",
+        "_timestamp",
+    ]
+
+    def __init__(
+        self,
+        storage_id: int,
+        serialized_event: str,
+        dagster_event_type_value: Optional[str] = None,
+        step_key: Optional[str] = None,
+        asset_key_str: Optional[str] = None,
+    ):
+        self.storage_id = storage_id
+        self.step_key = step_key
+        self._serialized_event = serialized_event
+        self._dagster_event_type_value = dagster_event_type_value
+        self._asset_key_str = asset_key_str
+        self._event_log_entry: Optional[EventLogEntry] = None
+        self._timestamp: Optional[float] = None
+
+    @property
+    def dagster_event_type(self) -> Optional[DagsterEventType]:
+        if self._dagster_event_type_value is None:
+            return None
+        return DagsterEventType(self._dagster_event_type_value)
+
+    @property
+    def asset_key(self) -> Optional[AssetKey]:
+        if self._asset_key_str is None:
+            return None
+        return AssetKey.from_db_string(self._asset_key_str)
+
+    @property
+    def timestamp(self) -> float:
+        if self._event_log_entry is not None:
+            return self._event_log_entry.timestamp
+
+        if self._timestamp is None:
+            # the timestamp is a top-level field of the serialized event, so it can be read without
+            # unpacking the nested dagster event. Keep the decoded JSON, in case the event was stored
+            # with a serdes codec and is deserialized later.
+            self._serialized_event = decode_serialized_value(self._serialized_event)
+            self._timestamp = json.loads(self._serialized_event)["timestamp"]
+        return self._timestamp  # type: ignore  # (set above)
+
+    @property
+    def event_log_entry(self) -> EventLogEntry:
+        if self._event_log_entry is None:
+            self._event_log_entry = deserialize_value(self._serialized_event, EventLogEntry)
+        return self._event_log_entry
+
+    def to_event_log_record(self) -> EventLogRecord:
+        return EventLogRecord(storage_id=self.storage_id, event_log_entry=self.event_log_entry)
+
+
 class EventRecordsResult(NamedTuple):
     """Return value for a query fetching event records from the instance.  Contains a list of event
     records, a cursor string, and a boolean indicating whether there are more records to fetch.
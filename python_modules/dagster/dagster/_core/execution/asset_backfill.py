@@ -1257,6 +1257,7 @@ def get_asset_backfill_iteration_materialized_partitions(
                 cursor=cursor,
                 limit=MATERIALIZATION_CHUNK_SIZE,
             )
+            instance_queryer.prefetch_run_records({record.run_id for record in result.records})
             records_in_backfill = [
                 record
                 for record in result.records
@@ -1727,6 +1728,7 @@ def _get_failed_asset_partitions(
 
     result: List[AssetKeyPartitionKey] = []
 
+    instance_queryer.prefetch_planned_materializations_for_runs([run.run_id for run in runs])
     for run in runs:
         planned_asset_keys = instance_queryer.get_planned_materializations_for_run(
             run_id=run.run_id
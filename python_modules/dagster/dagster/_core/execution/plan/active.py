@@ -1,4 +1,7 @@
+import bisect
+import itertools
 import time
+from collections import defaultdict
 from types import TracebackType
 from typing import (
     Any,
@@ -10,6 +13,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -86,7 +90,16 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, Set[str]] = {}
+
+        # rather than rescanning _pending after every completion, each pending step tracks how many
+        # of the steps it depends on are still unresolved, and is queued in _pending_resolved once
+        # all of them are - so that resolving a step only visits the steps that depend on it
+        self._pending_unresolved_counts: Dict[str, int] = {}
+        self._pending_dependents: Dict[str, Set[str]] = defaultdict(set)
+        self._pending_resolved: Set[str] = set()
+        self._pending_order: Dict[str, int] = {}
+        self._pending_counter = itertools.count()
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -101,7 +114,10 @@ def __init__(
         self._skipped_deps: Dict[str, Sequence[str]] = {}
 
         # steps move in to these buckets as a result of _update calls
+        # _executable is kept ordered by _executable_sort_keys, see _add_executable
         self._executable: List[str] = []
+        self._executable_sort_keys: List[Tuple[float, int]] = []
+        self._executable_counter = itertools.count()
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -116,12 +132,17 @@ def __init__(
         self._failed: Set[str] = set()
         self._skipped: Set[str] = set()
         self._abandoned: Set[str] = set()
+        # union of the above, the steps that downstream steps no longer wait on
+        self._resolved: Set[str] = set()
 
         # see verify_complete
         self._unknown_state: Set[str] = set()
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -197,16 +218,58 @@ def _pending_state_str(self) -> str:
             ),
         )
 
-    def _should_skip_step(self, step_key: str, successful_or_skipped_steps: Set[str]) -> bool:
+    def _add_pending(self, step_key: str, depends_on_steps: Set[str]) -> None:
+        self._pending[step_key] = depends_on_steps
+        self._pending_order[step_key] = next(self._pending_counter)
+
+        unresolved_steps = depends_on_steps - self._resolved
+        self._pending_unresolved_counts[step_key] = len(unresolved_steps)
+        for dep_key in unresolved_steps:
+            self._pending_dependents[dep_key].add(step_key)
+
+        if not unresolved_steps:
+            self._pending_resolved.add(step_key)
+
+    def _remove_pending(self, step_key: str) -> None:
+        del self._pending[step_key]
+        del self._pending_order[step_key]
+        del self._pending_unresolved_counts[step_key]
+
+    def _mark_resolved(self, step_key: str) -> None:
+        """Release the pending steps that were only waiting on this step."""
+        if step_key in self._resolved:
+            return
+
+        self._resolved.add(step_key)
+        for dependent_key in self._pending_dependents.pop(step_key, set()):
+            if dependent_key not in self._pending_unresolved_counts:
+                continue
+
+            self._pending_unresolved_counts[dependent_key] -= 1
+            if self._pending_unresolved_counts[dependent_key] == 0:
+                self._pending_resolved.add(dependent_key)
+
+    def _add_executable(self, step_key: str) -> None:
+        # Keep _executable sorted by the sort key of its steps, breaking ties by the order in which
+        # they became executable, so that get_steps_to_execute does not have to sort it each call.
+        sort_key = (
+            self._sort_key_fn(self.get_step_by_key(step_key)),
+            next(self._executable_counter),
+        )
+        index = bisect.bisect_right(self._executable_sort_keys, sort_key)
+        self._executable_sort_keys.insert(index, sort_key)
+        self._executable.insert(index, step_key)
+
+    def _should_skip_step(self, step_key: str) -> bool:
         step = self.get_step_by_key(step_key)
         for step_input in step.step_inputs:
             missing_source_handles = []
 
             for source_handle in step_input.get_step_output_handle_dependencies():
                 if (
-                    source_handle.step_key in successful_or_skipped_steps
-                    and source_handle not in self._step_outputs
-                ):
+                    source_handle.step_key in self._success
+                    or source_handle.step_key in self._skipped
+                ) and source_handle not in self._step_outputs:
                     missing_source_handles.append(source_handle)
 
             if missing_source_handles:
@@ -223,41 +286,30 @@ def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed.
         """
-        new_steps_to_execute: List[str] = []
-        new_steps_to_skip: List[str] = []
-        new_steps_to_abandon: List[str] = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-        resolved_steps = self._success | self._skipped | self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, depends_on_steps in self._pending.items():
-            if depends_on_steps.issubset(resolved_steps):
-                if self._should_skip_step(step_key, successful_or_skipped_steps):
-                    new_steps_to_skip.append(step_key)
-                elif depends_on_steps.intersection(failed_or_abandoned_steps):
-                    new_steps_to_abandon.append(step_key)
-                else:
-                    new_steps_to_execute.append(step_key)
+        # process the steps whose dependencies have all resolved in the order they became pending
+        resolved_pending = sorted(self._pending_resolved, key=self._pending_order.__getitem__)
+        self._pending_resolved = set()
 
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+        for step_key in resolved_pending:
+            depends_on_steps = self._pending[step_key]
+            self._remove_pending(step_key)
 
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
-
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
+            if self._should_skip_step(step_key):
+                self._pending_skip.append(step_key)
+            elif any(
+                dep_key in self._failed or dep_key in self._abandoned
+                for dep_key in depends_on_steps
+            ):
+                self._pending_abandon.append(step_key)
+            else:
+                self._add_executable(step_key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -266,7 +318,7 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._add_executable(key)
             del self._waiting_to_retry[key]
 
     def sleep_interval(self):
@@ -318,11 +370,6 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
         run_scoped_concurrency_limits_counter = None
         if self._tag_concurrency_limits:
             in_flight_steps = [self.get_step_by_key(key) for key in self._in_flight]
@@ -332,8 +379,9 @@ def get_steps_to_execute(
             )
 
         batch: List[ExecutionStep] = []
+        batch_indices: List[int] = []
 
-        for step in steps:
+        for index, step_key in enumerate(self._executable):
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -343,6 +391,7 @@ def get_steps_to_execute(
             ):
                 break
 
+            step = self.get_step_by_key(step_key)
             if run_scoped_concurrency_limits_counter:
                 if run_scoped_concurrency_limits_counter.is_blocked(step):
                     continue
@@ -363,10 +412,14 @@ def get_steps_to_execute(
                     continue
 
             batch.append(step)
+            batch_indices.append(index)
+
+        for index in reversed(batch_indices):
+            del self._executable[index]
+            del self._executable_sort_keys[index]
 
         for step in batch:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return batch
@@ -375,12 +428,12 @@ def get_steps_to_skip(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
+        steps_to_skip = self._pending_skip
+        self._pending_skip = []
         for key in steps_to_skip:
             step = self.get_step_by_key(key)
             steps.append(step)
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
             self._gathering_dynamic_outputs  # noqa: B018
             self._skip_for_dynamic_outputs(step)
 
@@ -390,11 +443,11 @@ def get_steps_to_abandon(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_abandon = list(self._pending_abandon)
+        steps_to_abandon = self._pending_abandon
+        self._pending_abandon = []
         for key in steps_to_abandon:
             steps.append(self.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_abandon.remove(key)
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -446,20 +499,24 @@ def plan_events_iterator(
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -479,11 +536,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._plan.get_executable_step_deps()[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._mark_resolved(step_key)
 
         self._retry_state.mark_attempt(step_key)
 
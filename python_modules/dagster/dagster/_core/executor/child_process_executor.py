@@ -1,18 +1,22 @@
 """Facilities for running arbitrary commands in child processes."""
 
+import multiprocessing.connection
 import os
 import queue
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
 from multiprocessing import Queue
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Union
 
 from typing_extensions import Literal
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -43,6 +47,15 @@ class ChildProcessSystemErrorEvent(
     pass
 
 
+class ChildProcessWorkerReadyEvent(
+    NamedTuple("ChildProcessWorkerReadyEvent", [("pid", int), ("will_exit", bool)]),
+    ChildProcessEvent,
+):
+    """Sent by a reusable worker process after each command, once it is ready for the next one or
+    is about to exit.
+    """
+
+
 class ChildProcessCommand(ABC):
     """Inherit from this class in order to use this library.
 
@@ -100,11 +113,42 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
 """Sentinel value."""
 
 
+class ChildProcessEventSelector:
+    """Multiplexes the event queues of child processes, so that a parent process driving several
+    child process commands at once can block until any of them has something to report, instead of
+    waiting on each of their queues in turn.
+
+    Commands executed with a selector poll their queue without blocking; call `wait` once none of
+    them has yielded an event.
+    """
+
+    def __init__(self):
+        self._waitables: Dict[int, Sequence[Any]] = {}
+
+    def register(self, process: BaseProcess, event_queue: Queue) -> None:
+        # The read end of the queue becomes ready once an event has been put on the queue, and the
+        # sentinel of the process once the process has exited.
+        self._waitables[id(event_queue)] = [event_queue._reader, process.sentinel]  # type: ignore  # noqa: SLF001
+
+    def unregister(self, event_queue: Queue) -> None:
+        self._waitables.pop(id(event_queue), None)
+
+    def wait(self, timeout: float) -> None:
+        """Block until an event is available from one of the registered child processes, one of
+        them has exited, or the timeout has elapsed.
+        """
+        waitables = [waitable for waitables in self._waitables.values() for waitable in waitables]
+        if waitables:
+            multiprocessing.connection.wait(waitables, timeout=timeout)
+        else:
+            time.sleep(timeout)
+
+
 def _poll_for_event(
-    process, event_queue
+    process, event_queue, timeout: float = TICK
 ) -> Optional[Union["DagsterEvent", Literal["PROCESS_DEAD_AND_QUEUE_EMPTY"]]]:
     try:
-        return event_queue.get(block=True, timeout=TICK)
+        return event_queue.get(block=True, timeout=timeout)
     except queue.Empty:
         if not process.is_alive():
             # There is a possibility that after the last queue.get the
@@ -120,7 +164,9 @@ def _poll_for_event(
 
 
 def execute_child_process_command(
-    multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessCommand
+    multiprocessing_ctx: MultiprocessingBaseContext,
+    command: ChildProcessCommand,
+    selector: Optional[ChildProcessEventSelector] = None,
 ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
     """Execute a ChildProcessCommand in a new process.
 
@@ -141,6 +187,8 @@ def execute_child_process_command(
     Args:
         multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
         command (ChildProcessCommand): The command to execute in the child process.
+        selector (Optional[ChildProcessEventSelector]): If provided, the queue is polled without
+            blocking, and the caller is expected to wait on the selector instead.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
@@ -148,17 +196,20 @@ def execute_child_process_command(
     check.inst_param(command, "command", ChildProcessCommand)
 
     event_queue = multiprocessing_ctx.Queue()
+    poll_timeout = 0 if selector else TICK
     try:
         process = multiprocessing_ctx.Process(  # type: ignore
             target=_execute_command_in_child_process, args=(event_queue, command)
         )
         process.start()
+        if selector:
+            selector.register(process, event_queue)
         yield process
 
         completed_properly = False
 
         while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+            event = _poll_for_event(process, event_queue, poll_timeout)
 
             if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
                 break
@@ -174,4 +225,223 @@ def execute_child_process_command(
 
         process.join()
     finally:
+        if selector:
+            selector.unregister(event_queue)
         event_queue.close()
+
+
+def _get_peak_memory_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        # not available on windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS, and in kilobytes on linux
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def _run_child_process_worker(
+    command_queue: Queue,
+    event_queue: Queue,
+    term_event: Any,
+    max_commands: Optional[int],
+    max_memory_mb: Optional[int],
+) -> None:
+    """Executes the ChildProcessCommands sent over the command queue one at a time, until a None
+    sentinel is received or the worker should be recycled.
+
+    Setting the term event interrupts the command that is executing, after which the worker exits.
+    """
+    # the termination thread only interrupts the worker while a command is executing
+    is_idle_event = threading.Event()
+    is_idle_event.set()
+    start_termination_thread(term_event, is_idle_event)
+
+    with capture_interrupts():
+        num_commands = 0
+        while True:
+            command = command_queue.get()
+            if command is None:
+                return
+
+            is_idle_event.clear()
+            try:
+                _execute_command_in_child_process(event_queue, command)
+            finally:
+                is_idle_event.set()
+
+            num_commands += 1
+            peak_memory_mb = _get_peak_memory_mb()
+            will_exit = (
+                term_event.is_set()
+                or (max_commands is not None and num_commands >= max_commands)
+                or (
+                    max_memory_mb is not None
+                    and peak_memory_mb is not None
+                    and peak_memory_mb >= max_memory_mb
+                )
+            )
+            event_queue.put(ChildProcessWorkerReadyEvent(pid=os.getpid(), will_exit=will_exit))
+            if will_exit:
+                return
+
+
+class ChildProcessWorker:
+    """A reusable worker process, with the queues used to send it commands and to receive the
+    events of the command that it is executing.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_commands: Optional[int],
+        max_memory_mb: Optional[int],
+    ):
+        self.command_queue = multiprocessing_ctx.Queue()
+        self.event_queue = multiprocessing_ctx.Queue()
+        # set to interrupt the command that the worker is executing
+        self.term_event = multiprocessing_ctx.Event()
+        self.process: BaseProcess = multiprocessing_ctx.Process(  # type: ignore
+            target=_run_child_process_worker,
+            args=(
+                self.command_queue,
+                self.event_queue,
+                self.term_event,
+                max_commands,
+                max_memory_mb,
+            ),
+        )
+        self.process.start()
+
+    def stop(self) -> None:
+        """Ask the worker to exit once it has finished executing its current command."""
+        if self.process.is_alive():
+            self.command_queue.put(None)
+
+
+WORKER_SHUTDOWN_TIMEOUT = 30.0
+"""Seconds to wait for worker processes to exit when the pool is shut down, before killing them."""
+
+
+class ChildProcessWorkerPool:
+    """A pool of reusable worker processes that execute ChildProcessCommands.
+
+    Unlike `execute_child_process_command`, which starts a new process for each command, the pool
+    keeps workers alive between commands, so that modules imported and definitions loaded while
+    executing a command are still loaded for the next command executed by the same worker. Each
+    worker executes one command at a time. Workers are started on demand, and are replaced after
+    executing `max_commands_per_worker` commands, once their peak memory usage reaches
+    `max_worker_memory_mb`, or after their command was interrupted.
+
+    Use the pool as a context manager, to shut down its workers on exit.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_commands_per_worker: Optional[int] = None,
+        max_worker_memory_mb: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_commands_per_worker = check.opt_int_param(
+            max_commands_per_worker, "max_commands_per_worker"
+        )
+        self._max_worker_memory_mb = check.opt_int_param(
+            max_worker_memory_mb, "max_worker_memory_mb"
+        )
+        self._workers: List[ChildProcessWorker] = []
+        self._idle_workers: List[ChildProcessWorker] = []
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+
+    def _acquire_worker(self) -> ChildProcessWorker:
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.process.is_alive():
+                return worker
+
+        worker = ChildProcessWorker(
+            self._multiprocessing_ctx, self._max_commands_per_worker, self._max_worker_memory_mb
+        )
+        self._workers.append(worker)
+        return worker
+
+    def execute_command(
+        self,
+        command: ChildProcessCommand,
+        selector: Optional[ChildProcessEventSelector] = None,
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, ChildProcessWorker]]]:
+        """Execute a ChildProcessCommand in a worker process of the pool.
+
+        Yields the same objects as `execute_child_process_command`, except that the worker
+        executing the command is yielded instead of a process.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+
+        worker = self._acquire_worker()
+        poll_timeout = 0 if selector else TICK
+        if selector:
+            selector.register(worker.process, worker.event_queue)
+        try:
+            yield worker
+            yield from self._execute_command_in_worker(worker, command, poll_timeout)
+        finally:
+            if selector:
+                selector.unregister(worker.event_queue)
+
+    def _execute_command_in_worker(
+        self, worker: ChildProcessWorker, command: ChildProcessCommand, poll_timeout: float
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent]]]:
+        worker.command_queue.put(command)
+
+        completed_properly = False
+        while not completed_properly:
+            event = _poll_for_event(worker.process, worker.event_queue, poll_timeout)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                break
+
+            yield event
+
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                completed_properly = True
+
+        if not completed_properly:
+            raise ChildProcessCrashException(
+                pid=worker.process.pid, exit_code=worker.process.exitcode
+            )
+
+        # wait for the worker to report whether it can execute another command
+        ready_event = None
+        while ready_event is None:
+            event = _poll_for_event(worker.process, worker.event_queue, poll_timeout)
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                break
+            if isinstance(event, ChildProcessWorkerReadyEvent):
+                ready_event = event
+            else:
+                yield None
+
+        if ready_event and not ready_event.will_exit and not worker.term_event.is_set():
+            self._idle_workers.append(worker)
+        else:
+            worker.stop()
+
+    def shutdown(self) -> None:
+        for worker in self._workers:
+            worker.stop()
+        for worker in self._workers:
+            worker.process.join(timeout=WORKER_SHUTDOWN_TIMEOUT)
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join()
+            worker.command_queue.close()
+            worker.event_queue.close()
+        self._workers = []
+        self._idle_workers = []
@@ -28,10 +28,14 @@
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.base import Executor
 from dagster._core.executor.child_process_executor import (
+    TICK,
     ChildProcessCommand,
     ChildProcessCrashException,
     ChildProcessEvent,
+    ChildProcessEventSelector,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 from dagster._core.instance import DagsterInstance
@@ -53,7 +57,7 @@ def __init__(
         dagster_run: "DagsterRun",
         step_key: str,
         instance_ref: "InstanceRef",
-        term_event: Any,
+        term_event: Optional[Any],
         recon_pipeline: ReconstructableJob,
         retry_mode: RetryMode,
         known_state: Optional[KnownExecutionState],
@@ -70,10 +74,14 @@ def __init__(
         self.repository_load_data = repository_load_data
 
     def execute(self) -> Iterator[DagsterEvent]:
+        # When executed by a reusable worker process, the term event is None and termination is
+        # handled by the worker. The reconstructed job definition is cached by `ReconstructableJob`,
+        # so a worker only loads the job for the first step that it executes.
         recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             done_event = threading.Event()
-            start_termination_thread(self.term_event, done_event)
+            if self.term_event:
+                start_termination_thread(self.term_event, done_event)
             try:
                 log_manager = create_context_free_log_manager(instance, self.dagster_run)
 
@@ -104,7 +112,8 @@ def execute(self) -> Iterator[DagsterEvent]:
             finally:
                 # set events to stop the termination thread on exit
                 done_event.set()  # waiting on term_event so set done first
-                self.term_event.set()
+                if self.term_event:
+                    self.term_event.set()
 
 
 class MultiprocessExecutor(Executor):
@@ -115,6 +124,9 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        reuse_processes: bool = False,
+        max_steps_per_process: Optional[int] = None,
+        max_process_memory_mb: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -140,6 +152,13 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._reuse_processes = check.bool_param(reuse_processes, "reuse_processes")
+        self._max_steps_per_process = check.opt_int_param(
+            max_steps_per_process, "max_steps_per_process"
+        )
+        self._max_process_memory_mb = check.opt_int_param(
+            max_process_memory_mb, "max_process_memory_mb"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -193,6 +212,17 @@ def execute(
             instance_concurrency_context = stack.enter_context(
                 InstanceConcurrencyContext(plan_context.instance, plan_context.dagster_run)
             )
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        max_commands_per_worker=self._max_steps_per_process,
+                        max_worker_memory_mb=self._max_process_memory_mb,
+                    )
+                )
+                if self._reuse_processes
+                else None
+            )
             active_execution = stack.enter_context(
                 ActiveExecution(
                     execution_plan,
@@ -207,6 +237,9 @@ def execute(
             processes: Dict[str, BaseProcess] = {}
             term_events: Dict[str, Any] = {}
             stopping: bool = False
+            # child processes report events through their queues, which are multiplexed by the
+            # selector so that the loop can block until any of them has an event
+            selector = ChildProcessEventSelector()
 
             try:
                 while (not stopping and not active_execution.is_complete) or active_iters:
@@ -237,7 +270,8 @@ def execute(
 
                         for step in steps:
                             step_context = plan_context.for_step(step)
-                            term_events[step.key] = multiproc_ctx.Event()
+                            if not worker_pool:
+                                term_events[step.key] = multiproc_ctx.Event()
                             active_iters[step.key] = execute_step_out_of_process(
                                 multiproc_ctx,
                                 job,
@@ -249,16 +283,20 @@ def execute(
                                 self.retries,
                                 active_execution.get_known_state(),
                                 execution_plan.repository_load_data,
+                                worker_pool,
+                                selector,
                             )
 
                     # process active iterators
                     empty_iters = []
+                    received_event = False
                     for key, step_iter in active_iters.items():
                         try:
                             event_or_none = next(step_iter)
                             if event_or_none is None:
                                 continue
                             else:
+                                received_event = True
                                 yield event_or_none
                                 active_execution.handle_event(event_or_none)
 
@@ -288,10 +326,14 @@ def execute(
                         except StopIteration:
                             empty_iters.append(key)
 
+                    if active_iters and not received_event and not empty_iters:
+                        selector.wait(timeout=TICK)
+
                     # clear and mark complete finished iterators
                     for key in empty_iters:
                         del active_iters[key]
-                        del term_events[key]
+                        # a step executed by a worker has no term event until the worker is acquired
+                        term_events.pop(key, None)
                         if key in processes:
                             del processes[key]
                         active_execution.verify_complete(plan_context, key)
@@ -372,13 +414,16 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    worker_pool: Optional[ChildProcessWorkerPool] = None,
+    selector: Optional[ChildProcessEventSelector] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
         dagster_run=step_context.dagster_run,
         step_key=step.key,
         instance_ref=step_context.instance.get_ref(),
-        term_event=term_events[step.key],
+        # steps executed by a worker are terminated with the term event of the worker
+        term_event=None if worker_pool else term_events[step.key],
         recon_pipeline=recon_job,
         retry_mode=retries,
         known_state=known_state,
@@ -387,11 +432,20 @@ def execute_step_out_of_process(
 
     yield DagsterEvent.step_worker_starting(
         step_context,
-        f'Launching subprocess for "{step.key}".',
+        (
+            f'Sending "{step.key}" to a worker subprocess.'
+            if worker_pool
+            else f'Launching subprocess for "{step.key}".'
+        ),
         metadata={},
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    command_iterator = (
+        worker_pool.execute_command(command, selector)
+        if worker_pool
+        else execute_child_process_command(multiproc_ctx, command, selector)
+    )
+    for ret in command_iterator:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -399,5 +453,8 @@ def execute_step_out_of_process(
                 errors[ret.pid] = ret.error_info
         elif isinstance(ret, BaseProcess):
             processes[step.key] = ret
+        elif isinstance(ret, ChildProcessWorker):
+            processes[step.key] = ret.process
+            term_events[step.key] = ret.term_event
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
@@ -164,12 +164,14 @@
     from dagster._core.storage.event_log import EventLogStorage
     from dagster._core.storage.event_log.base import (
         AssetRecord,
+        DynamicPartitionsResult,
         EventLogConnection,
         EventLogRecord,
         EventRecordsFilter,
         EventRecordsResult,
         PlannedMaterializationInfo,
     )
+    from dagster._core.storage.event_log.write_behind import EventLogWriteBehindQueue
     from dagster._core.storage.partition_status_cache import (
         AssetPartitionStatus,
         AssetStatusCacheValue,
@@ -200,6 +202,26 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# Sets the maximum batch size of the event log write-behind queue. When set, events handled by
+# `handle_new_event` are queued in-process and written to the event log storage by a background
+# thread, which coalesces events from all steps into batch writes. The queue is flushed whenever a
+# step or run changes status, and when the instance is disposed. Defaults to 0, which turns off
+# write-behind entirely.
+def _get_event_write_behind_batch_size() -> int:
+    return int(os.getenv("DAGSTER_EVENT_WRITE_BEHIND_BATCH_SIZE", "0"))
+
+
+# The maximum number of seconds an event may wait in the write-behind queue before being written.
+def _get_event_write_behind_max_latency() -> float:
+    return float(os.getenv("DAGSTER_EVENT_WRITE_BEHIND_MAX_LATENCY", "0.5"))
+
+
+# The maximum number of events held in the write-behind queue. Handling a new event blocks while
+# the queue is full.
+def _get_event_write_behind_max_queue_size() -> int:
+    return int(os.getenv("DAGSTER_EVENT_WRITE_BEHIND_MAX_QUEUE_SIZE", "10000"))
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, Tuple[Any, Any]]:
@@ -496,6 +518,18 @@ def __init__(
         # Used for batched event handling
         self._event_buffer: Dict[str, List[EventLogEntry]] = defaultdict(list)
 
+        # Used for write-behind event handling
+        self._event_write_behind_queue: Optional["EventLogWriteBehindQueue"] = None
+        if _get_event_write_behind_batch_size() > 0:
+            from dagster._core.storage.event_log.write_behind import EventLogWriteBehindQueue
+
+            self._event_write_behind_queue = EventLogWriteBehindQueue(
+                self._event_storage,
+                max_batch_size=_get_event_write_behind_batch_size(),
+                max_latency=_get_event_write_behind_max_latency(),
+                max_queue_size=_get_event_write_behind_max_queue_size(),
+            )
+
     # ctors
 
     @public
@@ -958,6 +992,14 @@ def auto_materialize_max_tick_retries(self) -> int:
     def auto_materialize_use_sensors(self) -> int:
         return self.get_settings("auto_materialize").get("use_sensors", True)
 
+    @property
+    def auto_materialize_num_evaluation_processes(self) -> Optional[int]:
+        return self.get_settings("auto_materialize").get("num_evaluation_processes")
+
+    @property
+    def auto_materialize_skip_unchanged_entities(self) -> bool:
+        return self.get_settings("auto_materialize").get("skip_unchanged_entities", False)
+
     @property
     def global_op_concurrency_default_limit(self) -> Optional[int]:
         return self.get_settings("concurrency").get("default_op_concurrency_limit")
@@ -1015,6 +1057,8 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        if self._event_write_behind_queue:
+            self._event_write_behind_queue.dispose()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1099,6 +1143,12 @@ def has_historical_job(self, snapshot_id: str) -> bool:
     def get_execution_plan_snapshot(self, snapshot_id: str) -> "ExecutionPlanSnapshot":
         return self._run_storage.get_execution_plan_snapshot(snapshot_id)
 
+    @traced
+    def get_execution_plan_snapshots(
+        self, snapshot_ids: Sequence[str]
+    ) -> Mapping[str, "ExecutionPlanSnapshot"]:
+        return self._run_storage.get_execution_plan_snapshots(snapshot_ids)
+
     @traced
     def get_run_stats(self, run_id: str) -> DagsterRunStatsSnapshot:
         return self._event_storage.get_stats_for_run(run_id)
@@ -1920,6 +1970,12 @@ def update_asset_cached_status_data(
     ) -> None:
         self._event_storage.update_asset_cached_status_data(asset_key, cache_values)
 
+    @traced
+    def update_asset_cached_status_data_by_asset_key(
+        self, cache_values_by_asset_key: Mapping[AssetKey, "AssetStatusCacheValue"]
+    ) -> None:
+        self._event_storage.update_asset_cached_status_data_by_asset_key(cache_values_by_asset_key)
+
     @traced
     def wipe_asset_cached_status(self, asset_keys: Sequence[AssetKey]) -> None:
         check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
@@ -2170,11 +2226,13 @@ def get_status_by_partition(
 
         if isinstance(cached_value, AssetStatusCacheValue):
             materialized_partitions = cached_value.deserialize_materialized_partition_subsets(
-                partitions_def
+                partitions_def, self
+            )
+            failed_partitions = cached_value.deserialize_failed_partition_subsets(
+                partitions_def, self
             )
-            failed_partitions = cached_value.deserialize_failed_partition_subsets(partitions_def)
             in_progress_partitions = cached_value.deserialize_in_progress_partition_subsets(
-                partitions_def
+                partitions_def, self
             )
 
             status_by_partition = {}
@@ -2263,6 +2321,14 @@ def get_materialized_partitions(
             asset_key, before_cursor=before_cursor, after_cursor=after_cursor
         )
 
+    @traced
+    def get_materialized_partitions_by_asset_key(
+        self, after_cursors_by_asset_key: Mapping[AssetKey, Optional[int]]
+    ) -> Mapping[AssetKey, Set[str]]:
+        return self._event_storage.get_materialized_partitions_by_asset_key(
+            after_cursors_by_asset_key
+        )
+
     @traced
     def get_latest_storage_id_by_partition(
         self,
@@ -2297,6 +2363,36 @@ def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         check.str_param(partitions_def_name, "partitions_def_name")
         return self._event_storage.get_dynamic_partitions(partitions_def_name)
 
+    @traced
+    def get_paginated_dynamic_partitions(
+        self, partitions_def_name: str, limit: int, cursor: Optional[str] = None
+    ) -> "DynamicPartitionsResult":
+        """Get a page of the partition keys for the specified
+        :py:class:`DynamicPartitionsDefinition`, in the order they were added.
+
+        Args:
+            partitions_def_name (str): The name of the `DynamicPartitionsDefinition`.
+            limit (int): The maximum number of partition keys to return.
+            cursor (Optional[str]): The cursor of the previous page, if any.
+        """
+        check.str_param(partitions_def_name, "partitions_def_name")
+        check.int_param(limit, "limit")
+        check.opt_str_param(cursor, "cursor")
+        return self._event_storage.get_paginated_dynamic_partitions(
+            partitions_def_name, limit, cursor
+        )
+
+    @traced
+    def get_dynamic_partitions_count(self, partitions_def_name: str) -> int:
+        """Get the number of partition keys for the specified
+        :py:class:`DynamicPartitionsDefinition`.
+
+        Args:
+            partitions_def_name (str): The name of the `DynamicPartitionsDefinition`.
+        """
+        check.str_param(partitions_def_name, "partitions_def_name")
+        return self._event_storage.get_dynamic_partitions_count(partitions_def_name)
+
     @public
     @traced
     def add_dynamic_partitions(
@@ -2348,6 +2444,21 @@ def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) ->
         check.str_param(partition_key, "partition_key")
         return self._event_storage.has_dynamic_partition(partitions_def_name, partition_key)
 
+    @traced
+    def has_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> Mapping[str, bool]:
+        """Check which of the given partition keys exist for the
+        :py:class:`DynamicPartitionsDefinition`.
+
+        Args:
+            partitions_def_name (str): The name of the `DynamicPartitionsDefinition`.
+            partition_keys (Sequence[str]): Partition keys to check.
+        """
+        check.str_param(partitions_def_name, "partitions_def_name")
+        check.sequence_param(partition_keys, "partition_keys", of_type=str)
+        return self._event_storage.has_dynamic_partitions(partitions_def_name, partition_keys)
+
     # event subscriptions
 
     def _get_yaml_python_handlers(self) -> Sequence[logging.Handler]:
@@ -2388,6 +2499,9 @@ def get_handlers(self) -> Sequence[logging.Handler]:
         return handlers
 
     def store_event(self, event: "EventLogEntry") -> None:
+        if self._event_write_behind_queue:
+            # preserve the ordering of events that were handled before this one
+            self._event_write_behind_queue.flush()
         self._event_storage.store_event(event)
 
     def handle_new_event(
@@ -2406,6 +2520,10 @@ def handle_new_event(
         to the storage layer in a single batch. If an error occurrs during batch writing, then we
         fall back to iterative individual event writes.
 
+        If the event log write-behind queue is enabled (see `DAGSTER_EVENT_WRITE_BEHIND_BATCH_SIZE`),
+        events are instead put on the queue and written asynchronously. Step and run status events
+        flush the queue before subscribers are notified.
+
         Args:
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
@@ -2421,7 +2539,10 @@ def handle_new_event(
             else:
                 return
 
-        if len(events) == 1:
+        if self._event_write_behind_queue:
+            for event in events:
+                self._event_write_behind_queue.put(event)
+        elif len(events) == 1:
             self._event_storage.store_event(events[0])
         else:
             try:
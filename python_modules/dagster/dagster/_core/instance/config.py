@@ -414,6 +414,23 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                         "How many threads to use to process ticks from multiple automation policy sensors in parallel"
                     ),
                 ),
+                "num_evaluation_processes": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many processes to use to evaluate the automation conditions of independent"
+                        " assets within a single tick in parallel"
+                    ),
+                ),
+                "skip_unchanged_entities": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Whether to reuse the previous results of automation conditions whose inputs"
+                        " have not changed since the previous tick instead of evaluating them again"
+                    ),
+                ),
             }
         ),
         "concurrency": Field(
@@ -137,6 +137,14 @@ def prepare(cls, context: LoadingContext, ids: Iterable[TKey]) -> None:
         _, blocking_loader = context.get_loaders_for(cls)
         blocking_loader.prepare(ids)
 
+    @classmethod
+    def prime(cls, context: LoadingContext, id: TKey, value: Optional[Self]) -> None:
+        """Populate the cache of the blocking loader with an object fetched elsewhere, e.g. in
+        another process.
+        """
+        _, blocking_loader = context.get_loaders_for(cls)
+        blocking_loader.prime(id, value)
+
 
 class LoadingContextForTest(LoadingContext):
     """Loading context intended to be used in unit tests that would not otherwise construct a LoadingContext."""
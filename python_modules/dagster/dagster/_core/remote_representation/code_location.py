@@ -234,7 +234,13 @@ def get_partition_names(
         job_name: str,
         instance: DagsterInstance,
         selected_asset_keys: Optional[AbstractSet[AssetKey]],
+        start_index: int = 0,
+        end_index: Optional[int] = None,
     ) -> Union[PartitionNamesSnap, "PartitionExecutionErrorSnap"]:
+        """Returns the partition names of the job between the given indexes. The start index is
+        inclusive and the end index is exclusive, or all the names after the start index are
+        returned if it is None.
+        """
         remote_repo = self.get_repository(repository_handle.repository_name)
         partition_set_name = partition_set_snap_name_for_job_name(job_name)
 
@@ -245,10 +251,14 @@ def get_partition_names(
             # partition set that allows it
             if partition_set.has_partition_name_data():
                 return PartitionNamesSnap(
-                    partition_names=partition_set.get_partition_names(instance=instance)
+                    partition_names=partition_set.get_partition_names(
+                        instance=instance, start_index=start_index, end_index=end_index
+                    )
                 )
             else:
-                return self.get_partition_names_from_repo(repository_handle, job_name)
+                return self.get_partition_names_from_repo(
+                    repository_handle, job_name, start_index, end_index
+                )
         else:
             # Asset jobs might have no corresponding partition set but still have partitioned
             # assets, so we get the partition names using the assets.
@@ -257,6 +267,8 @@ def get_partition_names(
                     job_name=job_name,
                     selected_asset_keys=selected_asset_keys,
                     instance=instance,
+                    start_index=start_index,
+                    end_index=end_index,
                 )
             )
 
@@ -265,6 +277,8 @@ def get_partition_names_from_repo(
         self,
         repository_handle: RepositoryHandle,
         job_name: str,
+        start_index: int = 0,
+        end_index: Optional[int] = None,
     ) -> Union["PartitionNamesSnap", "PartitionExecutionErrorSnap"]:
         pass
 
@@ -541,10 +555,14 @@ def get_partition_names_from_repo(
         self,
         repository_handle: RepositoryHandle,
         job_name: str,
+        start_index: int = 0,
+        end_index: Optional[int] = None,
     ) -> Union["PartitionNamesSnap", "PartitionExecutionErrorSnap"]:
         return get_partition_names(
             self._get_repo_def(repository_handle.repository_name),
             job_name=job_name,
+            start_index=start_index,
+            end_index=end_index,
         )
 
     def get_schedule_execution_data(
@@ -920,9 +938,15 @@ def get_partition_tags_from_repo(
         )
 
     def get_partition_names_from_repo(
-        self, repository_handle: RepositoryHandle, job_name: str
+        self,
+        repository_handle: RepositoryHandle,
+        job_name: str,
+        start_index: int = 0,
+        end_index: Optional[int] = None,
     ) -> Union[PartitionNamesSnap, "PartitionExecutionErrorSnap"]:
-        return sync_get_external_partition_names_grpc(self.client, repository_handle, job_name)
+        return sync_get_external_partition_names_grpc(
+            self.client, repository_handle, job_name, start_index, end_index
+        )
 
     def get_schedule_execution_data(
         self,
@@ -362,10 +362,14 @@ def get_partition_names_for_asset_job(
         job_name: str,
         selected_asset_keys: Optional[AbstractSet[AssetKey]],
         instance: DagsterInstance,
+        start_index: int = 0,
+        end_index: Optional[int] = None,
     ) -> Sequence[str]:
-        return self._get_partitions_def_for_job(
-            job_name=job_name, selected_asset_keys=selected_asset_keys
-        ).get_partition_keys(dynamic_partitions_store=instance)
+        return list(
+            self._get_partitions_def_for_job(
+                job_name=job_name, selected_asset_keys=selected_asset_keys
+            ).iter_partition_keys(start_index, end_index, dynamic_partitions_store=instance)
+        )
 
     def get_partition_tags_for_implicit_asset_job(
         self,
@@ -1176,12 +1180,16 @@ def get_partitions_definition(self) -> PartitionsDefinition:
             )
         return partitions_data.get_partitions_definition()
 
-    def get_partition_names(self, instance: DagsterInstance) -> Sequence[str]:
+    def get_partition_names(
+        self, instance: DagsterInstance, start_index: int = 0, end_index: Optional[int] = None
+    ) -> Sequence[str]:
         partitions = self._partition_set_snap.partitions
         if partitions is None:
             check.failed(
                 "Partition set does not have partition data, cannot get partitions definition"
             )
-        return self.get_partitions_definition().get_partition_keys(
-            dynamic_partitions_store=instance
+        return list(
+            self.get_partitions_definition().iter_partition_keys(
+                start_index, end_index, dynamic_partitions_store=instance
+            )
         )
@@ -1008,15 +1008,23 @@ def from_job_def(cls, job_def: JobDefinition) -> Self:
         )
 
 
-@whitelist_for_serdes(storage_name="ExternalPartitionNamesData")
+@whitelist_for_serdes(
+    storage_name="ExternalPartitionNamesData", skip_when_none_fields={"start_index"}
+)
 @record_custom
 class PartitionNamesSnap(IHaveNew):
     partition_names: Sequence[str]
+    # The index of the first partition name when only a range of them was requested, or None if
+    # all the partition names are included
+    start_index: Optional[int]
 
-    def __new__(cls, partition_names: Optional[Sequence[str]] = None):
+    def __new__(
+        cls, partition_names: Optional[Sequence[str]] = None, start_index: Optional[int] = None
+    ):
         return super().__new__(
             cls,
             partition_names=partition_names or [],
+            start_index=start_index,
         )
 
 
@@ -19,6 +19,7 @@
 from dagster._core.definitions import RunRequest
 from dagster._core.definitions.asset_key import T_EntityKey, entity_key_from_db_string
 from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionEvaluationProfile,
     AutomationConditionEvaluationWithRunIds,
 )
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
@@ -340,6 +341,13 @@ def with_run_requests(
     ) -> "InstigatorTick":
         return self._replace(tick_data=self.tick_data.with_run_requests(run_requests, **kwargs))
 
+    def with_automation_condition_profile(
+        self, automation_condition_profile: AutomationConditionEvaluationProfile
+    ) -> "InstigatorTick":
+        return self._replace(
+            tick_data=self.tick_data.with_automation_condition_profile(automation_condition_profile)
+        )
+
     def with_reason(self, skip_reason: str) -> "InstigatorTick":
         check.opt_str_param(skip_reason, "skip_reason")
         return self._replace(tick_data=self.tick_data.with_reason(skip_reason))
@@ -528,6 +536,10 @@ def unsubmitted_run_ids_with_requests(self) -> Sequence[Tuple[str, RunRequest]]:
             if run_id in unrequested_run_ids
         ]
 
+    @property
+    def automation_condition_profile(self) -> Optional[AutomationConditionEvaluationProfile]:
+        return self.tick_data.automation_condition_profile
+
     @property
     def automation_condition_evaluation_id(self) -> int:
         """Returns a unique identifier for the current automation condition evaluation. In general,
@@ -574,6 +586,7 @@ class TickData(
             ("run_requests", Optional[Sequence[RunRequest]]),  # run requests created by the tick
             ("auto_materialize_evaluation_id", Optional[int]),
             ("reserved_run_ids", Optional[Sequence[str]]),
+            ("automation_condition_profile", Optional[AutomationConditionEvaluationProfile]),
         ],
     )
 ):
@@ -607,6 +620,9 @@ class TickData(
         reserved_run_ids (Optional[Sequence[str]]): A list of run IDs to use for each of the
             run_requests. Used to ensure that if the tick fails partway through, we don't create
             any duplicate runs for the tick. Currently only used by AUTO_MATERIALIZE ticks.
+        automation_condition_profile (Optional[AutomationConditionEvaluationProfile]): Timing
+            information for the AutomationConditions evaluated by this tick. Currently only used by
+            AUTO_MATERIALIZE ticks.
     """
 
     def __new__(
@@ -632,6 +648,7 @@ def __new__(
         run_requests: Optional[Sequence[RunRequest]] = None,
         auto_materialize_evaluation_id: Optional[int] = None,
         reserved_run_ids: Optional[Sequence[str]] = None,
+        automation_condition_profile: Optional[AutomationConditionEvaluationProfile] = None,
     ):
         _validate_tick_args(instigator_type, status, run_ids, error, skip_reason)
         check.opt_list_param(log_key, "log_key", of_type=str)
@@ -660,6 +677,11 @@ def __new__(
             run_requests=check.opt_sequence_param(run_requests, "run_requests"),
             auto_materialize_evaluation_id=auto_materialize_evaluation_id,
             reserved_run_ids=check.opt_sequence_param(reserved_run_ids, "reserved_run_ids"),
+            automation_condition_profile=check.opt_inst_param(
+                automation_condition_profile,
+                "automation_condition_profile",
+                AutomationConditionEvaluationProfile,
+            ),
         )
 
     def with_status(
@@ -717,6 +739,16 @@ def with_run_requests(
             )
         )
 
+    def with_automation_condition_profile(
+        self, automation_condition_profile: AutomationConditionEvaluationProfile
+    ) -> "TickData":
+        return TickData(
+            **merge_dicts(
+                self._asdict(),
+                {"automation_condition_profile": automation_condition_profile},
+            )
+        )
+
     def with_failure_count(self, failure_count: int) -> "TickData":
         return TickData(
             **merge_dicts(
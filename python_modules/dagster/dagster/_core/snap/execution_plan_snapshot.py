@@ -1,4 +1,4 @@
-from typing import AbstractSet, Mapping, NamedTuple, Optional, Sequence
+from typing import AbstractSet, Iterable, Mapping, NamedTuple, Optional, Sequence
 
 import dagster._check as check
 from dagster._core.definitions import NodeHandle
@@ -20,6 +20,7 @@
     UnresolvedCollectExecutionStep,
     UnresolvedMappedExecutionStep,
 )
+from dagster._core.loader import LoadableBy, LoadingContext
 from dagster._serdes import create_snapshot_id, whitelist_for_serdes
 from dagster._utils.error import SerializableErrorInfo
 
@@ -51,7 +52,8 @@ class ExecutionPlanSnapshot(
             ("executor_name", Optional[str]),
             ("repository_load_data", Optional[RepositoryLoadData]),
         ],
-    )
+    ),
+    LoadableBy[str],
 ):
     # serdes log
     # added executor_name
@@ -94,6 +96,14 @@ def __new__(
             ),
         )
 
+    @classmethod
+    def _blocking_batch_load(
+        cls, keys: Iterable[str], context: LoadingContext
+    ) -> Iterable[Optional["ExecutionPlanSnapshot"]]:
+        snapshot_ids = list(keys)
+        snapshots_by_id = context.instance.get_execution_plan_snapshots(snapshot_ids)
+        return [snapshots_by_id.get(snapshot_id) for snapshot_id in snapshot_ids]
+
     @property
     def asset_selection(self) -> AbstractSet[AssetKey]:
         asset_keys = set()
@@ -0,0 +1,62 @@
+"""add run event stats table
+
+Revision ID: 117c3dfa7bf2
+Revises: 6b7fb194ff9c
+Create Date: 2024-11-21 10:42:13.518216
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "117c3dfa7bf2"
+down_revision = "6b7fb194ff9c"
+branch_labels = None
+depends_on = None
+
+TABLE_NAME = "run_event_stats"
+INDEX_NAME = "idx_run_event_stats"
+
+
+def upgrade():
+    # only event log storages maintain run event stats
+    if not has_table("event_logs"):
+        return
+
+    if not has_table(TABLE_NAME):
+        op.create_table(
+            TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), nullable=False),
+            db.Column("dagster_event_type", db.Text, nullable=False),
+            db.Column("event_count", db.Integer, nullable=False),
+            db.Column("last_event_timestamp", db.types.TIMESTAMP),
+        )
+
+    if not has_index(TABLE_NAME, INDEX_NAME):
+        op.create_index(
+            INDEX_NAME,
+            TABLE_NAME,
+            ["run_id", "dagster_event_type"],
+            unique=True,
+            mysql_length={"run_id": 255, "dagster_event_type": 64},
+        )
+
+
+def downgrade():
+    if has_table("secondary_indexes"):
+        # the table must be backfilled again by `dagster instance reindex` after an upgrade
+        op.execute(db.text(f"DELETE FROM secondary_indexes WHERE name = '{TABLE_NAME}'"))
+
+    if has_table(TABLE_NAME):
+        if has_index(TABLE_NAME, INDEX_NAME):
+            op.drop_index(INDEX_NAME, TABLE_NAME)
+        op.drop_table(TABLE_NAME)
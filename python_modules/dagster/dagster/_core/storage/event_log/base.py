@@ -36,7 +36,7 @@
 from dagster._core.loader import LoadableBy, LoadingContext
 from dagster._core.storage.asset_check_execution_record import AssetCheckExecutionRecord
 from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
-from dagster._core.storage.partition_status_cache import get_and_update_asset_status_cache_value
+from dagster._core.storage.partition_status_cache import get_and_update_asset_status_cache_values
 from dagster._core.storage.sql import AlembicVersion
 from dagster._core.storage.tags import MULTIDIMENSIONAL_PARTITION_PREFIX
 from dagster._utils import PrintFn
@@ -178,6 +178,17 @@ class PlannedMaterializationInfo(NamedTuple):
     run_id: str
 
 
+class DynamicPartitionsResult(NamedTuple):
+    """Return value for a query fetching a page of the partition keys of a dynamic partitions
+    definition. Contains the partition keys in the order they were added, a cursor string, and a
+    boolean indicating whether there are more partition keys to fetch.
+    """
+
+    partition_keys: Sequence[str]
+    cursor: str
+    has_more: bool
+
+
 class EventLogStorage(ABC, MayHaveInstanceWeakref[T_DagsterInstance]):
     """Abstract base class for storing structured event logs from pipeline runs.
 
@@ -376,6 +387,15 @@ def update_asset_cached_status_data(
     ) -> None:
         pass
 
+    def update_asset_cached_status_data_by_asset_key(
+        self, cache_values_by_asset_key: Mapping[AssetKey, "AssetStatusCacheValue"]
+    ) -> None:
+        """Updates the cached status of each of the given assets. Storages that can write all of
+        them in one transaction should override this.
+        """
+        for asset_key, cache_values in cache_values_by_asset_key.items():
+            self.update_asset_cached_status_data(asset_key, cache_values)
+
     def get_asset_keys(
         self,
         prefix: Optional[Sequence[str]] = None,
@@ -488,6 +508,32 @@ def get_latest_asset_partition_materialization_attempts_without_materializations
     ) -> Mapping[str, Tuple[str, int]]:
         pass
 
+    def get_materialized_partitions_by_asset_key(
+        self, after_cursors_by_asset_key: Mapping[AssetKey, Optional[int]]
+    ) -> Mapping[AssetKey, Set[str]]:
+        """Fetch the partitions of each of the given assets that have been materialized after its
+        cursor, or ever materialized if its cursor is None. Storages that can fetch them for many
+        assets in a single query should override this.
+        """
+        return {
+            asset_key: self.get_materialized_partitions(asset_key, after_cursor=after_cursor)
+            for asset_key, after_cursor in after_cursors_by_asset_key.items()
+        }
+
+    def get_latest_asset_partition_materialization_attempts_without_materializations_by_asset_key(
+        self, after_storage_ids_by_asset_key: Mapping[AssetKey, Optional[int]]
+    ) -> Mapping[AssetKey, Mapping[str, Tuple[str, int]]]:
+        """Bulk version of
+        `get_latest_asset_partition_materialization_attempts_without_materializations`, fetching
+        the attempts after the storage id of each of the given assets.
+        """
+        return {
+            asset_key: self.get_latest_asset_partition_materialization_attempts_without_materializations(
+                asset_key, after_storage_id=after_storage_id
+            )
+            for asset_key, after_storage_id in after_storage_ids_by_asset_key.items()
+        }
+
     @abstractmethod
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         """Get the list of partition keys for a dynamic partitions definition."""
@@ -498,6 +544,36 @@ def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) ->
         """Check if a dynamic partition exists."""
         raise NotImplementedError()
 
+    def get_paginated_dynamic_partitions(
+        self, partitions_def_name: str, limit: int, cursor: Optional[str] = None
+    ) -> DynamicPartitionsResult:
+        """Get a page of the partition keys for a dynamic partitions definition, after the given
+        cursor. Storages that can page through the keys in the database should override this.
+        """
+        partition_keys = self.get_dynamic_partitions(partitions_def_name)
+        offset = EventLogCursor.parse(cursor).offset() if cursor else 0
+        page = partition_keys[offset : offset + limit]
+        return DynamicPartitionsResult(
+            partition_keys=page,
+            cursor=EventLogCursor.from_offset(offset + len(page)).to_string(),
+            has_more=offset + len(page) < len(partition_keys),
+        )
+
+    def has_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> Mapping[str, bool]:
+        """Check which of the given dynamic partitions exist. Storages that can check all of them
+        in a single query should override this.
+        """
+        return {
+            partition_key: self.has_dynamic_partition(partitions_def_name, partition_key)
+            for partition_key in partition_keys
+        }
+
+    def get_dynamic_partitions_count(self, partitions_def_name: str) -> int:
+        """Get the number of partition keys for a dynamic partitions definition."""
+        return len(self.get_dynamic_partitions(partitions_def_name))
+
     @abstractmethod
     def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
@@ -661,11 +737,8 @@ def get_asset_status_cache_values(
         context: LoadingContext,
     ) -> Sequence[Optional["AssetStatusCacheValue"]]:
         """Get the cached status information for each asset."""
-        values = []
-        for asset_key, partitions_def in partitions_defs_by_key:
-            values.append(
-                get_and_update_asset_status_cache_value(
-                    self._instance, asset_key, partitions_def, loading_context=context
-                )
-            )
-        return values
+        keys = list(partitions_defs_by_key)
+        values_by_key = get_and_update_asset_status_cache_values(
+            self._instance, dict(keys), loading_context=context
+        )
+        return [values_by_key[asset_key] for asset_key, _ in keys]
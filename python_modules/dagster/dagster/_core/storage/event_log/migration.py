@@ -11,9 +11,11 @@
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+RUN_EVENT_STATS = "run_event_stats"  # builds the run event stats table from the event log
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
+    RUN_EVENT_STATS: lambda: migrate_run_event_stats_data,
 }
 ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
 
@@ -72,6 +74,52 @@ def migrate_asset_key_data(event_log_storage, print_fn=None):
                 pass
 
 
+def migrate_run_event_stats_data(event_log_storage, print_fn=None):
+    """Utility method to build the run event stats table from the data in existing event log
+    records. Takes in event_log_storage, and a print_fn to keep track of progress.
+    """
+    from dagster._core.storage.event_log.schema import RunEventStatsTable, SqlEventLogStorageTable
+    from dagster._core.storage.event_log.sql_event_log import (
+        RUN_STATS_EVENT_TYPES,
+        SqlEventLogStorage,
+    )
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    if event_log_storage.is_run_sharded:
+        # the events of each run are stored in a separate shard, so run stats are aggregated from
+        # the events of the run shard instead
+        return
+
+    query = (
+        db_select(
+            [
+                SqlEventLogStorageTable.c.run_id,
+                SqlEventLogStorageTable.c.dagster_event_type,
+                db.func.count().label("event_count"),
+                db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
+            ]
+        )
+        .where(
+            db.and_(
+                SqlEventLogStorageTable.c.run_id != None,  # noqa: E711
+                SqlEventLogStorageTable.c.dagster_event_type.in_(RUN_STATS_EVENT_TYPES),
+            )
+        )
+        .group_by(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.dagster_event_type)
+    )
+    with event_log_storage.index_connection() as conn:
+        if print_fn:
+            print_fn("Aggregating run event stats from event logs.")
+        conn.execute(RunEventStatsTable.delete())
+        conn.execute(
+            RunEventStatsTable.insert().from_select(
+                ["run_id", "dagster_event_type", "event_count", "last_event_timestamp"], query
+            )
+        )
+
+
 def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
     from dagster._core.definitions.events import AssetKey
     from dagster._core.storage.event_log.schema import AssetKeyTable, SqlEventLogStorageTable
@@ -1,10 +1,13 @@
+import logging
 import os
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
 
 import dagster._check as check
+from dagster._core.event_api import EventLogRecord
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
@@ -22,14 +25,82 @@ class CallbackAfterCursor(NamedTuple):
     callback: Callable[[EventLogEntry, str], None]
 
 
+class _WatchedRun:
+    """The callbacks registered for a single watched run, and how far its events have been read."""
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self.callbacks: List[CallbackAfterCursor] = []
+        # storage ids after which each callback wants events, parallel to `callbacks`
+        self.callback_storage_ids: List[int] = []
+        # the greatest storage id of this run's events that have been read, None until the first
+        # read for the run
+        self.storage_id: Optional[int] = None
+        # whether all events of this run up to the shared tail cursor have been read, so that the
+        # run's new events can be read by the shared tail query
+        self.is_tailing = False
+
+    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
+        self.callbacks.append(CallbackAfterCursor(cursor, callback))
+        self.callback_storage_ids.append(
+            EventLogCursor.parse(cursor).storage_id() if cursor else -1
+        )
+
+    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
+        kept = [
+            (callback_with_cursor, storage_id)
+            for callback_with_cursor, storage_id in zip(self.callbacks, self.callback_storage_ids)
+            if callback_with_cursor.callback != callback
+        ]
+        self.callbacks = [callback_with_cursor for callback_with_cursor, _ in kept]
+        self.callback_storage_ids = [storage_id for _, storage_id in kept]
+
+    @property
+    def read_cursor(self) -> Optional[str]:
+        """The cursor from which to read this run's next events."""
+        if self.storage_id is None:
+            # no events have been read for this run yet, so start after the earliest cursor that any
+            # callback asked for
+            start_storage_id = min(self.callback_storage_ids, default=-1)
+            return (
+                str(EventLogCursor.from_storage_id(start_storage_id))
+                if start_storage_id >= 0
+                else None
+            )
+        return str(EventLogCursor.from_storage_id(self.storage_id))
+
+    def dispatch(self, record: EventLogRecord) -> None:
+        if self.storage_id is not None and record.storage_id <= self.storage_id:
+            return
+        self.storage_id = record.storage_id
+
+        cursor = str(EventLogCursor.from_storage_id(record.storage_id))
+        for callback_with_cursor, storage_id in zip(self.callbacks, self.callback_storage_ids):
+            if storage_id < record.storage_id:
+                try:
+                    callback_with_cursor.callback(record.event_log_entry, cursor)
+                except Exception:
+                    logging.exception(
+                        "Exception in callback for event watch on run %s.", self.run_id
+                    )
+
+
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that uses a single polling thread to retrieve new events for all watched
+    run_ids.
+
+    For storages that are not run sharded, the thread tails the event log by storage id, reading the
+    new events of every watched run with a single query per tick, and fans them out to the callbacks
+    registered for each run. A newly watched run is first caught up with per-run queries, after
+    which it joins the shared tail. For run sharded storages, where storage ids are only ordered
+    within a run, each watched run is queried in turn.
+
+    The thread polls every INIT_POLL_PERIOD while there are new events, backs off exponentially up
+    to MAX_POLL_PERIOD while idle, and sleeps without polling while no runs are watched.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _lock protects _watched_runs and the state of each _WatchedRun. It is held
+        while callbacks are invoked, so that no callback is called after `unwatch_run` returns.
     """
 
     def __init__(self, event_log_storage: EventLogStorage):
@@ -37,15 +108,22 @@ def __init__(self, event_log_storage: EventLogStorage):
             event_log_storage, "event_log_storage", EventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _lock protects _watched_runs
+        self._lock: threading.RLock = threading.RLock()
+        self._watched_runs: Dict[str, _WatchedRun] = {}
         self._disposed = False
 
+        self._wake = threading.Event()
+        self._should_thread_exit = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # the storage id up to which the event log has been tailed, set on the first poll
+        self._tail_storage_id: Optional[int] = None
+        self._chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
+
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+        with self._lock:
+            _has_run_id = run_id in self._watched_runs
         return _has_run_id
 
     def watch_run(
@@ -59,14 +137,19 @@ def watch_run(
         callback = check.callable_param(callback, "callback")
         check.invariant(not self._disposed, "Attempted to watch_run after close")
 
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
+        with self._lock:
+            if run_id not in self._watched_runs:
+                self._watched_runs[run_id] = _WatchedRun(run_id)
+            self._watched_runs[run_id].add_callback(cursor, callback)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sql-event-watch", daemon=True
                 )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+                self._thread.start()
+
+        # poll promptly for the newly watched run
+        self._wake.set()
 
     def unwatch_run(
         self,
@@ -75,113 +158,108 @@ def unwatch_run(
     ) -> None:
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._lock:
+            if run_id in self._watched_runs:
+                self._watched_runs[run_id].remove_callback(handler)
+                if not self._watched_runs[run_id].callbacks:
+                    del self._watched_runs[run_id]
 
     def close(self) -> None:
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
+            self._should_thread_exit.set()
+            self._wake.set()
+            if self._thread:
+                self._thread.join()
+                self._thread = None
+            with self._lock:
+                self._watched_runs = {}
+
+    @property
+    def _can_tail(self) -> bool:
+        return (
+            isinstance(self._event_log_storage, SqlEventLogStorage)
+            and not self._event_log_storage.is_run_sharded
+        )
 
+    def _run(self) -> None:
+        """Polling function to update Observers with EventLogEntrys from Event Log DB."""
+        wait_time = INIT_POLL_PERIOD
+        while not self._should_thread_exit.is_set():
+            try:
+                has_new_events = self._poll()
+            except Exception:
+                logging.exception("Exception while polling the event log for watched runs.")
+                has_new_events = False
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
+            wait_time = INIT_POLL_PERIOD if has_new_events else min(wait_time * 2, MAX_POLL_PERIOD)
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
+            with self._lock:
+                is_idle = not self._watched_runs
+            # sleep until a run is watched, or until the next poll
+            self._wake.wait(None if is_idle else wait_time)
+            if self._wake.is_set():
+                self._wake.clear()
+                wait_time = INIT_POLL_PERIOD
 
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
+    def _poll(self) -> bool:
+        """Reads new events for all watched runs, and returns whether there were any."""
+        if self._tail_storage_id is None and self._can_tail:
+            self._tail_storage_id = self._event_log_storage.get_maximum_record_id() or 0
 
-    """
+        with self._lock:
+            watched_runs = list(self._watched_runs.values())
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", EventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
-        self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
+        has_new_events = False
+        for watched_run in watched_runs:
+            if not watched_run.is_tailing:
+                has_new_events = self._poll_run(watched_run) or has_new_events
 
-    @property
-    def should_thread_exit(self) -> threading.Event:
-        return self._should_thread_exit
+        tailing_runs = [watched_run for watched_run in watched_runs if watched_run.is_tailing]
+        if tailing_runs:
+            has_new_events = self._poll_tail(tailing_runs) or has_new_events
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor.
+        return has_new_events
 
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
-        """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
+    def _poll_run(self, watched_run: _WatchedRun) -> bool:
+        with self._lock:
+            read_cursor = watched_run.read_cursor
 
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys.
+        connection = self._event_log_storage.get_records_for_run(
+            watched_run.run_id, cursor=read_cursor, limit=self._chunk_limit
+        )
+        self._dispatch(watched_run, connection.records)
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+        if self._tail_storage_id is not None and not connection.has_more:
+            # Every event of this run has been read, so the run can join the shared tail. Events
+            # that are read again by the tail query are skipped when dispatched.
+            with self._lock:
+                watched_run.storage_id = max(
+                    watched_run.storage_id if watched_run.storage_id is not None else -1,
+                    self._tail_storage_id,
+                )
+                watched_run.is_tailing = True
 
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
-
-    def run(self) -> None:
-        """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
-        """
-        cursor = None
-        wait_time = INIT_POLL_PERIOD
+        return bool(connection.records)
 
-        chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
+    def _poll_tail(self, tailing_runs: Sequence[_WatchedRun]) -> bool:
+        storage = check.inst(self._event_log_storage, SqlEventLogStorage)
+        runs_by_id = {watched_run.run_id: watched_run for watched_run in tailing_runs}
 
-        while not self._should_thread_exit.wait(wait_time):
-            conn = self._event_log_storage.get_records_for_run(
-                self._run_id,
-                cursor=cursor,
-                limit=chunk_limit,
-            )
-            cursor = conn.cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+        records = storage.get_records_for_runs_after_storage_id(
+            list(runs_by_id.keys()),
+            check.not_none(self._tail_storage_id),
+            limit=self._chunk_limit,
+        )
+        with self._lock:
+            for record in records:
+                runs_by_id[record.event_log_entry.run_id].dispatch(record)
+        if records:
+            self._tail_storage_id = records[-1].storage_id
+
+        return bool(records)
+
+    def _dispatch(self, watched_run: _WatchedRun, records: Sequence[EventLogRecord]) -> None:
+        with self._lock:
+            for record in records:
+                watched_run.dispatch(record)
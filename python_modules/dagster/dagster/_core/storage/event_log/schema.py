@@ -180,6 +180,22 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_sql_current_timestamp()),
 )
 
+RunEventStatsTable = db.Table(
+    "run_event_stats",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", db.String(255), nullable=False),
+    db.Column("dagster_event_type", db.Text, nullable=False),
+    # the number of events of this type in the run, and the timestamp of the latest one
+    db.Column("event_count", db.Integer, nullable=False),
+    db.Column("last_event_timestamp", db.types.TIMESTAMP),
+)
+
 db.Index(
     "idx_asset_check_executions",
     AssetCheckExecutionsTable.c.asset_key,
@@ -270,3 +286,10 @@
     mysql_length={"concurrency_key": 255, "run_id": 255, "step_key": 32},
     unique=True,
 )
+db.Index(
+    "idx_run_event_stats",
+    RunEventStatsTable.c.run_id,
+    RunEventStatsTable.c.dagster_event_type,
+    mysql_length={"run_id": 255, "dagster_event_type": 64},
+    unique=True,
+)
@@ -45,6 +45,7 @@
 )
 from dagster._core.event_api import (
     EventRecordsResult,
+    LazyEventLogRecord,
     RunShardedEventsCursor,
     RunStatusChangeRecordsFilter,
 )
@@ -67,6 +68,7 @@
     AssetEntry,
     AssetRecord,
     AssetRecordsFilter,
+    DynamicPartitionsResult,
     EventLogConnection,
     EventLogCursor,
     EventLogRecord,
@@ -78,6 +80,7 @@
     ASSET_DATA_MIGRATIONS,
     ASSET_KEY_INDEX_COLS,
     EVENT_LOG_DATA_MIGRATIONS,
+    RUN_EVENT_STATS,
 )
 from dagster._core.storage.event_log.schema import (
     AssetCheckExecutionsTable,
@@ -87,6 +90,7 @@
     ConcurrencySlotsTable,
     DynamicPartitionsTable,
     PendingStepsTable,
+    RunEventStatsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageTable,
 )
@@ -96,10 +100,10 @@
     db_fetch_mappings,
     db_select,
     db_subquery,
+    db_supports_insert_returning,
 )
-from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes import deserialize_value, deserialize_values, serialize_value
 from dagster._serdes.errors import DeserializationError
-from dagster._serdes.serdes import deserialize_values
 from dagster._time import datetime_from_timestamp, get_current_timestamp, utc_datetime_from_naive
 from dagster._utils import PrintFn
 from dagster._utils.concurrency import (
@@ -117,6 +121,22 @@
 
 MIN_ASSET_ROWS = 25
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
+# Keeps the number of bound parameters of a multi-row event insert well within database limits
+EVENT_BATCH_INSERT_CHUNK_SIZE = 500
+
+# The event types counted in the run event stats table, from which run stats are computed
+RUN_STATS_EVENT_TYPES = [
+    DagsterEventType.STEP_SUCCESS.value,
+    DagsterEventType.STEP_FAILURE.value,
+    DagsterEventType.ASSET_MATERIALIZATION.value,
+    DagsterEventType.STEP_EXPECTATION_RESULT.value,
+    DagsterEventType.PIPELINE_ENQUEUED.value,
+    DagsterEventType.PIPELINE_STARTING.value,
+    DagsterEventType.PIPELINE_START.value,
+    DagsterEventType.PIPELINE_SUCCESS.value,
+    DagsterEventType.PIPELINE_FAILURE.value,
+    DagsterEventType.PIPELINE_CANCELED.value,
+]
 
 
 def get_max_event_records_limit() -> int:
@@ -129,6 +149,12 @@ def get_max_event_records_limit() -> int:
         return DEFAULT_MAX_LIMIT_EVENT_RECORDS
 
 
+def get_event_serdes_codec() -> Optional[str]:
+    # Opt-in serdes codec (e.g. "zlib") for the `event` column of newly written event log rows.
+    # Rows are read back regardless of the codec they were written with.
+    return os.getenv("DAGSTER_EVENT_LOG_SERDES_CODEC") or None
+
+
 def enforce_max_records_limit(limit: int):
     max_limit = get_max_event_records_limit()
     if limit > max_limit:
@@ -183,6 +209,13 @@ def upgrade(self) -> None:
     def has_table(self, table_name: str) -> bool:
         """This method checks if a table exists in the database."""
 
+    @property
+    def event_serdes_codec(self) -> Optional[str]:
+        """The serdes codec used to encode the `event` column of new event log rows, or None to
+        store plain JSON.
+        """
+        return get_event_serdes_codec()
+
     def prepare_insert_event(self, event: EventLogEntry) -> Any:
         """Helper method for preparing the event log SQL insertion statement.  Abstracted away to
         have a single place for the logical table representation of the event, while having a way
@@ -216,7 +249,7 @@ def _event_to_row(self, event: EventLogEntry) -> Dict[str, Any]:
 
         return {
             "run_id": event.run_id,
-            "event": serialize_value(event),
+            "event": serialize_value(event, codec=self.event_serdes_codec),
             "dagster_event_type": dagster_event_type,
             "timestamp": self._event_insert_timestamp(event),
             "step_key": step_key,
@@ -448,6 +481,8 @@ def store_event(self, event: EventLogEntry) -> None:
             result = conn.execute(insert_event_statement)
             event_id = result.inserted_primary_key[0]
 
+        self.store_run_event_stats([event])
+
         if (
             event.is_dagster_event
             and event.dagster_event_type in ASSET_EVENTS
@@ -465,6 +500,191 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events, coalescing the writes to the event log and index tables.
+
+        The events of each run are written to the event log table with a single multi-row insert,
+        the run event stats table and the asset key table are updated once per distinct run and
+        event type and once per distinct asset key and event type, and all asset event tags are
+        written with a single bulk insert.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        events_by_run_id: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        for event in events:
+            events_by_run_id[event.run_id].append(event)
+
+        stored_events: List[EventLogEntry] = []
+        event_ids: List[Optional[int]] = []
+        for run_id, run_events in events_by_run_id.items():
+            with self.run_connection(run_id) as conn:
+                event_ids.extend(self._insert_event_batch(conn, run_events))
+            stored_events.extend(run_events)
+
+        self.store_run_event_stats(stored_events)
+        self._store_asset_event_batch(stored_events, event_ids)
+
+        for event, event_id in zip(stored_events, event_ids):
+            if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, event_id)
+
+    def _insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Insert a batch of events into the event log table, returning their storage ids.
+
+        If the dialect does not support `INSERT ... RETURNING`, consecutive events that do not need
+        a storage id for index updates are inserted with a single multi-row insert, and a storage id
+        of None is returned for them.
+        """
+        event_ids: List[Optional[int]] = []
+
+        if db_supports_insert_returning(conn):
+            for i in range(0, len(events), EVENT_BATCH_INSERT_CHUNK_SIZE):
+                chunk = events[i : i + EVENT_BATCH_INSERT_CHUNK_SIZE]
+                result = conn.execute(
+                    self.prepare_insert_event_batch(chunk).returning(SqlEventLogStorageTable.c.id)
+                )
+                # storage ids are assigned in insertion order, but the order of the returned rows
+                # is not guaranteed
+                event_ids.extend(sorted(cast(int, row[0]) for row in result.fetchall()))
+            return event_ids
+
+        rows: List[Dict[str, Any]] = []
+        for event in events:
+            if not self._has_event_index_updates(event):
+                rows.append(self._event_to_row(event))
+                event_ids.append(None)
+                continue
+
+            # flush the pending rows first, to preserve the ordering of storage ids
+            if rows:
+                conn.execute(SqlEventLogStorageTable.insert(), rows)
+                rows = []
+            result = conn.execute(self.prepare_insert_event(event))
+            event_ids.append(result.inserted_primary_key[0])
+
+        if rows:
+            conn.execute(SqlEventLogStorageTable.insert(), rows)
+
+        return event_ids
+
+    def _has_event_index_updates(self, event: EventLogEntry) -> bool:
+        if not event.is_dagster_event:
+            return False
+
+        dagster_event = event.get_dagster_event()
+        return bool(dagster_event.event_type in ASSET_EVENTS and dagster_event.asset_key) or (
+            dagster_event.event_type in ASSET_CHECK_EVENTS
+        )
+
+    def _store_asset_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
+    ) -> None:
+        """Update the asset key and asset event tags tables for a batch of stored events."""
+        asset_events: List[EventLogEntry] = []
+        asset_event_ids: List[int] = []
+        for event, event_id in zip(events, event_ids):
+            if not (
+                event.is_dagster_event
+                and event.dagster_event_type in ASSET_EVENTS
+                and event.get_dagster_event().asset_key
+            ):
+                continue
+
+            if event_id is None:
+                raise DagsterInvariantViolationError(
+                    "Cannot store asset event tags for null event id."
+                )
+            asset_events.append(event)
+            asset_event_ids.append(event_id)
+
+        # The asset key table entry only depends on the latest event of each asset event type, so
+        # the entry is updated once per asset key and event type instead of once per event.
+        latest_asset_events: Dict[Tuple[AssetKey, DagsterEventType], Tuple[EventLogEntry, int]] = {}
+        for event, event_id in zip(asset_events, asset_event_ids):
+            dagster_event = event.get_dagster_event()
+            latest_asset_events[
+                (check.not_none(dagster_event.asset_key), dagster_event.event_type)
+            ] = (event, event_id)
+
+        for event, event_id in sorted(latest_asset_events.values(), key=lambda x: x[1]):
+            self.store_asset_event(event, event_id)
+
+        if asset_events:
+            self.store_asset_event_tags(asset_events, asset_event_ids)
+
+    def _can_use_run_event_stats(self) -> bool:
+        # Run sharded storages aggregate the run stats from the events of the run shard. Otherwise,
+        # the run event stats table is used once it has been backfilled by `reindex_events`.
+        return not self.is_run_sharded and self.has_secondary_index(RUN_EVENT_STATS)
+
+    def store_run_event_stats(self, events: Sequence[EventLogEntry]) -> None:
+        """Increment the counts and latest timestamps in the run event stats table for the given
+        stored events.
+        """
+        stats: Dict[Tuple[str, str], Tuple[int, datetime]] = {}
+        for event in events:
+            if not event.is_dagster_event or event.dagster_event_type not in RUN_STATS_EVENT_TYPES:
+                continue
+            key = (event.run_id, event.get_dagster_event().event_type_value)
+            timestamp = self._event_insert_timestamp(event)
+            if key in stats:
+                count, last_timestamp = stats[key]
+                stats[key] = (count + 1, max(last_timestamp, timestamp))
+            else:
+                stats[key] = (1, timestamp)
+
+        if not stats or not self._can_use_run_event_stats():
+            return
+
+        with self.index_connection() as conn:
+            self._upsert_run_event_stats(conn, stats)
+
+    def _upsert_run_event_stats(
+        self, conn: Connection, stats: Mapping[Tuple[str, str], Tuple[int, datetime]]
+    ) -> None:
+        for (run_id, dagster_event_type), (count, timestamp) in stats.items():
+            update_stats = (
+                RunEventStatsTable.update()
+                .where(
+                    db.and_(
+                        RunEventStatsTable.c.run_id == run_id,
+                        RunEventStatsTable.c.dagster_event_type == dagster_event_type,
+                    )
+                )
+                .values(
+                    event_count=RunEventStatsTable.c.event_count + count,
+                    last_event_timestamp=db_case(
+                        [
+                            (
+                                RunEventStatsTable.c.last_event_timestamp >= timestamp,
+                                RunEventStatsTable.c.last_event_timestamp,
+                            )
+                        ],
+                        else_=timestamp,
+                    ),
+                )
+            )
+            if conn.execute(update_stats).rowcount:
+                continue
+
+            try:
+                conn.execute(
+                    RunEventStatsTable.insert().values(
+                        run_id=run_id,
+                        dagster_event_type=dagster_event_type,
+                        event_count=count,
+                        last_event_timestamp=timestamp,
+                    )
+                )
+            except db_exc.IntegrityError:
+                # the row was inserted by a concurrent write for the same run
+                conn.execute(update_stats)
+
     def get_records_for_run(
         self,
         run_id,
@@ -494,7 +714,15 @@ def get_records_for_run(
         )
 
         query = (
-            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.event,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    SqlEventLogStorageTable.c.step_key,
+                    SqlEventLogStorageTable.c.asset_key,
+                ]
+            )
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .order_by(
                 SqlEventLogStorageTable.c.id.asc()
@@ -526,23 +754,13 @@ def get_records_for_run(
         with self.run_connection(run_id) as conn:
             results = conn.execute(query).fetchall()
 
-        last_record_id = None
+        lazy_records = [_lazy_event_log_record_from_row(row) for row in results]
         try:
-            records = []
-            for (
-                record_id,
-                json_str,
-            ) in results:
-                records.append(
-                    EventLogRecord(
-                        storage_id=record_id,
-                        event_log_entry=deserialize_value(json_str, EventLogEntry),
-                    )
-                )
-                last_record_id = record_id
+            records = [lazy_record.to_event_log_record() for lazy_record in lazy_records]
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
+        last_record_id = lazy_records[-1].storage_id if lazy_records else None
         if last_record_id is not None:
             next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
         elif cursor:
@@ -561,22 +779,34 @@ def get_records_for_run(
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
-        query = (
-            db_select(
+        if self._can_use_run_event_stats():
+            # read the maintained counts, instead of aggregating over all of the events of the run
+            query = db_select(
                 [
-                    SqlEventLogStorageTable.c.dagster_event_type,
-                    db.func.count().label("n_events_of_type"),
-                    db.func.max(SqlEventLogStorageTable.c.timestamp).label("last_event_timestamp"),
+                    RunEventStatsTable.c.dagster_event_type,
+                    RunEventStatsTable.c.event_count,
+                    RunEventStatsTable.c.last_event_timestamp,
                 ]
-            )
-            .where(
-                db.and_(
-                    SqlEventLogStorageTable.c.run_id == run_id,
-                    SqlEventLogStorageTable.c.dagster_event_type != None,  # noqa: E711
+            ).where(RunEventStatsTable.c.run_id == run_id)
+        else:
+            query = (
+                db_select(
+                    [
+                        SqlEventLogStorageTable.c.dagster_event_type,
+                        db.func.count().label("n_events_of_type"),
+                        db.func.max(SqlEventLogStorageTable.c.timestamp).label(
+                            "last_event_timestamp"
+                        ),
+                    ]
+                )
+                .where(
+                    db.and_(
+                        SqlEventLogStorageTable.c.run_id == run_id,
+                        SqlEventLogStorageTable.c.dagster_event_type != None,  # noqa: E711
+                    )
                 )
+                .group_by("dagster_event_type")
             )
-            .group_by("dagster_event_type")
-        )
 
         with self.run_connection(run_id) as conn:
             results = conn.execute(query).fetchall()
@@ -640,7 +870,15 @@ def get_step_stats_for_run(
         # choose to revisit this in the future, especially if we are able to do JSON-column queries
         # in SQL as a way of bypassing the serdes layer in all cases.
         raw_event_query = (
-            db_select([SqlEventLogStorageTable.c.event])
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.event,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    SqlEventLogStorageTable.c.step_key,
+                    SqlEventLogStorageTable.c.asset_key,
+                ]
+            )
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
             .where(
@@ -670,7 +908,8 @@ def get_step_stats_for_run(
             results = conn.execute(raw_event_query).fetchall()
 
         try:
-            records = deserialize_values((json_str for (json_str,) in results), EventLogEntry)
+            # only the payloads of the events that carry step stats data are deserialized
+            records = [_lazy_event_log_record_from_row(row) for row in results]
             return build_run_step_stats_from_events(run_id, records)
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
@@ -691,6 +930,14 @@ def _apply_migration(self, migration_name, migration_fn, print_fn, force):
     def reindex_events(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
         """Call this method to run any data migrations across the event_log table."""
         for migration_name, migration_fn in EVENT_LOG_DATA_MIGRATIONS.items():
+            if migration_name == RUN_EVENT_STATS and not self.has_table(RunEventStatsTable.name):
+                # the table is created by the schema migration, which has not been applied yet
+                if print_fn:
+                    print_fn(
+                        f"Skipping data migration: {migration_name}, run `dagster instance"
+                        " migrate` first"
+                    )
+                continue
             self._apply_migration(migration_name, migration_fn, print_fn, force)
 
     def reindex_assets(self, print_fn: Optional[PrintFn] = None, force: bool = False) -> None:
@@ -726,6 +973,9 @@ def wipe(self) -> None:
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("run_event_stats"):
+                conn.execute(RunEventStatsTable.delete())
+
         self._wipe_index()
 
     def _wipe_index(self):
@@ -748,6 +998,9 @@ def _wipe_index(self):
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("run_event_stats"):
+                conn.execute(RunEventStatsTable.delete())
+
     def delete_events(self, run_id: str) -> None:
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
@@ -775,6 +1028,8 @@ def delete_events_for_run(self, conn: Connection, run_id: str) -> None:
         conn.execute(
             SqlEventLogStorageTable.delete().where(SqlEventLogStorageTable.c.run_id == run_id)
         )
+        if self._can_use_run_event_stats():
+            conn.execute(RunEventStatsTable.delete().where(RunEventStatsTable.c.run_id == run_id))
         if asset_event_ids:
             conn.execute(
                 AssetEventTagsTable.delete().where(
@@ -803,7 +1058,7 @@ def update_event_log_record(self, record_id: int, event: EventLogEntry) -> None:
                 SqlEventLogStorageTable.update()
                 .where(SqlEventLogStorageTable.c.id == record_id)
                 .values(
-                    event=serialize_value(event),
+                    event=serialize_value(event, codec=self.event_serdes_codec),
                     dagster_event_type=dagster_event_type,
                     timestamp=self._event_insert_timestamp(event),
                     step_key=event.step_key,
@@ -1187,6 +1442,39 @@ def get_maximum_record_id(self) -> Optional[int]:
             result = conn.execute(db_select([db.func.max(SqlEventLogStorageTable.c.id)])).fetchone()
             return result[0]  # type: ignore
 
+    def get_records_for_runs_after_storage_id(
+        self, run_ids: Sequence[str], storage_id: int, limit: int
+    ) -> Sequence[EventLogRecord]:
+        """Get the event records of the given runs with a storage id greater than `storage_id`, in
+        ascending storage id order. Allows tailing the event log for many runs with a single query.
+        Only supported for non sharded sql storage.
+        """
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+        check.int_param(storage_id, "storage_id")
+        check.int_param(limit, "limit")
+        check.invariant(not self.is_run_sharded, "Cannot query across runs of sharded storage")
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id.in_(run_ids),
+                    SqlEventLogStorageTable.c.id > storage_id,
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+            .limit(limit)
+        )
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        return [
+            EventLogRecord(storage_id=row[0], event_log_entry=event_log_entry)
+            for row, event_log_entry in zip(
+                rows, deserialize_values([row[1] for row in rows], EventLogEntry)
+            )
+        ]
+
     def _construct_asset_record_from_row(
         self,
         row,
@@ -1524,6 +1812,26 @@ def update_asset_cached_status_data(
                     .values(cached_status_data=serialize_value(cache_values))
                 )
 
+    def update_asset_cached_status_data_by_asset_key(
+        self, cache_values_by_asset_key: Mapping[AssetKey, "AssetStatusCacheValue"]
+    ) -> None:
+        if not cache_values_by_asset_key or not self.can_read_asset_status_cache():
+            return
+
+        with self.index_transaction() as conn:
+            conn.execute(
+                AssetKeyTable.update()
+                .where(AssetKeyTable.c.asset_key == db.bindparam("asset_key_string"))
+                .values(cached_status_data=db.bindparam("cached_status_data_string")),
+                [
+                    {
+                        "asset_key_string": asset_key.to_string(),
+                        "cached_status_data_string": serialize_value(cache_values),
+                    }
+                    for asset_key, cache_values in cache_values_by_asset_key.items()
+                ],
+            )
+
     def _fetch_backcompat_materialization_times(
         self, asset_keys: Sequence[AssetKey]
     ) -> Mapping[AssetKey, datetime]:
@@ -1831,6 +2139,58 @@ def get_materialized_partitions(
 
         return set([cast(str, row[0]) for row in results])
 
+    def get_materialized_partitions_by_asset_key(
+        self, after_cursors_by_asset_key: Mapping[AssetKey, Optional[int]]
+    ) -> Mapping[AssetKey, Set[str]]:
+        if not after_cursors_by_asset_key:
+            return {}
+
+        asset_keys = list(after_cursors_by_asset_key.keys())
+        asset_keys_by_string = {asset_key.to_string(): asset_key for asset_key in asset_keys}
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.partition,
+                    db.func.max(SqlEventLogStorageTable.c.id),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key.in_(list(asset_keys_by_string.keys())),
+                    SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition)
+        )
+
+        assets_details = self._get_assets_details(asset_keys)
+        query = self._add_assets_wipe_filter_to_query(query, assets_details, asset_keys)
+
+        # scan the events after the earliest cursor in one query, and filter each asset's partitions
+        # by its own cursor: a partition was materialized after the cursor if its latest
+        # materialization was
+        after_cursors = list(after_cursors_by_asset_key.values())
+        if all(after_cursors):
+            query = query.where(
+                SqlEventLogStorageTable.c.id > min(cast(int, c) for c in after_cursors)
+            )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        materialized_partitions_by_asset_key: Dict[AssetKey, Set[str]] = {
+            asset_key: set() for asset_key in asset_keys
+        }
+        for asset_key_string, partition, latest_storage_id in results:
+            asset_key = asset_keys_by_string[cast(str, asset_key_string)]
+            after_cursor = after_cursors_by_asset_key[asset_key]
+            if not after_cursor or latest_storage_id > after_cursor:
+                materialized_partitions_by_asset_key[asset_key].add(cast(str, partition))
+        return materialized_partitions_by_asset_key
+
     def _latest_event_ids_by_partition_subquery(
         self,
         asset_key: AssetKey,
@@ -1842,15 +2202,37 @@ def _latest_event_ids_by_partition_subquery(
         """Subquery for locating the latest event ids by partition for a given asset key and set
         of event types.
         """
+        return self._latest_event_ids_by_asset_partition_subquery(
+            [asset_key],
+            event_types,
+            asset_partitions=asset_partitions,
+            before_cursor=before_cursor,
+            after_cursor=after_cursor,
+        )
+
+    def _latest_event_ids_by_asset_partition_subquery(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_types: Sequence[DagsterEventType],
+        asset_partitions: Optional[Sequence[str]] = None,
+        before_cursor: Optional[int] = None,
+        after_cursor: Optional[int] = None,
+    ):
+        """Subquery for locating the latest event ids by asset key and partition for a set of asset
+        keys and event types.
+        """
         query = db_select(
             [
+                SqlEventLogStorageTable.c.asset_key,
                 SqlEventLogStorageTable.c.dagster_event_type,
                 SqlEventLogStorageTable.c.partition,
                 db.func.max(SqlEventLogStorageTable.c.id).label("id"),
             ]
         ).where(
             db.and_(
-                SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
+                SqlEventLogStorageTable.c.asset_key.in_(
+                    [asset_key.to_string() for asset_key in asset_keys]
+                ),
                 SqlEventLogStorageTable.c.partition != None,  # noqa: E711
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
                     [event_type.value for event_type in event_types]
@@ -1865,13 +2247,15 @@ def _latest_event_ids_by_partition_subquery(
             query = query.where(SqlEventLogStorageTable.c.id > after_cursor)
 
         latest_event_ids_subquery = query.group_by(
-            SqlEventLogStorageTable.c.dagster_event_type, SqlEventLogStorageTable.c.partition
+            SqlEventLogStorageTable.c.asset_key,
+            SqlEventLogStorageTable.c.dagster_event_type,
+            SqlEventLogStorageTable.c.partition,
         )
 
-        assets_details = self._get_assets_details([asset_key])
+        assets_details = self._get_assets_details(asset_keys)
         return db_subquery(
             self._add_assets_wipe_filter_to_query(
-                latest_event_ids_subquery, assets_details, [asset_key]
+                latest_event_ids_subquery, assets_details, asset_keys
             ),
             "latest_event_ids_by_partition_subquery",
         )
@@ -1974,64 +2358,72 @@ def get_latest_asset_partition_materialization_attempts_without_materializations
         """
         check.inst_param(asset_key, "asset_key", AssetKey)
 
-        latest_event_ids_subquery = self._latest_event_ids_by_partition_subquery(
-            asset_key,
+        return self.get_latest_asset_partition_materialization_attempts_without_materializations_by_asset_key(
+            {asset_key: after_storage_id}
+        )[asset_key]
+
+    def get_latest_asset_partition_materialization_attempts_without_materializations_by_asset_key(
+        self, after_storage_ids_by_asset_key: Mapping[AssetKey, Optional[int]]
+    ) -> Mapping[AssetKey, Mapping[str, Tuple[str, int]]]:
+        if not after_storage_ids_by_asset_key:
+            return {}
+
+        asset_keys = list(after_storage_ids_by_asset_key.keys())
+        asset_keys_by_string = {asset_key.to_string(): asset_key for asset_key in asset_keys}
+        # scan the events after the earliest storage id in one query, and filter each asset's
+        # planned events by its own storage id below
+        after_storage_ids = list(after_storage_ids_by_asset_key.values())
+        latest_event_ids_subquery = self._latest_event_ids_by_asset_partition_subquery(
+            asset_keys,
             [
                 DagsterEventType.ASSET_MATERIALIZATION,
                 DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
             ],
-            after_cursor=after_storage_id,
-        )
-
-        latest_events_subquery = db_subquery(
-            db_select(
-                [
-                    SqlEventLogStorageTable.c.dagster_event_type,
-                    SqlEventLogStorageTable.c.partition,
-                    SqlEventLogStorageTable.c.run_id,
-                    SqlEventLogStorageTable.c.id,
-                ]
-            ).select_from(
-                latest_event_ids_subquery.join(
-                    SqlEventLogStorageTable,
-                    SqlEventLogStorageTable.c.id == latest_event_ids_subquery.c.id,
-                ),
+            after_cursor=(
+                min(cast(int, storage_id) for storage_id in after_storage_ids)
+                if all(storage_id is not None for storage_id in after_storage_ids)
+                else None
             ),
-            "latest_events_subquery",
         )
 
-        materialization_planned_events = db_select(
+        latest_events_query = db_select(
             [
-                latest_events_subquery.c.dagster_event_type,
-                latest_events_subquery.c.partition,
-                latest_events_subquery.c.run_id,
-                latest_events_subquery.c.id,
-            ]
-        ).where(
-            latest_events_subquery.c.dagster_event_type
-            == DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value
-        )
-
-        materialization_events = db_select(
-            [
-                latest_events_subquery.c.dagster_event_type,
-                latest_events_subquery.c.partition,
-                latest_events_subquery.c.run_id,
-                latest_events_subquery.c.id,
+                SqlEventLogStorageTable.c.asset_key,
+                SqlEventLogStorageTable.c.dagster_event_type,
+                SqlEventLogStorageTable.c.partition,
+                SqlEventLogStorageTable.c.run_id,
+                SqlEventLogStorageTable.c.id,
             ]
-        ).where(
-            latest_events_subquery.c.dagster_event_type
-            == DagsterEventType.ASSET_MATERIALIZATION.value
+        ).select_from(
+            latest_event_ids_subquery.join(
+                SqlEventLogStorageTable,
+                SqlEventLogStorageTable.c.id == latest_event_ids_subquery.c.id,
+            ),
         )
 
         with self.index_connection() as conn:
-            materialization_planned_rows = db_fetch_mappings(conn, materialization_planned_events)
-            materialization_rows = db_fetch_mappings(conn, materialization_events)
+            latest_event_rows = db_fetch_mappings(conn, latest_events_query)
 
-        materialization_planned_rows_by_partition = {
-            row["partition"]: (row["run_id"], row["id"]) for row in materialization_planned_rows
+        materialization_planned_rows_by_asset_key: Dict[AssetKey, Dict[str, Tuple[str, int]]] = {
+            asset_key: {} for asset_key in asset_keys
         }
+        materialization_rows = []
+        for row in latest_event_rows:
+            asset_key = asset_keys_by_string[row["asset_key"]]
+            if row["dagster_event_type"] == DagsterEventType.ASSET_MATERIALIZATION.value:
+                materialization_rows.append(row)
+                continue
+            after_storage_id = after_storage_ids_by_asset_key[asset_key]
+            if after_storage_id is None or row["id"] > after_storage_id:
+                materialization_planned_rows_by_asset_key[asset_key][row["partition"]] = (
+                    row["run_id"],
+                    row["id"],
+                )
+
         for mat_row in materialization_rows:
+            materialization_planned_rows_by_partition = materialization_planned_rows_by_asset_key[
+                asset_keys_by_string[mat_row["asset_key"]]
+            ]
             mat_partition = mat_row["partition"]
             mat_event_id = mat_row["id"]
             if mat_partition not in materialization_planned_rows_by_partition:
@@ -2041,7 +2433,7 @@ def get_latest_asset_partition_materialization_attempts_without_materializations
                 # this planned materialization event was followed by a materialization event
                 materialization_planned_rows_by_partition.pop(mat_partition)
 
-        return materialization_planned_rows_by_partition
+        return materialization_planned_rows_by_asset_key
 
     def _check_partitions_table(self) -> None:
         # Guards against cases where the user is not running the latest migration for
@@ -2053,22 +2445,108 @@ def _check_partitions_table(self) -> None:
                 " instance migrate`."
             )
 
+    @property
+    def _can_cache_dynamic_partitions(self) -> bool:
+        # the partition keys of a definition can be cached for as long as the number of its rows
+        # and their max id are unchanged, which holds as long as ids of deleted rows are not reused
+        return True
+
+    @cached_property
+    def _dynamic_partitions_cache(self) -> Dict[str, Tuple[Tuple[int, int], Sequence[str]]]:
+        return {}
+
+    def _get_dynamic_partitions_version(self, partitions_def_name: str) -> Tuple[int, int]:
+        query = db_select(
+            [
+                db.func.count(DynamicPartitionsTable.c.id),
+                db.func.max(DynamicPartitionsTable.c.id),
+            ]
+        ).where(DynamicPartitionsTable.c.partitions_def_name == partitions_def_name)
+        with self.index_connection() as conn:
+            row = conn.execute(query).fetchone()
+
+        return (row[0] or 0, row[1] or 0) if row else (0, 0)
+
+    def _fetch_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
+        query = (
+            db_select([DynamicPartitionsTable.c.partition])
+            .where(DynamicPartitionsTable.c.partitions_def_name == partitions_def_name)
+            .order_by(DynamicPartitionsTable.c.id)
+        )
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        return [cast(str, row[0]) for row in rows]
+
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         """Get the list of partition keys for a partition definition."""
         self._check_partitions_table()
-        columns = [
-            DynamicPartitionsTable.c.partitions_def_name,
-            DynamicPartitionsTable.c.partition,
-        ]
+        if not self._can_cache_dynamic_partitions:
+            return self._fetch_dynamic_partitions(partitions_def_name)
+
+        # reading the keys again is skipped while no partitions have been added or deleted. The
+        # version is read before the keys, so keys added in between only cause an extra refetch
+        version = self._get_dynamic_partitions_version(partitions_def_name)
+        cached = self._dynamic_partitions_cache.get(partitions_def_name)
+        if cached is None or cached[0] != version:
+            cached = (version, self._fetch_dynamic_partitions(partitions_def_name))
+            self._dynamic_partitions_cache[partitions_def_name] = cached
+
+        # copied, since callers may modify the returned list
+        return list(cached[1])
+
+    def get_paginated_dynamic_partitions(
+        self, partitions_def_name: str, limit: int, cursor: Optional[str] = None
+    ) -> DynamicPartitionsResult:
+        self._check_partitions_table()
         query = (
-            db_select(columns)
+            db_select([DynamicPartitionsTable.c.id, DynamicPartitionsTable.c.partition])
             .where(DynamicPartitionsTable.c.partitions_def_name == partitions_def_name)
             .order_by(DynamicPartitionsTable.c.id)
+            .limit(limit)
         )
+        if cursor:
+            query = query.where(
+                DynamicPartitionsTable.c.id > EventLogCursor.parse(cursor).storage_id()
+            )
         with self.index_connection() as conn:
             rows = conn.execute(query).fetchall()
 
-        return [cast(str, row[1]) for row in rows]
+        if rows:
+            new_cursor = EventLogCursor.from_storage_id(rows[-1][0]).to_string()
+        elif cursor:
+            new_cursor = cursor
+        else:
+            new_cursor = EventLogCursor.from_storage_id(-1).to_string()
+
+        return DynamicPartitionsResult(
+            partition_keys=[cast(str, row[1]) for row in rows],
+            cursor=new_cursor,
+            has_more=len(rows) == limit,
+        )
+
+    def has_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> Mapping[str, bool]:
+        self._check_partitions_table()
+        if not partition_keys:
+            return {}
+
+        query = db_select([DynamicPartitionsTable.c.partition]).where(
+            db.and_(
+                DynamicPartitionsTable.c.partitions_def_name == partitions_def_name,
+                DynamicPartitionsTable.c.partition.in_(partition_keys),
+            )
+        )
+        with self.index_connection() as conn:
+            existing_keys = {row[0] for row in conn.execute(query).fetchall()}
+
+        return {partition_key: partition_key in existing_keys for partition_key in partition_keys}
+
+    def get_dynamic_partitions_count(self, partitions_def_name: str) -> int:
+        self._check_partitions_table()
+        count, _ = self._get_dynamic_partitions_version(partitions_def_name)
+        return count
 
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
         self._check_partitions_table()
@@ -3112,6 +3590,17 @@ def get_updated_data_version_partitions(
         return updated_partitions
 
 
+def _lazy_event_log_record_from_row(row: SqlAlchemyRow) -> LazyEventLogRecord:
+    storage_id, json_str, dagster_event_type, step_key, asset_key = row
+    return LazyEventLogRecord(
+        storage_id=storage_id,
+        serialized_event=json_str,
+        dagster_event_type_value=dagster_event_type,
+        step_key=step_key,
+        asset_key_str=asset_key,
+    )
+
+
 def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     """Utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
     supported in sqlalchemy 1.3.
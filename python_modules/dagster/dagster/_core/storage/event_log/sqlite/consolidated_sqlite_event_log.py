@@ -148,6 +148,11 @@ def watch(self, run_id, cursor, callback):
     def supports_global_concurrency_limits(self) -> bool:
         return False
 
+    @property
+    def _can_cache_dynamic_partitions(self) -> bool:
+        # sqlite reuses the rowid of the last row once it is deleted
+        return False
+
     def on_modified(self):
         keys = [
             (run_id, callback)
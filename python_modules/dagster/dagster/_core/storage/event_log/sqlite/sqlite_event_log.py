@@ -286,6 +286,48 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to replicate the asset events and run status change events of a batch
+        in the central index shard, enabling cross-run queries.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        rows_by_run_id = defaultdict(list)
+        index_events = []
+        for event in events:
+            rows_by_run_id[event.run_id].append(self._event_to_row(event))
+
+            if not event.is_dagster_event:
+                continue
+
+            if event.get_dagster_event().asset_key:
+                check.invariant(
+                    event.dagster_event_type in ASSET_EVENTS,
+                    "Can only store asset materializations, materialization_planned, and"
+                    " observations in index database",
+                )
+                index_events.append(event)
+            elif event.dagster_event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
+                index_events.append(event)
+
+        for run_id, rows in rows_by_run_id.items():
+            with self.run_connection(run_id) as conn:
+                conn.execute(SqlEventLogStorageTable.insert(), rows)
+
+        if index_events:
+            # mirror the events in the cross-run index database
+            with self.index_connection() as conn:
+                event_ids = self._insert_event_batch(conn, index_events)
+
+            self._store_asset_event_batch(index_events, event_ids)
+
+        for event in events:
+            if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, None)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -512,6 +554,11 @@ def is_run_sharded(self) -> bool:
     def supports_global_concurrency_limits(self) -> bool:
         return False
 
+    @property
+    def _can_cache_dynamic_partitions(self) -> bool:
+        # sqlite reuses the rowid of the last row once it is deleted
+        return False
+
 
 class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
     def __init__(
@@ -0,0 +1,173 @@
+import logging
+import queue
+import threading
+import time
+from typing import List, Optional, Sequence, Union
+
+import dagster._check as check
+from dagster._core.events import PIPELINE_EVENTS, DagsterEventType
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.base import EventLogStorage
+
+DEFAULT_WRITE_BEHIND_MAX_LATENCY = 0.5  # 500ms
+DEFAULT_WRITE_BEHIND_MAX_QUEUE_SIZE = 10000
+
+# Events that mark a change in step or run status. The write-behind queue is flushed whenever one of
+# these is handled, so that the event log is durable any time a step or run transitions.
+WRITE_BEHIND_FLUSH_EVENTS = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+    *PIPELINE_EVENTS,
+}
+
+
+def is_write_behind_flush_event(event: EventLogEntry) -> bool:
+    return event.is_dagster_event and event.dagster_event_type in WRITE_BEHIND_FLUSH_EVENTS
+
+
+class _FlushRequest:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class _Shutdown:
+    pass
+
+
+class EventLogWriteBehindQueue:
+    """Write-behind buffer for an event log storage.
+
+    Events are put on a bounded in-process queue and written by a single background thread, which
+    coalesces events from all steps into `store_event_batch` calls. A batch is written as soon as
+    it reaches `max_batch_size` events, or `max_latency` seconds after its first event was queued,
+    whichever happens first. When the queue is full, `put` blocks until the writer catches up.
+
+    If a batch write fails, the writer falls back to storing the events of that batch one at a time.
+    Any error raised by those individual writes is re-raised from the next call to `flush`.
+
+    LOCKING INFO:
+        INVARIANTS: _error_lock protects _error
+    """
+
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        max_batch_size: int,
+        max_latency: float = DEFAULT_WRITE_BEHIND_MAX_LATENCY,
+        max_queue_size: int = DEFAULT_WRITE_BEHIND_MAX_QUEUE_SIZE,
+    ):
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", EventLogStorage
+        )
+        self._max_batch_size = check.int_param(max_batch_size, "max_batch_size")
+        check.invariant(self._max_batch_size > 0, "max_batch_size must be positive")
+        self._max_latency = check.numeric_param(max_latency, "max_latency")
+        self._queue: queue.Queue[Union[EventLogEntry, _FlushRequest, _Shutdown]] = queue.Queue(
+            maxsize=check.int_param(max_queue_size, "max_queue_size")
+        )
+
+        self._error_lock = threading.Lock()
+        self._error: Optional[Exception] = None
+        self._disposed = False
+
+        self._thread = threading.Thread(
+            target=self._run, name="event-log-write-behind", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._max_batch_size
+
+    @property
+    def max_latency(self) -> float:
+        return self._max_latency
+
+    def put(self, event: EventLogEntry) -> None:
+        """Queue an event to be written. Step and run status events flush the queue before
+        returning, so that the event log is up to date whenever a step or run changes status.
+        """
+        check.inst_param(event, "event", EventLogEntry)
+        check.invariant(not self._disposed, "Attempted to put an event after dispose")
+        self._queue.put(event)
+
+        if is_write_behind_flush_event(event):
+            self.flush()
+
+    def flush(self) -> None:
+        """Block until every event queued before this call has been written to storage."""
+        if self._disposed:
+            return
+
+        request = _FlushRequest()
+        self._queue.put(request)
+        request.done.wait()
+
+        with self._error_lock:
+            error, self._error = self._error, None
+        if error:
+            raise error
+
+    def dispose(self) -> None:
+        if self._disposed:
+            return
+        self._queue.put(_Shutdown())
+        self._thread.join()
+        self._disposed = True
+
+    def _run(self) -> None:
+        batch: List[EventLogEntry] = []
+        deadline: Optional[float] = None
+
+        while True:
+            timeout = max(deadline - time.monotonic(), 0) if deadline is not None else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, EventLogEntry):
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self._max_latency
+                if len(batch) < self._max_batch_size and time.monotonic() < deadline:
+                    continue
+
+            # the batch is full, the latency deadline expired, or a flush / shutdown was requested
+            if batch:
+                self._write(batch)
+                batch = []
+                deadline = None
+
+            if isinstance(item, _FlushRequest):
+                item.done.set()
+            elif isinstance(item, _Shutdown):
+                return
+
+    def _write(self, events: Sequence[EventLogEntry]) -> None:
+        if len(events) == 1:
+            self._write_individually(events)
+            return
+
+        try:
+            self._event_log_storage.store_event_batch(events)
+        except Exception:
+            logging.exception(
+                "Exception while storing event batch, falling back to storing %s events"
+                " individually.",
+                len(events),
+            )
+            self._write_individually(events)
+
+    def _write_individually(self, events: Sequence[EventLogEntry]) -> None:
+        for event in events:
+            try:
+                self._event_log_storage.store_event(event)
+            except Exception as e:
+                logging.exception("Exception while storing event for run %s.", event.run_id)
+                with self._error_lock:
+                    self._error = self._error or e
@@ -14,6 +14,7 @@
 from dagster._core.storage.event_log.base import (
     AssetCheckSummaryRecord,
     AssetRecord,
+    DynamicPartitionsResult,
     EventLogConnection,
     EventLogRecord,
     EventLogStorage,
@@ -283,6 +284,11 @@ def get_execution_plan_snapshot(
     ) -> "ExecutionPlanSnapshot":
         return self._storage.run_storage.get_execution_plan_snapshot(execution_plan_snapshot_id)
 
+    def get_execution_plan_snapshots(
+        self, execution_plan_snapshot_ids: Sequence[str]
+    ) -> Mapping[str, "ExecutionPlanSnapshot"]:
+        return self._storage.run_storage.get_execution_plan_snapshots(execution_plan_snapshot_ids)
+
     def wipe(self) -> None:
         return self._storage.run_storage.wipe()
 
@@ -586,6 +592,20 @@ def get_latest_asset_partition_materialization_attempts_without_materializations
             asset_key, after_storage_id
         )
 
+    def get_materialized_partitions_by_asset_key(
+        self, after_cursors_by_asset_key: Mapping["AssetKey", Optional[int]]
+    ) -> Mapping["AssetKey", Set[str]]:
+        return self._storage.event_log_storage.get_materialized_partitions_by_asset_key(
+            after_cursors_by_asset_key
+        )
+
+    def get_latest_asset_partition_materialization_attempts_without_materializations_by_asset_key(
+        self, after_storage_ids_by_asset_key: Mapping["AssetKey", Optional[int]]
+    ) -> Mapping["AssetKey", Mapping[str, Tuple[str, int]]]:
+        return self._storage.event_log_storage.get_latest_asset_partition_materialization_attempts_without_materializations_by_asset_key(
+            after_storage_ids_by_asset_key
+        )
+
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         return self._storage.event_log_storage.get_dynamic_partitions(partitions_def_name)
 
@@ -594,6 +614,23 @@ def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) ->
             partitions_def_name, partition_key
         )
 
+    def get_paginated_dynamic_partitions(
+        self, partitions_def_name: str, limit: int, cursor: Optional[str] = None
+    ) -> DynamicPartitionsResult:
+        return self._storage.event_log_storage.get_paginated_dynamic_partitions(
+            partitions_def_name, limit, cursor
+        )
+
+    def has_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> Mapping[str, bool]:
+        return self._storage.event_log_storage.has_dynamic_partitions(
+            partitions_def_name, partition_keys
+        )
+
+    def get_dynamic_partitions_count(self, partitions_def_name: str) -> int:
+        return self._storage.event_log_storage.get_dynamic_partitions_count(partitions_def_name)
+
     def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
     ) -> None:
@@ -632,6 +669,13 @@ def update_asset_cached_status_data(
             asset_key=asset_key, cache_values=cache_values
         )
 
+    def update_asset_cached_status_data_by_asset_key(
+        self, cache_values_by_asset_key: Mapping["AssetKey", "AssetStatusCacheValue"]
+    ) -> None:
+        self._storage.event_log_storage.update_asset_cached_status_data_by_asset_key(
+            cache_values_by_asset_key
+        )
+
     def get_records_for_run(
         self,
         run_id: str,
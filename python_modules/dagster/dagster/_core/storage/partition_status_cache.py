@@ -1,5 +1,16 @@
 from enum import Enum
-from typing import TYPE_CHECKING, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from dagster import (
     AssetKey,
@@ -14,6 +25,7 @@
     MultiPartitionsDefinition,
 )
 from dagster._core.definitions.partition import (
+    DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
     PartitionsDefinition,
     PartitionsSubset,
@@ -153,28 +165,40 @@ def _blocking_batch_load(
         return context.instance.event_log_storage.get_asset_status_cache_values(keys, context)
 
     def deserialize_materialized_partition_subsets(
-        self, partitions_def: PartitionsDefinition
+        self,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> PartitionsSubset:
         if not self.serialized_materialized_partition_subset:
             return partitions_def.empty_subset()
 
-        return partitions_def.deserialize_subset(self.serialized_materialized_partition_subset)
+        return deserialize_cached_partitions_subset(
+            partitions_def, self.serialized_materialized_partition_subset, dynamic_partitions_store
+        )
 
     def deserialize_failed_partition_subsets(
-        self, partitions_def: PartitionsDefinition
+        self,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> PartitionsSubset:
         if not self.serialized_failed_partition_subset:
             return partitions_def.empty_subset()
 
-        return partitions_def.deserialize_subset(self.serialized_failed_partition_subset)
+        return deserialize_cached_partitions_subset(
+            partitions_def, self.serialized_failed_partition_subset, dynamic_partitions_store
+        )
 
     def deserialize_in_progress_partition_subsets(
-        self, partitions_def: PartitionsDefinition
+        self,
+        partitions_def: PartitionsDefinition,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> PartitionsSubset:
         if not self.serialized_in_progress_partition_subset:
             return partitions_def.empty_subset()
 
-        return partitions_def.deserialize_subset(self.serialized_in_progress_partition_subset)
+        return deserialize_cached_partitions_subset(
+            partitions_def, self.serialized_in_progress_partition_subset, dynamic_partitions_store
+        )
 
     def get_materialized_subset(
         self,
@@ -182,7 +206,9 @@ def get_materialized_subset(
         asset_key: AssetKey,
         partitions_def: PartitionsDefinition,
     ) -> EntitySubset[AssetKey]:
-        value = self.deserialize_materialized_partition_subsets(partitions_def)
+        value = self.deserialize_materialized_partition_subsets(
+            partitions_def, asset_graph_view.get_inner_queryer_for_back_compat()
+        )
         return EntitySubset(
             asset_graph_view, key=asset_key, value=_ValidatedEntitySubsetValue(value)
         )
@@ -193,7 +219,9 @@ def get_failed_subset(
         asset_key: AssetKey,
         partitions_def: PartitionsDefinition,
     ) -> EntitySubset[AssetKey]:
-        value = self.deserialize_failed_partition_subsets(partitions_def)
+        value = self.deserialize_failed_partition_subsets(
+            partitions_def, asset_graph_view.get_inner_queryer_for_back_compat()
+        )
         return EntitySubset(
             asset_graph_view, key=asset_key, value=_ValidatedEntitySubsetValue(value)
         )
@@ -204,12 +232,46 @@ def get_in_progress_subset(
         asset_key: AssetKey,
         partitions_def: PartitionsDefinition,
     ) -> EntitySubset[AssetKey]:
-        value = self.deserialize_in_progress_partition_subsets(partitions_def)
+        value = self.deserialize_in_progress_partition_subsets(
+            partitions_def, asset_graph_view.get_inner_queryer_for_back_compat()
+        )
         return EntitySubset(
             asset_graph_view, key=asset_key, value=_ValidatedEntitySubsetValue(value)
         )
 
 
+def serialize_cached_partitions_subset(
+    subset: PartitionsSubset,
+    partitions_def: PartitionsDefinition,
+    dynamic_partitions_store: DynamicPartitionsStore,
+) -> str:
+    """Serializes a partitions subset for the asset status cache. Subsets of dynamic partitions
+    definitions are stored as bitmaps over the current partition keys, which requires a dynamic
+    partitions store to deserialize.
+    """
+    if isinstance(partitions_def, DynamicPartitionsDefinition) and isinstance(
+        subset, DefaultPartitionsSubset
+    ):
+        return subset.serialize_bitmap(
+            partitions_def.get_partition_key_index(dynamic_partitions_store)
+        )
+    return subset.serialize()
+
+
+def deserialize_cached_partitions_subset(
+    partitions_def: PartitionsDefinition,
+    serialized: str,
+    dynamic_partitions_store: Optional[DynamicPartitionsStore],
+) -> PartitionsSubset:
+    if isinstance(
+        partitions_def, DynamicPartitionsDefinition
+    ) and DefaultPartitionsSubset.is_serialized_bitmap(serialized):
+        return DefaultPartitionsSubset.from_serialized_bitmap(
+            partitions_def.get_partition_key_index(dynamic_partitions_store), serialized
+        )
+    return partitions_def.deserialize_subset(serialized)
+
+
 def get_materialized_multipartitions(
     instance: DagsterInstance, asset_key: AssetKey, partitions_def: MultiPartitionsDefinition
 ) -> Sequence[str]:
@@ -282,16 +344,35 @@ def get_last_planned_storage_id(
     return info.storage_id
 
 
-def _build_status_cache(
+class _StatusCacheRefresh(NamedTuple):
+    """The events to fetch to bring the status cache value of a partitioned asset up to date, and
+    the stored cache value to apply them to, if it is still valid for the partitions definition.
+    Cursors of None fetch all of the asset's events.
+    """
+
+    partitions_def: PartitionsDefinition
+    partitions_def_id: str
+    stored_cache_value: Optional[AssetStatusCacheValue]
+    latest_storage_id: int
+    fetch_materialized_partitions: bool
+    materialized_partitions_cursor: Optional[int]
+    fetch_materialization_attempts: bool
+    materialization_attempts_cursor: Optional[int]
+
+
+def _get_status_cache_refresh(
     instance: DagsterInstance,
     asset_key: AssetKey,
     partitions_def: Optional[PartitionsDefinition],
     dynamic_partitions_store: DynamicPartitionsStore,
     stored_cache_value: Optional[AssetStatusCacheValue],
     asset_record: Optional["AssetRecord"],
-) -> Optional[AssetStatusCacheValue]:
-    """This method refreshes the asset status cache for a given asset key. It recalculates
-    the materialized partition subset for the asset key and updates the cache value.
+) -> Tuple[Optional[AssetStatusCacheValue], Optional[_StatusCacheRefresh]]:
+    """Returns the up to date status cache value for the asset if it can be determined without
+    fetching any events, and otherwise the events to fetch to refresh it.
+
+    A stored cache value that is still valid for the partitions definition is only updated with the
+    events after its storage id.
     """
     last_materialization_storage_id = (
         asset_record.asset_entry.last_materialization_storage_id if asset_record else None
@@ -306,16 +387,27 @@ def _build_status_cache(
         last_planned_materialization_storage_id or 0,
     )
     if not latest_storage_id:
-        return None
+        return None, None
 
     if not partitions_def or not is_cacheable_partition_type(partitions_def):
-        return AssetStatusCacheValue(latest_storage_id=latest_storage_id)
+        return AssetStatusCacheValue(latest_storage_id=latest_storage_id), None
 
-    failed_subset = (
-        partitions_def.deserialize_subset(stored_cache_value.serialized_failed_partition_subset)
-        if stored_cache_value and stored_cache_value.serialized_failed_partition_subset
-        else None
+    partitions_def_id = partitions_def.get_serializable_unique_identifier(
+        dynamic_partitions_store=dynamic_partitions_store
     )
+    if stored_cache_value and not _can_update_stored_cache_value(
+        stored_cache_value, partitions_def, partitions_def_id, dynamic_partitions_store
+    ):
+        stored_cache_value = None
+
+    if (
+        stored_cache_value
+        and latest_storage_id <= stored_cache_value.latest_storage_id
+        and not stored_cache_value.earliest_in_progress_materialization_event_id
+    ):
+        # no events have been stored for the asset since the cache value was built and none of its
+        # runs were in progress then, so none of its subsets can have changed
+        return stored_cache_value._replace(partitions_def_id=partitions_def_id), None
 
     cached_in_progress_cursor = (
         (
@@ -327,128 +419,191 @@ def _build_status_cache(
         else None
     )
 
-    if stored_cache_value:
-        # fetch the incremental new materialized partitions, and update the cached materialized
-        # subset
-        new_partitions = set()
-        if (
-            last_materialization_storage_id
-            and last_materialization_storage_id > stored_cache_value.latest_storage_id
-        ):
-            new_partitions = get_validated_partition_keys(
-                dynamic_partitions_store,
-                partitions_def,
-                instance.get_materialized_partitions(
-                    asset_key, after_cursor=stored_cache_value.latest_storage_id
-                ),
+    return None, _StatusCacheRefresh(
+        partitions_def=partitions_def,
+        partitions_def_id=partitions_def_id,
+        stored_cache_value=stored_cache_value,
+        latest_storage_id=latest_storage_id,
+        # fetch the incremental new materialized partitions if there is a stored cache value, and
+        # all materialized partitions otherwise
+        fetch_materialized_partitions=(
+            stored_cache_value is None
+            or bool(
+                last_materialization_storage_id
+                and last_materialization_storage_id > stored_cache_value.latest_storage_id
             )
-
-        materialized_subset: PartitionsSubset = (
-            partitions_def.deserialize_subset(
-                stored_cache_value.serialized_materialized_partition_subset
+        ),
+        materialized_partitions_cursor=(
+            stored_cache_value.latest_storage_id if stored_cache_value else None
+        ),
+        # fetch incomplete materializations if there have been any planned materializations since
+        # the cursor
+        fetch_materialization_attempts=bool(
+            last_planned_materialization_storage_id
+            and (
+                not cached_in_progress_cursor
+                or last_planned_materialization_storage_id > cached_in_progress_cursor
             )
-            if stored_cache_value.serialized_materialized_partition_subset
-            else partitions_def.empty_subset()
-        )
+        ),
+        materialization_attempts_cursor=cached_in_progress_cursor,
+    )
 
-        if new_partitions:
-            materialized_subset = materialized_subset.with_partition_keys(new_partitions)
 
-        if failed_subset and new_partitions:
-            failed_subset = failed_subset - partitions_def.empty_subset().with_partition_keys(
-                new_partitions
-            )
+def _build_status_cache(
+    refresh: _StatusCacheRefresh,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    materialized_partitions: Set[str],
+    incomplete_materializations: Mapping[str, Tuple[str, int]],
+    run_statuses: Mapping[str, DagsterRunStatus],
+) -> AssetStatusCacheValue:
+    """This method refreshes the asset status cache for a given asset key. It applies the fetched
+    events to the stored cache value, or builds a new cache value from them if there is none.
+
+    The serialized subsets of the stored cache value that the events do not change are carried
+    over without being deserialized.
+    """
+    partitions_def = refresh.partitions_def
+    stored_cache_value = refresh.stored_cache_value
 
+    new_partitions = (
+        get_validated_partition_keys(
+            dynamic_partitions_store, partitions_def, materialized_partitions
+        )
+        if materialized_partitions
+        else set()
+    )
+    if stored_cache_value and not new_partitions:
+        serialized_materialized_subset = stored_cache_value.serialized_materialized_partition_subset
     else:
-        materialized_subset = partitions_def.empty_subset().with_partition_keys(
-            get_validated_partition_keys(
-                dynamic_partitions_store,
-                partitions_def,
-                instance.get_materialized_partitions(asset_key),
-            )
+        materialized_subset = _deserialize_stored_partitions_subset(
+            partitions_def,
+            stored_cache_value.serialized_materialized_partition_subset
+            if stored_cache_value
+            else None,
+            dynamic_partitions_store,
+        ).with_partition_keys(new_partitions)
+        serialized_materialized_subset = serialize_cached_partitions_subset(
+            materialized_subset, partitions_def, dynamic_partitions_store
         )
 
     (
-        failed_subset,
+        new_failed_subset,
         in_progress_subset,
         earliest_in_progress_materialization_event_id,
-    ) = build_failed_and_in_progress_partition_subset(
-        instance,
-        asset_key,
+    ) = _get_failed_and_in_progress_partition_subsets(
         partitions_def,
         dynamic_partitions_store,
-        last_planned_materialization_storage_id=last_planned_materialization_storage_id,
-        failed_subset=failed_subset,
-        after_storage_id=cached_in_progress_cursor,
+        incomplete_materializations,
+        run_statuses,
+        failed_subset=partitions_def.empty_subset(),
     )
 
+    stored_serialized_failed_subset = (
+        stored_cache_value.serialized_failed_partition_subset if stored_cache_value else None
+    )
+    if stored_serialized_failed_subset and not new_partitions and new_failed_subset.is_empty:
+        serialized_failed_subset = stored_serialized_failed_subset
+    else:
+        failed_subset = _deserialize_stored_partitions_subset(
+            partitions_def, stored_serialized_failed_subset, dynamic_partitions_store
+        )
+        if new_partitions:
+            failed_subset = failed_subset - partitions_def.empty_subset().with_partition_keys(
+                new_partitions
+            )
+        serialized_failed_subset = serialize_cached_partitions_subset(
+            failed_subset | new_failed_subset, partitions_def, dynamic_partitions_store
+        )
+
     return AssetStatusCacheValue(
-        latest_storage_id=latest_storage_id,
-        partitions_def_id=partitions_def.get_serializable_unique_identifier(
-            dynamic_partitions_store=dynamic_partitions_store
+        latest_storage_id=refresh.latest_storage_id,
+        partitions_def_id=refresh.partitions_def_id,
+        serialized_materialized_partition_subset=serialized_materialized_subset,
+        serialized_failed_partition_subset=serialized_failed_subset,
+        serialized_in_progress_partition_subset=serialize_cached_partitions_subset(
+            in_progress_subset, partitions_def, dynamic_partitions_store
         ),
-        serialized_materialized_partition_subset=materialized_subset.serialize(),
-        serialized_failed_partition_subset=failed_subset.serialize(),
-        serialized_in_progress_partition_subset=in_progress_subset.serialize(),
         earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
     )
 
 
-def build_failed_and_in_progress_partition_subset(
-    instance: DagsterInstance,
-    asset_key: AssetKey,
+def _deserialize_stored_partitions_subset(
     partitions_def: PartitionsDefinition,
+    serialized: Optional[str],
     dynamic_partitions_store: DynamicPartitionsStore,
-    last_planned_materialization_storage_id: int,
-    failed_subset: Optional[PartitionsSubset[str]] = None,
-    after_storage_id: Optional[int] = None,
-) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
-    in_progress_partitions: Set[str] = set()
+) -> PartitionsSubset:
+    if not serialized:
+        return partitions_def.empty_subset()
+    return deserialize_cached_partitions_subset(
+        partitions_def, serialized, dynamic_partitions_store
+    )
 
-    incomplete_materializations = {}
 
-    failed_subset = failed_subset or partitions_def.empty_subset()
+def _can_update_stored_cache_value(
+    stored_cache_value: AssetStatusCacheValue,
+    partitions_def: PartitionsDefinition,
+    partitions_def_id: str,
+    dynamic_partitions_store: DynamicPartitionsStore,
+) -> bool:
+    if stored_cache_value.partitions_def_id == partitions_def_id:
+        return True
+
+    # Adding partitions to a dynamic partitions definition changes its unique identifier, but
+    # subsets stored as bitmaps over the keys it had before still decode to the same keys, so the
+    # stored value only needs to be updated with the events since it was built.
+    if not isinstance(partitions_def, DynamicPartitionsDefinition):
+        return False
+    key_index = partitions_def.get_partition_key_index(dynamic_partitions_store)
+    return all(
+        DefaultPartitionsSubset.can_deserialize_bitmap(key_index, serialized)
+        for serialized in [
+            stored_cache_value.serialized_materialized_partition_subset,
+            stored_cache_value.serialized_failed_partition_subset,
+            stored_cache_value.serialized_in_progress_partition_subset,
+        ]
+        if serialized
+    )
 
-    # Fetch incomplete materializations if there have been any planned materializations since the
-    # cursor
-    if last_planned_materialization_storage_id and (
-        not after_storage_id or last_planned_materialization_storage_id > after_storage_id
-    ):
-        incomplete_materializations = instance.event_log_storage.get_latest_asset_partition_materialization_attempts_without_materializations(
-            asset_key, after_storage_id=after_storage_id
-        )
 
+def _get_run_statuses(
+    instance: DagsterInstance, run_ids: Iterable[str]
+) -> Mapping[str, DagsterRunStatus]:
+    """Fetches the statuses of the given runs in batches. Deleted runs are omitted."""
+    to_fetch = list(set(run_ids))
+    run_statuses = {}
+    while to_fetch:
+        chunk = to_fetch[:RUN_FETCH_BATCH_SIZE]
+        to_fetch = to_fetch[RUN_FETCH_BATCH_SIZE:]
+        for r in instance.get_runs(filters=RunsFilter(run_ids=chunk)):
+            run_statuses[r.run_id] = r.status
+    return run_statuses
+
+
+def _get_failed_and_in_progress_partition_subsets(
+    partitions_def: PartitionsDefinition,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    incomplete_materializations: Mapping[str, Tuple[str, int]],
+    run_statuses: Mapping[str, DagsterRunStatus],
+    failed_subset: PartitionsSubset,
+) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
+    in_progress_partitions: Set[str] = set()
     failed_partitions: Set[str] = set()
 
     cursor = None
-    if incomplete_materializations:
-        to_fetch = list(set([run_id for run_id, _event_id in incomplete_materializations.values()]))
-        finished_runs = {}
-        unfinished_runs = {}
-
-        while to_fetch:
-            chunk = to_fetch[:RUN_FETCH_BATCH_SIZE]
-            to_fetch = to_fetch[RUN_FETCH_BATCH_SIZE:]
-            for r in instance.get_runs(filters=RunsFilter(run_ids=chunk)):
-                if r.status in FINISHED_STATUSES:
-                    finished_runs[r.run_id] = r.status
-                else:
-                    unfinished_runs[r.run_id] = r.status
-
-        for partition, (run_id, event_id) in incomplete_materializations.items():
-            if run_id in finished_runs:
-                status = finished_runs.get(run_id)
-                if status == DagsterRunStatus.FAILURE:
-                    failed_partitions.add(partition)
-            elif run_id in unfinished_runs:
-                in_progress_partitions.add(partition)
-                # If the run is not finished, keep track of the event id so we can check on it next time
-                if cursor is None or event_id < cursor:
-                    cursor = event_id
-            else:
-                # Runs that are neither finished nor unfinished must have been deleted, so are
-                # considered neither in-progress nor failed
-                pass
+    for partition, (run_id, event_id) in incomplete_materializations.items():
+        status = run_statuses.get(run_id)
+        if status is None:
+            # Runs that are neither finished nor unfinished must have been deleted, so are
+            # considered neither in-progress nor failed
+            continue
+        if status in FINISHED_STATUSES:
+            if status == DagsterRunStatus.FAILURE:
+                failed_partitions.add(partition)
+        else:
+            in_progress_partitions.add(partition)
+            # If the run is not finished, keep track of the event id so we can check on it next time
+            if cursor is None or event_id < cursor:
+                cursor = event_id
 
     if failed_partitions:
         failed_subset = failed_subset.with_partition_keys(
@@ -461,7 +616,9 @@ def build_failed_and_in_progress_partition_subset(
         failed_subset,
         (
             partitions_def.empty_subset().with_partition_keys(
-                get_validated_partition_keys(instance, partitions_def, in_progress_partitions)
+                get_validated_partition_keys(
+                    dynamic_partitions_store, partitions_def, in_progress_partitions
+                )
             )
             if in_progress_partitions
             else partitions_def.empty_subset()
@@ -470,47 +627,161 @@ def build_failed_and_in_progress_partition_subset(
     )
 
 
-def get_and_update_asset_status_cache_value(
+def build_failed_and_in_progress_partition_subset(
     instance: DagsterInstance,
     asset_key: AssetKey,
-    partitions_def: Optional[PartitionsDefinition],
+    partitions_def: PartitionsDefinition,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    last_planned_materialization_storage_id: int,
+    failed_subset: Optional[PartitionsSubset[str]] = None,
+    after_storage_id: Optional[int] = None,
+) -> Tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
+    incomplete_materializations = {}
+
+    # Fetch incomplete materializations if there have been any planned materializations since the
+    # cursor
+    if last_planned_materialization_storage_id and (
+        not after_storage_id or last_planned_materialization_storage_id > after_storage_id
+    ):
+        incomplete_materializations = instance.event_log_storage.get_latest_asset_partition_materialization_attempts_without_materializations(
+            asset_key, after_storage_id=after_storage_id
+        )
+
+    return _get_failed_and_in_progress_partition_subsets(
+        partitions_def,
+        dynamic_partitions_store,
+        incomplete_materializations,
+        _get_run_statuses(
+            instance, [run_id for run_id, _event_id in incomplete_materializations.values()]
+        ),
+        failed_subset=failed_subset or partitions_def.empty_subset(),
+    )
+
+
+def _get_materialized_partitions_by_asset_key(
+    instance: DagsterInstance, after_cursors_by_asset_key: Mapping[AssetKey, Optional[int]]
+) -> Mapping[AssetKey, Set[str]]:
+    # a single asset is fetched with the per-asset query, which every storage implements natively
+    if len(after_cursors_by_asset_key) == 1:
+        ((asset_key, after_cursor),) = after_cursors_by_asset_key.items()
+        return {
+            asset_key: instance.get_materialized_partitions(asset_key, after_cursor=after_cursor)
+        }
+    return instance.get_materialized_partitions_by_asset_key(after_cursors_by_asset_key)
+
+
+def get_and_update_asset_status_cache_values(
+    instance: DagsterInstance,
+    partitions_defs_by_key: Mapping[AssetKey, Optional[PartitionsDefinition]],
     dynamic_partitions_loader: Optional[DynamicPartitionsStore] = None,
     loading_context: Optional[LoadingContext] = None,
-) -> Optional[AssetStatusCacheValue]:
+) -> Mapping[AssetKey, Optional[AssetStatusCacheValue]]:
+    """Brings the status cache values of many assets up to date at once.
+
+    The new materializations and materialization attempts of all the assets since their cursors
+    are fetched in one query each, the statuses of the runs of those attempts in batches, and the
+    changed cache values are written back in one transaction.
+    """
     from dagster._core.storage.event_log.base import AssetRecord
 
+    asset_keys = list(partitions_defs_by_key.keys())
     if loading_context:
-        asset_record = AssetRecord.blocking_get(loading_context, asset_key)
-    else:
-        asset_record = next(iter(instance.get_asset_records(asset_keys=[asset_key])), None)
-
-    if asset_record is None:
-        stored_cache_value = None
+        asset_records = AssetRecord.blocking_get_many(loading_context, asset_keys)
     else:
-        stored_cache_value = asset_record.asset_entry.cached_status
+        asset_records = instance.get_asset_records(asset_keys=asset_keys)
+    asset_records_by_key = {
+        asset_record.asset_entry.asset_key: asset_record for asset_record in asset_records
+    }
 
     dynamic_partitions_store = dynamic_partitions_loader if dynamic_partitions_loader else instance
-    use_cached_value = (
-        stored_cache_value
-        and partitions_def
-        and stored_cache_value.partitions_def_id
-        == partitions_def.get_serializable_unique_identifier(
-            dynamic_partitions_store=dynamic_partitions_store
+
+    stored_cache_values: Dict[AssetKey, Optional[AssetStatusCacheValue]] = {}
+    updated_cache_values: Dict[AssetKey, Optional[AssetStatusCacheValue]] = {}
+    refreshes: Dict[AssetKey, _StatusCacheRefresh] = {}
+    for asset_key, partitions_def in partitions_defs_by_key.items():
+        asset_record = asset_records_by_key.get(asset_key)
+        stored_cache_values[asset_key] = (
+            asset_record.asset_entry.cached_status if asset_record else None
+        )
+        updated_cache_values[asset_key], refresh = _get_status_cache_refresh(
+            instance,
+            asset_key,
+            partitions_def,
+            dynamic_partitions_store,
+            stored_cache_values[asset_key],
+            asset_record,
         )
+        if refresh:
+            refreshes[asset_key] = refresh
+
+    materialized_partitions_by_key = (
+        _get_materialized_partitions_by_asset_key(
+            instance,
+            {
+                asset_key: refresh.materialized_partitions_cursor
+                for asset_key, refresh in refreshes.items()
+                if refresh.fetch_materialized_partitions
+            },
+        )
+        if any(refresh.fetch_materialized_partitions for refresh in refreshes.values())
+        else {}
     )
-    updated_cache_value = _build_status_cache(
-        instance=instance,
-        asset_key=asset_key,
-        partitions_def=partitions_def,
-        dynamic_partitions_store=dynamic_partitions_store,
-        stored_cache_value=stored_cache_value if use_cached_value else None,
-        asset_record=asset_record,
+    incomplete_materializations_by_key = (
+        instance.event_log_storage.get_latest_asset_partition_materialization_attempts_without_materializations_by_asset_key(
+            {
+                asset_key: refresh.materialization_attempts_cursor
+                for asset_key, refresh in refreshes.items()
+                if refresh.fetch_materialization_attempts
+            }
+        )
+        if any(refresh.fetch_materialization_attempts for refresh in refreshes.values())
+        else {}
     )
-    if (
-        updated_cache_value is not None
-        and instance.event_log_storage.can_write_asset_status_cache()
-        and updated_cache_value != stored_cache_value
-    ):
-        instance.update_asset_cached_status_data(asset_key, updated_cache_value)
+    run_statuses = _get_run_statuses(
+        instance,
+        [
+            run_id
+            for incomplete_materializations in incomplete_materializations_by_key.values()
+            for run_id, _event_id in incomplete_materializations.values()
+        ],
+    )
+
+    for asset_key, refresh in refreshes.items():
+        updated_cache_values[asset_key] = _build_status_cache(
+            refresh,
+            dynamic_partitions_store,
+            materialized_partitions=materialized_partitions_by_key.get(asset_key, set()),
+            incomplete_materializations=incomplete_materializations_by_key.get(asset_key, {}),
+            run_statuses=run_statuses,
+        )
+
+    # unchanged serialized subsets are carried over from the stored values, so this comparison is
+    # cheap, and a value is only rewritten when one of its subsets or its cursor has moved
+    changed_cache_values = {
+        asset_key: updated_cache_value
+        for asset_key, updated_cache_value in updated_cache_values.items()
+        if updated_cache_value is not None and updated_cache_value != stored_cache_values[asset_key]
+    }
+    if changed_cache_values and instance.event_log_storage.can_write_asset_status_cache():
+        if len(changed_cache_values) == 1:
+            ((asset_key, updated_cache_value),) = changed_cache_values.items()
+            instance.update_asset_cached_status_data(asset_key, updated_cache_value)
+        else:
+            instance.update_asset_cached_status_data_by_asset_key(changed_cache_values)
 
-    return updated_cache_value
+    return updated_cache_values
+
+
+def get_and_update_asset_status_cache_value(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    partitions_def: Optional[PartitionsDefinition],
+    dynamic_partitions_loader: Optional[DynamicPartitionsStore] = None,
+    loading_context: Optional[LoadingContext] = None,
+) -> Optional[AssetStatusCacheValue]:
+    return get_and_update_asset_status_cache_values(
+        instance,
+        {asset_key: partitions_def},
+        dynamic_partitions_loader=dynamic_partitions_loader,
+        loading_context=loading_context,
+    )[asset_key]
@@ -310,6 +310,24 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
             ExecutionPlanSnapshot
         """
 
+    def get_execution_plan_snapshots(
+        self, execution_plan_snapshot_ids: Sequence[str]
+    ) -> Mapping[str, ExecutionPlanSnapshot]:
+        """Fetch several snapshots by ID. Snapshots which do not exist are omitted.
+
+        Args:
+            execution_plan_snapshot_ids (Sequence[str])
+
+        Returns:
+            Mapping[str, ExecutionPlanSnapshot]
+        """
+        snapshots_by_id = {}
+        for snapshot_id in execution_plan_snapshot_ids:
+            snapshot = self.get_execution_plan_snapshot(snapshot_id)
+            if snapshot is not None:
+                snapshots_by_id[snapshot_id] = snapshot
+        return snapshots_by_id
+
     @abstractmethod
     def wipe(self) -> None:
         """Clears the run storage."""
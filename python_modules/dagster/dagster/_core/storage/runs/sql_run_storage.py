@@ -615,6 +615,27 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return self._get_snapshot(execution_plan_snapshot_id)  # type: ignore  # (allowed to return None?)
 
+    def get_execution_plan_snapshots(
+        self, execution_plan_snapshot_ids: Sequence[str]
+    ) -> Mapping[str, ExecutionPlanSnapshot]:
+        check.sequence_param(
+            execution_plan_snapshot_ids, "execution_plan_snapshot_ids", of_type=str
+        )
+        if not execution_plan_snapshot_ids:
+            return {}
+
+        query = db_select([SnapshotsTable.c.snapshot_id, SnapshotsTable.c.snapshot_body]).where(
+            SnapshotsTable.c.snapshot_id.in_(execution_plan_snapshot_ids)
+        )
+        snapshots_by_id = {}
+        for row in self.fetchall(query):
+            snapshot = defensively_unpack_execution_plan_snapshot_query(
+                logging, [row["snapshot_body"]]
+            )
+            if snapshot is not None:
+                snapshots_by_id[row["snapshot_id"]] = snapshot
+        return snapshots_by_id  # type: ignore  # (snapshot table also stores job snapshots)
+
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
         check.str_param(snapshot_id, "snapshot_id")
         check.not_none_param(snapshot_obj, "snapshot_obj")
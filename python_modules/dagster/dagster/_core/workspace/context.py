@@ -316,12 +316,16 @@ def get_partition_names(
         job_name: str,
         instance: DagsterInstance,
         selected_asset_keys: Optional[AbstractSet[AssetKey]],
+        start_index: int = 0,
+        end_index: Optional[int] = None,
     ) -> Union["PartitionNamesSnap", "PartitionExecutionErrorSnap"]:
         return self.get_code_location(repository_handle.location_name).get_partition_names(
             repository_handle=repository_handle,
             job_name=job_name,
             instance=instance,
             selected_asset_keys=selected_asset_keys,
+            start_index=start_index,
+            end_index=end_index,
         )
 
     def get_partition_set_execution_param_data(
@@ -27,6 +27,7 @@
 )
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph
 from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionEvaluationProfile,
     AutomationConditionEvaluationWithRunIds,
 )
 from dagster._core.definitions.events import AssetKey
@@ -263,6 +264,11 @@ def set_run_requests(
         self._tick = self._tick.with_run_requests(run_requests, reserved_run_ids=reserved_run_ids)
         return self._tick
 
+    def set_automation_condition_profile(
+        self, automation_condition_profile: AutomationConditionEvaluationProfile
+    ):
+        self._tick = self._tick.with_automation_condition_profile(automation_condition_profile)
+
     def update_state(self, status: TickStatus, **kwargs: object):
         self._tick = self._tick.with_status(status=status, **kwargs)
 
@@ -926,7 +932,7 @@ def _evaluate_auto_materialize_tick(
                 *{key for key in auto_materialize_entity_keys if isinstance(key, AssetCheckKey)}
             )
 
-            run_requests, new_cursor, evaluations = AutomationTickEvaluationContext(
+            evaluation_context = AutomationTickEvaluationContext(
                 evaluation_id=evaluation_id,
                 asset_graph=asset_graph,
                 asset_selection=asset_selection,
@@ -948,7 +954,9 @@ def _evaluate_auto_materialize_tick(
                 ),
                 auto_observe_asset_keys=auto_observe_asset_keys,
                 logger=self._logger,
-            ).evaluate()
+            )
+            run_requests, new_cursor, evaluations = evaluation_context.evaluate()
+            tick_context.set_automation_condition_profile(evaluation_context.profile)
 
             check.invariant(new_cursor.evaluation_id == evaluation_id)
 
@@ -883,8 +883,11 @@ def _handle_dynamic_partitions_requests(
     for request in dynamic_partitions_requests:
         existent_partitions = []
         nonexistent_partitions = []
+        has_partition_by_key = instance.has_dynamic_partitions(
+            request.partitions_def_name, request.partition_keys
+        )
         for partition_key in request.partition_keys:
-            if instance.has_dynamic_partition(request.partitions_def_name, partition_key):
+            if has_partition_by_key[partition_key]:
                 existent_partitions.append(partition_key)
             else:
                 nonexistent_partitions.append(partition_key)
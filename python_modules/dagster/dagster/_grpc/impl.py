@@ -446,7 +446,10 @@ def get_partition_config(
 
 
 def get_partition_names(
-    repo_def: RepositoryDefinition, job_name: str
+    repo_def: RepositoryDefinition,
+    job_name: str,
+    start_index: int = 0,
+    end_index: Optional[int] = None,
 ) -> Union[PartitionNamesSnap, PartitionExecutionErrorSnap]:
     try:
         job_def = repo_def.get_job(job_name)
@@ -459,7 +462,12 @@ def get_partition_names(
             ),
         ):
             return PartitionNamesSnap(
-                partition_names=job_def.get_partition_keys(selected_asset_keys=None)
+                partition_names=list(
+                    job_def.iter_partition_keys(
+                        selected_asset_keys=None, start_index=start_index, end_index=end_index
+                    )
+                ),
+                start_index=start_index,
             )
     except Exception:
         return PartitionExecutionErrorSnap(
@@ -162,6 +162,13 @@ def _maybe_log_exception(logger: logging.Logger, call_name: str):
     logger.exception(f"Exception during {call_name} code server call")
 
 
+def _get_repository_serdes_codec() -> Optional[str]:
+    # Opt-in serdes codec (e.g. "zlib") for serialized repository snapshots, which can be very large
+    # for repositories with many assets. Clients read encoded snapshots transparently, but must be
+    # on a dagster version that supports serdes codecs.
+    return os.getenv("DAGSTER_CODE_SERVER_SERDES_CODEC") or None
+
+
 def _record_utilization_metrics(logger: logging.Logger) -> None:
     with _METRICS_LOCK:
         last_cpu_measurement_time = _UTILIZATION_METRICS["container_utilization"][
@@ -637,6 +644,8 @@ def ExternalPartitionNames(
                 get_partition_names(
                     self._get_repo_for_origin(partition_names_args.repository_origin),
                     job_name=partition_names_args.get_job_name(),
+                    start_index=partition_names_args.start_index,
+                    end_index=partition_names_args.end_index,
                 )
             )
         except Exception:
@@ -792,7 +801,8 @@ def _get_serialized_external_repository_data(
                 RepositorySnap.from_def(
                     self._get_repo_for_origin(repository_origin),
                     defer_snapshots=request.defer_snapshots,
-                )
+                ),
+                codec=_get_repository_serdes_codec(),
             )
         except Exception:
             _maybe_log_exception(self._logger, "Repository")
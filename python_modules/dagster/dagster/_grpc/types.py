@@ -457,6 +457,11 @@ class PartitionNamesArgs(
             # (and do) safely ignore this parameter, because, in those versions, the job name on its
             # own is enough to specify which PartitionsDefinition to use.
             ("job_name", Optional[str]),
+            # The range of partition names to return. Prior user code versions ignore these
+            # parameters and return all the partition names, without setting the start_index of
+            # the PartitionNamesSnap.
+            ("start_index", int),
+            ("end_index", Optional[int]),
         ],
     )
 ):
@@ -465,6 +470,8 @@ def __new__(
         repository_origin: RemoteRepositoryOrigin,
         partition_set_name: str,
         job_name: Optional[str] = None,
+        start_index: int = 0,
+        end_index: Optional[int] = None,
     ):
         return super(PartitionNamesArgs, cls).__new__(
             cls,
@@ -473,6 +480,8 @@ def __new__(
             ),
             job_name=check.opt_str_param(job_name, "job_name"),
             partition_set_name=check.str_param(partition_set_name, "partition_set_name"),
+            start_index=check.int_param(start_index, "start_index"),
+            end_index=check.opt_int_param(end_index, "end_index"),
         )
 
     def get_job_name(self) -> str:
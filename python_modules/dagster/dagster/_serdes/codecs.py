@@ -0,0 +1,109 @@
+"""Text-safe encodings of serialized values.
+
+`serialize_value` produces JSON. A codec transforms that JSON into a more compact representation
+for values that are stored or transmitted in bulk (e.g. event log rows). Every encoded value starts
+with the magic prefix of its codec, which can never be the start of a JSON document, so
+`deserialize_value` reads plain JSON and values written with any registered codec transparently.
+
+Encoded values are plain ascii strings, so they can be written to the same text columns and
+protobuf string fields as JSON.
+"""
+
+import base64
+import zlib
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+import dagster._check as check
+from dagster._serdes.errors import SerdesUsageError
+
+# the first character of a JSON document is either whitespace or the start of a JSON value
+_JSON_START_CHARS = frozenset(' \t\r\n{["-0123456789tfn')
+
+
+class SerdesCodec(ABC):
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """The name used to select this codec, e.g. `serialize_value(val, codec="zlib")`."""
+
+    @property
+    @abstractmethod
+    def prefix(self) -> str:
+        """The magic prefix that identifies values encoded with this codec."""
+
+    @abstractmethod
+    def encode(self, json_str: str) -> str:
+        """Encode a serialized JSON string. The returned value does not include the prefix."""
+
+    @abstractmethod
+    def decode(self, encoded: str) -> str:
+        """Decode a value produced by `encode` back into the serialized JSON string."""
+
+
+class ZlibSerdesCodec(SerdesCodec):
+    """Deflate-compressed, base64-encoded JSON. Serialized dagster objects repeat the same class and
+    field names many times over, so they typically compress to a fraction of their size.
+    """
+
+    @property
+    def name(self) -> str:
+        return "zlib"
+
+    @property
+    def prefix(self) -> str:
+        return "zlib:"
+
+    def encode(self, json_str: str) -> str:
+        return base64.b64encode(zlib.compress(json_str.encode("utf-8"))).decode("ascii")
+
+    def decode(self, encoded: str) -> str:
+        return zlib.decompress(base64.b64decode(encoded)).decode("utf-8")
+
+
+_CODECS_BY_NAME: Dict[str, SerdesCodec] = {}
+
+
+def register_serdes_codec(codec: SerdesCodec) -> None:
+    check.inst_param(codec, "codec", SerdesCodec)
+    if not codec.prefix or codec.prefix[0] in _JSON_START_CHARS:
+        raise SerdesUsageError(
+            f"Serdes codec prefix `{codec.prefix}` must not be empty or start with a character"
+            " that can begin a JSON document."
+        )
+    for registered in _CODECS_BY_NAME.values():
+        if (
+            registered.name == codec.name
+            or registered.prefix.startswith(codec.prefix)
+            or codec.prefix.startswith(registered.prefix)
+        ):
+            raise SerdesUsageError(
+                f"Serdes codec `{codec.name}` conflicts with registered codec `{registered.name}`."
+            )
+    _CODECS_BY_NAME[codec.name] = codec
+
+
+def get_serdes_codec(name: str) -> SerdesCodec:
+    if name not in _CODECS_BY_NAME:
+        raise SerdesUsageError(
+            f"Unknown serdes codec `{name}`. Registered codecs: {sorted(_CODECS_BY_NAME)}."
+        )
+    return _CODECS_BY_NAME[name]
+
+
+def encode_serialized_value(json_str: str, codec_name: Optional[str]) -> str:
+    if codec_name is None:
+        return json_str
+    codec = get_serdes_codec(codec_name)
+    return codec.prefix + codec.encode(json_str)
+
+
+def decode_serialized_value(val: str) -> str:
+    """Return the JSON string for a value produced by `serialize_value`, with or without a codec."""
+    for codec in _CODECS_BY_NAME.values():
+        if val.startswith(codec.prefix):
+            return codec.decode(val[len(codec.prefix) :])
+    return val
+
+
+register_serdes_codec(ZlibSerdesCodec())
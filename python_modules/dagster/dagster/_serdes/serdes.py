@@ -56,6 +56,7 @@
     has_generated_new,
     is_record,
 )
+from dagster._serdes.codecs import decode_serialized_value, encode_serialized_value
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster._utils import is_named_tuple_instance, is_named_tuple_subclass
 from dagster._utils.warnings import disable_dagster_warnings
@@ -541,6 +542,8 @@ def get_storage_name(self) -> str:
         return self.storage_name or self.klass.__name__
 
 
+SCALAR_TYPES = (int, float, str, bool)
+
 EMPTY_VALUES_TO_SKIP: Tuple[None, List[Any], Dict[Any, Any], Set[Any]] = (
     None,
     [],
@@ -584,13 +587,25 @@ def unpack(
     ) -> T:
         try:
             unpacked_dict = self.before_unpack(context, unpacked_dict)
+            param_names_by_storage_key = self._param_names_by_storage_key
+            if not self.field_serializers and not context.observed_unknown_serdes_values:
+                # Fast path: with no custom field serializers and no unknown values observed so far,
+                # there is nothing to do beyond remapping keys and dropping ignored fields.
+                return self.klass(
+                    **{
+                        param_names_by_storage_key[key]: value
+                        for key, value in unpacked_dict.items()
+                        if key in param_names_by_storage_key
+                    }
+                )
+
             unpacked: Dict[str, PackableValue] = {}
             for key, value in unpacked_dict.items():
-                loaded_name = self.loaded_field_names.get(key, key)
+                loaded_name = param_names_by_storage_key.get(key)
                 # Naively implements backwards compatibility by filtering arguments that aren't present in
                 # the constructor. If a property is present in the serialized object, but doesn't exist in
                 # the version of the class loaded into memory, that property will be completely ignored.
-                if loaded_name in self.constructor_param_names:
+                if loaded_name is not None:
                     # custom unpack regardless of hook vs recursive descent
                     custom = self.field_serializers.get(loaded_name)
                     if custom:
@@ -642,25 +657,32 @@ def pack_items(
         descent_path: str,
     ) -> Iterator[Tuple[str, JsonSerializableValue]]:
         yield "__class__", self.get_storage_name()
+        storage_field_names = self.storage_field_names
+        customized_fields = self._customized_pack_fields
         for key, inner_value in self.object_as_mapping(self.before_pack(value)).items():
-            if (key in self.skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP) or (
-                key in self.skip_when_none_fields and inner_value is None
-            ):
-                continue
-            storage_key = self.storage_field_names.get(key, key)
-            custom = self.field_serializers.get(key)
-            if custom:
-                yield (
-                    storage_key,
-                    custom.pack(
-                        inner_value,
-                        whitelist_map=whitelist_map,
-                        descent_path=f"{descent_path}.{key}",
-                    ),
-                )
+            if key in customized_fields:
+                if (key in self.skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP) or (
+                    key in self.skip_when_none_fields and inner_value is None
+                ):
+                    continue
+                custom = self.field_serializers.get(key)
+                if custom:
+                    yield (
+                        storage_field_names.get(key, key),
+                        custom.pack(
+                            inner_value,
+                            whitelist_map=whitelist_map,
+                            descent_path=f"{descent_path}.{key}",
+                        ),
+                    )
+                    continue
+
+            # scalars are by far the most common field values, so avoid the recursive call for them
+            if type(inner_value) in SCALAR_TYPES or inner_value is None:
+                yield storage_field_names.get(key, key), inner_value  # type: ignore # 2 hot 4 cast()
             else:
                 yield (
-                    storage_key,
+                    storage_field_names.get(key, key),
                     _transform_for_serialization(
                         inner_value,
                         whitelist_map=whitelist_map,
@@ -668,8 +690,7 @@ def pack_items(
                         descent_path=f"{descent_path}.{key}",
                     ),
                 )
-        for key, default in self.old_fields.items():
-            yield key, default
+        yield from self._old_field_items
 
     # Hook: Modify the contents of the object before packing
     def before_pack(self, value: T) -> T:
@@ -682,6 +703,34 @@ def constructor_param_names(self) -> Sequence[str]: ...
     def get_storage_name(self) -> str:
         return self.storage_name or self.klass.__name__
 
+    # The properties below are resolved once per serializer (i.e. per whitelisted class) on first
+    # use, so that the pack / unpack hot paths only have to do a single lookup per field.
+
+    @cached_property
+    def _param_names_by_storage_key(self) -> Mapping[str, str]:
+        """Maps each key that may be present in a serialized object to the constructor parameter
+        it is loaded into. Keys that are not in this mapping are ignored when unpacking.
+        """
+        param_names = set(self.constructor_param_names)
+        param_names_by_storage_key = {name: name for name in param_names}
+        for storage_key, loaded_name in self.loaded_field_names.items():
+            if loaded_name in param_names:
+                param_names_by_storage_key[storage_key] = loaded_name
+            else:
+                param_names_by_storage_key.pop(storage_key, None)
+        return param_names_by_storage_key
+
+    @cached_property
+    def _customized_pack_fields(self) -> AbstractSet[str]:
+        """Fields that are skipped when empty / None or that have a custom field serializer."""
+        return frozenset(
+            {*self.skip_when_empty_fields, *self.skip_when_none_fields, *self.field_serializers}
+        )
+
+    @cached_property
+    def _old_field_items(self) -> Sequence[Tuple[str, JsonSerializableValue]]:
+        return tuple(self.old_fields.items())
+
 
 T_NamedTuple = TypeVar("T_NamedTuple", default=NamedTuple)
 
@@ -824,11 +873,14 @@ def pack(
 def serialize_value(
     val: PackableValue,
     whitelist_map: WhitelistMap = _WHITELIST_MAP,
+    codec: Optional[str] = None,
     **json_kwargs: Any,
 ) -> str:
     """Serialize an object to a JSON string.
 
-    Objects are first converted to a JSON-serializable form with `pack_value`.
+    Objects are first converted to a JSON-serializable form with `pack_value`. If a `codec` is
+    provided (e.g. `"zlib"`), the JSON is encoded with that codec. `deserialize_value` detects
+    encoded values, so they do not need to be decoded separately.
     """
     serializable_value = _transform_for_serialization(
         val,
@@ -836,7 +888,7 @@ def serialize_value(
         object_handler=_wrap_object,
         descent_path=_root(val),
     )
-    return seven.json.dumps(serializable_value, **json_kwargs)
+    return encode_serialized_value(seven.json.dumps(serializable_value, **json_kwargs), codec)
 
 
 @overload
@@ -909,7 +961,7 @@ def _transform_for_serialization(
 ) -> JsonSerializableValue:
     # this is a hot code path so we handle the common base cases without isinstance
     tval = type(val)
-    if tval in (int, float, str, bool) or val is None:
+    if tval in SCALAR_TYPES or val is None:
         return val  # type: ignore # 2 hot 4 cast()
     if tval is list:
         return [
@@ -1129,7 +1181,8 @@ def deserialize_value(
 
     Two steps:
 
-    - Parse the input string as JSON with an object_hook for custom types.
+    - Decode the input string if it was serialized with a codec, then parse it as JSON with an
+      object_hook for custom types.
     - Optionally, check that the resulting object is of the expected type.
     """
     check.str_param(val, "val")
@@ -1178,7 +1231,7 @@ def deserialize_values(
         for val in vals:
             context = UnpackContext()
             unpacked_value = seven.json.loads(
-                val,
+                decode_serialized_value(val),
                 object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
             )
             unpacked_value = context.finalize_unpack(unpacked_value)
@@ -1204,7 +1257,8 @@ def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
 def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContext) -> UnpackedValue:
     if "__class__" in val:
         klass_name = val["__class__"]
-        if klass_name not in whitelist_map.object_deserializers:
+        deserializer = whitelist_map.object_deserializers.get(klass_name)
+        if deserializer is None:
             return context.observe_unknown_value(
                 UnknownSerdesValue(
                     f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.',
@@ -1212,8 +1266,7 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
                 )
             )
 
-        val.pop("__class__")
-        deserializer = whitelist_map.object_deserializers[klass_name]
+        del val["__class__"]
         return deserializer.unpack(val, whitelist_map, context)
 
     if "__enum__" in val:
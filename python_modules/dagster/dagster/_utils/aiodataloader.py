@@ -84,6 +84,13 @@ def prepare(self, keys: Iterable[KeyT]) -> None:
             if cache_key not in self._cache:
                 self._to_query[cache_key] = key
 
+    def prime(self, key: KeyT, value: ReturnT) -> None:
+        # add a value fetched elsewhere to the cache, unless the key has already been loaded
+        cache_key = self.get_cache_key(key)
+        if cache_key not in self._cache:
+            self._cache[cache_key] = value
+            self._to_query.pop(cache_key, None)
+
     def blocking_load(self, key: KeyT) -> ReturnT:
         """Loads the provided key synchronously, pulling from the cache if possible."""
         self.prepare([key])
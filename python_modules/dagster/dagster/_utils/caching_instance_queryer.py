@@ -18,6 +18,7 @@
 import dagster._check as check
 from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
 from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
+from dagster._core.definitions.asset_key import EntityKey
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph
 from dagster._core.definitions.data_version import DataVersion, extract_data_version_from_entry
 from dagster._core.definitions.declarative_automation.legacy.valid_asset_subset import (
@@ -38,6 +39,7 @@
 from dagster._core.events import DagsterEventType
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.loader import LoadingContext
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 from dagster._core.storage.dagster_run import (
     IN_PROGRESS_RUN_STATUSES,
     DagsterRun,
@@ -88,6 +90,8 @@ def __init__(
         ] = {}
 
         self._dynamic_partitions_cache: Dict[str, Sequence[str]] = {}
+        self._dynamic_partition_key_sets: Dict[str, AbstractSet[str]] = {}
+        self._asset_status_cache_values: Dict[AssetKey, Optional["AssetStatusCacheValue"]] = {}
 
         self._evaluation_time = evaluation_time if evaluation_time else get_current_datetime()
 
@@ -117,24 +121,82 @@ def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
 
         AssetRecord.blocking_get_many(self._loading_context, asset_keys)
 
+    def prefetch_run_records(self, run_ids: Iterable[str]) -> None:
+        """For performance, batches together queries for the records of the given runs."""
+        RunRecord.prepare(self._loading_context, run_ids)
+
+    def prime_run_records(self, run_records: Iterable[RunRecord]) -> None:
+        """Caches run records that were fetched elsewhere, so they need not be fetched again."""
+        for run_record in run_records:
+            RunRecord.prime(self._loading_context, run_record.dagster_run.run_id, run_record)
+
+    def prefetch_planned_materializations_for_runs(self, run_ids: Iterable[str]) -> None:
+        """For performance, batches together queries for the records of the given runs and for the
+        execution plan snapshots of any of those runs that do not have an asset selection.
+        """
+        run_records = RunRecord.blocking_get_many(self._loading_context, run_ids)
+        ExecutionPlanSnapshot.prepare(
+            self._loading_context,
+            {
+                check.not_none(record.dagster_run.execution_plan_snapshot_id)
+                for record in run_records
+                if not record.dagster_run.asset_selection
+                and record.dagster_run.execution_plan_snapshot_id
+            },
+        )
+
+    def prefetch_asset_status_cache_values(self, asset_keys: Iterable[AssetKey]):
+        """For performance, brings the status caches of the given partitioned assets up to date
+        together, fetching their new events in a few queries rather than a few per asset.
+        """
+        from dagster._core.storage.partition_status_cache import (
+            get_and_update_asset_status_cache_values,
+        )
+
+        partitions_defs_by_key = {
+            asset_key: self.asset_graph.get(asset_key).partitions_def
+            for asset_key in asset_keys
+            if asset_key not in self._asset_status_cache_values
+            and self.asset_graph.has(asset_key)
+            and self.asset_graph.get(asset_key).partitions_def is not None
+        }
+        if not partitions_defs_by_key:
+            return
+
+        self._asset_status_cache_values.update(
+            get_and_update_asset_status_cache_values(
+                instance=self.instance,
+                partitions_defs_by_key=partitions_defs_by_key,
+                dynamic_partitions_loader=self,
+                loading_context=self._loading_context,
+            )
+        )
+
     ####################
     # ASSET STATUS CACHE
     ####################
 
-    @cached_method
-    def _get_updated_cache_value(self, *, asset_key: AssetKey) -> Optional["AssetStatusCacheValue"]:
-        from dagster._core.storage.partition_status_cache import (
-            get_and_update_asset_status_cache_value,
-        )
+    def get_prefetched_asset_status_cache_values(
+        self,
+    ) -> Mapping[AssetKey, Optional["AssetStatusCacheValue"]]:
+        return dict(self._asset_status_cache_values)
+
+    def prime_asset_status_cache_values(
+        self, cache_values_by_key: Mapping[AssetKey, Optional["AssetStatusCacheValue"]]
+    ) -> None:
+        """Populates the status cache values of assets with values fetched elsewhere, e.g. in
+        another process.
+        """
+        for asset_key, cache_value in cache_values_by_key.items():
+            self._asset_status_cache_values.setdefault(asset_key, cache_value)
 
-        partitions_def = check.not_none(self.asset_graph.get(asset_key).partitions_def)
-        return get_and_update_asset_status_cache_value(
-            instance=self.instance,
-            asset_key=asset_key,
-            partitions_def=partitions_def,
-            dynamic_partitions_loader=self,
-            loading_context=self._loading_context,
+    def _get_updated_cache_value(self, *, asset_key: AssetKey) -> Optional["AssetStatusCacheValue"]:
+        check.invariant(
+            self.asset_graph.get(asset_key).partitions_def is not None,
+            f"Asset {asset_key.to_user_string()} is not partitioned",
         )
+        self.prefetch_asset_status_cache_values([asset_key])
+        return self._asset_status_cache_values[asset_key]
 
     @cached_method
     def get_failed_or_in_progress_subset(self, *, asset_key: AssetKey) -> PartitionsSubset:
@@ -147,8 +209,8 @@ def get_failed_or_in_progress_subset(self, *, asset_key: AssetKey) -> Partitions
             return partitions_def.empty_subset()
 
         return cache_value.deserialize_failed_partition_subsets(
-            partitions_def
-        ) | cache_value.deserialize_in_progress_partition_subsets(partitions_def)
+            partitions_def, self
+        ) | cache_value.deserialize_in_progress_partition_subsets(partitions_def, self)
 
     @cached_method
     def get_materialized_asset_subset(
@@ -161,7 +223,7 @@ def get_materialized_asset_subset(
             if cache_value is None:
                 value = partitions_def.empty_subset()
             else:
-                value = cache_value.deserialize_materialized_partition_subsets(partitions_def)
+                value = cache_value.deserialize_materialized_partition_subsets(partitions_def, self)
         else:
             value = self.asset_partition_has_materialization_or_observation(
                 AssetKeyPartitionKey(asset_key)
@@ -179,7 +241,7 @@ def get_in_progress_asset_subset(
             if cache_value is None:
                 value = partitions_def.empty_subset()
             else:
-                value = cache_value.deserialize_in_progress_partition_subsets(partitions_def)
+                value = cache_value.deserialize_in_progress_partition_subsets(partitions_def, self)
         else:
             # NOTE: this computation is not correct in all cases for unpartitioned assets. it is
             # possible (though rare) for run A to be launched targeting an asset, then later run B
@@ -238,7 +300,7 @@ def get_failed_asset_subset(self, *, asset_key: AssetKey) -> SerializableEntityS
             if cache_value is None:
                 value = partitions_def.empty_subset()
             else:
-                value = cache_value.deserialize_failed_partition_subsets(partitions_def)
+                value = cache_value.deserialize_failed_partition_subsets(partitions_def, self)
         else:
             # ideally, unpartitioned assets would also be handled by the asset status cache
             planned_materialization_info = (
@@ -432,6 +494,61 @@ def get_latest_materialization_or_observation_record(
             asset_partition=asset_partition, before_cursor=before_cursor
         )
 
+    def get_entity_keys_updated_after_storage_id(
+        self, storage_id: Optional[int]
+    ) -> Optional[AbstractSet[EntityKey]]:
+        """Returns the set of assets and asset checks with any event after the given storage id that
+        could change the result of evaluating a condition on them: the planning or completion of
+        an execution, as well as the completion of any run which planned to execute them.
+
+        Returns None if the event log storage does not support querying events across all runs.
+        """
+        from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
+
+        event_log_storage = self.instance.event_log_storage
+        if not event_log_storage.supports_event_consumer_queries():
+            return None
+
+        run_completion_event_types = {
+            DagsterEventType.RUN_SUCCESS,
+            DagsterEventType.RUN_FAILURE,
+            DagsterEventType.RUN_CANCELED,
+        }
+        entity_keys: Set[EntityKey] = set()
+        completed_run_ids: Set[str] = set()
+        after_cursor = storage_id or 0
+        while True:
+            entries_by_storage_id = event_log_storage.get_logs_for_all_runs_by_log_id(
+                after_cursor=after_cursor,
+                dagster_event_type={
+                    *ASSET_EVENTS,
+                    *ASSET_CHECK_EVENTS,
+                    *run_completion_event_types,
+                },
+                limit=RECORD_BATCH_SIZE,
+            )
+            for entry in entries_by_storage_id.values():
+                dagster_event = check.not_none(entry.dagster_event)
+                if dagster_event.event_type in run_completion_event_types:
+                    completed_run_ids.add(entry.run_id)
+                elif dagster_event.event_type == DagsterEventType.ASSET_CHECK_EVALUATION:
+                    entity_keys.add(dagster_event.asset_check_evaluation_data.asset_check_key)
+                elif dagster_event.event_type == DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED:
+                    entity_keys.add(dagster_event.asset_check_planned_data.asset_check_key)
+                else:
+                    entity_keys.add(check.not_none(dagster_event.asset_key))
+            if len(entries_by_storage_id) < RECORD_BATCH_SIZE:
+                break
+            after_cursor = max(entries_by_storage_id.keys())
+
+        self.prefetch_planned_materializations_for_runs(completed_run_ids)
+        for run_id in completed_run_ids:
+            entity_keys.update(self.get_planned_materializations_for_run(run_id))
+            run = self._get_run_by_id(run_id)
+            if run is not None and run.asset_check_selection:
+                entity_keys.update(run.asset_check_selection)
+        return entity_keys
+
     ####################
     # OBSERVATIONS
     ####################
@@ -467,9 +584,8 @@ def next_version_record(
     # RUNS
     ####################
 
-    @cached_method
     def _get_run_record_by_id(self, *, run_id: str) -> Optional[RunRecord]:
-        return self.instance.get_run_record_by_id(run_id)
+        return RunRecord.blocking_get(self._loading_context, run_id)
 
     def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
         run_record = self._get_run_record_by_id(run_id=run_id)
@@ -494,7 +610,7 @@ def _get_planned_materializations_for_run_from_snapshot(
         self, *, snapshot_id: str
     ) -> AbstractSet[AssetKey]:
         execution_plan_snapshot = check.not_none(
-            self._instance.get_execution_plan_snapshot(snapshot_id)
+            ExecutionPlanSnapshot.blocking_get(self._loading_context, snapshot_id)
         )
         return execution_plan_snapshot.asset_selection
 
@@ -656,7 +772,11 @@ def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         return self._dynamic_partitions_cache[partitions_def_name]
 
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
-        return partition_key in self.get_dynamic_partitions(partitions_def_name)
+        if partitions_def_name not in self._dynamic_partition_key_sets:
+            self._dynamic_partition_key_sets[partitions_def_name] = set(
+                self.get_dynamic_partitions(partitions_def_name)
+            )
+        return partition_key in self._dynamic_partition_key_sets[partitions_def_name]
 
     @cached_method
     def asset_partitions_with_newly_updated_parents_and_new_cursor(
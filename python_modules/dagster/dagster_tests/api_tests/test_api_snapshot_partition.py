@@ -58,6 +58,22 @@ def test_external_partition_names_grpc(instance: DagsterInstance):
         assert data.partition_names == list(string.ascii_lowercase)
 
 
+def test_external_partition_names_range_grpc(instance: DagsterInstance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repository_handle = code_location.get_repository("bar_repo").handle
+        data = sync_get_external_partition_names_grpc(
+            code_location.client, repository_handle, "baz", start_index=3, end_index=6
+        )
+        assert isinstance(data, PartitionNamesSnap)
+        assert data.partition_names == ["d", "e", "f"]
+        assert data.start_index == 3
+
+        data = sync_get_external_partition_names_grpc(
+            code_location.client, repository_handle, "baz", start_index=24
+        )
+        assert data.partition_names == ["y", "z"]
+
+
 def test_external_partition_names(instance: DagsterInstance):
     with get_bar_repo_code_location(instance) as code_location:
         data = code_location.get_partition_names(
@@ -1,3 +1,4 @@
+import random
 from datetime import datetime, timedelta
 
 import pytest
@@ -23,6 +24,7 @@
 from dagster._check import CheckError
 from dagster._core.definitions.asset_dep import AssetDep
 from dagster._core.definitions.asset_spec import AssetSpec
+from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
 from dagster._core.definitions.partition import DefaultPartitionsSubset
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.partition_mapping import (
@@ -718,6 +720,60 @@ def test_multipartitions_mapping_get_downstream_partitions(
     ).get_partition_keys() == set(downstream_partition_keys)
 
 
+def test_multipartitions_mapping_maps_each_dimension_of_subset():
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition("2024-01-01", end_date="2024-02-01"),
+            "abc": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+    date_keys = partitions_def.get_partitions_def_for_dimension("date").get_partition_keys()
+    mapping = MultiPartitionMapping(
+        {
+            "date": DimensionPartitionMapping("date", TimeWindowPartitionMapping(start_offset=-1)),
+            "abc": DimensionPartitionMapping("abc", IdentityPartitionMapping()),
+        }
+    )
+
+    def _shifted_keys(partition_keys, offset):
+        shifted = set()
+        for partition_key in partition_keys:
+            date_index = date_keys.index(partition_key.keys_by_dimension["date"])
+            for i in [date_index, date_index + offset]:
+                if 0 <= i < len(date_keys):
+                    shifted.add(
+                        MultiPartitionKey(
+                            {"date": date_keys[i], "abc": partition_key.keys_by_dimension["abc"]}
+                        )
+                    )
+        return shifted
+
+    rng = random.Random(3)
+    for _ in range(10):
+        partition_keys = set(rng.sample(partitions_def.get_partition_keys(), rng.randint(1, 40)))
+        subset = partitions_def.subset_with_partition_keys(partition_keys)
+
+        upstream_subset = mapping.get_upstream_mapped_partitions_result_for_partitions(
+            subset, partitions_def, partitions_def
+        ).partitions_subset
+        assert isinstance(upstream_subset, MultiPartitionsSubset)
+        assert upstream_subset.get_partition_keys() == _shifted_keys(partition_keys, -1)
+
+        downstream_subset = mapping.get_downstream_partitions_for_partitions(
+            subset, partitions_def, partitions_def
+        )
+        assert isinstance(downstream_subset, MultiPartitionsSubset)
+        assert downstream_subset.get_partition_keys() == _shifted_keys(partition_keys, 1)
+
+        # subsets of flattened multi-partition keys are mapped the same way
+        assert (
+            mapping.get_upstream_mapped_partitions_result_for_partitions(
+                DefaultPartitionsSubset(partition_keys), partitions_def, partitions_def
+            ).partitions_subset
+            == upstream_subset
+        )
+
+
 def test_multipartitions_mapping_dynamic():
     mapping = MultiPartitionMapping(
         {"dynamic": DimensionPartitionMapping("dynamic", IdentityPartitionMapping())}
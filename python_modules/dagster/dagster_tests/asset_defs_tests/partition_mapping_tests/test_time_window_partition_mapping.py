@@ -1,3 +1,4 @@
+import random
 from datetime import datetime, timezone
 from typing import Optional, Sequence
 
@@ -992,3 +993,117 @@ def test_get_downstream_partitions_for_all_partitions_subset() -> None:
         # don't include 05-05 through 05-09
         PartitionKeyRange("2021-05-10", "2021-05-30")
     )
+
+
+@pytest.mark.parametrize(
+    "downstream_partitions_def,upstream_partitions_def",
+    [
+        (
+            DailyPartitionsDefinition(start_date="2023-01-01"),
+            DailyPartitionsDefinition(start_date="2023-01-01"),
+        ),
+        (
+            DailyPartitionsDefinition(start_date="2023-03-01", end_date="2023-09-01"),
+            DailyPartitionsDefinition(start_date="2023/01/01", fmt="%Y/%m/%d"),
+        ),
+        (
+            DailyPartitionsDefinition(start_date="2023-01-01", timezone="US/Pacific"),
+            HourlyPartitionsDefinition(start_date="2023-01-01-00:00", timezone="US/Pacific"),
+        ),
+        (
+            HourlyPartitionsDefinition(start_date="2023-03-01-00:00", timezone="US/Pacific"),
+            DailyPartitionsDefinition(start_date="2023-01-01", timezone="US/Pacific"),
+        ),
+        (
+            WeeklyPartitionsDefinition(start_date="2023-01-01"),
+            DailyPartitionsDefinition(start_date="2023-01-01", end_offset=1),
+        ),
+        (
+            MonthlyPartitionsDefinition(start_date="2023-01-01"),
+            WeeklyPartitionsDefinition(start_date="2023-01-01"),
+        ),
+        (
+            WeeklyPartitionsDefinition(start_date="2023-01-04"),
+            DailyPartitionsDefinition(start_date="2023-01-02"),
+        ),
+        (
+            DailyPartitionsDefinition(start_date="2023-01-01"),
+            DailyPartitionsDefinition(start_date="2023-02-01", end_date="2023-11-01"),
+        ),
+        (
+            TimeWindowPartitionsDefinition(
+                start="2023-01-01-00:00", cron_schedule="0 9 * * 1-5", fmt="%Y-%m-%d-%H:%M"
+            ),
+            DailyPartitionsDefinition(start_date="2023-01-01", hour_offset=9),
+        ),
+    ],
+)
+def test_ordinal_mapping_matches_time_window_mapping(
+    downstream_partitions_def: TimeWindowPartitionsDefinition,
+    upstream_partitions_def: TimeWindowPartitionsDefinition,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    current_time = datetime(2023, 12, 1, 9, 30)
+    rng = random.Random(11)
+
+    def _subsets(partitions_def: TimeWindowPartitionsDefinition):
+        partition_keys = partitions_def.get_partition_keys(current_time=current_time)
+        yield partitions_def.empty_subset().with_partition_keys(partition_keys)
+        for _ in range(5):
+            yield partitions_def.empty_subset().with_partition_keys(
+                rng.sample(partition_keys, rng.randint(1, min(len(partition_keys), 50)))
+            )
+
+    def _map_all(mapping: TimeWindowPartitionMapping):
+        return [
+            (
+                mapping.get_upstream_mapped_partitions_result_for_partitions(
+                    subset, downstream_partitions_def, upstream_partitions_def, current_time
+                ),
+                mapping.get_downstream_partitions_for_partitions(
+                    upstream_subset,
+                    upstream_partitions_def,
+                    downstream_partitions_def,
+                    current_time,
+                ),
+            )
+            for subset, upstream_subset in zip(
+                _subsets(downstream_partitions_def), _subsets(upstream_partitions_def)
+            )
+        ]
+
+    for mapping in [
+        TimeWindowPartitionMapping(),
+        TimeWindowPartitionMapping(start_offset=-2),
+        TimeWindowPartitionMapping(start_offset=-1, end_offset=1),
+        TimeWindowPartitionMapping(start_offset=1, end_offset=3),
+        TimeWindowPartitionMapping(end_offset=2, allow_nonexistent_upstream_partitions=True),
+    ]:
+        rng.seed(11)
+        results = _map_all(mapping)
+        with monkeypatch.context() as m:
+            m.setattr(
+                TimeWindowPartitionMapping, "_map_partitions_by_ordinals", lambda *_, **__: None
+            )
+            rng.seed(11)
+            expected_results = _map_all(mapping)
+
+        for (upstream_result, downstream_subset), (
+            expected_upstream_result,
+            expected_downstream_subset,
+        ) in zip(results, expected_results):
+            assert (
+                upstream_result.partitions_subset.get_partition_keys()
+                == expected_upstream_result.partitions_subset.get_partition_keys()
+            )
+            assert len(upstream_result.partitions_subset) == len(
+                expected_upstream_result.partitions_subset
+            )
+            assert (
+                upstream_result.required_but_nonexistent_partition_keys
+                == expected_upstream_result.required_but_nonexistent_partition_keys
+            )
+            assert (
+                downstream_subset.get_partition_keys()
+                == expected_downstream_subset.get_partition_keys()
+            )
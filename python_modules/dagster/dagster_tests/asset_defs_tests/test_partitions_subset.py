@@ -1,15 +1,33 @@
+import json
+import random
 from typing import cast
 from unittest.mock import Mock
 
 import pytest
-from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster import (
+    DagsterInstance,
+    DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
+from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    DefaultPartitionsSubset,
+    PartitionKeyBitmap,
+)
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.definitions.time_window_partitions import (
     PersistedTimeWindow,
     TimeWindowPartitionsDefinition,
     TimeWindowPartitionsSubset,
 )
 from dagster._core.errors import DagsterInvalidDeserializationVersionError
+from dagster._core.storage.partition_status_cache import (
+    deserialize_cached_partitions_subset,
+    serialize_cached_partitions_subset,
+)
 from dagster._core.test_utils import freeze_time
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._time import create_datetime, get_current_datetime
@@ -29,6 +47,7 @@ def test_default_subset_cannot_deserialize_invalid_version():
 
     class NewSerializationVersionSubset(DefaultPartitionsSubset):
         SERIALIZATION_VERSION = -1
+        BITMAP_SERIALIZATION_VERSION = -1
 
     with pytest.raises(DagsterInvalidDeserializationVersionError, match="version -1"):
         NewSerializationVersionSubset.from_serialized(static_partitions_def, serialized_subset)
@@ -84,6 +103,7 @@ def test_get_subset_type():
 def test_empty_subsets():
     assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is TimeWindowPartitionsSubset
+    assert type(composite.empty_subset()) is MultiPartitionsSubset
 
 
 @pytest.mark.parametrize(
@@ -209,3 +229,185 @@ def test_partitions_set_short_circuiting() -> None:
 
     # Test short-circuiting of -. Returns an empty DefaultPartitionsSubset
     assert (default_ps - all_ps) == DefaultPartitionsSubset.empty_subset()
+
+
+def test_static_partitions_subset_bitmap_set_operations() -> None:
+    partition_keys = [f"key_{i}" for i in range(300)]
+    static_partitions_def = StaticPartitionsDefinition(partition_keys)
+    rng = random.Random(13)
+
+    for _ in range(20):
+        keys_a = set(rng.sample(partition_keys, rng.randint(0, 300)))
+        keys_b = set(rng.sample(partition_keys, rng.randint(0, 300)))
+        subset_a = static_partitions_def.subset_with_partition_keys(keys_a)
+        subset_b = static_partitions_def.subset_with_partition_keys(keys_b)
+
+        for subset in [subset_a, subset_b, subset_a | subset_b, subset_a & subset_b]:
+            assert isinstance(cast(DefaultPartitionsSubset, subset).subset, PartitionKeyBitmap)
+
+        assert subset_a == DefaultPartitionsSubset(keys_a)
+        assert set((subset_a | subset_b).get_partition_keys()) == keys_a | keys_b
+        assert set((subset_a & subset_b).get_partition_keys()) == keys_a & keys_b
+        assert set((subset_a - subset_b).get_partition_keys()) == keys_a - keys_b
+        assert len(subset_a) == len(keys_a)
+        assert all((key in subset_a) == (key in keys_a) for key in partition_keys)
+        assert set(subset_a.get_partition_keys_not_in_subset(static_partitions_def)) == (
+            set(partition_keys) - keys_a
+        )
+        # bitmap-backed subsets produce the same ranges as scanning the partition keys
+        assert subset_a.get_partition_key_ranges(static_partitions_def) == DefaultPartitionsSubset(
+            keys_a
+        ).get_partition_key_ranges(static_partitions_def)
+
+        # set operations with set-backed subsets fall back to python sets
+        assert subset_a | DefaultPartitionsSubset(keys_b) == DefaultPartitionsSubset(
+            keys_a | keys_b
+        )
+        assert DefaultPartitionsSubset(keys_b) - subset_a == DefaultPartitionsSubset(
+            keys_b - keys_a
+        )
+
+
+def test_static_partitions_subset_bitmap_with_unknown_keys() -> None:
+    static_partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+    subset = static_partitions_def.empty_subset().with_partition_keys(["a", "z"])
+    assert not isinstance(subset.subset, PartitionKeyBitmap)
+    assert subset == DefaultPartitionsSubset({"a", "z"})
+    assert static_partitions_def.deserialize_subset(subset.serialize()) == subset
+
+
+def test_static_partitions_subset_bitmap_serialization() -> None:
+    partition_keys = [f"customer_{i}" for i in range(10000)]
+    static_partitions_def = StaticPartitionsDefinition(partition_keys)
+    subset = static_partitions_def.subset_with_partition_keys(partition_keys[100:9000:3])
+
+    serialized = subset.serialize()
+    assert json.loads(serialized)["version"] == DefaultPartitionsSubset.BITMAP_SERIALIZATION_VERSION
+    assert len(serialized) < 1000
+    assert static_partitions_def.deserialize_subset(serialized) == subset
+    assert deserialize_value(serialize_value(subset)) == subset
+
+    # keys appended to the partitions definition do not invalidate the stored bitmap
+    appended_partitions_def = StaticPartitionsDefinition([*partition_keys, "customer_new"])
+    assert appended_partitions_def.can_deserialize_subset(serialized, None, None)
+    assert appended_partitions_def.deserialize_subset(serialized) == subset
+
+    # bitmaps over a different key order cannot be decoded
+    reordered_partitions_def = StaticPartitionsDefinition(list(reversed(partition_keys)))
+    assert not reordered_partitions_def.can_deserialize_subset(
+        serialized, None, StaticPartitionsDefinition.__name__
+    )
+    with pytest.raises(DagsterInvalidDeserializationVersionError, match="key order"):
+        reordered_partitions_def.deserialize_subset(serialized)
+
+
+def test_dynamic_partitions_subset_status_cache_serialization() -> None:
+    dynamic_partitions_def = DynamicPartitionsDefinition(name="customers")
+    partition_keys = [f"customer_{i}" for i in range(5000)]
+
+    with DagsterInstance.ephemeral() as instance:
+        instance.add_dynamic_partitions("customers", partition_keys)
+        subset = dynamic_partitions_def.empty_subset().with_partition_keys(partition_keys[::2])
+
+        serialized = serialize_cached_partitions_subset(subset, dynamic_partitions_def, instance)
+        assert len(serialized) < len(subset.serialize()) / 10
+        deserialized = deserialize_cached_partitions_subset(
+            dynamic_partitions_def, serialized, instance
+        )
+        assert deserialized == subset
+        assert deserialized.get_partition_key_ranges(
+            dynamic_partitions_def, dynamic_partitions_store=instance
+        )[:2] == [
+            PartitionKeyRange("customer_0", "customer_0"),
+            PartitionKeyRange("customer_2", "customer_2"),
+        ]
+        # without the dynamic partitions store, subsets are serialized as lists of keys
+        assert dynamic_partitions_def.deserialize_subset(deserialized.serialize()) == subset
+
+        instance.add_dynamic_partitions("customers", ["customer_new"])
+        assert (
+            deserialize_cached_partitions_subset(dynamic_partitions_def, serialized, instance)
+            == subset
+        )
+
+
+def test_multi_partitions_subset_set_operations() -> None:
+    multi_partitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition("2024-01-01", end_date="2024-03-01"),
+            "abc": StaticPartitionsDefinition(["a", "b", "c", "d"]),
+        }
+    )
+    partition_keys = multi_partitions_def.get_partition_keys()
+    rng = random.Random(7)
+
+    for _ in range(20):
+        keys_a = set(rng.sample(partition_keys, rng.randint(0, len(partition_keys))))
+        keys_b = set(rng.sample(partition_keys, rng.randint(0, len(partition_keys))))
+        subset_a = multi_partitions_def.subset_with_partition_keys(keys_a)
+        subset_b = multi_partitions_def.subset_with_partition_keys(keys_b)
+
+        # subsets of the time dimension are stored per key of the static dimension
+        for subset in [subset_a, subset_b, subset_a | subset_b, subset_a & subset_b]:
+            assert isinstance(subset, MultiPartitionsSubset)
+            assert all(
+                isinstance(primary_subset, TimeWindowPartitionsSubset)
+                for primary_subset in subset.subsets_by_secondary_key.values()
+            )
+
+        assert subset_a.get_partition_keys() == keys_a
+        assert subset_a == DefaultPartitionsSubset(keys_a)
+        assert DefaultPartitionsSubset(keys_a) == subset_a
+        assert (subset_a | subset_b).get_partition_keys() == keys_a | keys_b
+        assert (subset_a & subset_b).get_partition_keys() == keys_a & keys_b
+        assert (subset_a - subset_b).get_partition_keys() == keys_a - keys_b
+        assert (subset_a - DefaultPartitionsSubset(keys_b)).get_partition_keys() == keys_a - keys_b
+        assert len(subset_a) == len(keys_a)
+        assert all((key in subset_a) == (key in keys_a) for key in partition_keys)
+        assert set(subset_a.get_partition_keys_not_in_subset(multi_partitions_def)) == (
+            set(partition_keys) - keys_a
+        )
+        assert subset_a.get_partition_key_ranges(multi_partitions_def) == DefaultPartitionsSubset(
+            keys_a
+        ).get_partition_key_ranges(multi_partitions_def)
+
+
+def test_multi_partitions_subset_serialization() -> None:
+    multi_partitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition("2023-01-01", end_date="2024-01-01"),
+            "customer": StaticPartitionsDefinition([f"customer_{i}" for i in range(50)]),
+        }
+    )
+    partition_keys = multi_partitions_def.get_partition_keys()
+    subset = multi_partitions_def.subset_with_partition_keys(
+        partition_keys[: len(partition_keys) // 2]
+    )
+
+    serialized = subset.serialize()
+    flattened_serialized = DefaultPartitionsSubset(set(subset.get_partition_keys())).serialize()
+    assert len(serialized) < len(flattened_serialized) / 10
+    assert multi_partitions_def.can_deserialize_subset(
+        serialized, None, MultiPartitionsDefinition.__name__
+    )
+    assert multi_partitions_def.deserialize_subset(serialized) == subset
+
+    # subsets serialized as lists of multi-partition keys can still be deserialized
+    assert multi_partitions_def.can_deserialize_subset(
+        flattened_serialized, None, MultiPartitionsDefinition.__name__
+    )
+    assert multi_partitions_def.deserialize_subset(flattened_serialized) == subset
+
+    # serdes stores the multi-partition keys
+    assert deserialize_value(serialize_value(subset.to_serializable_subset())) == subset
+
+    # the subsets are keyed by the primary dimension
+    other_primary_dimension_def = MultiPartitionsDefinition(
+        {
+            "date": StaticPartitionsDefinition(["2023-01-01"]),
+            "customer": StaticPartitionsDefinition([f"customer_{i}" for i in range(50)]),
+        }
+    )
+    assert not other_primary_dimension_def.can_deserialize_subset(serialized, None, None)
+    with pytest.raises(DagsterInvalidDeserializationVersionError, match="primary dimension"):
+        other_primary_dimension_def.deserialize_subset(serialized)
@@ -466,3 +466,38 @@ def test_non_volatile_data_time(timeline):
                 times_by_key=times_by_key,
                 evaluation_time=get_current_datetime(),
             )
+
+
+def test_prefetch_planned_materializations_for_runs() -> None:
+    @asset
+    def a() -> None: ...
+
+    @asset(deps=[a])
+    def b() -> None: ...
+
+    instance = DagsterInstance.ephemeral()
+    asset_graph = AssetGraph.from_assets([a, b])
+    job = create_test_asset_job([a, b])
+    run_ids = [
+        job.execute_in_process(instance=instance).run_id,
+        job.execute_in_process(instance=instance, asset_selection=[a.key]).run_id,
+    ]
+
+    instance_queryer = _get_instance_queryer(instance, asset_graph)
+    with mock.patch.object(
+        instance, "get_run_records", wraps=instance.get_run_records
+    ) as get_run_records, mock.patch.object(
+        instance, "get_execution_plan_snapshots", wraps=instance.get_execution_plan_snapshots
+    ) as get_execution_plan_snapshots:
+        instance_queryer.prefetch_planned_materializations_for_runs([*run_ids, "nonexistent"])
+        assert instance_queryer.get_planned_materializations_for_run(run_ids[0]) == {
+            a.key,
+            b.key,
+        }
+        assert instance_queryer.get_planned_materializations_for_run(run_ids[1]) == {a.key}
+        assert instance_queryer.get_planned_materializations_for_run("nonexistent") == set()
+        assert instance_queryer.run_has_tag(run_ids[0], "foo", None) is False
+
+        # all runs and snapshots are fetched in a single query each
+        assert get_run_records.call_count == 1
+        assert get_execution_plan_snapshots.call_count == 1
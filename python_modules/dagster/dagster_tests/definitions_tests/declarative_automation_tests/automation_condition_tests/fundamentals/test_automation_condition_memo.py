@@ -0,0 +1,75 @@
+from dagster import (
+    AssetKey,
+    AutomationCondition,
+    DagsterInstance,
+    Definitions,
+    StaticPartitionsDefinition,
+    asset,
+    evaluate_automation_conditions,
+)
+from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView
+from dagster._core.definitions.declarative_automation.automation_condition_memo import (
+    AutomationConditionMemo,
+    get_subset_value_key,
+)
+
+
+def test_memoized_dep_conditions() -> None:
+    condition = AutomationCondition.any_deps_match(AutomationCondition.missing())
+
+    @asset
+    def A() -> None: ...
+
+    @asset(deps=[A], automation_condition=condition)
+    def B() -> None: ...
+
+    @asset(deps=[A], automation_condition=condition)
+    def C() -> None: ...
+
+    @asset(deps=[A], automation_condition=condition)
+    def D() -> None: ...
+
+    result = evaluate_automation_conditions(defs=[A, B, C, D], instance=DagsterInstance.ephemeral())
+    assert result.total_requested == 3
+
+    # the missing subset of A is computed once and reused by the other two children
+    profile = result.profile
+    assert profile.num_memo_hits >= 2
+    missing_profiles = [
+        p
+        for p in profile.node_profiles
+        if p.node_snapshot.class_name == "MissingAutomationCondition"
+    ]
+    assert len(missing_profiles) == 1
+    assert missing_profiles[0].num_evaluations == 1
+    assert missing_profiles[0].num_cache_hits == 2
+
+    # memoized results are identical to computed ones
+    for r in result.results:
+        (missing_node,) = [
+            node
+            for node in r.serializable_evaluation.iter_nodes()
+            if node.condition_snapshot.class_name == "MissingAutomationCondition"
+        ]
+        assert missing_node.true_subset.key == AssetKey("A")
+        assert missing_node.true_subset.size == 1
+
+
+def test_memo_eviction() -> None:
+    @asset(partitions_def=StaticPartitionsDefinition(["a", "b", "c"]))
+    def A() -> None: ...
+
+    asset_graph_view = AssetGraphView.for_test(Definitions(assets=[A]))
+    full_subset = asset_graph_view.get_full_subset(key=A.key)
+    empty_subset = asset_graph_view.get_empty_subset(key=A.key)
+    assert get_subset_value_key(full_subset) != get_subset_value_key(empty_subset)
+
+    memo = AutomationConditionMemo(max_entries=1)
+    memo.set("full", full_subset)
+    assert memo.get("full") == full_subset
+    memo.set("empty", empty_subset)
+    assert memo.get("full") is None
+    assert memo.get("empty") == empty_subset
+    assert (memo.num_hits, memo.num_misses, memo.num_evictions) == (2, 1, 1)
+    assert memo.num_entries == 1
+    assert memo.hit_ratio == 2 / 3
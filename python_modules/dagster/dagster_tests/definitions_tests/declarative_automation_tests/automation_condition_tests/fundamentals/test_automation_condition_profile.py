@@ -0,0 +1,77 @@
+import dagster._check as check
+from dagster import AutomationCondition, DagsterInstance, asset, evaluate_automation_conditions
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionEvaluationProfile,
+)
+from dagster._serdes import deserialize_value, serialize_value
+
+
+def test_automation_condition_profile() -> None:
+    condition = AutomationCondition.eager()
+
+    @asset
+    def A() -> None: ...
+
+    @asset(deps=[A], automation_condition=condition)
+    def B() -> None: ...
+
+    @asset(deps=[B], automation_condition=condition)
+    def C() -> None: ...
+
+    result = evaluate_automation_conditions(defs=[A, B, C], instance=DagsterInstance.ephemeral())
+    profile = result.profile
+    assert profile.num_evaluated == 2
+    assert profile.num_skipped == 0
+    assert {p.key for p in profile.slowest_entity_profiles} == {B.key, C.key}
+    durations = [p.duration for p in profile.slowest_entity_profiles]
+    assert durations == sorted(durations, reverse=True)
+
+    # identical condition trees are aggregated into a single profile per node, other than the
+    # nodes that are evaluated on a specific dependency
+    root_unique_id = condition.get_node_unique_id(parent_unique_id=None, index=None)
+    unique_ids = {
+        node.condition_snapshot.unique_id
+        for r in result.results
+        for node in r.serializable_evaluation.iter_nodes()
+    }
+    assert {p.node_snapshot.unique_id for p in profile.node_profiles} == unique_ids
+    root_profile = profile.get_node_profile(root_unique_id)
+    assert root_profile
+    assert root_profile.parent_unique_id is None
+    assert root_profile.num_evaluations == 2
+    assert root_profile.slowest_entity_key in {B.key, C.key}
+    assert root_profile.max_duration <= root_profile.total_duration
+    for node_profile in profile.node_profiles:
+        # nodes may reuse a subset computed for an identical node within another tree
+        assert node_profile.num_evaluations + node_profile.num_cache_hits in {1, 2}
+        assert node_profile.self_duration <= node_profile.total_duration + 1e-9
+        if node_profile is not root_profile:
+            assert profile.get_node_profile(check.not_none(node_profile.parent_unique_id))
+
+    assert deserialize_value(serialize_value(profile), AutomationConditionEvaluationProfile) == (
+        profile
+    )
+
+
+def test_automation_condition_profile_skipped() -> None:
+    @asset(automation_condition=AutomationCondition.eager())
+    def A() -> None: ...
+
+    instance = DagsterInstance.ephemeral(
+        settings={"auto_materialize": {"skip_unchanged_entities": True}}
+    )
+    result = evaluate_automation_conditions(defs=[A], instance=instance)
+    for _ in range(3):
+        result = evaluate_automation_conditions(defs=[A], instance=instance, cursor=result.cursor)
+
+    profile = result.profile
+    assert profile.num_skipped == 1
+    assert profile.num_evaluated == 0
+    assert profile.slowest_entity_profiles == []
+    root_unique_id = AutomationCondition.eager().get_node_unique_id(
+        parent_unique_id=None, index=None
+    )
+    assert [
+        (p.node_snapshot.unique_id, p.num_evaluations, p.num_cache_hits)
+        for p in profile.node_profiles
+    ] == [(root_unique_id, 0, 1)]
@@ -0,0 +1,93 @@
+import datetime
+
+from dagster import (
+    AssetMaterialization,
+    AutomationCondition,
+    DagsterInstance,
+    asset,
+    evaluate_automation_conditions,
+)
+from dagster._core.definitions.declarative_automation.automation_condition_evaluator import (
+    _SkippedAutomationResult,
+)
+
+
+def _get_skipped_keys(result) -> set:
+    return {r.key for r in result.results if isinstance(r, _SkippedAutomationResult)}
+
+
+def test_skip_unchanged_entities() -> None:
+    @asset
+    def A() -> None: ...
+
+    @asset(deps=[A], automation_condition=AutomationCondition.eager())
+    def B() -> None: ...
+
+    @asset(deps=[B], automation_condition=AutomationCondition.on_cron("0 * * * *"))
+    def C() -> None: ...
+
+    instance = DagsterInstance.ephemeral(
+        settings={"auto_materialize": {"skip_unchanged_entities": True}}
+    )
+    current_time = datetime.datetime(2024, 8, 16, 1, 35)
+    result = None
+
+    def _evaluate(cursor):
+        return evaluate_automation_conditions(
+            defs=[A, B, C], instance=instance, cursor=cursor, evaluation_time=current_time
+        )
+
+    # the results of the first evaluations change from tick to tick
+    for _ in range(3):
+        result = _evaluate(result.cursor if result else None)
+        assert result.total_requested == 0
+        assert _get_skipped_keys(result) == set()
+        current_time += datetime.timedelta(minutes=1)
+
+    # nothing has changed since the previous tick, which did not change the cursors either
+    result = _evaluate(result.cursor)
+    assert result.total_requested == 0
+    assert _get_skipped_keys(result) == {B.key, C.key}
+
+    # A is updated, so B is requested, and C is evaluated as its parent is requested
+    instance.report_runless_asset_event(AssetMaterialization("A"))
+    current_time += datetime.timedelta(minutes=1)
+    result = _evaluate(result.cursor)
+    assert result.get_requested_partitions(B.key) == {None}
+    assert _get_skipped_keys(result) == set()
+
+    # B is materialized, and both are evaluated until their cursors settle
+    instance.report_runless_asset_event(AssetMaterialization("B"))
+    for _ in range(3):
+        current_time += datetime.timedelta(minutes=1)
+        result = _evaluate(result.cursor)
+        assert result.total_requested == 0
+    current_time += datetime.timedelta(minutes=1)
+    result = _evaluate(result.cursor)
+    assert result.total_requested == 0
+    assert _get_skipped_keys(result) == {B.key, C.key}
+
+    # the cron tick of C passes, but B has not been updated since
+    current_time = datetime.datetime(2024, 8, 16, 2, 1)
+    result = _evaluate(result.cursor)
+    assert result.total_requested == 0
+    assert _get_skipped_keys(result) == {B.key}
+
+    # B is updated, so C is requested
+    instance.report_runless_asset_event(AssetMaterialization("B"))
+    current_time += datetime.timedelta(minutes=1)
+    result = _evaluate(result.cursor)
+    assert result.get_requested_partitions(C.key) == {None}
+    assert _get_skipped_keys(result) == set()
+
+
+def test_skip_unchanged_entities_disabled() -> None:
+    @asset(automation_condition=AutomationCondition.eager())
+    def A() -> None: ...
+
+    instance = DagsterInstance.ephemeral()
+    result = evaluate_automation_conditions(defs=[A], instance=instance)
+    for _ in range(3):
+        result = evaluate_automation_conditions(defs=[A], instance=instance, cursor=result.cursor)
+        assert _get_skipped_keys(result) == set()
+        assert all(cursor.input_hash is None for cursor in result.cursor.previous_condition_cursors)
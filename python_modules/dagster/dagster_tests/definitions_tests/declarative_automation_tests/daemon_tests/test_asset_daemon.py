@@ -3,6 +3,7 @@
 from contextlib import contextmanager, nullcontext
 from typing import Any, Generator, Mapping, Optional, Sequence, cast
 
+import dagster._check as check
 import pytest
 from dagster import (
     AssetSpec,
@@ -245,6 +246,21 @@ def test_asset_daemon_with_threadpool_without_sensor(
             scenario.evaluate_daemon(instance, threadpool_executor=threadpool_executor)
 
 
+daemon_scenarios_with_evaluation_processes = [*basic_scenarios[:5], *partition_scenarios[:5]]
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    daemon_scenarios_with_evaluation_processes,
+    ids=[scenario.id for scenario in daemon_scenarios_with_evaluation_processes],
+)
+def test_asset_daemon_with_evaluation_processes(scenario: AssetDaemonScenario) -> None:
+    with get_daemon_instance(
+        extra_overrides={"auto_materialize": {"num_evaluation_processes": 2, "use_sensors": False}}
+    ) as instance:
+        scenario.evaluate_daemon(instance)
+
+
 @pytest.mark.parametrize(
     "scenario",
     auto_materialize_sensor_scenarios,
@@ -328,6 +344,9 @@ def test_daemon_paused() -> None:
         assert ticks[0].timestamp == state.current_time.timestamp()
         assert ticks[0].tick_data.end_timestamp == state.current_time.timestamp()
         assert ticks[0].automation_condition_evaluation_id == 1
+        profile = check.not_none(ticks[0].automation_condition_profile)
+        assert profile.num_evaluated > 0
+        assert profile.node_profiles
 
         state = daemon_scenario.execution_fn(state)
         ticks = _get_asset_daemon_ticks(instance)
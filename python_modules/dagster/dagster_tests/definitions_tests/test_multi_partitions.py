@@ -681,3 +681,27 @@ def test_multipartitions_range_cartesian_multiple_keys_in_both_ranges():
         MultiPartitionKey({"a": "2024-01-03", "b": "3"}),
         MultiPartitionKey({"a": "2024-01-03", "b": "4"}),
     ]
+
+
+def test_multipartitions_iter_partition_keys():
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2015-01-01"),
+            "static": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+    current_time = datetime(2024, 1, 1)
+    partition_keys = partitions_def.get_partition_keys(current_time=current_time)
+
+    for start_index, end_index in [(0, None), (0, 4), (2, 7), (3, 6), (5, 5), (7, 2)]:
+        assert (
+            list(partitions_def.iter_partition_keys(start_index, end_index, current_time))
+            == partition_keys[start_index:end_index]
+        )
+
+    last_keys = list(
+        partitions_def.iter_partition_keys(len(partition_keys) - 2, current_time=current_time)
+    )
+    assert last_keys == ["2023-12-31|b", "2023-12-31|c"]
+    assert last_keys[0].keys_by_dimension == {"date": "2023-12-31", "static": "b"}
+    assert list(partitions_def.iter_partition_keys(len(partition_keys), None, current_time)) == []
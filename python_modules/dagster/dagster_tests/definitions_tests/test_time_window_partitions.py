@@ -23,13 +23,14 @@
     ScheduleType,
     TimeWindow,
     TimeWindowPartitionsSubset,
+    dst_safe_strftime,
     dst_safe_strptime,
 )
 from dagster._core.definitions.timestamp import TimestampWithTimezone
 from dagster._core.test_utils import freeze_time
 from dagster._record import copy
 from dagster._serdes import deserialize_value, serialize_value
-from dagster._time import create_datetime, parse_time_string
+from dagster._time import create_datetime, get_timezone, parse_time_string
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 
 DATE_FORMAT = "%Y-%m-%d"
@@ -1826,3 +1827,250 @@ def test_persisted_time_window_serdes():
     deserialized_time_window = deserialize_value(serialized_time_window, PersistedTimeWindow)
     assert isinstance(deserialized_time_window, PersistedTimeWindow)
     assert serialize_value(deserialized_time_window) == serialized_time_window
+
+
+def test_partition_ordinal_index() -> None:
+    partitions_def = DailyPartitionsDefinition(start_date="2015-01-01")
+    index = partitions_def.get_partition_ordinal_index()
+    assert index is partitions_def.get_partition_ordinal_index()
+
+    start = create_datetime(2015, 1, 1).timestamp()
+    assert index.ordinal_for_boundary(start) == 0
+    assert index.ordinal_for_boundary(create_datetime(2015, 3, 1).timestamp()) == 59
+    assert index.boundary_for_ordinal(59) == create_datetime(2015, 3, 1).timestamp()
+    # not a partition boundary
+    assert index.ordinal_for_boundary(create_datetime(2015, 3, 1, 12).timestamp()) is None
+    assert index.ordinal_at_or_after(create_datetime(2015, 3, 1, 12).timestamp()) == 60
+    # before the start of the partitions def
+    assert index.ordinal_for_boundary(create_datetime(2014, 12, 31).timestamp()) is None
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        DailyPartitionsDefinition(start_date="2015-01-01", end_date="2015-03-01"),
+        HourlyPartitionsDefinition(
+            start_date="2020-11-01-00:00", end_date="2020-11-04-00:00", timezone="US/Pacific"
+        ),
+        WeeklyPartitionsDefinition(start_date="2015-01-01", end_date="2016-01-01"),
+    ],
+)
+def test_time_window_partitions_subset_ordinal_set_operations(partitions_def) -> None:
+    all_keys = partitions_def.get_partition_keys()
+    rand = random.Random(12345)
+    for _ in range(20):
+        a_keys = set(rand.sample(all_keys, rand.randint(0, len(all_keys))))
+        b_keys = set(rand.sample(all_keys, rand.randint(0, len(all_keys))))
+        a = partitions_def.empty_subset().with_partition_keys(a_keys)
+        b = partitions_def.empty_subset().with_partition_keys(b_keys)
+
+        for subset, expected_keys in [
+            (a, a_keys),
+            (a | b, a_keys | b_keys),
+            (a & b, a_keys & b_keys),
+            (a - b, a_keys - b_keys),
+            (b - a, b_keys - a_keys),
+        ]:
+            assert set(subset.get_partition_keys()) == expected_keys
+            assert len(subset) == len(expected_keys)
+            assert all(key in subset for key in expected_keys)
+            assert not any(key in subset for key in set(all_keys) - expected_keys)
+            # results round-trip through serialization and match a subset built from scratch
+            assert partitions_def.deserialize_subset(subset.serialize()) == subset
+            assert subset == partitions_def.empty_subset().with_partition_keys(expected_keys)
+
+
+def test_time_window_partitions_subset_set_operations_different_starts() -> None:
+    # windows before the start of the partitions def are not covered by its ordinal index, so
+    # these fall back to datetime arithmetic
+    partitions_def = DailyPartitionsDefinition(start_date="2015-01-05")
+    earlier_partitions_def = DailyPartitionsDefinition(start_date="2015-01-01")
+    a = earlier_partitions_def.empty_subset().with_partition_keys(["2015-01-01", "2015-01-06"])
+    b = partitions_def.empty_subset().with_partition_keys(["2015-01-06", "2015-01-07"])
+    a = cast(TimeWindowPartitionsSubset, a).with_partitions_def(partitions_def)
+
+    assert set((a | b).get_partition_keys()) == {"2015-01-01", "2015-01-06", "2015-01-07"}
+    assert set((a & b).get_partition_keys()) == {"2015-01-06"}
+    assert set((a - b).get_partition_keys()) == {"2015-01-01"}
+    assert "2015-01-01" in a
+    assert "2015-01-07" not in a
+
+
+ORDINAL_INDEX_CRON_SCHEDULES = [
+    "0 * * * *",
+    "15 * * * *",
+    "*/15 * * * *",
+    "0 0 * * *",
+    "30 2 * * *",
+    "30 1 * * *",
+    "0 0 * * 0",
+    "30 2 * * 3",
+    "0 0 1 * *",
+    "30 1 5 * *",
+    "0 0 31 * *",
+    "0 9 * * 1-5",
+]
+ORDINAL_INDEX_TIMEZONES = ["UTC", "US/Pacific", "Europe/Berlin", "America/Havana"]
+
+
+def _reference_partition_keys(
+    partitions_def: TimeWindowPartitionsDefinition, current_timestamp: float
+) -> Sequence[str]:
+    """Enumerates partition keys by iterating over the cron schedule."""
+    partition_keys = []
+    partitions_past_current_time = 0
+    for window in partitions_def._iterate_time_windows(partitions_def.start.timestamp()):  # noqa: SLF001
+        if partitions_def.end and window.end.timestamp() > partitions_def.end.timestamp():
+            break
+        if window.end.timestamp() > current_timestamp:
+            if partitions_past_current_time >= partitions_def.end_offset:
+                break
+            partitions_past_current_time += 1
+        partition_keys.append(
+            dst_safe_strftime(
+                window.start,
+                partitions_def.timezone,
+                partitions_def.fmt,
+                partitions_def.cron_schedule,
+            )
+        )
+    if partitions_def.end_offset < 0:
+        partition_keys = partition_keys[: partitions_def.end_offset]
+    return partition_keys
+
+
+@pytest.mark.parametrize("cron_schedule", ORDINAL_INDEX_CRON_SCHEDULES)
+@pytest.mark.parametrize("timezone", ORDINAL_INDEX_TIMEZONES)
+def test_partition_ordinal_index_matches_cron_iteration(cron_schedule: str, timezone: str) -> None:
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule=cron_schedule,
+        start="2020-01-01-00:00",
+        timezone=timezone,
+        fmt="%Y-%m-%d-%H:%M",
+    )
+    index = partitions_def.get_partition_ordinal_index()
+    num_boundaries = 24 * 400 if cron_schedule.endswith("* * * *") else 800
+    boundaries = [
+        window.start.timestamp()
+        for _, window in zip(
+            range(num_boundaries),
+            partitions_def._iterate_time_windows(partitions_def.start.timestamp()),  # noqa: SLF001
+        )
+    ]
+
+    assert [index.boundary_for_ordinal(i) for i in range(num_boundaries)] == boundaries
+
+    rand = random.Random(cron_schedule + timezone)
+    for _ in range(500):
+        ordinal = rand.randrange(num_boundaries - 1)
+        assert index.ordinal_for_boundary(boundaries[ordinal]) == ordinal
+        timestamp = rand.uniform(boundaries[ordinal], boundaries[ordinal + 1])
+        if timestamp != boundaries[ordinal]:
+            assert index.ordinal_at_or_after(timestamp) == ordinal + 1
+            assert index.ordinal_for_boundary(timestamp) is None
+    assert index.ordinal_at_or_after(boundaries[0] - 1) is None
+
+
+@pytest.mark.parametrize("cron_schedule", ORDINAL_INDEX_CRON_SCHEDULES)
+@pytest.mark.parametrize("timezone", ORDINAL_INDEX_TIMEZONES)
+def test_partition_keys_from_ordinal_index_match_cron_iteration(
+    cron_schedule: str, timezone: str
+) -> None:
+    rand = random.Random(cron_schedule + timezone)
+    for end_offset, end in [(0, None), (2, None), (-2, None), (0, "2020-06-15-00:00")]:
+        partitions_def = TimeWindowPartitionsDefinition(
+            cron_schedule=cron_schedule,
+            start="2020-01-01-00:00",
+            end=end,
+            timezone=timezone,
+            fmt="%Y-%m-%d-%H:%M",
+            end_offset=end_offset,
+        )
+        start_timestamp = partitions_def.start.timestamp()
+        current_time = datetime.fromtimestamp(
+            rand.uniform(start_timestamp, start_timestamp + 86400 * 365),
+            tz=get_timezone(timezone),
+        )
+        expected_keys = _reference_partition_keys(partitions_def, current_time.timestamp())
+
+        assert partitions_def.get_partition_keys(current_time) == expected_keys
+        assert partitions_def.get_num_partitions(current_time) == len(expected_keys)
+        assert partitions_def.get_last_partition_key(current_time) == (
+            expected_keys[-1] if expected_keys else None
+        )
+
+        start_idx = rand.randrange(len(expected_keys) + 1)
+        end_idx = start_idx + rand.randrange(20)
+        assert (
+            partitions_def.get_partition_keys_between_indexes(start_idx, end_idx, current_time)
+            == expected_keys[start_idx:end_idx]
+        )
+        assert (
+            list(partitions_def.iter_partition_keys(start_idx, current_time=current_time))
+            == expected_keys[start_idx:]
+        )
+
+        for key in rand.sample(expected_keys, min(len(expected_keys), 10)):
+            assert partitions_def.has_partition_key(key, current_time)
+        assert not partitions_def.has_partition_key("2019-12-31-00:00", current_time)
+        assert not partitions_def.has_partition_key("2030-01-01-00:00", current_time)
+
+
+def test_partition_keys_shared_across_equal_partitions_defs() -> None:
+    from dagster._core.definitions.partition import get_partition_key_cache
+
+    current_time = datetime(2024, 1, 1, 5, 30)
+    get_partition_key_cache().clear()
+
+    first_def = HourlyPartitionsDefinition(start_date="2023-01-01-00:00")
+    second_def = HourlyPartitionsDefinition(start_date="2023-01-01-00:00")
+    assert first_def is not second_def
+
+    partition_keys = first_def.get_partition_keys(current_time)
+    assert len(partition_keys) == 365 * 24 + 5
+    assert get_partition_key_cache().stats.misses == 1
+
+    assert second_def.get_partition_keys(current_time) == partition_keys
+    assert get_partition_key_cache().stats.hits == 1
+
+    # callers receive copies, so mutating the result leaves the cached keys intact
+    partition_keys.append("not-a-partition")
+    assert second_def.get_partition_keys(current_time)[-1] == "2024-01-01-04:00"
+    assert second_def.get_partition_keys_between_indexes(2, 4, current_time) == [
+        "2023-01-01-02:00",
+        "2023-01-01-03:00",
+    ]
+
+    # a new partition existing invalidates the cache entry
+    later_keys = second_def.get_partition_keys(current_time + timedelta(hours=1))
+    assert later_keys[-1] == "2024-01-01-05:00"
+    assert get_partition_key_cache().stats.misses == 2
+    assert get_partition_key_cache().stats.num_entries == 2
+
+    with freeze_time(current_time):
+        windows = first_def.time_windows_for_partition_keys(
+            frozenset(["2023-06-01-12:00", "2023-01-01-00:00"])
+        )
+    assert windows == [
+        time_window("2023-01-01T00:00:00", "2023-01-01T01:00:00"),
+        time_window("2023-06-01T12:00:00", "2023-06-01T13:00:00"),
+    ]
+
+    daily_def = DailyPartitionsDefinition(start_date="2023-01-01", end_offset=1)
+    with freeze_time(current_time):
+        for timestamp in [datetime(2023, 3, 5, 7, 0), datetime(2023, 3, 5, 7, 15)]:
+            assert first_def.get_partition_key_for_timestamp(timestamp.timestamp()) == (
+                "2023-03-05-07:00"
+            )
+            assert daily_def.get_partition_key_for_timestamp(timestamp.timestamp()) == (
+                "2023-03-05"
+            )
+    assert (
+        first_def.get_partition_key_for_timestamp(
+            datetime(2023, 3, 5, 7, 0).timestamp(), end_closed=True
+        )
+        == "2023-03-05-06:00"
+    )
+
+    get_partition_key_cache().clear()
+    assert get_partition_key_cache().stats.num_entries == 0
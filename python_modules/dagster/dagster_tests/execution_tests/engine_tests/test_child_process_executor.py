@@ -5,10 +5,12 @@
 
 import pytest
 from dagster._core.executor.child_process_executor import (
+    TICK,
     ChildProcessCommand,
     ChildProcessCrashException,
     ChildProcessDoneEvent,
     ChildProcessEvent,
+    ChildProcessEventSelector,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
     execute_child_process_command,
@@ -81,6 +83,38 @@ def test_basic_child_process_command_with_process_events():
     assert events[3].pid == child_pid
 
 
+def test_child_process_commands_with_selector():
+    selector = ChildProcessEventSelector()
+    command_iters = [
+        execute_child_process_command(
+            multiprocessing, DoubleAStringChildProcessCommand(value), selector
+        )
+        for value in ["aa", "bb"]
+    ]
+
+    events = []
+    while command_iters:
+        received = False
+        for command_iter in list(command_iters):
+            try:
+                event = next(command_iter)
+            except StopIteration:
+                command_iters.remove(command_iter)
+                continue
+
+            if event is not None:
+                received = True
+                events.append(event)
+
+        if command_iters and not received:
+            selector.wait(timeout=TICK)
+
+    assert sorted(
+        event for event in events if not isinstance(event, (ChildProcessEvent, BaseProcess))
+    ) == ["aaaa", "bbbb"]
+    assert len([event for event in events if isinstance(event, ChildProcessDoneEvent)]) == 2
+
+
 def test_child_process_uncaught_exception():
     results = list(
         filter(
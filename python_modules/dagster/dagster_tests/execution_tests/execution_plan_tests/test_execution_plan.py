@@ -119,6 +119,43 @@ def test_active_execution_plan():
         assert active_execution.is_complete
 
 
+def test_active_execution_plan_wide_fan_in():
+    @op
+    def emit():
+        return 1
+
+    @op
+    def collect(nums):
+        return sum(nums)
+
+    @job
+    def wide_job():
+        collect([emit.alias(f"emit_{i}")() for i in range(100)])
+
+    plan = create_execution_plan(wide_job)
+
+    with plan.start(retry_mode=(RetryMode.DISABLED), max_concurrent=10) as active_execution:
+        emit_keys = []
+        while len(emit_keys) < 100:
+            steps = active_execution.get_steps_to_execute()
+            assert steps
+            assert len(steps) <= 10
+            assert all(step.key != "collect" for step in steps)
+            # complete in reverse order to check that collect waits on every emit step
+            for step in reversed(steps):
+                emit_keys.append(step.key)
+                active_execution.mark_step_produced_output(StepOutputHandle(step.key, "result"))
+                active_execution.mark_success(step.key)
+
+        assert sorted(emit_keys) == sorted(f"emit_{i}" for i in range(100))
+
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["collect"]
+        active_execution.mark_success("collect")
+
+        assert active_execution.is_complete
+
+
 def test_failing_execution_plan():
     job_def = define_diamond_job()
     plan = create_execution_plan(job_def)
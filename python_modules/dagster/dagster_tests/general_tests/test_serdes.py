@@ -10,6 +10,7 @@
 import pytest
 from dagster._model import DagsterModel
 from dagster._record import IHaveNew, record, record_custom
+from dagster._serdes.codecs import SerdesCodec, decode_serialized_value, register_serdes_codec
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster._serdes.serdes import (
     EnumSerializer,
@@ -511,6 +512,30 @@ class Foo(NamedTuple):
     assert deserialized == val
 
 
+def test_named_tuple_storage_field_names_unpack_keys() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env, storage_field_names={"color": "colour"}, old_fields={"old": 1})
+    class Foo(NamedTuple):
+        color: str
+        size: int = 0
+
+    val = Foo("red", 2)
+    serialized = serialize_value(val, whitelist_map=test_env)
+    assert serialized == '{"__class__": "Foo", "colour": "red", "old": 1, "size": 2}'
+    assert deserialize_value(serialized, whitelist_map=test_env) == val
+
+    # the python field name is also accepted, and unknown keys are ignored, including ones holding
+    # values of unknown classes
+    assert deserialize_value(
+        '{"__class__": "Foo", "color": "blue", "unknown": 1}', whitelist_map=test_env
+    ) == Foo("blue")
+    assert deserialize_value(
+        '{"__class__": "Foo", "colour": "blue", "unknown": {"__class__": "Bar"}}',
+        whitelist_map=test_env,
+    ) == Foo("blue")
+
+
 def test_named_tuple_old_fields() -> None:
     test_env = WhitelistMap.create()
 
@@ -1190,3 +1215,55 @@ def foo(self):
     assert (
         deserialize_value(serialize_value(r, whitelist_map=test_env), whitelist_map=test_env) == r
     )
+
+
+def test_serdes_codec() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Foo(NamedTuple):
+        color: str
+        sizes: Sequence[int]
+
+    val = [Foo("red", list(range(10))) for _ in range(50)]
+    serialized = serialize_value(val, whitelist_map=test_env)
+    encoded = serialize_value(val, whitelist_map=test_env, codec="zlib")
+    assert encoded.startswith("zlib:")
+    assert len(encoded) < len(serialized) / 10
+    assert deserialize_value(encoded, whitelist_map=test_env) == val
+    assert deserialize_value(serialized, whitelist_map=test_env) == val
+    assert decode_serialized_value(encoded) == serialized
+    assert decode_serialized_value(serialized) == serialized
+
+    with pytest.raises(SerdesUsageError, match="Unknown serdes codec"):
+        serialize_value(val, whitelist_map=test_env, codec="unknown")
+
+
+def test_register_serdes_codec() -> None:
+    class CodecWithPrefix(SerdesCodec):
+        def __init__(self, name: str, prefix: str):
+            self._name = name
+            self._prefix = prefix
+
+        @property
+        def name(self) -> str:
+            return self._name
+
+        @property
+        def prefix(self) -> str:
+            return self._prefix
+
+        def encode(self, json_str: str) -> str:
+            return json_str
+
+        def decode(self, encoded: str) -> str:
+            return encoded
+
+    with pytest.raises(SerdesUsageError, match="must not be empty or start with"):
+        register_serdes_codec(CodecWithPrefix("json_like", '{"'))
+
+    with pytest.raises(SerdesUsageError, match="conflicts with registered codec"):
+        register_serdes_codec(CodecWithPrefix("zlib", "other:"))
+
+    with pytest.raises(SerdesUsageError, match="conflicts with registered codec"):
+        register_serdes_codec(CodecWithPrefix("zlib2", "zlib"))
@@ -0,0 +1,117 @@
+import time
+from unittest import mock
+
+import pytest
+from dagster import AssetKey, AssetMaterialization, DagsterInstance, Output, job, op
+from dagster._core.events import DagsterEventType
+from dagster._core.storage.event_log.write_behind import EventLogWriteBehindQueue
+from dagster._core.test_utils import instance_for_test
+from dagster._core.utils import make_new_run_id
+
+from dagster_tests.storage_tests.utils.event_log_storage import (
+    _event_record,
+    create_test_event_log_record,
+)
+
+
+@op
+def materialize_many(context):
+    for i in range(20):
+        context.log.info(f"log {i}")
+        yield AssetMaterialization(asset_key=AssetKey("write_behind_asset"), partition=str(i))
+    yield Output(1)
+
+
+@job
+def write_behind_job():
+    materialize_many()
+
+
+def test_write_behind_latency_flush():
+    with DagsterInstance.ephemeral() as instance:
+        storage = instance.event_log_storage
+        run_id = make_new_run_id()
+        write_behind_queue = EventLogWriteBehindQueue(storage, max_batch_size=100, max_latency=0.1)
+        try:
+            for i in range(5):
+                write_behind_queue.put(create_test_event_log_record(str(i), run_id))
+
+            start = time.time()
+            while len(storage.get_logs_for_run(run_id)) < 5:
+                assert time.time() - start < 5
+                time.sleep(0.05)
+
+            assert [event.user_message for event in storage.get_logs_for_run(run_id)] == [
+                str(i) for i in range(5)
+            ]
+        finally:
+            write_behind_queue.dispose()
+
+
+def test_write_behind_batches_and_step_boundary_flush():
+    with DagsterInstance.ephemeral() as instance:
+        storage = instance.event_log_storage
+        run_id = make_new_run_id()
+        # a long latency, so that only the batch size and step boundaries trigger writes
+        write_behind_queue = EventLogWriteBehindQueue(storage, max_batch_size=4, max_latency=60)
+        try:
+            with mock.patch.object(
+                storage, "store_event_batch", wraps=storage.store_event_batch
+            ) as store_event_batch:
+                for i in range(4):
+                    write_behind_queue.put(create_test_event_log_record(str(i), run_id))
+                write_behind_queue.flush()
+                assert store_event_batch.call_count == 1
+                assert len(storage.get_logs_for_run(run_id)) == 4
+
+                write_behind_queue.put(create_test_event_log_record("4", run_id))
+                write_behind_queue.put(
+                    _event_record(run_id, "A", time.time(), DagsterEventType.STEP_START)
+                )
+                # step start events flush the queue before returning
+                assert store_event_batch.call_count == 2
+                assert len(storage.get_logs_for_run(run_id)) == 6
+        finally:
+            write_behind_queue.dispose()
+
+
+def test_write_behind_batch_failure_fallback():
+    with DagsterInstance.ephemeral() as instance:
+        storage = instance.event_log_storage
+        run_id = make_new_run_id()
+        write_behind_queue = EventLogWriteBehindQueue(storage, max_batch_size=3, max_latency=60)
+        try:
+            with mock.patch.object(storage, "store_event_batch", side_effect=Exception("oops")):
+                for i in range(3):
+                    write_behind_queue.put(create_test_event_log_record(str(i), run_id))
+                write_behind_queue.flush()
+            assert len(storage.get_logs_for_run(run_id)) == 3
+
+            with mock.patch.object(storage, "store_event", side_effect=Exception("oops again")):
+                write_behind_queue.put(create_test_event_log_record("3", run_id))
+                with pytest.raises(Exception, match="oops again"):
+                    write_behind_queue.flush()
+        finally:
+            write_behind_queue.dispose()
+
+
+def test_write_behind_instance(monkeypatch):
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BEHIND_BATCH_SIZE", "8")
+    monkeypatch.setenv("DAGSTER_EVENT_WRITE_BEHIND_MAX_LATENCY", "60")
+
+    with instance_for_test() as instance:
+        assert instance._event_write_behind_queue  # noqa: SLF001
+        assert instance._event_write_behind_queue.max_batch_size == 8  # noqa: SLF001
+
+        result = write_behind_job.execute_in_process(instance=instance)
+        assert result.success
+
+        # the run success event flushes the queue, so every event is stored by the time the run
+        # has completed
+        records = instance.get_records_for_run(result.run_id).records
+        assert records[-1].event_log_entry.dagster_event_type == DagsterEventType.RUN_SUCCESS
+        assert (
+            len(instance.fetch_materializations(AssetKey("write_behind_asset"), limit=100).records)
+            == 20
+        )
+        assert instance.get_run_stats(result.run_id).steps_succeeded == 1
@@ -1,13 +1,17 @@
 import tempfile
 import time
 from contextlib import contextmanager
-from typing import Any, Callable, Mapping, Optional
+from typing import Any, Callable, List, Mapping, Optional
+from unittest import mock
 
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
 from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.sqlite.consolidated_sqlite_event_log import (
+    ConsolidatedSqliteEventLogStorage,
+)
 from dagster._core.utils import make_new_run_id
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
@@ -146,3 +150,55 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def _wait_for(condition: Callable[[], bool]) -> None:
+    attempts = 50
+    while not condition() and attempts > 0:
+        time.sleep(0.1)
+        attempts -= 1
+
+
+def test_tail_multiple_runs():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        # not run sharded, so watched runs are read by tailing the event log
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        watcher = SqlPollingEventWatcher(storage)
+        run_id_1, run_id_2 = make_new_run_id(), make_new_run_id()
+        watched_1: List[EventLogEntry] = []
+        watched_2: List[EventLogEntry] = []
+
+        try:
+            storage.store_event(create_event(1, run_id_1))
+            storage.store_event(create_event(2, run_id_2))
+
+            watcher.watch_run(run_id_1, None, lambda event, _cursor: watched_1.append(event))
+            watcher.watch_run(
+                run_id_2,
+                str(EventLogCursor.from_storage_id(2)),
+                lambda event, _cursor: watched_2.append(event),
+            )
+            assert watcher.has_run_id(run_id_1)
+            assert watcher.has_run_id(run_id_2)
+            _wait_for(
+                lambda: all(
+                    watched_run.is_tailing
+                    for watched_run in watcher._watched_runs.values()  # noqa: SLF001
+                )
+            )
+            assert len(watched_1) == 1
+
+            with mock.patch.object(
+                storage, "get_records_for_run", wraps=storage.get_records_for_run
+            ) as get_records_for_run:
+                for i in range(3, 7):
+                    storage.store_event(create_event(i, run_id_1 if i % 2 else run_id_2))
+                _wait_for(lambda: len(watched_1) == 3 and len(watched_2) == 2)
+                # both runs have caught up, so their events are read by the shared tail query
+                assert get_records_for_run.call_count == 0
+
+            assert [int(event.message) for event in watched_1] == [1, 3, 5]
+            assert [int(event.message) for event in watched_2] == [4, 6]
+        finally:
+            watcher.close()
+            storage.dispose()
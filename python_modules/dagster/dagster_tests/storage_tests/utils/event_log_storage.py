@@ -98,6 +98,7 @@
 from dagster._core.storage.event_log.base import EventLogStorage
 from dagster._core.storage.event_log.migration import (
     EVENT_LOG_DATA_MIGRATIONS,
+    RUN_EVENT_STATS,
     migrate_asset_key_data,
 )
 from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
@@ -795,6 +796,85 @@ def test_event_log_get_stats_for_run(
         assert stats.start_time
         assert math.isclose(stats.start_time, start_time)
 
+    def test_event_log_run_event_stats(
+        self,
+        test_run_id: str,
+        storage: EventLogStorage,
+    ):
+        records = _stats_records(run_id=test_run_id)
+        # the stats of a run are accumulated across single event and batch writes
+        for record in records[:5]:
+            storage.store_event(record)
+        storage.store_event_batch(records[5:])
+
+        def _assert_stats():
+            stats = storage.get_stats_for_run(test_run_id)
+            assert stats.steps_succeeded == 2
+            assert stats.steps_failed == 1
+            assert stats.materializations == 3
+            assert stats.expectations == 2
+
+        _assert_stats()
+
+        if not isinstance(storage, SqlEventLogStorage) or storage.is_run_sharded:
+            return
+
+        assert storage.has_secondary_index(RUN_EVENT_STATS)
+
+        # the backfill rebuilds the same stats from the event log
+        storage.reindex_events(force=True)
+        _assert_stats()
+
+        storage.delete_events(test_run_id)
+        assert storage.get_stats_for_run(test_run_id).steps_succeeded == 0
+
+    def test_event_log_step_stats_partial_deserialization(
+        self,
+        test_run_id: str,
+        storage: EventLogStorage,
+    ):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("Lazy event log records are only used by SQL storages")
+
+        for record in _stats_records(run_id=test_run_id):
+            storage.store_event(record)
+
+        with mock.patch(
+            "dagster._core.event_api.deserialize_value", wraps=deserialize_value
+        ) as deserialize_mock:
+            step_stats = storage.get_step_stats_for_run(test_run_id)
+
+        assert len(step_stats) == 4
+        # only the 3 materialization and 2 expectation result payloads are deserialized
+        assert deserialize_mock.call_count == 5
+
+    def test_event_log_serdes_codec(
+        self,
+        test_run_id: str,
+        storage: EventLogStorage,
+        monkeypatch,
+    ):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("Serdes codecs are only used by SQL storages")
+
+        records = _stats_records(run_id=test_run_id)
+        # rows written before and after enabling the codec are both readable
+        storage.store_event(records[0])
+        monkeypatch.setenv("DAGSTER_EVENT_LOG_SERDES_CODEC", "zlib")
+        for record in records[1:]:
+            storage.store_event(record)
+
+        event_records = storage.get_records_for_run(test_run_id).records
+        assert [record.event_log_entry for record in event_records] == records
+
+        first_row = storage.get_event_log_table_data(test_run_id, event_records[0].storage_id)
+        assert first_row and first_row.event.startswith("{")
+        last_row = storage.get_event_log_table_data(test_run_id, event_records[-1].storage_id)
+        assert last_row and last_row.event.startswith("zlib:")
+
+        step_stats = storage.get_step_stats_for_run(test_run_id)
+        assert len(step_stats) == 4
+
     def test_event_log_step_stats(
         self,
         test_run_id: str,
@@ -1051,6 +1131,76 @@ def test_basic_get_logs_for_run_multiple_runs(self, instance, storage):
             stats_two = storage.get_stats_for_run(result_two.run_id)
             assert stats_two.steps_succeeded == 1
 
+    def test_store_event_batch_multiple_runs(self, instance, storage):
+        events_one, result_one = _synthesize_events(two_asset_ops)
+        events_two, result_two = _synthesize_events(return_one_op_func)
+
+        with create_and_delete_test_runs(instance, [result_one.run_id, result_two.run_id]):
+            # interleave the events of both runs, as the write-behind queue would
+            storage.store_event_batch(
+                [event for pair in zip(events_one, events_two) for event in pair]
+                + events_one[len(events_two) :]
+                + events_two[len(events_one) :]
+            )
+
+            out_events_one = storage.get_logs_for_run(result_one.run_id)
+            assert _event_types(out_events_one) == _event_types(events_one)
+
+            out_events_two = storage.get_logs_for_run(result_two.run_id)
+            assert _event_types(out_events_two) == _event_types(events_two)
+
+            assert storage.get_stats_for_run(result_one.run_id).steps_succeeded == 2
+            assert storage.has_asset_key(AssetKey("asset_1"))
+            assert storage.has_asset_key(AssetKey(["path", "to", "asset_3"]))
+            assert len(storage.fetch_materializations(AssetKey("asset_2"), limit=100).records) == 1
+
+    def test_store_event_batch_asset_index_updates(self, storage, test_run_id):
+        partitions_def = StaticPartitionsDefinition([str(i) for i in range(50)])
+
+        class DummyIOManager(IOManager):
+            def handle_output(self, context, obj):
+                pass
+
+            def load_input(self, context):
+                return 1
+
+        @asset(partitions_def=partitions_def, io_manager_def=DummyIOManager())
+        def batched_asset(context):
+            context.add_output_metadata({"foo": "bar"})
+
+        with instance_for_test() as test_instance:
+            events, _ = _synthesize_events(
+                [batched_asset],
+                instance=test_instance,
+                run_id=test_run_id,
+                tags={ASSET_PARTITION_RANGE_START_TAG: "0", ASSET_PARTITION_RANGE_END_TAG: "49"},
+            )
+
+        if isinstance(storage, SqlEventLogStorage):
+            with mock.patch.object(
+                storage, "store_asset_event", wraps=storage.store_asset_event
+            ) as store_asset_event, mock.patch.object(
+                storage, "store_asset_event_tags", wraps=storage.store_asset_event_tags
+            ) as store_asset_event_tags:
+                storage.store_event_batch(events)
+
+            # the asset key table is updated once for all 50 materializations
+            assert store_asset_event.call_count == 1
+            assert store_asset_event_tags.call_count == 1
+        else:
+            storage.store_event_batch(events)
+
+        assert len(storage.get_logs_for_run(test_run_id)) == len(events)
+        result = storage.fetch_materializations(batched_asset.key, limit=100)
+        assert len(result.records) == 50
+        assert {record.partition_key for record in result.records} == {str(i) for i in range(50)}
+        [asset_record] = storage.get_asset_records([batched_asset.key])
+        assert asset_record.asset_entry.last_materialization_record
+        assert (
+            asset_record.asset_entry.last_materialization_record.storage_id
+            == result.records[0].storage_id
+        )
+
     def test_basic_get_logs_for_run_multiple_runs_cursors(self, instance, storage):
         events_one, result_one = _synthesize_events(return_one_op_func)
         events_two, result_two = _synthesize_events(return_one_op_func)
@@ -4806,6 +4956,47 @@ def test_has_dynamic_partition(self, storage: EventLogStorage):
         assert not storage.has_dynamic_partition(partitions_def_name="foo", partition_key="qux")
         assert not storage.has_dynamic_partition(partitions_def_name="bar", partition_key="foo")
 
+    def test_dynamic_partitions_bulk_queries(self, storage: EventLogStorage):
+        assert storage.get_dynamic_partitions_count("foo") == 0
+        assert storage.has_dynamic_partitions("foo", ["foo", "bar"]) == {"foo": False, "bar": False}
+        result = storage.get_paginated_dynamic_partitions("foo", limit=2)
+        assert result.partition_keys == []
+        assert not result.has_more
+
+        storage.add_dynamic_partitions(
+            partitions_def_name="foo", partition_keys=["a", "b", "c", "d", "e"]
+        )
+        assert storage.get_dynamic_partitions_count("foo") == 5
+        assert storage.has_dynamic_partitions("foo", ["a", "e", "z"]) == {
+            "a": True,
+            "e": True,
+            "z": False,
+        }
+        assert storage.has_dynamic_partitions("bar", ["a"]) == {"a": False}
+
+        partition_keys = []
+        cursor = None
+        while True:
+            result = storage.get_paginated_dynamic_partitions("foo", limit=2, cursor=cursor)
+            partition_keys.extend(result.partition_keys)
+            cursor = result.cursor
+            if not result.has_more:
+                break
+        assert partition_keys == ["a", "b", "c", "d", "e"]
+
+        # keys added after the last page are picked up from the returned cursor
+        storage.add_dynamic_partitions(partitions_def_name="foo", partition_keys=["f"])
+        result = storage.get_paginated_dynamic_partitions("foo", limit=2, cursor=cursor)
+        assert result.partition_keys == ["f"]
+
+        storage.delete_dynamic_partition(partitions_def_name="foo", partition_key="f")
+        assert storage.get_dynamic_partitions("foo") == ["a", "b", "c", "d", "e"]
+        storage.add_dynamic_partitions(partitions_def_name="foo", partition_keys=["g"])
+        assert storage.get_dynamic_partitions("foo") == ["a", "b", "c", "d", "e", "g"]
+        storage.delete_dynamic_partition(partitions_def_name="foo", partition_key="a")
+        assert storage.get_dynamic_partitions("foo") == ["b", "c", "d", "e", "g"]
+        assert storage.get_dynamic_partitions_count("foo") == 5
+
     def test_concurrency(self, storage: EventLogStorage):
         if not storage.supports_global_concurrency_limits:
             pytest.skip("storage does not support global op concurrency")
@@ -13,6 +13,7 @@
     StaticPartitionsDefinition,
     asset,
     define_asset_job,
+    materialize,
 )
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.time_window_partitions import HourlyPartitionsDefinition
@@ -26,6 +27,7 @@
     RUN_FETCH_BATCH_SIZE,
     build_failed_and_in_progress_partition_subset,
     get_and_update_asset_status_cache_value,
+    get_and_update_asset_status_cache_values,
     get_last_planned_storage_id,
 )
 from dagster._core.test_utils import create_run_for_test
@@ -267,6 +269,104 @@ def asset1():
             ]
         )
 
+    def test_get_and_update_cached_status_for_many_assets(self, instance):
+        daily_partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+        static_partitions_def = StaticPartitionsDefinition(["x", "y", "z"])
+
+        @asset(partitions_def=daily_partitions_def)
+        def daily_asset():
+            return 1
+
+        @asset(partitions_def=static_partitions_def)
+        def static_asset():
+            return 1
+
+        @asset(partitions_def=static_partitions_def)
+        def failing_asset():
+            raise Exception("failed")
+
+        @asset
+        def unpartitioned_asset():
+            return 1
+
+        partitions_defs_by_key = {
+            daily_asset.key: daily_partitions_def,
+            static_asset.key: static_partitions_def,
+            failing_asset.key: static_partitions_def,
+            unpartitioned_asset.key: None,
+        }
+
+        materialize([daily_asset], instance=instance, partition_key="2022-02-01")
+        materialize([static_asset], instance=instance, partition_key="x")
+        materialize([failing_asset], instance=instance, partition_key="y", raise_on_error=False)
+        materialize([unpartitioned_asset], instance=instance)
+
+        traced_counter.set(Counter())
+        cached_statuses = get_and_update_asset_status_cache_values(instance, partitions_defs_by_key)
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_materialized_partitions_by_asset_key") == 1
+        assert counts.get("DagsterInstance.get_materialized_partitions") is None
+        assert counts.get("DagsterInstance.update_asset_cached_status_data_by_asset_key") == 1
+        assert counts.get("DagsterInstance.update_asset_cached_status_data") is None
+
+        def _materialized_keys(asset_key):
+            cached_status = cached_statuses[asset_key]
+            assert cached_status
+            return set(
+                cached_status.deserialize_materialized_partition_subsets(
+                    partitions_defs_by_key[asset_key]
+                ).get_partition_keys()
+            )
+
+        assert _materialized_keys(daily_asset.key) == {"2022-02-01"}
+        assert _materialized_keys(static_asset.key) == {"x"}
+        assert _materialized_keys(failing_asset.key) == set()
+        failing_status = cached_statuses[failing_asset.key]
+        assert failing_status
+        assert set(
+            failing_status.deserialize_failed_partition_subsets(
+                static_partitions_def
+            ).get_partition_keys()
+        ) == {"y"}
+        unpartitioned_status = cached_statuses[unpartitioned_asset.key]
+        assert unpartitioned_status
+        assert unpartitioned_status.serialized_materialized_partition_subset is None
+
+        # the stored values match those built one asset at a time
+        for asset_key, partitions_def in partitions_defs_by_key.items():
+            assert (
+                get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+                == cached_statuses[asset_key]
+            )
+
+        materialize([daily_asset], instance=instance, partition_key="2022-02-02")
+        materialize([failing_asset], instance=instance, partition_key="z", raise_on_error=False)
+
+        traced_counter.set(Counter())
+        cached_statuses = get_and_update_asset_status_cache_values(instance, partitions_defs_by_key)
+        counts = traced_counter.get().counts()
+        # only the daily asset has new materializations, and only the updated values are written
+        assert counts.get("DagsterInstance.get_materialized_partitions") == 1
+        assert counts.get("DagsterInstance.update_asset_cached_status_data_by_asset_key") == 1
+        assert _materialized_keys(daily_asset.key) == {"2022-02-01", "2022-02-02"}
+        assert _materialized_keys(static_asset.key) == {"x"}
+        failing_status = cached_statuses[failing_asset.key]
+        assert failing_status
+        assert set(
+            failing_status.deserialize_failed_partition_subsets(
+                static_partitions_def
+            ).get_partition_keys()
+        ) == {"y", "z"}
+
+        traced_counter.set(Counter())
+        assert get_and_update_asset_status_cache_values(instance, partitions_defs_by_key) == (
+            cached_statuses
+        )
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_materialized_partitions") is None
+        assert counts.get("DagsterInstance.get_materialized_partitions_by_asset_key") is None
+        assert counts.get("DagsterInstance.update_asset_cached_status_data_by_asset_key") is None
+
     def test_cached_status_on_wipe(self, instance):
         partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
 
@@ -319,6 +419,64 @@ def asset1():
         assert cached_status
         assert cached_status.serialized_materialized_partition_subset is None
 
+    def test_dynamic_partitions_status_updated_incrementally(self, instance):
+        dynamic = DynamicPartitionsDefinition(name="fruits")
+
+        @asset(partitions_def=dynamic)
+        def asset1():
+            return 1
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+        instance.add_dynamic_partitions("fruits", ["apple", "banana"])
+        asset_job.execute_in_process(instance=instance, partition_key="apple")
+
+        traced_counter.set(Counter())
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, dynamic)
+        assert cached_status
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_materialized_partitions") == 1
+        assert counts.get("DagsterInstance.update_asset_cached_status_data") == 1
+
+        # nothing has happened since the cache was built, so it is neither recomputed nor rewritten
+        assert (
+            get_and_update_asset_status_cache_value(instance, asset_key, dynamic) == cached_status
+        )
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_materialized_partitions") == 1
+        assert counts.get("DagsterInstance.update_asset_cached_status_data") == 1
+
+        # adding a partition changes the partitions def id, but the stored subsets are still valid
+        # and only the new materialization is fetched
+        instance.add_dynamic_partitions("fruits", ["cherry"])
+        asset_job.execute_in_process(instance=instance, partition_key="cherry")
+        updated_status = get_and_update_asset_status_cache_value(instance, asset_key, dynamic)
+        assert updated_status
+        assert updated_status.partitions_def_id != cached_status.partitions_def_id
+        assert set(
+            updated_status.deserialize_materialized_partition_subsets(
+                dynamic, instance
+            ).get_partition_keys()
+        ) == {"apple", "cherry"}
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_materialized_partitions") == 2
+        assert counts.get("DagsterInstance.update_asset_cached_status_data") == 2
+        assert updated_status.deserialize_failed_partition_subsets(dynamic, instance).is_empty
+
+        # deleting a partition invalidates the stored bitmaps, so the cache is rebuilt
+        instance.delete_dynamic_partition("fruits", "banana")
+        rebuilt_status = get_and_update_asset_status_cache_value(instance, asset_key, dynamic)
+        assert rebuilt_status
+        assert set(
+            rebuilt_status.deserialize_materialized_partition_subsets(
+                dynamic, instance
+            ).get_partition_keys()
+        ) == {"apple", "cherry"}
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_materialized_partitions") == 3
+
     def test_failure_cache(self, instance):
         partitions_def = StaticPartitionsDefinition(["good1", "good2", "fail1", "fail2"])
 
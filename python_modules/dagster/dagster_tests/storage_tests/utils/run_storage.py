@@ -1161,6 +1161,27 @@ def test_add_get_execution_snapshot(self, storage: RunStorage):
 
             assert not storage.has_execution_plan_snapshot(snapshot_id)
 
+    def test_get_execution_plan_snapshots(self, storage: RunStorage):
+        from dagster._core.execution.api import create_execution_plan
+        from dagster._core.snap import snapshot_from_execution_plan
+
+        snapshot_ids = []
+        for job_name in ["job_one", "job_two"]:
+            job_def = GraphDefinition(name=job_name, node_defs=[]).to_job()
+            execution_plan = create_execution_plan(job_def)
+            ep_snapshot = snapshot_from_execution_plan(
+                execution_plan, job_def.get_job_snapshot_id()
+            )
+            snapshot_ids.append(storage.add_execution_plan_snapshot(ep_snapshot))
+
+        assert storage.get_execution_plan_snapshots([]) == {}
+        snapshots_by_id = storage.get_execution_plan_snapshots([*snapshot_ids, "nope"])
+        assert set(snapshots_by_id.keys()) == set(snapshot_ids)
+        for snapshot_id in snapshot_ids:
+            assert serialize_pp(snapshots_by_id[snapshot_id]) == serialize_pp(
+                storage.get_execution_plan_snapshot(snapshot_id)
+            )
+
     def test_fetch_run_filter(self, storage):
         assert storage
         one = make_new_run_id()
@@ -1,5 +1,6 @@
 from contextlib import contextmanager
-from typing import Any, ContextManager, Iterator, Mapping, Optional, Sequence, cast
+from datetime import datetime
+from typing import Any, ContextManager, Iterator, Mapping, Optional, Sequence, Tuple
 
 import dagster._check as check
 import sqlalchemy as db
@@ -8,7 +9,7 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
-from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, BATCH_WRITABLE_EVENTS
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import pg_config
 from dagster._core.storage.event_log import (
@@ -21,6 +22,7 @@
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
 from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.event_log.schema import RunEventStatsTable
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -190,6 +192,8 @@ def store_event(self, event: EventLogEntry) -> None:
             )
             event_id = int(res[1])  # type: ignore
 
+        self.store_run_event_stats([event])
+
         if (
             event.is_dagster_event
             and event.dagster_event_type in ASSET_EVENTS
@@ -207,27 +211,6 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
-    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
-        check.sequence_param(events, "event", of_type=EventLogEntry)
-
-        check.invariant(
-            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
-            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
-        )
-
-        insert_event_statement = self.prepare_insert_event_batch(events)
-        with self._connect() as conn:
-            result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
-            event_ids = [cast(int, row[0]) for row in result.fetchall()]
-
-        # We only update the asset table with the last event
-        self.store_asset_event(events[-1], event_ids[-1])
-
-        if any((event_id is None for event_id in event_ids)):
-            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
-
-        self.store_asset_event_tags(events, event_ids)
-
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
@@ -280,6 +263,37 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 query = query.on_conflict_do_nothing()
             conn.execute(query)
 
+    def _upsert_run_event_stats(
+        self, conn: Connection, stats: Mapping[Tuple[str, str], Tuple[int, datetime]]
+    ) -> None:
+        # Overload base implementation to push upsert logic down into the db layer
+        query = db_dialects.postgresql.insert(RunEventStatsTable).values(
+            [
+                dict(
+                    run_id=run_id,
+                    dagster_event_type=dagster_event_type,
+                    event_count=count,
+                    last_event_timestamp=timestamp,
+                )
+                for (run_id, dagster_event_type), (count, timestamp) in stats.items()
+            ]
+        )
+        conn.execute(
+            query.on_conflict_do_update(
+                index_elements=[
+                    RunEventStatsTable.c.run_id,
+                    RunEventStatsTable.c.dagster_event_type,
+                ],
+                set_=dict(
+                    event_count=RunEventStatsTable.c.event_count + query.excluded.event_count,
+                    last_event_timestamp=db.func.greatest(
+                        RunEventStatsTable.c.last_event_timestamp,
+                        query.excluded.last_event_timestamp,
+                    ),
+                ),
+            )
+        )
+
     def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
     ) -> None: